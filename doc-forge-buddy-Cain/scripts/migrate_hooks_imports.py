@@ -2,43 +2,62 @@
 """
 Script para migrar imports de hooks antigos para novos hooks consolidados.
 Execute este script para atualizar automaticamente os imports no projeto.
+
+Todos os mapeamentos (especificador antigo -> novo) são compilados em uma única
+tabela de consulta: especificadores exatos por dicionário e mapeamentos de pasta
+(``'@/hooks/old/*'``) por prefixo mais longo. Cada arquivo é percorrido uma vez por
+um scanner que pula comentários, strings comuns e template strings, e só reescreve
+strings que são especificadores de módulo de verdade (``import ... from``,
+``export ... from``, ``import '...'``, ``import()``, ``require()`` e ``vi.mock()``).
+Imports relativos são normalizados para a forma ``@/`` antes da consulta.
+
+Uso:
+    python scripts/migrate_hooks_imports.py --dry-run
+    python scripts/migrate_hooks_imports.py --report docs/migracao_hooks.json
+    python scripts/migrate_hooks_imports.py --remove-old-hooks
 """
 
+import argparse
+import json
 import os
+import posixpath
 import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, asdict
 from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
-# Mapeamento de imports antigos para novos
+# Mapeamento de imports antigos para novos (especificadores; '/*' mapeia uma pasta inteira)
 IMPORT_MAPPINGS = {
     # Contratos
-    "from '@/hooks/useContractData'": "from '@/hooks/shared/useContractManager'",
-    "from '@/hooks/useContractsQuery'": "from '@/hooks/shared/useContractManager'",
-    "from '@/hooks/useCompleteContractData'": "from '@/hooks/shared/useContractManager'",
-    "from '@/hooks/useContractAnalysis'": "from '@/hooks/shared/useContractManager'",
-    "from '@/hooks/useContractsWithPendingBills'": "from '@/hooks/shared/useContractBills'",
-    
+    '@/hooks/useContractData': '@/hooks/shared/useContractManager',
+    '@/hooks/useContractsQuery': '@/hooks/shared/useContractManager',
+    '@/hooks/useCompleteContractData': '@/hooks/shared/useContractManager',
+    '@/hooks/useContractAnalysis': '@/hooks/shared/useContractManager',
+    '@/hooks/useContractsWithPendingBills': '@/hooks/shared/useContractBills',
+
     # Contas de contrato
-    "from '@/hooks/useContractBills'": "from '@/hooks/shared/useContractBills'",
-    "from '@/hooks/useContractBillsSync'": "from '@/hooks/shared/useContractBills'",
-    
+    '@/hooks/useContractBills': '@/hooks/shared/useContractBills',
+    '@/hooks/useContractBillsSync': '@/hooks/shared/useContractBills',
+
     # Imagens
-    "from '@/hooks/useImageOptimizationGlobal'": "from '@/hooks/shared/useImageOptimizer'",
-    "from '@/hooks/useOptimizedImages'": "from '@/hooks/shared/useImageOptimizer'",
-    
+    '@/hooks/useImageOptimizationGlobal': '@/hooks/shared/useImageOptimizer',
+    '@/hooks/useOptimizedImages': '@/hooks/shared/useImageOptimizer',
+
     # Local Storage
-    "from '@/hooks/useLocalStorage'": "from '@/hooks/shared/useLocalStorage'",
-    
+    '@/hooks/useLocalStorage': '@/hooks/shared/useLocalStorage',
+
     # Auth
-    "from '@/hooks/useAuth'": "from '@/hooks/providers/useAuthProvider'",
-    
+    '@/hooks/useAuth': '@/hooks/providers/useAuthProvider',
+
     # API
-    "from '@/hooks/useOptimizedData'": "from '@/hooks/shared/useAPI'",
+    '@/hooks/useOptimizedData': '@/hooks/shared/useAPI',
 }
 
-# Hooks que devem ser removidos (arquivos)
+# Hooks que devem ser removidos (arquivos em src/hooks)
 HOOKS_TO_REMOVE = [
     'useContractData.ts',
-    'useContractsQuery.ts', 
+    'useContractsQuery.ts',
     'useCompleteContractData.tsx',
     'useContractAnalysis.tsx',
     'useContractBillsSync.ts',
@@ -47,106 +66,291 @@ HOOKS_TO_REMOVE = [
     'useOptimizedData.ts',
 ]
 
-def migrate_file_imports(file_path):
+SOURCE_EXTENSIONS = ('.ts', '.tsx', '.js', '.jsx')
+IGNORED_DIRS = {'node_modules', 'dist', 'build', '.git', 'coverage'}
+ALIAS_PREFIX = '@/'
+
+# Um único scanner: comentários e strings são consumidos inteiros, então nada dentro
+# deles é confundido com import; templates são tratados à parte por causa de ${}.
+TOKEN = re.compile(r"""
+    (?P<comment>//[^\n]*|/\*[\s\S]*?\*/)
+  | (?P<string>'(?:[^'\\\n]|\\.)*'|"(?:[^"\\\n]|\\.)*")
+  | (?P<template>`)
+  | (?P<word>[A-Za-z_$][\w$]*)
+  | (?P<punct>[{}()\[\].,;:=])
+""", re.VERBOSE)
+
+MOCK_CALLS = {'mock', 'doMock', 'unmock', 'importActual', 'importMock', 'requireActual'}
+
+
+class MappingTable:
+    """Mapeamentos compilados: dicionário para especificadores exatos e prefixos ordenados"""
+
+    def __init__(self, mappings: Dict[str, str]):
+        self.exact: Dict[str, str] = {}
+        self.prefixes: List[Tuple[str, str]] = []
+        for old, new in mappings.items():
+            if old.endswith('/*'):
+                self.prefixes.append((old[:-1], new[:-1] if new.endswith('/*') else new + '/'))
+            else:
+                self.exact[old] = new
+        self.prefixes.sort(key=lambda item: len(item[0]), reverse=True)
+
+    def lookup(self, specifier: str) -> Optional[str]:
+        found = self.exact.get(specifier)
+        if found is not None:
+            return found
+        for old, new in self.prefixes:
+            if specifier.startswith(old):
+                return new + specifier[len(old):]
+        return None
+
+
+def _skip_template(content: str, pos: int) -> int:
+    """Avança de um ` de abertura até depois do ` de fechamento, respeitando ${ ... }"""
+    i = pos + 1
+    n = len(content)
+    while i < n:
+        char = content[i]
+        if char == '\\':
+            i += 2
+            continue
+        if char == '`':
+            return i + 1
+        if char == '$' and i + 1 < n and content[i + 1] == '{':
+            depth = 1
+            i += 2
+            while i < n and depth:
+                match = TOKEN.match(content, i)
+                if match is None:
+                    i += 1
+                    continue
+                if match.lastgroup == 'template':
+                    i = _skip_template(content, i)
+                    continue
+                if match.lastgroup == 'punct':
+                    if match.group() == '{':
+                        depth += 1
+                    elif match.group() == '}':
+                        depth -= 1
+                i = match.end()
+            continue
+        i += 1
+    return n
+
+
+def find_specifiers(content: str) -> List[Tuple[int, int, str]]:
+    """(início, fim, valor) de cada string que é especificador de módulo"""
+    found = []
+    recent: List[str] = []  # últimos tokens significativos
+    pos = 0
+    n = len(content)
+    while pos < n:
+        match = TOKEN.search(content, pos)
+        if match is None:
+            break
+        kind = match.lastgroup
+        if kind == 'comment':
+            pos = match.end()
+            continue
+        if kind == 'template':
+            pos = _skip_template(content, match.start())
+            recent.append('`')
+            continue
+        if kind == 'string':
+            prev = recent[-1] if recent else ''
+            before = recent[-2] if len(recent) > 1 else ''
+            is_specifier = (
+                (prev in ('from', 'import') and before != '.')
+                or (prev == '(' and before in ('import', 'require') and
+                    (len(recent) < 3 or recent[-3] != '.'))
+                or (prev == '(' and before in MOCK_CALLS and len(recent) > 3 and
+                    recent[-3] == '.' and recent[-4] in ('vi', 'jest'))
+            )
+            if is_specifier:
+                found.append((match.start() + 1, match.end() - 1, match.group()[1:-1]))
+        recent.append(match.group())
+        if len(recent) > 8:
+            del recent[:-4]
+        pos = match.end()
+    return found
+
+
+def to_alias(file_path: str, specifier: str) -> str:
+    """'../hooks/useAuth' em src/pages/X.tsx -> '@/hooks/useAuth'"""
+    if not specifier.startswith('.'):
+        return specifier
+    target = posixpath.normpath(posixpath.join(posixpath.dirname(file_path), specifier))
+    if target.startswith('src/'):
+        return ALIAS_PREFIX + target[len('src/'):]
+    return specifier
+
+
+@dataclass
+class Edit:
+    line: int
+    old: str
+    new: str
+
+
+@dataclass
+class FileResult:
+    path: str
+    edits: List[Edit] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+_worker_state: Dict[str, object] = {}
+
+
+def _init_worker(project_root: str, mappings: Dict[str, str], dry_run: bool) -> None:
+    _worker_state['root'] = project_root
+    _worker_state['table'] = MappingTable(mappings)
+    _worker_state['dry_run'] = dry_run
+
+
+def migrate_file_imports(rel_path: str) -> FileResult:
     """Migra os imports de um arquivo específico."""
+    table: MappingTable = _worker_state['table']
+    full_path = os.path.join(_worker_state['root'], rel_path)
+    result = FileResult(rel_path)
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
+        with open(full_path, 'r', encoding='utf-8') as f:
             content = f.read()
-        
-        original_content = content
-        
-        # Aplicar mapeamentos de import
-        for old_import, new_import in IMPORT_MAPPINGS.items():
-            content = content.replace(old_import, new_import)
-        
-        # Atualizar import do useAuth (caso específico)
-        content = re.sub(
-            r"import\s*{\s*useAuth\s*}\s*from\s*['\"]@/hooks/useAuth['\"]",
-            "import { useAuth } from '@/hooks/providers/useAuthProvider'",
-            content
-        )
-        
-        # Atualizar import do useLocalStorage (caso específico)
-        content = re.sub(
-            r"import\s*{\s*useLocalStorage\s*}\s*from\s*['\"]@/hooks/useLocalStorage['\"]",
-            "import { useLocalStorage } from '@/hooks/shared/useLocalStorage'",
-            content
-        )
-        
-        # Salvar se houve mudanças
-        if content != original_content:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            print(f"✅ Atualizado: {file_path}")
-            return True
-        else:
-            print(f"⏭️  Nenhuma mudança: {file_path}")
-            return False
-            
-    except Exception as e:
-        print(f"❌ Erro ao processar {file_path}: {e}")
-        return False
+    except (OSError, UnicodeDecodeError) as e:
+        result.error = str(e)
+        return result
+
+    own_alias = ALIAS_PREFIX + os.path.splitext(rel_path[len('src/'):])[0] if rel_path.startswith('src/') else None
+    pieces = []
+    last = 0
+    for start, end, specifier in find_specifiers(content):
+        replacement = table.lookup(to_alias(rel_path, specifier))
+        # Não reescreve o próprio módulo consolidado para importar a si mesmo
+        if replacement is None or replacement == specifier or replacement == own_alias:
+            continue
+        pieces.append(content[last:start])
+        pieces.append(replacement)
+        last = end
+        result.edits.append(Edit(content.count('\n', 0, start) + 1, specifier, replacement))
+
+    if result.edits and not _worker_state['dry_run']:
+        pieces.append(content[last:])
+        try:
+            with open(full_path, 'w', encoding='utf-8') as f:
+                f.write(''.join(pieces))
+        except OSError as e:
+            result.error = str(e)
+    return result
+
+
+def find_source_files(project_root: Path) -> List[str]:
+    files = []
+    skipped = {f'src/hooks/{name}' for name in HOOKS_TO_REMOVE}
+    for root, dirs, names in os.walk(project_root / 'src'):
+        dirs[:] = [d for d in dirs if d not in IGNORED_DIRS]
+        for name in names:
+            if name.endswith(SOURCE_EXTENSIONS):
+                rel_path = os.path.relpath(os.path.join(root, name), project_root).replace('\\', '/')
+                # Pular arquivos que vamos remover
+                if rel_path not in skipped:
+                    files.append(rel_path)
+    return sorted(files)
+
+
+def migrate_project(project_root: Path, mappings: Dict[str, str], dry_run: bool = False,
+                    jobs: Optional[int] = None) -> List[FileResult]:
+    files = find_source_files(project_root)
+    jobs = jobs or os.cpu_count() or 1
+    if jobs <= 1:
+        _init_worker(str(project_root), mappings, dry_run)
+        return [migrate_file_imports(path) for path in files]
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                             initargs=(str(project_root), mappings, dry_run)) as executor:
+        return list(executor.map(migrate_file_imports, files, chunksize=32))
+
 
 def main():
     """Função principal de migração."""
+    parser = argparse.ArgumentParser(description='Migra imports de hooks antigos para os hooks consolidados')
+    parser.add_argument('--project-dir', default=str(Path(__file__).resolve().parent.parent),
+                        help='Diretório do projeto (padrão: pasta acima de scripts/)')
+    parser.add_argument('--mappings', default=None,
+                        help='Arquivo JSON {"especificador antigo": "novo"} usado no lugar da tabela padrão; '
+                             'chaves terminadas em "/*" casam por prefixo (ex.: "@/hooks/*": "@/hooks/shared/*")')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='Só mostra o que seria alterado')
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='Processos em paralelo (padrão: número de CPUs)')
+    parser.add_argument('--report', default=None,
+                        help='Grava as edições por arquivo em JSON')
+    parser.add_argument('--remove-old-hooks', action='store_true',
+                        help='Remove os hooks antigos depois da migração')
+    args = parser.parse_args()
+
     print("🚀 Iniciando migração de imports de hooks...")
-    
-    # Diretório do projeto
-    project_root = Path(__file__).parent / "src"
-    
-    if not project_root.exists():
-        print(f"❌ Diretório do projeto não encontrado: {project_root}")
+
+    project_root = Path(args.project_dir)
+    if not (project_root / 'src').exists():
+        print(f"❌ Diretório do projeto não encontrado: {project_root / 'src'}")
         return
-    
-    # Contadores
-    files_updated = 0
-    files_processed = 0
-    
-    # Processar todos os arquivos TypeScript/JavaScript/TSX/JSX
-    for file_path in project_root.rglob("*.{ts,tsx,js,jsx}"):
-        # Pular arquivos de hooks consolidados e node_modules
-        if 'node_modules' in str(file_path) or 'dist' in str(file_path) or 'build' in str(file_path):
-            continue
-            
-        # Pular arquivos que vamos remover
-        if file_path.name in HOOKS_TO_REMOVE:
-            continue
-            
-        files_processed += 1
-        if migrate_file_imports(file_path):
-            files_updated += 1
-    
+
+    mappings = IMPORT_MAPPINGS
+    if args.mappings:
+        with open(args.mappings, 'r', encoding='utf-8') as f:
+            mappings = json.load(f)
+
+    results = migrate_project(project_root, mappings, dry_run=args.dry_run, jobs=args.jobs)
+    updated = [r for r in results if r.edits]
+    errors = [r for r in results if r.error]
+
+    for result in updated:
+        verb = 'Seria atualizado' if args.dry_run else 'Atualizado'
+        print(f"✅ {verb}: {result.path}")
+        for edit in result.edits:
+            print(f"      L{edit.line}: '{edit.old}' → '{edit.new}'")
+    for result in errors:
+        print(f"❌ Erro ao processar {result.path}: {result.error}")
+
+    total_edits = sum(len(r.edits) for r in updated)
     print(f"\n📊 Relatório da migração:")
-    print(f"   - Arquivos processados: {files_processed}")
-    print(f"   - Arquivos atualizados: {files_updated}")
-    print(f"   - Taxa de atualização: {(files_updated/files_processed*100):.1f}%" if files_processed > 0 else "   - Nenhum arquivo processado")
-    
-    # Oferecer para remover hooks antigos
-    print(f"\n🗑️  Hooks antigos identificados para remoção:")
-    for hook in HOOKS_TO_REMOVE:
-        hook_path = project_root / "hooks" / hook
-        if hook_path.exists():
+    print(f"   - Arquivos processados: {len(results)}")
+    print(f"   - Arquivos atualizados: {len(updated)}")
+    print(f"   - Especificadores reescritos: {total_edits}")
+    if results:
+        print(f"   - Taxa de atualização: {(len(updated) / len(results) * 100):.1f}%")
+
+    if args.report:
+        os.makedirs(os.path.dirname(os.path.abspath(args.report)), exist_ok=True)
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump({'dry_run': args.dry_run, 'files': [asdict(r) for r in updated + errors]},
+                      f, ensure_ascii=False, indent=2)
+        print(f"   - Edições gravadas em {args.report}")
+
+    hooks_dir = project_root / 'src' / 'hooks'
+    remaining = [hook for hook in HOOKS_TO_REMOVE if (hooks_dir / hook).exists()]
+    if remaining:
+        print(f"\n🗑️  Hooks antigos identificados para remoção:")
+        for hook in remaining:
             print(f"   - {hook}")
-    
-    print(f"\n📝 Próximos passos:")
-    print(f"   1. Revise os arquivos atualizados")
-    print(f"   2. Execute os testes para verificar compatibilidade")
-    print(f"   3. Remova os hooks antigos se tudo estiver funcionando")
-    print(f"   4. Atualize a documentação se necessário")
-    
-    response = input(f"\n🤔 Deseja remover os hooks antigos agora? (y/N): ").strip().lower()
-    if response == 'y':
-        remove_old_hooks(project_root)
+
+    if args.remove_old_hooks and not args.dry_run:
+        remove_old_hooks(hooks_dir)
     else:
-        print("⏸️  Migração concluída sem remoção. Você pode remover os hooks manualmente mais tarde.")
+        print(f"\n📝 Próximos passos:")
+        print(f"   1. Revise os arquivos atualizados")
+        print(f"   2. Execute os testes para verificar compatibilidade")
+        print(f"   3. Remova os hooks antigos com --remove-old-hooks se tudo estiver funcionando")
+        print(f"   4. Atualize a documentação se necessário")
+
 
-def remove_old_hooks(project_root):
-    """Remove os hooks antigos após confirmação."""
+def remove_old_hooks(hooks_dir):
+    """Remove os hooks antigos."""
     print("\n🗑️  Removendo hooks antigos...")
-    
+
     removed_count = 0
     for hook in HOOKS_TO_REMOVE:
-        hook_path = project_root / "hooks" / hook
+        hook_path = hooks_dir / hook
         if hook_path.exists():
             try:
                 hook_path.unlink()
@@ -154,9 +358,10 @@ def remove_old_hooks(project_root):
                 removed_count += 1
             except Exception as e:
                 print(f"   ❌ Erro ao remover {hook}: {e}")
-    
+
     print(f"\n📊 {removed_count} hooks antigos removidos com sucesso!")
     print(f"🎉 Migração de hooks concluída!")
 
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,447 @@
+#!/usr/bin/env python3
+"""
+Analisador de Assinaturas dos Stores - Doc Forge Buddy
+Encontra todos os consumidores dos stores de src/stores (appStore, contractStore,
+notificationStore), seguindo os hooks seletores até os componentes, e classifica
+cada assinatura como estado inteiro, seletor estreito ou somente ações.
+
+A Context API não tem bailout por seletor: quando o ``value`` do provider muda,
+todo consumidor re-renderiza, mesmo que só leia uma fatia do estado. Um consumidor
+que não lê todas as fatias re-renderiza em atualizações que não lhe dizem respeito.
+"""
+
+import argparse
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from symbol_index import SymbolIndex, ModuleInfo, is_test_file
+from ts_scopes import SourceView, FunctionScope
+
+STORES_DIR = 'src/stores/'
+MAX_PASSES = 8
+DEPENDENCY_HOOKS = {'useMemo', 'useCallback', 'useEffect', 'useLayoutEffect'}
+
+
+@dataclass
+class StoreInfo:
+    name: str
+    file_path: str
+    context: str
+    base_hooks: Set[str]
+    slices: List[str]
+    state_key: Optional[str]  # membro do value que guarda o estado ('state'); None se o value é o estado
+    action_keys: List[str] = field(default_factory=list)
+
+
+@dataclass
+class ReadSet:
+    fields: Set[str] = field(default_factory=set)
+    whole: bool = False
+    actions: bool = False
+
+    def merge(self, other: 'ReadSet') -> bool:
+        before = (len(self.fields), self.whole, self.actions)
+        self.fields |= other.fields
+        self.whole = self.whole or other.whole
+        self.actions = self.actions or other.actions
+        return before != (len(self.fields), self.whole, self.actions)
+
+
+@dataclass
+class Subscriber:
+    file_path: str
+    name: str
+    line: int
+    store: str
+    reads: ReadSet
+    via: Set[str] = field(default_factory=set)
+    is_hook: bool = False
+
+    def classification(self, slices: List[str]) -> str:
+        if self.reads.whole or (slices and set(slices) <= self.reads.fields):
+            return 'estado inteiro'
+        if not self.reads.fields:
+            return 'somente ações'
+        return 'seletor estreito'
+
+    def rerenders_unrelated(self, slices: List[str]) -> bool:
+        return self.classification(slices) != 'estado inteiro'
+
+
+class StoreSubscriptionAnalyzer:
+    """Consumidores de cada store e a fatia do estado que realmente leem"""
+
+    def __init__(self, project_root: str, index: Optional[SymbolIndex] = None, include_tests: bool = False):
+        self.project_root = Path(project_root)
+        self.index = index
+        self.include_tests = include_tests
+        self.stores: Dict[str, StoreInfo] = {}
+        # (arquivo, hook) -> store -> ReadSet; None = devolve o value do contexto inteiro
+        self.hooks: Dict[Tuple[str, str], Dict[str, Optional[ReadSet]]] = {}
+        self.subscribers: Dict[Tuple[str, str, str], Subscriber] = {}
+
+    # ------------------------------------------------------------- auxiliares
+    def type_members(self, view: SourceView, open_index: int) -> Dict[str, int]:
+        """Membros de primeiro nível de um ``{ ... }`` de tipo -> índice do início do tipo do membro"""
+        members = {}
+        close = view.brackets[open_index]
+        k = open_index + 1
+        expect = True
+        while 0 < k < close:
+            value = view.value(k)
+            if value in ('(', '[', '{', '<') and view.brackets[k] > k:
+                k = view.brackets[k] + 1
+                continue
+            if value in (';', ','):
+                expect = True
+            elif expect and view.tokens[k].kind in ('name', 'string'):
+                colon = k + 2 if view.value(k + 1) == '?' else k + 1
+                if view.value(colon) in (':', '('):
+                    members[view.value(k).strip('\'"')] = colon + 1
+                expect = False
+            elif view.tokens[k].line > view.tokens[k - 1].line and view.tokens[k].kind == 'name':
+                # membros separados só por quebra de linha
+                colon = k + 2 if view.value(k + 1) == '?' else k + 1
+                if view.value(colon) == ':':
+                    members[view.value(k)] = colon + 1
+            k += 1
+        return members
+
+    def find_type(self, path: str, name: str) -> Optional[Tuple[SourceView, int]]:
+        """``interface Nome {`` ou ``type Nome = {`` no próprio arquivo ou no módulo de onde é importado"""
+        module = self.index.modules.get(path)
+        if module is None:
+            return None
+        origin, origin_name = self.index.resolve_local(module, name)
+        for candidate, wanted in ((path, name), (origin, origin_name)):
+            if candidate not in self.index.modules:
+                continue
+            view = self.index.view(candidate)
+            for k in range(len(view.tokens) - 2):
+                if view.value(k) in ('interface', 'type') and view.value(k + 1) == wanted:
+                    j = k + 2
+                    while j < len(view.tokens) and view.value(j) != '{':
+                        j += 1
+                    if j < len(view.tokens) and view.brackets[j] > j:
+                        return view, j
+        return None
+
+    def members_of(self, view: SourceView, type_start: int) -> Optional[Tuple[SourceView, Dict[str, int]]]:
+        """Membros do tipo que começa em ``type_start`` (literal ``{...}`` ou nome de interface)"""
+        if view.value(type_start) == '{':
+            return view, self.type_members(view, type_start)
+        if view.tokens[type_start].kind == 'name':
+            found = self.find_type(view.path, view.value(type_start))
+            if found is not None:
+                return found[0], self.type_members(*found)
+        return None
+
+    # ---------------------------------------------------------------- stores
+    def discover_stores(self) -> None:
+        for path in sorted(self.index.modules):
+            if not path.startswith(STORES_DIR) or not path.endswith('.tsx'):
+                continue
+            view = self.index.view(path)
+            tokens = view.tokens
+            for k in range(len(tokens) - 3):
+                if view.value(k) != 'createContext' or view.value(k - 1) != '=' or view.value(k + 1) != '<':
+                    continue
+                context = view.value(k - 2)
+                state_key = None
+                slices: List[str] = []
+                actions: List[str] = []
+                value_type = self.members_of(view, k + 2)
+                if value_type is not None:
+                    type_view, members = value_type
+                    if 'state' in members:
+                        state_key = 'state'
+                        actions = [m for m in members if m != 'state']
+                        state_type = self.members_of(type_view, members['state'])
+                        slices = list(state_type[1]) if state_type is not None else []
+                    else:
+                        slices = list(members)
+                base = set()
+                for j in range(len(tokens) - 2):
+                    if view.value(j) == 'useContext' and view.value(j + 2) == context:
+                        scope = view.scopes.named_ancestor(view.scopes.enclosing(j))
+                        if scope is not None:
+                            base.add(scope.name)
+                name = Path(path).stem
+                self.stores[name] = StoreInfo(name, path, context, base, slices, state_key, actions)
+                for hook in base:
+                    self.hooks[(path, hook)] = {name: None}
+
+    # ------------------------------------------------------------ leitura
+    def _scope_of(self, view: SourceView, k: int) -> Optional[FunctionScope]:
+        return view.scopes.named_ancestor(view.scopes.enclosing(k))
+
+    def _pattern_reads(self, view: SourceView, open_index: int, store: StoreInfo, level: str,
+                       scope: FunctionScope) -> ReadSet:
+        """Leituras de um padrão de desestruturação ``{ a, b: { c } }`` aplicado ao store ou ao estado"""
+        reads = ReadSet()
+        for key, (start, end) in view.object_properties(open_index).items():
+            if key.startswith('...'):
+                reads.whole = True
+                continue
+            if level == 'store' and key != store.state_key:
+                reads.actions = True
+                continue
+            if level == 'store':
+                if view.value(start) == '{':
+                    reads.merge(self._pattern_reads(view, start, store, 'state', scope))
+                else:
+                    reads.merge(self._local_reads(view, scope, view.value(start), start, store, 'state'))
+            else:
+                reads.fields.add(key)
+        return reads
+
+    def _local_reads(self, view: SourceView, scope: FunctionScope, local: str, declared: int,
+                     store: StoreInfo, level: str) -> ReadSet:
+        """Leituras feitas através da variável ``local`` (store inteiro ou estado) dentro da função"""
+        reads = ReadSet()
+        for k in range(declared + 1, scope.body_end):
+            if view.value(k) != local or view.value(k - 1) in ('.', '?.') or view.tokens[k].kind != 'name':
+                continue
+            if view.value(k + 1) == ':' and view.value(k - 1) in ('{', ','):
+                continue  # chave de objeto
+            if self._in_dependency_array(view, k):
+                continue
+            reads.merge(self._access_reads(view, k, store, level, scope))
+        return reads
+
+    def _in_dependency_array(self, view: SourceView, k: int) -> bool:
+        """``k`` está no array de dependências de useMemo/useCallback/useEffect"""
+        opener = view.opener(k)
+        if view.value(opener) != '[' or view.value(view.brackets[opener] + 1) != ')':
+            return False
+        paren = view.brackets[view.brackets[opener] + 1]
+        return view.value(paren - 1) in DEPENDENCY_HOOKS
+
+    def _access_reads(self, view: SourceView, k: int, store: StoreInfo, level: str,
+                      scope: FunctionScope) -> ReadSet:
+        """Leitura a partir de uma expressão que vale o store (``level='store'``) ou o estado em ``k``"""
+        reads = ReadSet()
+        if level == 'store' and store.state_key is None:
+            level = 'state'
+        if view.value(k + 1) in ('.', '?.') and view.tokens[k + 2].kind == 'name':
+            member = view.value(k + 2)
+            if level == 'store':
+                if member != store.state_key:
+                    reads.actions = True
+                    return reads
+                return self._access_reads(view, k + 2, store, 'state', scope)
+            reads.fields.add(member)
+            return reads
+        if view.value(k + 1) == '[':
+            reads.whole = True
+            return reads
+        # const { ... } = expr / const x = expr
+        start = k
+        while view.value(start - 1) in ('.', '?.'):
+            start -= 2
+        ends = view.value(k + 1) in (';', '') or view.tokens[k + 1].line > view.tokens[k].line
+        if view.value(start - 1) == '=' and ends:
+            target = start - 2
+            if view.value(target) == '}' and view.brackets[target] >= 0:
+                return self._pattern_reads(view, view.brackets[target], store, level, scope)
+            if view.tokens[target].kind == 'name' and view.value(target - 1) in ('const', 'let'):
+                return self._local_reads(view, scope, view.value(target), target, store, level)
+        reads.whole = True  # repassado, retornado ou espalhado: depende do estado inteiro
+        return reads
+
+    def call_reads(self, view: SourceView, name_index: int, store: StoreInfo, scope: FunctionScope) -> ReadSet:
+        """Leituras a partir de uma chamada ao hook base (que devolve o value do contexto)"""
+        close = view.brackets[name_index + 1]
+        if view.value(close + 1) in ('.', '?.'):
+            return self._access_reads(view, close, store, 'store', scope)
+        if view.value(name_index - 1) == '=':
+            target = name_index - 2
+            while target > 0 and view.in_type[target]:
+                target -= 1
+            if view.value(target) == ':':
+                target -= 1
+            if view.value(target) == '}' and view.brackets[target] >= 0:
+                return self._pattern_reads(view, view.brackets[target], store, 'store', scope)
+            if view.tokens[target].kind == 'name':
+                return self._local_reads(view, scope, view.value(target), close, store, 'store')
+        return ReadSet(whole=True)
+
+    # -------------------------------------------------------------- varredura
+    def _callable_names(self, module: ModuleInfo) -> Dict[str, Tuple[str, str]]:
+        """Nomes locais do módulo que chamam hooks conhecidos"""
+        names = {}
+        for statement in module.imports:
+            for binding in statement.bindings:
+                if module.value_usages.get(binding.local, 0):
+                    key = self.index.resolve_local(module, binding.local)
+                    if key in self.hooks:
+                        names[binding.local] = key
+        for path, hook in self.hooks:
+            if path == module.path:
+                names[hook] = (path, hook)
+        return names
+
+    def scan_pass(self) -> bool:
+        changed = False
+        for path, module in self.index.modules.items():
+            if not self.include_tests and is_test_file(path):
+                continue
+            names = self._callable_names(module)
+            if not names:
+                continue
+            view = self.index.view(path)
+            for k, token in enumerate(view.tokens):
+                if token.kind != 'name' or token.value not in names or view.value(k + 1) != '(' \
+                        or view.value(k - 1) in ('.', '?.', 'function', 'const') or view.brackets[k + 1] < 0:
+                    continue
+                scope = self._scope_of(view, k)
+                key = names[token.value]
+                if scope is None or (path, scope.name) == key:
+                    continue
+                for store_name, hook_reads in self.hooks[key].items():
+                    store = self.stores[store_name]
+                    reads = self.call_reads(view, k, store, scope) if hook_reads is None else hook_reads
+                    sub_key = (path, scope.name, store_name)
+                    if sub_key not in self.subscribers:
+                        self.subscribers[sub_key] = Subscriber(path, scope.name, scope.line, store_name, ReadSet(),
+                                                               is_hook=scope.name.startswith('use'))
+                        changed = True
+                    subscriber = self.subscribers[sub_key]
+                    subscriber.via.add(token.value)
+                    changed = subscriber.reads.merge(reads) or changed
+                    if subscriber.is_hook and store_name not in self.hooks.get((path, scope.name), {}):
+                        self.hooks.setdefault((path, scope.name), {})[store_name] = subscriber.reads
+                        changed = True
+        return changed
+
+    def run_analysis(self) -> Dict[str, List[Subscriber]]:
+        print("🔍 Indexando módulos...")
+        if self.index is None:
+            self.index = SymbolIndex(str(self.project_root)).build()
+        self.discover_stores()
+        print(f"🗄️ {len(self.stores)} stores: {', '.join(sorted(self.stores))}")
+
+        print("🔗 Seguindo hooks seletores até os componentes...")
+        for _ in range(MAX_PASSES):
+            if not self.scan_pass():
+                break
+
+        by_store = self.by_store()
+        for name, subscribers in by_store.items():
+            components = [s for s in subscribers if not s.is_hook]
+            slices = self.stores[name].slices
+            wasted = sum(1 for s in components if s.rerenders_unrelated(slices))
+            print(f"   {name}: {len(components)} componentes assinantes, {wasted} re-renderizam sem necessidade")
+        return by_store
+
+    def by_store(self) -> Dict[str, List[Subscriber]]:
+        grouped: Dict[str, List[Subscriber]] = {name: [] for name in self.stores}
+        for subscriber in self.subscribers.values():
+            grouped[subscriber.store].append(subscriber)
+        for subscribers in grouped.values():
+            subscribers.sort(key=lambda s: (s.is_hook, s.file_path, s.line))
+        return grouped
+
+    # -------------------------------------------------------------- relatório
+    def _describe(self, subscriber: Subscriber, store: StoreInfo) -> str:
+        parts = []
+        if subscriber.reads.whole:
+            parts.append('estado inteiro')
+        elif subscriber.reads.fields:
+            parts.append(', '.join(f"`{f}`" for f in sorted(subscriber.reads.fields)))
+        if subscriber.reads.actions:
+            parts.append('ações')
+        return ' + '.join(parts) or '-'
+
+    def generate_report(self, output_file: str) -> None:
+        by_store = self.by_store()
+        report = f"""# Assinaturas dos Stores - Doc Forge Buddy
+
+**Data da análise:** {datetime.now().strftime('%d/%m/%Y %H:%M')}
+**Stores analisados:** {len(self.stores)}
+**Componentes assinantes:** {len({(s.file_path, s.name) for s in self.subscribers.values() if not s.is_hook})}
+**Hooks seletores:** {len({(s.file_path, s.name) for s in self.subscribers.values() if s.is_hook})}
+
+> A Context API não tem bailout por seletor: todo consumidor re-renderiza quando o `value` do
+> provider muda. Um assinante que não lê todas as fatias re-renderiza em atualizações que não usa.
+
+## 📊 Resumo por Store
+
+| Store | Fatias do estado | Assinantes | Estado inteiro | Seletor estreito | Somente ações | Re-render sem necessidade |
+|-------|------------------|------------|----------------|------------------|---------------|---------------------------|
+"""
+        for name, subscribers in by_store.items():
+            store = self.stores[name]
+            components = [s for s in subscribers if not s.is_hook]
+            counts = defaultdict(int)
+            for subscriber in components:
+                counts[subscriber.classification(store.slices)] += 1
+            wasted = sum(1 for s in components if s.rerenders_unrelated(store.slices))
+            fraction = f"{wasted}/{len(components)} ({wasted / len(components) * 100:.0f}%)" if components else '-'
+            report += (f"| `{name}` | {len(store.slices)} | {len(components)} | {counts['estado inteiro']} | "
+                       f"{counts['seletor estreito']} | {counts['somente ações']} | {fraction} |\n")
+
+        for name, subscribers in by_store.items():
+            store = self.stores[name]
+            report += f"\n## 🗄️ {name}\n\n"
+            report += f"**Arquivo:** `{store.file_path}` — contexto `{store.context}`, hooks base: "
+            report += ', '.join(f"`{hook}`" for hook in sorted(store.base_hooks)) + "\n"
+            if store.slices:
+                report += f"**Fatias:** {', '.join(f'`{s}`' for s in store.slices)}\n"
+            components = [s for s in subscribers if not s.is_hook]
+            hooks = [s for s in subscribers if s.is_hook]
+            if components:
+                report += "\n| Componente | Arquivo | Lê | Via | Classificação |\n"
+                report += "|------------|---------|----|-----|---------------|\n"
+                for subscriber in components:
+                    classification = subscriber.classification(store.slices)
+                    icon = '✅' if classification == 'estado inteiro' else '⚠️'
+                    report += (f"| `{subscriber.name}` | `{subscriber.file_path}`:{subscriber.line} | "
+                               f"{self._describe(subscriber, store)} | {', '.join(sorted(subscriber.via))} | "
+                               f"{icon} {classification} |\n")
+            else:
+                report += "\nNenhum componente assina este store.\n"
+            if hooks:
+                report += "\n| Hook seletor | Arquivo | Lê | Via |\n|--------------|---------|----|-----|\n"
+                for subscriber in hooks:
+                    report += (f"| `{subscriber.name}` | `{subscriber.file_path}`:{subscriber.line} | "
+                               f"{self._describe(subscriber, store)} | {', '.join(sorted(subscriber.via))} |\n")
+
+        report += """
+## 💡 Recomendações
+
+1. **Separe estado e ações em contextos distintos**: assinantes "somente ações" deixam de re-renderizar
+2. **Divida o appStore por fatia** (auth, theme, notifications) ou use um store com seletores (`useSyncExternalStore`)
+3. **Memoize o `value` dos providers** com `useMemo` para não invalidar assinantes a cada render do provider
+4. **Hooks seletores com `useMemo` não evitam o re-render**: o `useContext` interno já agenda a atualização
+5. **Priorize os componentes das páginas de contratos** que assinam `contractStore` com seletor estreito
+
+---
+*Relatório gerado automaticamente pelo analisador de assinaturas dos stores*
+"""
+        Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(report)
+        print(f"📄 Relatório salvo em: {output_file}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Analisador de assinaturas dos stores (Context API)')
+    parser.add_argument('--project-dir', default='/workspace/doc-forge-buddy-Cain',
+                        help='Diretório do projeto')
+    parser.add_argument('--output', default='docs/analise_assinaturas_store.md',
+                        help='Arquivo de saída do relatório')
+    parser.add_argument('--include-tests', action='store_true',
+                        help='Inclui arquivos de teste')
+    args = parser.parse_args()
+
+    analyzer = StoreSubscriptionAnalyzer(args.project_dir, include_tests=args.include_tests)
+    analyzer.run_analysis()
+    analyzer.generate_report(args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,466 @@
+#!/usr/bin/env python3
+"""
+Detector de Código Duplicado (clones) - Doc Forge Buddy
+Encontra trechos duplicados comparando fluxos de tokens normalizados: identificadores
+viram ``I``, números ``N`` e strings/templates/regex ``S``, de modo que cópias com
+nomes ou literais trocados também são detectadas (clones tipo 2). Declarações de
+import são ignoradas.
+
+Cada arquivo gera impressões digitais por *winnowing* (Schleimer et al.): hashes
+Karp-Rabin de k-gramas de tokens, dos quais só o mínimo de cada janela é mantido.
+As impressões vão para um índice hash -> ocorrências; trechos em comum aparecem como
+sequências de impressões na mesma diagonal (mesmo deslocamento entre dois arquivos),
+que são estendidas token a token e agrupadas em classes de clones. Nunca há
+comparação arquivo a arquivo.
+
+Analisa TypeScript/JavaScript com o ``ts_tokenizer`` e Python com o ``tokenize``.
+"""
+
+import argparse
+import fnmatch
+import io
+import keyword
+import os
+import time
+import tokenize as py_tokenize
+import zlib
+from array import array
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from ts_tokenizer import KEYWORDS, is_jsx_file, tokenize
+
+TS_EXTENSIONS = ('.ts', '.tsx', '.js', '.jsx', '.mjs', '.cjs')
+PY_EXTENSIONS = ('.py',)
+SKIPPED_DIRS = {'node_modules', 'dist', 'build', 'coverage', '.git', '__pycache__', '.next', 'public', 'playwright-report'}
+HASH_BASE = 1_000_003
+HASH_MOD = (1 << 61) - 1
+
+
+@dataclass
+class FileTokens:
+    path: str
+    ids: array  # token normalizado -> crc32
+    lines: array  # linha de cada token
+    fingerprints: List[Tuple[int, int]]  # (hash, posição do k-grama)
+    loc: int
+
+
+@dataclass
+class Fragment:
+    file: int
+    start: int  # índice do primeiro token
+    end: int  # índice após o último token
+
+
+@dataclass
+class CloneClass:
+    fragments: List[Fragment] = field(default_factory=list)
+    tokens: int = 0
+
+
+# ----------------------------------------------------------------- normalização
+def normalize_ts(source: str, jsx: bool) -> List[Tuple[str, int]]:
+    """Tokens TypeScript/JavaScript abstraídos, sem comentários e sem imports"""
+    tokens = tokenize(source, jsx=jsx)
+    normalized: List[Tuple[str, int]] = []
+    i, count = 0, len(tokens)
+    while i < count:
+        token = tokens[i]
+        kind, value = token.kind, token.value
+        if kind == 'name' and value == 'import' and (i + 1 < count and tokens[i + 1].value not in ('(', '.')):
+            # import ... from '...';  |  import '...';
+            j = i + 1
+            while j < count and tokens[j].kind != 'string':
+                j += 1
+            i = j + 1
+            if i < count and tokens[i].value == ';':
+                i += 1
+            continue
+        if kind == 'name':
+            normalized.append((value if value in KEYWORDS else 'I', token.line))
+        elif kind == 'number':
+            normalized.append(('N', token.line))
+        elif kind in ('string', 'template', 'regex', 'jsx_text'):
+            normalized.append(('S', token.line))
+        else:
+            normalized.append((value, token.line))
+        i += 1
+    return normalized
+
+
+def normalize_py(source: str) -> List[Tuple[str, int]]:
+    """Tokens Python abstraídos; blocos viram ``{``/``}`` e imports são ignorados"""
+    normalized: List[Tuple[str, int]] = []
+    skip_line = 0
+    fstring_depth = 0
+    try:
+        for token in py_tokenize.generate_tokens(io.StringIO(source).readline):
+            kind, value, line = token.type, token.string, token.start[0]
+            if kind == getattr(py_tokenize, 'FSTRING_START', -1):
+                if fstring_depth == 0:
+                    normalized.append(('S', line))
+                fstring_depth += 1
+                continue
+            if kind == getattr(py_tokenize, 'FSTRING_END', -1):
+                fstring_depth -= 1
+                continue
+            if fstring_depth or line == skip_line:
+                continue
+            if kind == py_tokenize.NAME:
+                if value in ('import', 'from') and token.line[:token.start[1]].strip() == '':
+                    skip_line = line
+                    continue
+                normalized.append((value if keyword.iskeyword(value) else 'I', line))
+            elif kind == py_tokenize.NUMBER:
+                normalized.append(('N', line))
+            elif kind == py_tokenize.STRING:
+                normalized.append(('S', line))
+            elif kind == py_tokenize.OP:
+                normalized.append((value, line))
+            elif kind == py_tokenize.INDENT:
+                normalized.append(('{', line))
+            elif kind == py_tokenize.DEDENT:
+                normalized.append(('}', line))
+            elif kind == py_tokenize.NEWLINE:
+                normalized.append((';', line))
+    except (py_tokenize.TokenError, IndentationError, SyntaxError):
+        pass
+    return normalized
+
+
+# ---------------------------------------------------------------- fingerprints
+def winnow(ids: array, k: int, window: int) -> List[Tuple[int, int]]:
+    """Hashes Karp-Rabin dos k-gramas e seleção do mínimo (mais à direita) por janela"""
+    if len(ids) < k:
+        return []
+    power = pow(HASH_BASE, k - 1, HASH_MOD)
+    value = 0
+    for token_id in ids[:k]:
+        value = (value * HASH_BASE + token_id) % HASH_MOD
+    hashes = [value]
+    for i in range(k, len(ids)):
+        value = ((value - ids[i - k] * power) * HASH_BASE + ids[i]) % HASH_MOD
+        hashes.append(value)
+
+    if len(hashes) <= window:
+        position = min(range(len(hashes)), key=lambda p: (hashes[p], -p))
+        return [(hashes[position], position)]
+    fingerprints: List[Tuple[int, int]] = []
+    candidates: List[int] = []  # deque monotônica de posições (lista + cabeça)
+    head = 0
+    last = -1
+    for position, value in enumerate(hashes):
+        while len(candidates) > head and hashes[candidates[-1]] >= value:
+            candidates.pop()
+        candidates.append(position)
+        if candidates[head] <= position - window:
+            head += 1
+        if position >= window - 1 and candidates[head] != last:
+            last = candidates[head]
+            fingerprints.append((hashes[last], last))
+        if head > 4096:
+            del candidates[:head]
+            head = 0
+    return fingerprints
+
+
+_worker_state: Dict[str, int] = {}
+
+
+def _init_worker(k: int, window: int) -> None:
+    _worker_state['k'] = k
+    _worker_state['window'] = window
+
+
+def _fingerprint_job(job: Tuple[str, str]) -> Optional[FileTokens]:
+    rel_path, full_path = job
+    try:
+        with open(full_path, 'r', encoding='utf-8') as f:
+            source = f.read()
+    except (OSError, UnicodeDecodeError):
+        return None
+    if full_path.endswith(PY_EXTENSIONS):
+        normalized = normalize_py(source)
+    else:
+        normalized = normalize_ts(source, jsx=is_jsx_file(full_path) or full_path.endswith('.js'))
+    ids = array('q', (zlib.crc32(value.encode('utf-8')) for value, _ in normalized))
+    lines = array('l', (line for _, line in normalized))
+    loc = sum(1 for line in source.splitlines() if line.strip())
+    return FileTokens(rel_path, ids, lines, winnow(ids, _worker_state['k'], _worker_state['window']), loc)
+
+
+class CloneDetector:
+    """Índice de impressões digitais e agrupamento em classes de clones"""
+
+    def __init__(self, roots: List[str], base_dir: str, min_tokens: int = 60, k: int = 20,
+                 excludes: Optional[List[str]] = None, max_bucket: int = 64, jobs: Optional[int] = None):
+        self.roots = roots
+        self.base_dir = base_dir
+        self.min_tokens = min_tokens
+        self.k = min(k, min_tokens)
+        self.window = min_tokens - self.k + 1  # garante uma impressão em todo trecho de min_tokens
+        self.excludes = excludes or []
+        self.max_bucket = max_bucket
+        self.jobs = jobs or os.cpu_count() or 1
+        self.files: List[FileTokens] = []
+        self.classes: List[CloneClass] = []
+        self.stats = {'files': 0, 'loc': 0, 'tokens': 0, 'fingerprints': 0, 'buckets': 0,
+                      'skipped_buckets': 0, 'pairs': 0, 'seconds': 0.0}
+
+    # ----------------------------------------------------------------- arquivos
+    def find_files(self) -> List[Tuple[str, str]]:
+        jobs = []
+        for root in self.roots:
+            for current, dirs, files in os.walk(root):
+                dirs[:] = [d for d in dirs if d not in SKIPPED_DIRS and not d.startswith('.')]
+                for name in files:
+                    if not name.endswith(TS_EXTENSIONS + PY_EXTENSIONS) or name.endswith('.d.ts'):
+                        continue
+                    full_path = os.path.join(current, name)
+                    rel_path = os.path.relpath(full_path, self.base_dir)
+                    if any(fnmatch.fnmatch(rel_path, pattern) for pattern in self.excludes):
+                        continue
+                    jobs.append((rel_path, full_path))
+        return sorted(set(jobs))
+
+    def fingerprint_files(self, jobs: List[Tuple[str, str]]) -> None:
+        if self.jobs <= 1 or len(jobs) < 16:
+            _init_worker(self.k, self.window)
+            results = [_fingerprint_job(job) for job in jobs]
+        else:
+            with ProcessPoolExecutor(max_workers=self.jobs, initializer=_init_worker,
+                                     initargs=(self.k, self.window)) as executor:
+                results = list(executor.map(_fingerprint_job, jobs, chunksize=16))
+        self.files = [r for r in results if r is not None and len(r.ids) >= self.min_tokens]
+        self.stats['files'] = len(self.files)
+        self.stats['loc'] = sum(f.loc for f in self.files)
+        self.stats['tokens'] = sum(len(f.ids) for f in self.files)
+        self.stats['fingerprints'] = sum(len(f.fingerprints) for f in self.files)
+
+    # ------------------------------------------------------------------ clones
+    def _matches(self) -> Dict[Tuple[int, int, int], List[int]]:
+        """(arquivo A, arquivo B, deslocamento) -> posições em A com impressão em comum"""
+        index: Dict[int, List[Tuple[int, int]]] = defaultdict(list)
+        for file_id, tokens in enumerate(self.files):
+            for value, position in tokens.fingerprints:
+                index[value].append((file_id, position))
+
+        diagonals: Dict[Tuple[int, int, int], List[int]] = defaultdict(list)
+        for occurrences in index.values():
+            if len(occurrences) < 2:
+                continue
+            self.stats['buckets'] += 1
+            if len(occurrences) > self.max_bucket:
+                self.stats['skipped_buckets'] += 1  # boilerplate repetido em todo lugar
+                continue
+            for i, (file_a, pos_a) in enumerate(occurrences):
+                for file_b, pos_b in occurrences[i + 1:]:
+                    if file_a == file_b and pos_a == pos_b:
+                        continue
+                    if (file_b, pos_b) < (file_a, pos_a):
+                        file_a, pos_a, file_b, pos_b = file_b, pos_b, file_a, pos_a
+                    diagonals[(file_a, file_b, pos_b - pos_a)].append(pos_a)
+        return diagonals
+
+    def _extend(self, file_a: int, file_b: int, offset: int, start: int, end: int) -> Tuple[int, int]:
+        """Estende o trecho [start, end) de A (e A+offset em B) enquanto os tokens forem iguais"""
+        ids_a, ids_b = self.files[file_a].ids, self.files[file_b].ids
+        limit_low = max(0, -offset)
+        while start > limit_low and ids_a[start - 1] == ids_b[start - 1 + offset]:
+            start -= 1
+        limit_high = min(len(ids_a), len(ids_b) - offset)
+        if file_a == file_b:
+            limit_high = min(limit_high, start + offset)  # sem sobreposição consigo mesmo
+        while end < limit_high and ids_a[end] == ids_b[end + offset]:
+            end += 1
+        return start, end
+
+    def _pairs(self) -> List[Tuple[Fragment, Fragment]]:
+        pairs = []
+        for (file_a, file_b, offset), positions in self._matches().items():
+            positions.sort()
+            run_start = previous = positions[0]
+            for position in positions[1:] + [None]:
+                if position is not None and position - previous <= self.window:
+                    previous = position
+                    continue
+                start, end = self._extend(file_a, file_b, offset, run_start, run_start)
+                if end - start >= self.min_tokens:
+                    pairs.append((Fragment(file_a, start, end), Fragment(file_b, start + offset, end + offset)))
+                if position is not None:
+                    run_start = previous = position
+        # Runs vizinhos podem ser estendidos até o mesmo trecho
+        unique = {(a.file, a.start, a.end, b.file, b.start, b.end): (a, b) for a, b in pairs}
+        self.stats['pairs'] = len(unique)
+        return list(unique.values())
+
+    def _group(self, pairs: List[Tuple[Fragment, Fragment]]) -> List[CloneClass]:
+        """Classes = componentes conexos; trechos do mesmo arquivo que se sobrepõem são o mesmo nó"""
+        by_file: Dict[int, List[Fragment]] = defaultdict(list)
+        for a, b in pairs:
+            by_file[a.file].append(a)
+            by_file[b.file].append(b)
+        node_of: Dict[int, int] = {}
+        nodes: List[Fragment] = []
+        for file_id, fragments in by_file.items():
+            fragments.sort(key=lambda f: (f.start, -f.end))
+            for fragment in fragments:
+                current = nodes[-1] if nodes and nodes[-1].file == file_id else None
+                overlap = min(current.end, fragment.end) - fragment.start if current else 0
+                if current and overlap * 2 >= min(current.end - current.start, fragment.end - fragment.start):
+                    current.end = max(current.end, fragment.end)
+                else:
+                    nodes.append(Fragment(file_id, fragment.start, fragment.end))
+                node_of[id(fragment)] = len(nodes) - 1
+
+        parent = list(range(len(nodes)))
+
+        def find(x: int) -> int:
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        for a, b in pairs:
+            root_a, root_b = find(node_of[id(a)]), find(node_of[id(b)])
+            if root_a != root_b:
+                parent[root_a] = root_b
+
+        groups: Dict[int, CloneClass] = defaultdict(CloneClass)
+        for index, node in enumerate(nodes):
+            groups[find(index)].fragments.append(node)
+        classes = [group for group in groups.values() if len(group.fragments) >= 2]
+        for group in classes:
+            group.fragments.sort(key=lambda f: (self.files[f.file].path, f.start))
+            group.tokens = sorted(f.end - f.start for f in group.fragments)[len(group.fragments) // 2]
+        classes.sort(key=lambda c: c.tokens * (len(c.fragments) - 1), reverse=True)
+        return classes
+
+    def run(self) -> List[CloneClass]:
+        started = time.perf_counter()
+        self.fingerprint_files(self.find_files())
+        self.classes = self._group(self._pairs())
+        self.stats['seconds'] = time.perf_counter() - started
+        return self.classes
+
+    # --------------------------------------------------------------- relatório
+    def line_range(self, fragment: Fragment) -> Tuple[int, int]:
+        lines = self.files[fragment.file].lines
+        return lines[fragment.start], lines[fragment.end - 1]
+
+    def location(self, fragment: Fragment) -> str:
+        first, last = self.line_range(fragment)
+        return f"{self.files[fragment.file].path}:{first}-{last}"
+
+    def duplicated_lines(self) -> Dict[str, int]:
+        """Linhas cobertas por algum trecho clonado, por arquivo"""
+        covered: Dict[int, set] = defaultdict(set)
+        for group in self.classes:
+            for fragment in group.fragments:
+                first, last = self.line_range(fragment)
+                covered[fragment.file].update(range(first, last + 1))
+        return {self.files[file_id].path: len(lines) for file_id, lines in covered.items()}
+
+    def print_summary(self) -> None:
+        s = self.stats
+        print(f"🧬 {s['files']} arquivos ({s['loc']:,} linhas, {s['tokens']:,} tokens), "
+              f"{s['fingerprints']:,} impressões, {len(self.classes)} classes de clones em {s['seconds']:.2f}s")
+        for group in self.classes[:5]:
+            print(f"   📋 {len(group.fragments)}x {group.tokens} tokens: "
+                  + ', '.join(self.location(f) for f in group.fragments[:3]))
+
+    def generate_report(self, output_file: str, top: int = 30) -> None:
+        s = self.stats
+        duplicated = self.duplicated_lines()
+        total_duplicated = sum(duplicated.values())
+        loc_by_path = {f.path: max(f.loc, 1) for f in self.files}
+        cross_file = sum(1 for group in self.classes if len({f.file for f in group.fragments}) > 1)
+        report = f"""# Análise de Código Duplicado (Clones)
+
+**Data da análise:** {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}
+**Arquivos analisados:** {s['files']} ({s['loc']:,} linhas, {s['tokens']:,} tokens normalizados)
+**Parâmetros:** clones com ≥ {self.min_tokens} tokens, k-gramas de {self.k} tokens, janela de {self.window}
+**Índice:** {s['fingerprints']:,} impressões digitais, {s['buckets']:,} compartilhadas ({s['skipped_buckets']} ignoradas por excesso de ocorrências)
+**Tempo total:** {s['seconds']:.2f}s
+
+## 📊 Resumo
+
+- **Classes de clones:** {len(self.classes)} ({cross_file} envolvendo mais de um arquivo)
+- **Pares de trechos clonados:** {s['pairs']}
+- **Linhas em trechos duplicados:** {total_duplicated:,} ({total_duplicated / max(s['loc'], 1) * 100:.1f}% das linhas analisadas)
+
+## 🎯 Maiores Classes de Clones
+
+> Ordenadas por tokens duplicados (tamanho x cópias excedentes)
+
+| Rank | Cópias | Tokens (mediana) | Linhas (mediana) | Locais |
+|------|--------|------------------|------------------|--------|
+"""
+        for i, group in enumerate(self.classes[:top], 1):
+            spans = sorted(last - first + 1 for first, last in map(self.line_range, group.fragments))
+            locations = '<br>'.join(f"`{self.location(f)}`" for f in group.fragments[:5])
+            if len(group.fragments) > 5:
+                locations += f"<br>… e mais {len(group.fragments) - 5}"
+            report += f"| {i} | {len(group.fragments)} | {group.tokens} | {spans[len(spans) // 2]} | {locations} |\n"
+
+        report += """
+## 📊 Arquivos com Mais Duplicação
+
+| Arquivo | Linhas duplicadas | % do arquivo |
+|---------|-------------------|--------------|
+"""
+        for path, lines in sorted(duplicated.items(), key=lambda item: -item[1])[:15]:
+            report += f"| `{path}` | {lines} | {min(lines / loc_by_path.get(path, 1) * 100, 100):.0f}% |\n"
+
+        report += """
+## 💡 Recomendações
+
+1. **Variantes de configuração** (`vite.config.*.ts` e afins) devem compartilhar uma base e sobrescrever só o que muda
+2. **Scripts duplicados** (`*_fixed.py`, cópias com sufixo) devem ser consolidados em um só, mantendo o que está em uso
+3. **Clones dentro do mesmo diretório** (modais, formulários, cards) são candidatos a componente ou hook compartilhado
+4. **Clones entre features** indicam lógica de domínio que deveria viver em `src/utils` ou `src/hooks/shared`
+5. **Classes com muitas cópias pequenas** costumam ser boilerplate; avalie se um helper ou gerador resolve antes de abstrair
+
+---
+*Relatório gerado automaticamente pelo Detector de Código Duplicado*
+"""
+        os.makedirs(os.path.dirname(os.path.abspath(output_file)), exist_ok=True)
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(report)
+        print(f"📄 Relatório salvo em: {output_file}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Detector de código duplicado por impressões digitais de tokens')
+    parser.add_argument('--project-dir', default='/workspace/doc-forge-buddy-Cain',
+                        help='Diretório do projeto')
+    parser.add_argument('--extra-dir', action='append', default=None,
+                        help='Diretórios adicionais (padrão: as ferramentas Python deste diretório)')
+    parser.add_argument('--min-tokens', type=int, default=60, help='Tamanho mínimo de um clone (tokens)')
+    parser.add_argument('--k', type=int, default=20, help='Tamanho dos k-gramas das impressões digitais')
+    parser.add_argument('--exclude', action='append', default=[],
+                        help='Padrão glob de caminhos a ignorar (relativo ao diretório base)')
+    parser.add_argument('--jobs', type=int, default=None, help='Processos para tokenização')
+    parser.add_argument('--top', type=int, default=30, help='Classes de clones no relatório')
+    parser.add_argument('--output', default='docs/analise_clones.md',
+                        help='Arquivo de saída do relatório')
+    args = parser.parse_args()
+
+    extra_dirs = args.extra_dir if args.extra_dir is not None else [os.path.dirname(os.path.abspath(__file__))]
+    roots = [args.project_dir] + extra_dirs
+    base_dir = os.path.commonpath([os.path.abspath(root) for root in roots])
+
+    detector = CloneDetector(roots, base_dir, min_tokens=args.min_tokens, k=args.k, excludes=args.exclude,
+                             jobs=args.jobs)
+    print("🔍 Gerando impressões digitais...")
+    detector.run()
+    detector.print_summary()
+    detector.generate_report(args.output, top=args.top)
+
+
+if __name__ == "__main__":
+    main()
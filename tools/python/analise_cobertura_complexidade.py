@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+Cruzamento de Cobertura de Testes x Complexidade - Doc Forge Buddy
+Lê o ``coverage/lcov.info`` gerado pelo vitest em streaming (um registro ``SF`` ...
+``end_of_record`` por vez, nunca o arquivo inteiro), projeta as execuções de linha
+(``DA``) e de ramo (``BRDA``) sobre os intervalos de linhas de cada função calculados
+pelo ``RefinedCyclomaticAnalyzer`` e ordena as funções por complexidade x ramos não
+cobertos.
+
+A complexidade vem do ``ResultsStore``: só arquivos alterados desde a última execução
+são reanalisados (em paralelo), e a junção de cada execução é gravada no store.
+
+Quando o lcov não tem registro de ramos dentro de uma função que nunca executou
+(relatórios vazios do provider v8), os ramos não cobertos são estimados pelos pontos
+de decisão da análise de complexidade e marcados com ``*`` no relatório.
+"""
+
+import argparse
+import os
+import time
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from analise_complexidade_refinada import RefinedCyclomaticAnalyzer
+from results_store import ResultsStore
+
+TOOL_NAME = 'cobertura_complexidade'
+SOURCE_EXTENSIONS = ('.ts', '.tsx')
+TEST_MARKERS = ('.test.', '.spec.', '/__tests__/', '/test/', '/tests/', '/stories/')
+
+# Ramos que cada ponto de decisão produz na instrumentação (if/ternário/&& têm dois lados)
+DECISION_BRANCHES = {
+    'if_statements': 2,
+    'else_if': 2,
+    'ternary': 2,
+    'for_loop': 2,
+    'while_loop': 2,
+    'logical_and': 2,
+    'logical_or': 2,
+    'nullish_coalescing': 2,
+    'case': 1,
+    'default': 1,
+    'catch': 1,
+}
+
+
+@dataclass
+class FileCoverage:
+    source: str
+    lines: List[Tuple[int, int]]  # (linha, execuções), ordenado
+    branches: List[Tuple[int, bool]]  # (linha, executado), ordenado
+
+
+def lcov_sources(lcov_path: str) -> Iterator[str]:
+    """Só os caminhos ``SF:`` do lcov, lendo linha a linha"""
+    with open(lcov_path, 'r', encoding='utf-8', errors='replace') as f:
+        for line in f:
+            if line.startswith('SF:'):
+                yield line[3:].rstrip('\r\n')
+
+
+def iter_lcov(lcov_path: str, wanted: Optional[set] = None) -> Iterator[FileCoverage]:
+    """Um ``FileCoverage`` por registro; registros fora de ``wanted`` são pulados sem parse"""
+    source: Optional[str] = None
+    lines: Dict[int, int] = {}
+    branches: List[Tuple[int, bool]] = []
+    with open(lcov_path, 'r', encoding='utf-8', errors='replace') as f:
+        for raw in f:
+            if raw.startswith('SF:'):
+                source = raw[3:].rstrip('\r\n')
+                if wanted is not None and source not in wanted:
+                    source = None
+                lines, branches = {}, []
+                continue
+            if source is None:
+                continue
+            tag, _, value = raw.rstrip('\r\n').partition(':')
+            try:
+                if tag == 'DA':
+                    number, hits = value.split(',')[:2]
+                    number = int(number)
+                    # O v8 pode repetir a mesma linha (várias instruções): soma as execuções
+                    lines[number] = lines.get(number, 0) + int(float(hits))
+                elif tag == 'BRDA':
+                    number, _block, _branch, taken = value.split(',', 3)
+                    branches.append((int(number), taken not in ('-', '0')))
+                elif tag == 'end_of_record':
+                    yield FileCoverage(source, sorted(lines.items()), sorted(branches))
+                    source = None
+            except ValueError:
+                continue
+
+
+def estimate_branches(breakdown: Dict[str, int]) -> int:
+    return sum(count * DECISION_BRANCHES.get(pattern, 0) for pattern, count in breakdown.items())
+
+
+def nest_functions(functions: List[Dict]) -> List[Tuple[Dict, List[Dict]]]:
+    """Cada função com as funções nomeadas diretamente aninhadas nela (intervalo de linhas contido)"""
+    ordered = sorted(functions, key=lambda f: (f['line_start'], -f['line_end']))
+    nested: List[Tuple[Dict, List[Dict]]] = []
+    stack: List[Tuple[Dict, List[Dict]]] = []
+    for function in ordered:
+        while stack and stack[-1][0]['line_end'] < function['line_end']:
+            stack.pop()
+        entry = (function, [])
+        if stack:
+            stack[-1][1].append(function)
+        stack.append(entry)
+        nested.append(entry)
+    return nested
+
+
+def join_functions(coverage: FileCoverage, functions: List[Dict]) -> List[Dict]:
+    """Projeta linhas e ramos do arquivo sobre o intervalo de cada função (busca binária)
+
+    Linhas, ramos e pontos de decisão contam só para a função nomeada mais interna: o
+    intervalo e a complexidade das funções aninhadas são descontados da que as contém.
+    """
+    line_numbers = [number for number, _ in coverage.lines]
+    lines_hit_prefix = [0]
+    for _, hits in coverage.lines:
+        lines_hit_prefix.append(lines_hit_prefix[-1] + (hits > 0))
+    branch_lines = [number for number, _ in coverage.branches]
+    branches_hit_prefix = [0]
+    for _, taken in coverage.branches:
+        branches_hit_prefix.append(branches_hit_prefix[-1] + taken)
+
+    def count(numbers: List[int], prefix: List[int], start: int, end: int) -> Tuple[int, int]:
+        lo, hi = bisect_left(numbers, start), bisect_right(numbers, end)
+        return hi - lo, prefix[hi] - prefix[lo]
+
+    rows = []
+    for function, children in nest_functions(functions):
+        start, end = function['line_start'], function['line_end']
+        lines_found, lines_hit = count(line_numbers, lines_hit_prefix, start, end)
+        branches_found, branches_hit = count(branch_lines, branches_hit_prefix, start, end)
+        complexity = function['complexity']
+        breakdown = dict(function['breakdown'])
+        for child in children:
+            found, hit = count(line_numbers, lines_hit_prefix, child['line_start'], child['line_end'])
+            lines_found, lines_hit = lines_found - found, lines_hit - hit
+            found, hit = count(branch_lines, branches_hit_prefix, child['line_start'], child['line_end'])
+            branches_found, branches_hit = branches_found - found, branches_hit - hit
+            complexity -= child['complexity'] - 1  # a base 1 da filha não está na mãe
+            for pattern, amount in child['breakdown'].items():
+                breakdown[pattern] = breakdown.get(pattern, 0) - amount
+        complexity = max(round(complexity, 2), 1)
+
+        uncovered, estimated = branches_found - branches_hit, False
+        if branches_found == 0 and lines_found and lines_hit == 0:
+            uncovered, estimated = estimate_branches(breakdown), True
+        rows.append({
+            'path': function['path'],
+            'name': function['name'],
+            'line_start': start,
+            'line_end': end,
+            'complexity': complexity,
+            'lines_found': lines_found,
+            'lines_hit': lines_hit,
+            'branches_found': branches_found,
+            'branches_hit': branches_hit,
+            'uncovered_branches': uncovered,
+            'estimated': int(estimated),
+            'score': round(complexity * uncovered, 2),
+        })
+    return rows
+
+
+class CoverageComplexityJoin:
+    """Junta o lcov com a complexidade por função e grava o ranking no store"""
+
+    def __init__(self, project_root: str, lcov_path: str, store: ResultsStore, jobs: Optional[int] = None):
+        self.project_root = Path(project_root).resolve()
+        self.lcov_path = str(Path(lcov_path).resolve())
+        self.store = store
+        self.jobs = jobs
+        self.run_id: Optional[int] = None
+        self.rows: List[Dict] = []
+        self.stats = {'records': 0, 'joined': 0, 'functions': 0, 'analyzed': 0, 'missing': 0,
+                      'lines_found': 0, 'lines_hit': 0, 'branches_found': 0, 'branches_hit': 0, 'seconds': 0.0}
+
+    def _full_path(self, source: str) -> Path:
+        path = Path(source)
+        return path if path.is_absolute() else self.project_root / path
+
+    def _is_candidate(self, source: str) -> bool:
+        normalized = '/' + source.replace('\\', '/')
+        return (source.endswith(SOURCE_EXTENSIONS) and not source.endswith('.d.ts')
+                and not any(marker in normalized for marker in TEST_MARKERS))
+
+    def run(self) -> List[Dict]:
+        started = time.perf_counter()
+        candidates: Dict[str, str] = {}  # SF -> caminho absoluto
+        for source in lcov_sources(self.lcov_path):
+            self.stats['records'] += 1
+            if not self._is_candidate(source):
+                continue
+            full_path = self._full_path(source)
+            if full_path.exists():
+                candidates[source] = str(full_path)
+            else:
+                self.stats['missing'] += 1
+
+        analyzer = RefinedCyclomaticAnalyzer()
+        self.stats['analyzed'] = analyzer.analyze_files(list(candidates.values()), store=self.store, jobs=self.jobs)
+        functions = self.store.load_functions(candidates.values())
+
+        rows = []
+        for coverage in iter_lcov(self.lcov_path, wanted=set(candidates)):
+            self.stats['joined'] += 1
+            self.stats['lines_found'] += len(coverage.lines)
+            self.stats['lines_hit'] += sum(1 for _, hits in coverage.lines if hits)
+            self.stats['branches_found'] += len(coverage.branches)
+            self.stats['branches_hit'] += sum(1 for _, taken in coverage.branches if taken)
+            file_functions = functions.get(self.store.relative(candidates[coverage.source]), [])
+            rows.extend(join_functions(coverage, file_functions))
+
+        rows.sort(key=lambda row: (row['score'], row['complexity']), reverse=True)
+        self.rows = rows
+        self.stats['functions'] = len(rows)
+        self.stats['seconds'] = time.perf_counter() - started
+        self.run_id = self.store.start_run(TOOL_NAME, {
+            'lcov': str(self.lcov_path),
+            'lcov_mtime': os.path.getmtime(self.lcov_path),
+            **{k: v for k, v in self.stats.items() if k != 'seconds'},
+        })
+        self.store.save_coverage_functions(self.run_id, rows)
+        self.store.prune_runs(TOOL_NAME)
+        return rows
+
+    def print_summary(self) -> None:
+        s = self.stats
+        print(f"📈 {s['records']} registros no lcov, {s['joined']} arquivos cruzados, {s['functions']} funções "
+              f"({s['analyzed']} arquivos reanalisados) em {s['seconds']:.2f}s")
+        for row in self.rows[:5]:
+            marker = '*' if row['estimated'] else ''
+            print(f"   🔥 {row['name']} ({row['path']}:{row['line_start']}) "
+                  f"complexidade {row['complexity']:.1f} x {row['uncovered_branches']}{marker} ramos = {row['score']:.0f}")
+
+    def generate_report(self, output_file: str, top: int = 25) -> None:
+        s = self.stats
+        line_rate = s['lines_hit'] / s['lines_found'] * 100 if s['lines_found'] else 0.0
+        branch_rate = s['branches_hit'] / s['branches_found'] * 100 if s['branches_found'] else 0.0
+        never_run = sum(1 for row in self.rows if row['lines_found'] and not row['lines_hit'])
+        estimated = sum(row['estimated'] for row in self.rows)
+        ranked = [row for row in self.rows if row['score'] > 0]
+
+        report = f"""# Cobertura de Testes x Complexidade
+
+**Data da análise:** {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}
+**Arquivo lcov:** `{self.lcov_path}`
+**Registros no lcov:** {s['records']} ({s['joined']} arquivos de código cruzados, {s['missing']} ausentes no disco)
+**Funções cruzadas:** {s['functions']} ({s['analyzed']} arquivos reanalisados nesta execução)
+**Execução no store:** #{self.run_id}
+
+## 📊 Resumo
+
+- **Cobertura de linhas:** {line_rate:.1f}% ({s['lines_hit']}/{s['lines_found']})
+- **Cobertura de ramos:** {branch_rate:.1f}% ({s['branches_hit']}/{s['branches_found']})
+- **Funções nunca executadas:** {never_run}
+- **Funções com ramos estimados** (sem `BRDA` no lcov): {estimated}
+- **Funções com ramos não cobertos:** {len(ranked)}
+
+## 🎯 Hotspots: Complexidade x Ramos Não Cobertos
+
+| Rank | Função | Arquivo | Linhas | Complexidade | Linhas cobertas | Ramos cobertos | Não cobertos | Score |
+|------|--------|---------|--------|--------------|-----------------|----------------|--------------|-------|
+"""
+        for i, row in enumerate(ranked[:top], 1):
+            marker = '*' if row['estimated'] else ''
+            branches = f"{row['branches_hit']}/{row['branches_found']}" if row['branches_found'] else '-'
+            report += (f"| {i} | `{row['name']}` | `{row['path']}` | {row['line_start']}-{row['line_end']} | "
+                       f"{row['complexity']:.1f} | {row['lines_hit']}/{row['lines_found']} | {branches} | "
+                       f"{row['uncovered_branches']}{marker} | **{row['score']:.0f}** |\n")
+        if estimated:
+            report += "\n\\* ramos estimados pelos pontos de decisão: o lcov não tem `BRDA` para a função\n"
+
+        per_file: Dict[str, List[float]] = defaultdict(lambda: [0.0, 0])
+        for row in ranked:
+            per_file[row['path']][0] += row['score']
+            per_file[row['path']][1] += 1
+        report += """
+## 📊 Arquivos com Maior Risco Acumulado
+
+| Arquivo | Funções em risco | Score total |
+|---------|------------------|-------------|
+"""
+        for path, (score, count) in sorted(per_file.items(), key=lambda item: -item[1][0])[:10]:
+            report += f"| `{path}` | {count} | {score:.0f} |\n"
+
+        report += """
+## 💡 Recomendações
+
+1. **Comece pelo topo do ranking**: funções complexas com ramos não cobertos são onde uma regressão passa despercebida
+2. **Teste os ramos, não só as linhas**: uma função pode ter linhas cobertas e ainda deixar os `else`/`catch` de fora
+3. **Ramos estimados (\\*)** vêm de relatórios v8 sem dados de ramo; rode `vitest --coverage` com os testes da área para obter os valores reais
+4. **Reduza a complexidade antes de testar** quando o score vier mais da complexidade que dos ramos: cada função extraída é mais fácil de cobrir
+5. **Compare execuções no store** (`node_modules/.cache/doc-forge-tools/results.sqlite`) para acompanhar a evolução do ranking
+
+---
+*Relatório gerado automaticamente pelo Cruzamento de Cobertura x Complexidade*
+"""
+        os.makedirs(os.path.dirname(os.path.abspath(output_file)), exist_ok=True)
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(report)
+        print(f"📄 Relatório salvo em: {output_file}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Cruza a cobertura do lcov com a complexidade por função')
+    parser.add_argument('--project-dir', default='/workspace/doc-forge-buddy-Cain',
+                        help='Diretório do projeto')
+    parser.add_argument('--lcov', default='coverage/lcov.info',
+                        help='Arquivo lcov (relativo ao projeto)')
+    parser.add_argument('--store', default=None, help='Banco de resultados (padrão: cache em node_modules)')
+    parser.add_argument('--jobs', type=int, default=None, help='Processos para a análise de complexidade')
+    parser.add_argument('--top', type=int, default=25, help='Funções no ranking do relatório')
+    parser.add_argument('--output', default='docs/analise_cobertura_complexidade.md',
+                        help='Arquivo de saída do relatório')
+    args = parser.parse_args()
+
+    lcov_path = os.path.join(args.project_dir, args.lcov)
+    if not os.path.exists(lcov_path):
+        print(f"❌ lcov não encontrado: {lcov_path} (rode os testes com --coverage)")
+        return
+
+    with ResultsStore(args.project_dir, args.store) as store:
+        join = CoverageComplexityJoin(args.project_dir, lcov_path, store, jobs=args.jobs)
+        join.run()
+        join.print_summary()
+        join.generate_report(args.output, top=args.top)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+Comparação de Complexidade com Baseline - Doc Forge Buddy
+Para revisão de PR: mostra o que ficou mais (ou menos) complexo em relação a uma
+baseline gravada, em vez do ranking absoluto.
+
+``--save-baseline`` grava no ``ResultsStore`` uma cópia das funções do projeto (rode na
+branch principal). A comparação casa cada função atual com a da baseline por arquivo +
+nome qualificado (``Componente.handler``, do ``ts_outline``) + impressão digital do corpo
+(hash dos tokens, que não muda com linhas movidas, espaços ou comentários):
+
+1. mesmo arquivo e nome qualificado (repetidos desempatam pela impressão digital e depois
+   pela ordem no arquivo)
+2. sobras com a mesma impressão digital: função renomeada (mesmo arquivo) ou movida
+3. o resto é função nova ou removida
+
+Só arquivos alterados desde a última análise são reanalisados; os demais vêm do store.
+"""
+
+import argparse
+import os
+import subprocess
+import time
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from analise_complexidade_refinada import RefinedCyclomaticAnalyzer
+from results_store import ResultsStore
+
+TOOL_NAME = 'baseline_complexidade'
+SOURCE_EXTENSIONS = ('.ts', '.tsx')
+TEST_MARKERS = ('.test.', '.spec.', '/__tests__/', '/test/', '/tests/', '/stories/')
+SKIP_DIRS = {'node_modules', 'dist', 'build', '.git', '.next', '.nuxt', 'coverage'}
+HOTSPOT_THRESHOLD = 15.0  # mesmo limiar das funções críticas da análise refinada
+
+STATUS_LABELS = {
+    'inalterada': '⚪ Inalteradas',
+    'alterada': '✏️ Alteradas',
+    'renomeada': '🏷️ Renomeadas',
+    'movida': '🔀 Movidas de arquivo',
+    'nova': '🆕 Novas',
+    'removida': '🗑️ Removidas',
+}
+
+Match = Tuple[Optional[Dict], Optional[Dict], str]  # (baseline, atual, status)
+
+
+def match_functions(baseline: List[Dict], current: List[Dict]) -> List[Match]:
+    """Casa funções da baseline com as atuais (arquivo + nome qualificado + impressão digital)"""
+    matches: List[Match] = []
+    by_name: Dict[Tuple[str, str], List[Dict]] = defaultdict(list)
+    for old in baseline:
+        by_name[(old['path'], old['qualified_name'])].append(old)
+    current_by_name: Dict[Tuple[str, str], List[Dict]] = defaultdict(list)
+    for new in current:
+        current_by_name[(new['path'], new['qualified_name'])].append(new)
+
+    unmatched_old: List[Dict] = []
+    unmatched_new: List[Dict] = []
+    for key, news in current_by_name.items():
+        olds = by_name.pop(key, [])
+        # Homônimos (callbacks, sobrecargas): primeiro o mesmo corpo, depois a ordem no arquivo
+        remaining = []
+        for new in news:
+            same = next((old for old in olds if old['fingerprint'] == new['fingerprint']), None)
+            if same is not None:
+                olds.remove(same)
+                matches.append((same, new, 'inalterada'))
+            else:
+                remaining.append(new)
+        for old, new in zip(olds, remaining):
+            matches.append((old, new, 'alterada'))
+        unmatched_old.extend(olds[len(remaining):])
+        unmatched_new.extend(remaining[len(olds):])
+    for olds in by_name.values():
+        unmatched_old.extend(olds)
+
+    by_fingerprint: Dict[str, List[Dict]] = defaultdict(list)
+    for old in unmatched_old:
+        by_fingerprint[old['fingerprint']].append(old)
+    for new in unmatched_new:
+        candidates = by_fingerprint.get(new['fingerprint'])
+        if not candidates:
+            matches.append((None, new, 'nova'))
+            continue
+        old = next((c for c in candidates if c['path'] == new['path']), candidates[0])
+        candidates.remove(old)
+        matches.append((old, new, 'renomeada' if old['path'] == new['path'] else 'movida'))
+    for olds in by_fingerprint.values():
+        matches.extend((old, None, 'removida') for old in olds)
+    return matches
+
+
+class BaselineComparison:
+    """Grava baselines e compara o estado atual do projeto com uma delas"""
+
+    def __init__(self, project_root: str, store: ResultsStore, jobs: Optional[int] = None,
+                 threshold: float = HOTSPOT_THRESHOLD):
+        self.project_root = Path(project_root).resolve()
+        self.store = store
+        self.jobs = jobs
+        self.threshold = threshold
+        self.baseline: Optional[Dict] = None
+        self.matches: List[Match] = []
+        self.stats = {'files': 0, 'analyzed': 0, 'seconds': 0.0}
+
+    def find_source_files(self) -> List[str]:
+        paths = []
+        for root, dirs, files in os.walk(self.project_root):
+            dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+            for name in files:
+                path = os.path.join(root, name)
+                normalized = '/' + self.store.relative(path)
+                if (name.endswith(SOURCE_EXTENSIONS) and not name.endswith('.d.ts')
+                        and not any(marker in normalized for marker in TEST_MARKERS)):
+                    paths.append(path)
+        return sorted(paths)
+
+    def _refresh(self) -> List[str]:
+        """Reanalisa só os arquivos alterados e devolve a lista de arquivos do projeto"""
+        started = time.perf_counter()
+        paths = self.find_source_files()
+        self.stats['files'] = len(paths)
+        self.stats['analyzed'] = RefinedCyclomaticAnalyzer().analyze_files(paths, store=self.store, jobs=self.jobs)
+        self.stats['seconds'] = time.perf_counter() - started
+        return paths
+
+    def _git_head(self) -> Optional[str]:
+        try:
+            result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=self.project_root,
+                                    capture_output=True, text=True, check=True)
+        except (OSError, subprocess.CalledProcessError):
+            return None
+        return result.stdout.strip() or None
+
+    def save_baseline(self, label: Optional[str] = None) -> Dict:
+        paths = self._refresh()
+        head = self._git_head()
+        run_id = self.store.start_run(TOOL_NAME, {'label': label or head or 'baseline', 'head': head,
+                                                  'files': len(paths)})
+        saved = self.store.save_baseline_functions(run_id, paths)
+        self.store.prune_runs(TOOL_NAME, keep=10)
+        self.baseline = {**self.store.latest_run(TOOL_NAME), 'functions': saved}
+        return self.baseline
+
+    def compare(self, baseline_id: Optional[int] = None) -> List[Match]:
+        if baseline_id is None:
+            self.baseline = self.store.latest_run(TOOL_NAME)
+        else:
+            self.baseline = self.store.latest_run(TOOL_NAME, before=baseline_id + 1)
+            if self.baseline and self.baseline['id'] != baseline_id:
+                self.baseline = None
+        if self.baseline is None:
+            return []
+
+        paths = self._refresh()
+        current = [function for functions in self.store.load_functions(paths).values() for function in functions]
+        self.matches = match_functions(self.store.baseline_functions(self.baseline['id']), current)
+        return self.matches
+
+    # ----------------------------------------------------------------- consultas
+    @staticmethod
+    def delta(match: Match) -> float:
+        old, new, _ = match
+        return (new['complexity'] if new else 0.0) - (old['complexity'] if old else 0.0)
+
+    def counts(self) -> Dict[str, int]:
+        counts = {status: 0 for status in STATUS_LABELS}
+        for _, _, status in self.matches:
+            counts[status] += 1
+        return counts
+
+    def regressions(self, min_delta: float) -> List[Match]:
+        rows = [m for m in self.matches if m[0] and m[1] and self.delta(m) >= min_delta]
+        return sorted(rows, key=self.delta, reverse=True)
+
+    def improvements(self, min_delta: float) -> List[Match]:
+        rows = [m for m in self.matches if m[0] and m[1] and self.delta(m) <= -min_delta]
+        return sorted(rows, key=self.delta)
+
+    def new_hotspots(self) -> List[Match]:
+        rows = [m for m in self.matches if m[1] and m[1]['complexity'] >= self.threshold
+                and (m[0] is None or m[0]['complexity'] < self.threshold)]
+        return sorted(rows, key=lambda m: m[1]['complexity'], reverse=True)
+
+    def resolved_hotspots(self) -> List[Match]:
+        rows = [m for m in self.matches if m[0] and m[0]['complexity'] >= self.threshold
+                and (m[1] is None or m[1]['complexity'] < self.threshold)]
+        return sorted(rows, key=lambda m: m[0]['complexity'], reverse=True)
+
+    def totals(self) -> Tuple[float, float]:
+        before = sum(old['complexity'] for old, _, _ in self.matches if old)
+        after = sum(new['complexity'] for _, new, _ in self.matches if new)
+        return before, after
+
+    def print_summary(self) -> None:
+        s = self.stats
+        before, after = self.totals()
+        counts = self.counts()
+        print(f"🔬 {s['files']} arquivos ({s['analyzed']} reanalisados) em {s['seconds']:.2f}s")
+        print(f"📊 Complexidade total {before:.1f} → {after:.1f} ({after - before:+.1f}); "
+              + ', '.join(f"{counts[status]} {status}s" for status in STATUS_LABELS if counts[status]))
+        print(f"   🔥 {len(self.new_hotspots())} novos hotspots, ✅ {len(self.resolved_hotspots())} resolvidos")
+
+    # ----------------------------------------------------------------- relatório
+    @staticmethod
+    def _function_cell(function: Dict) -> str:
+        return f"`{function['qualified_name'] or function['name']}`"
+
+    @staticmethod
+    def _location(function: Dict) -> str:
+        return f"`{function['path']}:{function['line_start']}`"
+
+    def generate_report(self, output_file: str, top: int = 25, min_delta: float = 1.0) -> None:
+        baseline = self.baseline
+        meta = baseline['meta']
+        before, after = self.totals()
+        counts = self.counts()
+        report = f"""# Comparação de Complexidade com Baseline
+
+**Data da análise:** {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}
+**Baseline:** #{baseline['id']} `{meta.get('label')}` (commit `{meta.get('head') or '-'}`, gravada em {baseline['created_at'].replace('T', ' ')})
+**Arquivos analisados:** {self.stats['files']} ({self.stats['analyzed']} reanalisados, {self.stats['seconds']:.2f}s)
+**Limiar de hotspot:** complexidade ≥ {self.threshold:g}
+
+## 📊 Resumo
+
+| Situação | Funções |
+|----------|---------|
+"""
+        for status, label in STATUS_LABELS.items():
+            report += f"| {label} | {counts[status]} |\n"
+        report += f"| **Complexidade total** | {before:.1f} → {after:.1f} (**{after - before:+.1f}**) |\n"
+
+        report += """
+## 🔥 Novos Hotspots
+
+| Função | Local | Antes | Depois | Cognitiva | Aninhamento | Situação |
+|--------|-------|-------|--------|-----------|-------------|----------|
+"""
+        for old, new, status in self.new_hotspots()[:top]:
+            before_cell = f"{old['complexity']:.1f}" if old else '-'
+            report += (f"| {self._function_cell(new)} | {self._location(new)} | {before_cell} | "
+                       f"**{new['complexity']:.1f}** | {new['cognitive_complexity']} | {new['max_nesting']} | "
+                       f"{status} |\n")
+
+        report += """
+## ✅ Hotspots Resolvidos
+
+| Função | Local (baseline) | Antes | Depois | Situação |
+|--------|------------------|-------|--------|----------|
+"""
+        for old, new, status in self.resolved_hotspots()[:top]:
+            after_cell = f"{new['complexity']:.1f}" if new else '-'
+            report += (f"| {self._function_cell(old)} | {self._location(old)} | {old['complexity']:.1f} | "
+                       f"{after_cell} | {status} |\n")
+
+        report += f"""
+## 📈 Funções que Ficaram Mais Complexas
+
+> Variação de complexidade ≥ {min_delta:g}; cognitiva e aninhamento como antes → depois
+
+| Função | Local | Complexidade | Δ | Cognitiva | Aninhamento | Situação |
+|--------|-------|--------------|---|-----------|-------------|----------|
+"""
+        for match in self.regressions(min_delta)[:top]:
+            report += self._delta_row(match)
+
+        report += """
+## 📉 Funções Simplificadas
+
+| Função | Local | Complexidade | Δ | Cognitiva | Aninhamento | Situação |
+|--------|-------|--------------|---|-----------|-------------|----------|
+"""
+        for match in self.improvements(min_delta)[:top]:
+            report += self._delta_row(match)
+
+        moved = [m for m in self.matches if m[2] in ('renomeada', 'movida')]
+        if moved:
+            report += """
+## 🔀 Funções Renomeadas ou Movidas
+
+| Baseline | Atual | Complexidade |
+|----------|-------|--------------|
+"""
+            for old, new, _ in moved[:top]:
+                report += (f"| {self._function_cell(old)} ({self._location(old)}) | "
+                           f"{self._function_cell(new)} ({self._location(new)}) | {new['complexity']:.1f} |\n")
+
+        report += """
+## 💡 Recomendações
+
+1. **Revise primeiro os novos hotspots**: são funções que passaram do limiar nesta mudança
+2. **Variações grandes em funções já complexas** pedem extração de funções ou hooks antes do merge
+3. **Compare a cognitiva com a ciclomática**: subir só a cognitiva indica aninhamento novo, que costuma ser resolvido com retornos antecipados
+4. **Hotspots resolvidos** mostram refatorações que valem ser registradas na descrição do PR
+5. **Grave a baseline na branch principal** (`--save-baseline`) depois de cada merge para manter a comparação relevante
+
+---
+*Relatório gerado automaticamente pela Comparação de Complexidade com Baseline*
+"""
+        os.makedirs(os.path.dirname(os.path.abspath(output_file)), exist_ok=True)
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(report)
+        print(f"📄 Relatório salvo em: {output_file}")
+
+    def _delta_row(self, match: Match) -> str:
+        old, new, status = match
+        return (f"| {self._function_cell(new)} | {self._location(new)} | "
+                f"{old['complexity']:.1f} → {new['complexity']:.1f} | **{self.delta(match):+.1f}** | "
+                f"{old['cognitive_complexity']} → {new['cognitive_complexity']} | "
+                f"{old['max_nesting']} → {new['max_nesting']} | {status} |\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compara a complexidade por função com uma baseline gravada')
+    parser.add_argument('--project-dir', default='/workspace/doc-forge-buddy-Cain',
+                        help='Diretório do projeto')
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='Grava o estado atual como baseline em vez de comparar')
+    parser.add_argument('--label', default=None, help='Rótulo da baseline gravada (padrão: commit atual)')
+    parser.add_argument('--baseline-id', type=int, default=None,
+                        help='Baseline a comparar (padrão: a mais recente)')
+    parser.add_argument('--threshold', type=float, default=HOTSPOT_THRESHOLD,
+                        help='Complexidade a partir da qual a função é hotspot')
+    parser.add_argument('--min-delta', type=float, default=1.0,
+                        help='Variação mínima de complexidade listada no relatório')
+    parser.add_argument('--store', default=None, help='Banco de resultados (padrão: cache em node_modules)')
+    parser.add_argument('--jobs', type=int, default=None, help='Processos para a análise de complexidade')
+    parser.add_argument('--top', type=int, default=25, help='Itens por tabela')
+    parser.add_argument('--output', default='docs/analise_comparacao_baseline.md',
+                        help='Arquivo de saída do relatório')
+    args = parser.parse_args()
+
+    with ResultsStore(args.project_dir, args.store) as store:
+        comparison = BaselineComparison(args.project_dir, store, jobs=args.jobs, threshold=args.threshold)
+        if args.save_baseline:
+            baseline = comparison.save_baseline(args.label)
+            print(f"💾 Baseline #{baseline['id']} `{baseline['meta']['label']}` gravada: "
+                  f"{baseline['functions']} funções em {comparison.stats['files']} arquivos "
+                  f"({comparison.stats['analyzed']} reanalisados, {comparison.stats['seconds']:.2f}s)")
+            return
+
+        comparison.compare(args.baseline_id)
+        if comparison.baseline is None:
+            print("❌ Nenhuma baseline encontrada (grave uma com --save-baseline)")
+            return
+        comparison.print_summary()
+        comparison.generate_report(args.output, top=args.top, min_delta=args.min_delta)
+
+
+if __name__ == "__main__":
+    main()
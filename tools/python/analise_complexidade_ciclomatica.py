@@ -12,6 +12,10 @@ from typing import Dict, List, Tuple, Any
 from dataclasses import dataclass, asdict
 import argparse
 
+from symbol_index import type_positions
+from ts_outline import Outline
+from ts_tokenizer import is_jsx_file, tokenize
+
 @dataclass
 class FunctionComplexity:
     name: str
@@ -96,64 +100,26 @@ class CyclomaticComplexityAnalyzer:
         }
     
     def calculate_function_complexity(self, content: str, file_path: str) -> List[FunctionComplexity]:
-        """Calcula complexidade de funções individuais"""
+        """Calcula complexidade das funções nomeadas da árvore do arquivo (ts_outline)"""
+        tokens = tokenize(content, jsx=is_jsx_file(file_path))
+        outline = Outline(tokens, None, type_positions(tokens))
         functions = []
-        lines = content.split('\n')
-        
-        # Padrões para detectar funções
-        function_patterns = [
-            r'(?:function\s+(\w+)\s*\([^)]*\)\s*\{)',
-            r'(?:const\s+(\w+)\s*=\s*(?:\([^)]*\)\s*=>|[^=]*=>)\s*\{)',
-            r'(?:(\w+)\s*:\s*(?:\([^)]*\)\s*=>|[^=]*=>)\s*\{)',
-            r'(?:(\w+)\s*=\s*\([^)]*\)\s*=>\s*\{)',
-            r'(?:const\s+(\w+)\s*=\s*function\s*\([^)]*\)\s*\{)',
-        ]
-        
-        function_stack = []
-        
-        for i, line in enumerate(lines):
-            # Detectar início de função
-            for pattern in function_patterns:
-                matches = re.finditer(pattern, line, re.MULTILINE)
-                for match in matches:
-                    func_name = match.group(1) if match.groups() else 'anonymous'
-                    
-                    # Encontrar o final da função
-                    end_line = self._find_function_end(lines, i)
-                    
-                    # Extrair conteúdo da função
-                    func_content = '\n'.join(lines[i:end_line+1])
-                    complexity = self._calculate_complexity_of_text(func_content)
-                    
-                    functions.append(FunctionComplexity(
-                        name=func_name,
-                        file_path=file_path,
-                        line_start=i+1,
-                        line_end=end_line+1,
-                        complexity=complexity['total'],
-                        complexity_breakdown=complexity['breakdown']
-                    ))
-        
-        return functions
-    
-    def _find_function_end(self, lines: List[str], start_line: int) -> int:
-        """Encontra o final de uma função baseado em chaves balanceadas"""
-        brace_count = 0
-        in_function = False
         
-        for i in range(start_line, len(lines)):
-            line = lines[i]
+        for node in outline.named_functions():
+            line_start, line_end = outline.line_span(node)
+            func_content = content[tokens[node.start].start:tokens[node.end].end]
+            complexity = self._calculate_complexity_of_text(func_content)
             
-            for char in line:
-                if char == '{':
-                    brace_count += 1
-                    in_function = True
-                elif char == '}':
-                    brace_count -= 1
-                    if in_function and brace_count == 0:
-                        return i
-        
-        return start_line + 10  # Fallback
+            functions.append(FunctionComplexity(
+                name=node.name,
+                file_path=file_path,
+                line_start=line_start,
+                line_end=line_end,
+                complexity=complexity['total'],
+                complexity_breakdown=complexity['breakdown']
+            ))
+        
+        return functions
     
     def _calculate_complexity_of_text(self, text: str) -> Dict[str, int]:
         """Calcula complexidade de um texto específico"""
@@ -7,11 +7,15 @@ Versão melhorada com cálculos mais precisos
 import os
 import re
 import json
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, asdict
 import argparse
 
+from ts_complexity import ComplexityPass, FunctionMetrics
+from ts_tokenizer import is_jsx_file, tokenize
+
 @dataclass
 class FunctionComplexity:
     name: str
@@ -20,7 +24,11 @@ class FunctionComplexity:
     line_end: int
     complexity: int
     complexity_breakdown: Dict[str, int]
-    function_type: str  # 'component', 'hook', 'utility', 'arrow'
+    function_type: str  # 'component', 'hook', 'function', 'arrow', 'method'
+    cognitive_complexity: int = 0
+    max_nesting: int = 0
+    qualified_name: str = ''  # ``Componente.handler`` (ts_outline)
+    fingerprint: str = ''  # hash dos tokens do corpo, para casar a função entre versões
     
 @dataclass
 class FileComplexity:
@@ -33,41 +41,25 @@ class FileComplexity:
     category: str
     lines_of_code: int
 
+_worker_state: Dict[str, Any] = {}
+
+
+def _init_worker() -> None:
+    _worker_state['analyzer'] = RefinedCyclomaticAnalyzer()
+
+
+def _analyze_job(file_path: str) -> Optional[FileComplexity]:
+    return _worker_state['analyzer'].analyze_file(file_path)
+
+
 class RefinedCyclomaticAnalyzer:
     """Analisador Refinado de Complexidade Ciclomática"""
     
     def __init__(self):
         self.results: List[FileComplexity] = []
+        self.churn_factors: Dict[str, float] = {}  # caminho real -> multiplicador de esforço pelo churn
         
-        # Padrões mais precisos que adicionam complexidade
-        self.complexity_patterns = {
-            'if_statements': r'\bif\s*\([^)]*\)\s*\{',  # if com condição e bloco
-            'else_if': r'\belse\s+if\s*\([^)]*\)\s*\{',
-            'else': r'\belse\s*\{',
-            'switch': r'\bswitch\s*\([^)]*\)\s*\{',
-            'case': r'\bcase\s+[^:]+:',
-            'default': r'\bdefault\s*:',
-            'for_loop': r'\bfor\s*\([^;]+;[^;]+;[^)]*\)\s*\{',
-            'while_loop': r'\bwhile\s*\([^)]*\)\s*\{',
-            'try_catch': r'\btry\s*\{',
-            'catch': r'\bcatch\s*\([^)]*\)\s*\{',
-            'finally': r'\bfinally\s*\{',
-            'ternary': r'[^?{]*\?[^:]*:',  # ternário simples
-            'logical_and': r'[^&]*\&\&[^&]*',  # apenas se não for operador de atribuição
-            'logical_or': r'[^|]*\|\|[^|]*',
-            'optional_chaining': r'\?\.',  # peso menor
-            'nullish_coalescing': r'\?\?',
-            'map_with_condition': r'\.map\s*\([^)]*\([^)]*\?[^)]*\)[^)]*\)',
-            'filter_with_condition': r'\.filter\s*\([^)]*\([^)]*\?[^)]*\)[^)]*\)',
-            'reduce_with_condition': r'\.reduce\s*\([^)]*\([^)]*\?[^)]*\)[^)]*\)',
-            'event_handler_simple': r'\s+on[A-Z][a-zA-Z]*\s*=\s*\([^)]*\)\s*=>\s*\{[^}]*\}',  # handlers simples
-            'arrow_function_complex': r'=>\s*\{[^}]*[^?].*\}',  #箭头函数 com lógica
-            'conditional_jsx': r'\{[^}]*\?[^}]*\}',
-            'short_circuit_render': r'\{[^}]*&&[^}]*\}',
-            'nested_component': r'<\w+[^>]*\{[^}]*\?[^}]*\}[^>]*>',  # JSX complexo
-        }
-        
-        # Pesos mais realistas
+        # Pesos mais realistas (chaves dos pontos de decisão emitidos por ts_complexity)
         self.complexity_weights = {
             'if_statements': 1.0,
             'else_if': 1.0,
@@ -105,157 +97,44 @@ class RefinedCyclomaticAnalyzer:
             'service': 20,
         }
     
-    def calculate_function_complexity(self, content: str, file_path: str) -> List[FunctionComplexity]:
-        """Calcula complexidade de funções individuais com melhor detecção"""
-        functions = []
-        lines = content.split('\n')
+    def calculate_function_complexity(self, content: str, file_path: str,
+                                      complexity_pass: Optional[ComplexityPass] = None) -> List[FunctionComplexity]:
+        """Calcula complexidade das funções nomeadas da árvore do arquivo (ts_outline):
+        funções, arrows, métodos de classe/objeto, hooks e componentes"""
+        if complexity_pass is None:
+            complexity_pass = self._complexity_pass(content, file_path)
+        outline = complexity_pass.scopes.outline
         
-        # Padrões para diferentes tipos de funções
-        function_patterns = [
-            # Named functions
-            (r'function\s+(\w+)\s*\([^)]*\)\s*\{', 'function'),
-            # Arrow functions
-            (r'const\s+(\w+)\s*=\s*\([^)]*\)\s*=>\s*\{', 'arrow'),
-            (r'const\s+(\w+)\s*=\s*[^=]*=>\s*\{', 'arrow'),
-            # Method definitions
-            (r'(\w+)\s*:\s*\([^)]*\)\s*=>\s*\{', 'method'),
-            (r'(\w+)\s*:\s*[^=]*=>\s*\{', 'method'),
-            # Function assignments
-            (r'(\w+)\s*=\s*function\s*\([^)]*\)\s*\{', 'function'),
-        ]
-        
-        # Detectar componentes React
-        is_react_component = self._is_react_component(file_path, content)
-        component_function_patterns = [
-            (r'const\s+(\w+)\s*=\s*\([^)]*\)\s*=>\s*\(', 'component'),
-            (r'function\s+(\w+)\s*\([^)]*\)\s*{', 'component'),
-        ]
-        
-        # Procurar por funções/componentes
-        for i, line in enumerate(lines):
-            # Componentes React
-            if is_react_component:
-                for pattern, func_type in component_function_patterns:
-                    matches = re.finditer(pattern, line, re.MULTILINE)
-                    for match in matches:
-                        func_name = match.group(1)
-                        end_line = self._find_function_end(lines, i)
-                        func_content = '\n'.join(lines[i:end_line+1])
-                        complexity = self._calculate_complexity_of_text(func_content)
-                        
-                        functions.append(FunctionComplexity(
-                            name=func_name,
-                            file_path=file_path,
-                            line_start=i+1,
-                            line_end=end_line+1,
-                            complexity=complexity['total'],
-                            complexity_breakdown=complexity['breakdown'],
-                            function_type=func_type
-                        ))
-            
-            # Outras funções
-            for pattern, func_type in function_patterns:
-                if not re.search(pattern, line):
-                    continue
-                
-                # Evitar duplicatas
-                if any(f.line_start == i+1 for f in functions):
-                    continue
-                
-                matches = re.finditer(pattern, line, re.MULTILINE)
-                for match in matches:
-                    func_name = match.group(1)
-                    end_line = self._find_function_end(lines, i)
-                    func_content = '\n'.join(lines[i:end_line+1])
-                    complexity = self._calculate_complexity_of_text(func_content)
-                    
-                    functions.append(FunctionComplexity(
-                        name=func_name,
-                        file_path=file_path,
-                        line_start=i+1,
-                        line_end=end_line+1,
-                        complexity=complexity['total'],
-                        complexity_breakdown=complexity['breakdown'],
-                        function_type=func_type
-                    ))
+        functions = []
+        for node in outline.named_functions():
+            metrics = complexity_pass.node_metrics(node)
+            line_start, line_end = outline.line_span(node)
+            functions.append(FunctionComplexity(
+                name=node.name,
+                file_path=file_path,
+                line_start=line_start,
+                line_end=line_end,
+                complexity=self._weighted_complexity(metrics),
+                complexity_breakdown=metrics.breakdown,
+                function_type=node.role,
+                cognitive_complexity=metrics.cognitive,
+                max_nesting=metrics.max_nesting,
+                qualified_name=outline.qualified_name(node),
+                fingerprint=outline.fingerprint(node)
+            ))
         
         return functions
     
-    def _find_function_end(self, lines: List[str], start_line: int) -> int:
-        """Encontra o final de uma função com melhor detecção"""
-        brace_count = 0
-        in_string = False
-        string_char = None
-        in_comment = False
-        in_block_comment = False
-        
-        for i in range(start_line, len(lines)):
-            line = lines[i]
-            j = 0
-            
-            while j < len(line):
-                char = line[j]
-                next_char = line[j+1] if j+1 < len(line) else ''
-                
-                # Detectar strings
-                if not in_string and not in_comment and not in_block_comment:
-                    if char in ['"', "'", '`']:
-                        in_string = True
-                        string_char = char
-                    elif char == '/' and next_char == '/':
-                        in_comment = True
-                        break
-                    elif char == '/' and next_char == '*':
-                        in_block_comment = True
-                        j += 1
-                    elif char == '{' and not in_string:
-                        brace_count += 1
-                    elif char == '}' and not in_string:
-                        brace_count -= 1
-                        if brace_count == 0 and i > start_line:
-                            return i
-                elif in_string and char == string_char:
-                    in_string = False
-                    string_char = None
-                elif in_block_comment and char == '*' and next_char == '/':
-                    in_block_comment = False
-                    j += 1
-                
-                j += 1
-        
-        return min(start_line + 50, len(lines) - 1)  # Limite seguro
+    def _complexity_pass(self, content: str, file_path: str) -> ComplexityPass:
+        """Passada única de tokens com os pontos de decisão e o aninhamento do arquivo"""
+        return ComplexityPass(tokenize(content, jsx=is_jsx_file(file_path)))
     
-    def _calculate_complexity_of_text(self, text: str) -> Dict[str, int]:
-        """Calcula complexidade com desconto por concisão"""
-        breakdown = {}
+    def _weighted_complexity(self, metrics: FunctionMetrics) -> float:
+        """Complexidade ponderada pelos pesos dos pontos de decisão"""
         total = 1  # Base complexity
-        
-        # Pular comentários e strings
-        clean_text = self._remove_comments_and_strings(text)
-        
-        for pattern_name, pattern in self.complexity_patterns.items():
-            matches = len(re.findall(pattern, clean_text, re.MULTILINE | re.DOTALL))
-            if matches > 0:
-                breakdown[pattern_name] = matches
-                weight = self.complexity_weights.get(pattern_name, 1.0)
-                total += matches * weight
-        
-        return {'total': total, 'breakdown': breakdown}
-    
-    def _remove_comments_and_strings(self, text: str) -> str:
-        """Remove comentários e strings para análise mais precisa"""
-        # Remover comentários de linha
-        text = re.sub(r'//.*$', '', text, flags=re.MULTILINE)
-        
-        # Remover comentários de bloco
-        text = re.sub(r'/\*.*?\*/', '', text, flags=re.DOTALL)
-        
-        # Remover strings (aproximação)
-        text = re.sub(r'"[^"]*"', '""', text)
-        text = re.sub(r"'[^']*'", "''", text)
-        text = re.sub(r'`[^`]*`', '``', text)
-        
-        return text
+        for pattern_name, count in metrics.breakdown.items():
+            total += count * self.complexity_weights.get(pattern_name, 1.0)
+        return total
     
     def _is_react_component(self, file_path: str, content: str) -> bool:
         """Identifica se é um componente React com mais precisão"""
@@ -329,11 +208,11 @@ class RefinedCyclomaticAnalyzer:
         lines_of_code = self.count_lines_of_code(content)
         
         # Calcular complexidade total
-        file_complexity_data = self._calculate_complexity_of_text(content)
-        total_complexity = file_complexity_data['total']
+        complexity_pass = self._complexity_pass(content, file_path)
+        total_complexity = self._weighted_complexity(complexity_pass.file_metrics())
         
         # Identificar funções
-        functions = self.calculate_function_complexity(content, file_path)
+        functions = self.calculate_function_complexity(content, file_path, complexity_pass)
         
         # Calcular complexidade média
         if functions:
@@ -409,6 +288,28 @@ class RefinedCyclomaticAnalyzer:
         self.results = results
         return results
     
+    def analyze_files(self, file_paths: List[str], store=None, jobs: Optional[int] = None) -> int:
+        """Analisa em paralelo só os arquivos sem resultado atual no ``ResultsStore``
+
+        Retorna quantos arquivos foram (re)analisados; os resultados ficam no store.
+        """
+        pending = store.stale_files(file_paths) if store is not None else list(file_paths)
+        if not pending:
+            return 0
+        jobs = jobs or os.cpu_count() or 1
+        if jobs <= 1 or len(pending) < 8:
+            _init_worker()
+            results = [_analyze_job(path) for path in pending]
+        else:
+            with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker) as executor:
+                results = list(executor.map(_analyze_job, pending, chunksize=8))
+        results = [r for r in results if r is not None]
+        if store is not None:
+            store.save_file_complexity(results)
+        else:
+            self.results = results
+        return len(pending)
+    
     def get_critical_files(self) -> Tuple[List[FileComplexity], List[FileComplexity], List[FileComplexity]]:
         """Retorna arquivos categorizados por criticidade"""
         critical = []      # > 50
@@ -450,7 +351,10 @@ class RefinedCyclomaticAnalyzer:
                     'Edge Function': 1.4,
                 }.get(file.category, 1.0)
                 
-                effort = base_hours * complexity_factor * size_factor * category_multiplier
+                # Arquivos que mudam muito custam mais para refatorar (analise_hotspots_churn)
+                churn_multiplier = self.churn_factors.get(os.path.realpath(file.file_path), 1.0)
+                
+                effort = base_hours * complexity_factor * size_factor * category_multiplier * churn_multiplier
                 total_effort += effort
             
             return total_effort
@@ -533,8 +437,8 @@ class RefinedCyclomaticAnalyzer:
 
 > Funções com complexidade ≥ 15 pontos - candidatos principais para refatoração
 
-| Função | Tipo | Arquivo | Complexidade | Linhas |
-|--------|------|---------|--------------|--------|
+| Função | Tipo | Arquivo | Complexidade | Cognitiva | Aninhamento | Linhas |
+|--------|------|---------|--------------|-----------|-------------|--------|
 """
             
             for func in all_functions[:12]:
@@ -547,7 +451,9 @@ class RefinedCyclomaticAnalyzer:
                     'method': '🔧'
                 }.get(func.function_type, '📄')
                 
-                markdown += f"| {func.name} | {type_emoji} {func.function_type} | `{relative_path}` | **{func.complexity:.1f}** | {func.line_start}-{func.line_end} |\n"
+                markdown += f"| {func.name} | {type_emoji} {func.function_type} | `{relative_path}` | **{func.complexity:.1f}** | {func.cognitive_complexity} | {func.max_nesting} | {func.line_start}-{func.line_end} |\n"
+        
+        markdown += self._analyze_cognitive_complexity()
         
         # Padrões problemáticos
         markdown += self._analyze_problematic_patterns()
@@ -597,6 +503,37 @@ class RefinedCyclomaticAnalyzer:
         print(f"📄 Relatório detalhado gerado: {output_file}")
         return output_file
     
+    def _analyze_cognitive_complexity(self) -> str:
+        """Funções mais difíceis de ler: complexidade cognitiva e aninhamento"""
+        functions = [func for result in self.results for func in result.functions]
+        if not functions:
+            return ""
+        
+        deep = [func for func in functions if func.max_nesting > 3]
+        average = sum(func.cognitive_complexity for func in functions) / len(functions)
+        markdown = f"""
+
+## 🧠 Complexidade Cognitiva e Aninhamento
+
+> Cognitiva: +1 por estrutura de controle, somado ao nível de aninhamento em que ela aparece;
+> `else`, `else if` e sequências de operadores lógicos somam 1. Aninhamento conta corpos de
+> if/laço/switch/catch, ternários e funções internas (callbacks de `.map`, handlers...).
+
+- **Complexidade cognitiva média por função:** {average:.1f}
+- **Funções com mais de 3 níveis de aninhamento:** {len(deep)}
+
+| Função | Arquivo | Cognitiva | Aninhamento | Ciclomática | Linhas |
+|--------|---------|-----------|-------------|-------------|--------|
+"""
+        functions.sort(key=lambda f: (f.cognitive_complexity, f.max_nesting), reverse=True)
+        for func in functions[:12]:
+            if func.cognitive_complexity == 0:
+                break
+            relative_path = func.file_path.replace('/workspace/doc-forge-buddy-Cain/', '')
+            markdown += f"| {func.name} | `{relative_path}` | **{func.cognitive_complexity}** | {func.max_nesting} | {func.complexity:.1f} | {func.line_start}-{func.line_end} |\n"
+        
+        return markdown
+    
     def _analyze_problematic_patterns(self) -> str:
         """Analisa padrões problemáticos específicos"""
         pattern_stats = {}
@@ -714,10 +651,18 @@ def main():
                        help='Diretório do projeto')
     parser.add_argument('--output', default='docs/analise_complexidade.md',
                        help='Arquivo de saída do relatório')
+    parser.add_argument('--with-churn', action='store_true',
+                       help='Pondera o esforço pelo churn do git (analise_hotspots_churn)')
     
     args = parser.parse_args()
     
     analyzer = RefinedCyclomaticAnalyzer()
+    if args.with_churn:
+        from analise_hotspots_churn import ChurnHotspotEngine
+        engine = ChurnHotspotEngine(args.project_dir)
+        engine.update()
+        analyzer.churn_factors = engine.effort_factors()
+        print(f"📜 Churn de {len(analyzer.churn_factors)} arquivos ({engine.stats['new_commits']} commits novos)")
     results = analyzer.analyze_project(args.project_dir)
     
     if results:
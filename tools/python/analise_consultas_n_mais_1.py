@@ -0,0 +1,575 @@
+#!/usr/bin/env python3
+"""
+Detector de Consultas N+1 - Doc Forge Buddy
+Encontra consultas Supabase (``.from()``, ``.rpc()``, métodos dos repositórios)
+disparadas dentro de laços ``for``/``while``, callbacks de ``.map``/``.forEach``,
+fan-outs ``Promise.all(items.map(...))`` e componentes renderizados por linha,
+usando o índice de escopos para provar que a consulta roda a cada iteração
+"""
+
+import argparse
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from symbol_index import SymbolIndex, ModuleInfo, is_test_file
+from supabase_queries import QueryChain, extract_query_chains
+from ts_scopes import FunctionScope, SourceView
+from ts_tokenizer import string_value
+
+ITERATION_METHODS = {'map', 'forEach', 'flatMap', 'filter', 'reduce', 'some', 'every', 'find', 'findIndex'}
+# Callbacks executados imediatamente dentro da iteração (não adiam a consulta)
+INLINE_CALLBACKS = ITERATION_METHODS | {'all', 'allSettled', 'then'}
+REPOSITORY_GLOB = 'src/repositories/*Repository.ts'
+REPOSITORY_LAYER = 'src/repositories/'
+MEMBER_MODIFIERS = {'private', 'protected', 'public', 'readonly'}
+
+SEVERITY = {'sequencial': 0, 'paralelo': 1, 'sem controle': 2, 'componente por linha': 3}
+SEVERITY_LABELS = {
+    'sequencial': '🔴 await sequencial no laço',
+    'paralelo': '🟠 fan-out paralelo (Promise.all)',
+    'sem controle': '🟡 disparo por item sem await',
+    'componente por linha': '🟣 componente com consulta por linha',
+}
+
+
+@dataclass
+class QuerySite:
+    index: int  # primeiro token da chamada
+    label: str  # "saved_terms (select)", "rpc get_x", "repo.findById"
+    kind: str  # 'tabela', 'rpc', 'repositório' ou 'indireta'
+    chain: Optional[QueryChain] = None
+    awaited: bool = False
+
+
+@dataclass
+class LoopScope:
+    kind: str  # 'for', 'for...of', 'while', '.map', ...
+    start: int
+    end: int
+    source: str  # expressão que define o fan-out
+    line: int
+    function: Optional[int] = None  # posição (ScopeIndex) da função do próprio laço
+    parallel: bool = False
+
+
+@dataclass
+class NPlusOneFinding:
+    file_path: str
+    line: int
+    function: str
+    loop: str
+    fan_out: str
+    query: str
+    severity: str
+    suggestion: str
+    nesting: int = 1
+    via: str = ''
+
+
+class _ModuleScan(SourceView):
+    """Escopos e consultas de um módulo"""
+
+    def __init__(self, module: ModuleInfo):
+        super().__init__(module.path, module.source, module.tokens)
+        self.module = module
+        self.queries: List[QuerySite] = []
+        self.loops: List[LoopScope] = []
+
+    def statement_end(self, k: int) -> int:
+        """Fim de um corpo de laço sem chaves (até o ``;`` no mesmo nível)"""
+        while k < len(self.tokens):
+            value = self.value(k)
+            if value in ('(', '[', '{') and self.brackets[k] > k:
+                k = self.brackets[k] + 1
+                continue
+            if value == ';' or value == '}':
+                return k
+            k += 1
+        return len(self.tokens) - 1
+
+
+def is_repository_module(path: str) -> bool:
+    """Camada de repositórios (src/repositories/) ou arquivo ``*Repository.ts``/``*.repository.ts``"""
+    return path.startswith(REPOSITORY_LAYER) or 'repository.' in Path(path).name.lower()
+
+
+class NPlusOneDetector:
+    """Cruza as consultas de cada módulo com os laços e callbacks de iteração"""
+
+    def __init__(self, project_root: str, index: Optional[SymbolIndex] = None, include_tests: bool = False):
+        self.project_root = Path(project_root)
+        self.index = index
+        self.include_tests = include_tests
+        self.scans: Dict[str, _ModuleScan] = {}
+        self.repository_methods: Set[str] = set()
+        self.querying: Dict[str, Set[str]] = defaultdict(set)  # módulo -> funções com consulta direta
+        self.findings: List[NPlusOneFinding] = []
+
+    # ------------------------------------------------------------- consultas
+    def collect_repository_methods(self) -> None:
+        for path in self.index.modules:
+            if not Path(path).match(REPOSITORY_GLOB):
+                continue
+            scan = self.scan(path)
+            for scope in scan.scopes.functions:
+                if scope.kind == 'method' and scope.name not in ('constructor',) \
+                        and not scope.name.startswith(('_', 'map', 'to', 'handle', 'log', 'validate')):
+                    self.repository_methods.add(scope.name)
+
+    def scan(self, path: str) -> _ModuleScan:
+        if path not in self.scans:
+            self.scans[path] = _ModuleScan(self.index.modules[path])
+        return self.scans[path]
+
+    def find_direct_queries(self, path: str) -> None:
+        scan = self.scan(path)
+        source = scan.module.source
+        tokens = scan.tokens
+        if '.from(' in source or '.from (' in source:
+            for chain in extract_query_chains(path, tokens, source, scan.brackets):
+                awaited = scan.value(chain.token_start - 1) == 'await'
+                scan.queries.append(QuerySite(chain.token_start, f"{chain.table} ({chain.operation})", 'tabela',
+                                              chain, awaited))
+        is_repository = Path(path).match(REPOSITORY_GLOB) or path.endswith('BaseRepository.ts')
+        for k in range(1, len(tokens) - 1):
+            token = tokens[k]
+            if token.kind != 'name' or tokens[k - 1].value not in ('.', '?.') or tokens[k + 1].value != '(':
+                continue
+            start = scan.expression_start(k)
+            awaited = scan.value(start - 1) == 'await'
+            if token.value == 'rpc':
+                name = string_value(tokens[k + 2]) if k + 2 < len(tokens) else None
+                scan.queries.append(QuerySite(start, f"rpc {name or '?'}", 'rpc', awaited=awaited))
+            elif token.value in self.repository_methods:
+                receiver = scan.text(start, k - 2)
+                if (receiver == 'this' and is_repository) or self.is_repository_receiver(scan, start, k - 1):
+                    scan.queries.append(QuerySite(start, f"{receiver}.{token.value}()", 'repositório',
+                                                  awaited=awaited))
+        for site in scan.queries:
+            owner = scan.scopes.named_ancestor(scan.scopes.enclosing(site.index))
+            if owner is not None:
+                self.querying[path].add(owner.name)
+
+    # ------------------------------------------------------- receptores
+    def is_repository_receiver(self, scan: _ModuleScan, start: int, end: int) -> bool:
+        """``repo``/``this.repo`` em [start, end) guarda uma instância de repositório?
+
+        Segue a declaração (local ou importada) até ``new XRepository()``, uma fábrica da
+        camada de repositórios ou uma anotação de tipo dela. Chamadas estáticas na própria
+        classe (``RepositoryError.transaction()``) não são instâncias.
+        """
+        if end - start == 1 and scan.tokens[start].kind == 'name':
+            name = scan.value(start)
+            if scan.module.binding_for(name) is not None:
+                origin, local = self.index.resolve_local(scan.module, name)
+                if origin not in self.index.modules or not is_repository_module(origin):
+                    return False
+                origin_scan = self.scan(origin)
+                k = self._declaration(origin_scan, local, member=False)
+                return k is not None and self._repository_value(origin_scan, k)
+            k = self._declaration(scan, name, member=False)
+        elif end - start == 3 and scan.value(start) == 'this' and scan.value(start + 1) in ('.', '?.'):
+            k = self._declaration(scan, scan.value(start + 2), member=True)
+        else:
+            return False
+        return k is not None and self._repository_value(scan, k)
+
+    @staticmethod
+    def _declaration(scan: _ModuleScan, name: str, member: bool) -> Optional[int]:
+        """Posição do ``=``/``:`` que segue a declaração de ``name`` (ou de ``this.name``)"""
+        for k in range(1, len(scan.tokens) - 1):
+            if scan.value(k) != name or scan.tokens[k].kind != 'name' or scan.value(k + 1) not in ('=', ':'):
+                continue
+            prev = scan.value(k - 1)
+            if member:
+                declared = prev in MEMBER_MODIFIERS or (prev == '.' and scan.value(k - 2) == 'this')
+            else:
+                declared = prev in ('const', 'let', 'var')
+            if declared:
+                return k + 1
+        return None
+
+    def _repository_value(self, scan: _ModuleScan, k: int) -> bool:
+        """A anotação ou o inicializador em ``k`` produz uma instância de repositório?"""
+        if scan.value(k) == ':':
+            return scan.tokens[k + 1].kind == 'name' and self._repository_symbol(scan, scan.value(k + 1))
+        j = k + 1
+        if scan.value(j) == 'await':
+            j += 1
+        if scan.value(j) == 'new':
+            name = scan.value(j + 1)
+            return self._repository_symbol(scan, name) and not self._is_error_class(scan, name)
+        if scan.value(j) == 'this' and scan.value(j + 1) == '.' and scan.value(j + 3) == '(':
+            return is_repository_module(scan.path)  # fábrica da própria classe (RepositoryFactory.get)
+        if scan.tokens[j].kind == 'name' and (scan.value(j + 1) == '(' or
+                                               (scan.value(j + 1) == '.' and scan.value(j + 3) == '(')):
+            return self._repository_symbol(scan, scan.value(j))
+        return False
+
+    def _repository_symbol(self, scan: _ModuleScan, name: str) -> bool:
+        origin, _ = self.index.resolve_local(scan.module, name)
+        return is_repository_module(origin)
+
+    def _is_error_class(self, scan: _ModuleScan, name: str) -> bool:
+        origin, local = self.index.resolve_local(scan.module, name)
+        if origin not in self.index.modules:
+            return name.endswith('Error')
+        origin_scan = self.scan(origin)
+        for k in range(1, len(origin_scan.tokens) - 2):
+            if origin_scan.value(k) == local and origin_scan.value(k - 1) == 'class':
+                return origin_scan.value(k + 1) == 'extends' and origin_scan.value(k + 2).endswith('Error')
+        return False
+
+    def find_indirect_queries(self, path: str) -> None:
+        """Chamadas a funções (do módulo ou importadas) que fazem consulta diretamente"""
+        scan = self.scan(path)
+        tokens = scan.tokens
+        own = self.querying.get(path, set())
+        for k in range(len(tokens) - 1):
+            token = tokens[k]
+            if token.kind != 'name' or tokens[k + 1].value != '(' or scan.value(k - 1) in ('function',):
+                continue
+            name = token.value
+            target = None
+            if scan.value(k - 1) in ('.', '?.'):
+                receiver = scan.value(k - 2)
+                if receiver == 'this' and name in own:
+                    target = f"this.{name}()"
+                else:
+                    binding = scan.module.binding_for(receiver) if scan.value(k - 3) not in ('.', '?.') else None
+                    if binding is not None and binding[0].resolved \
+                            and name in self.querying.get(binding[0].resolved, ()):
+                        target = f"{receiver}.{name}()"
+            elif name in own:
+                target = f"{name}()"
+            else:
+                binding = scan.module.binding_for(name)
+                if binding is not None and binding[0].resolved:
+                    chain = self.index.resolve_export(binding[0].resolved, binding[1].imported)
+                    origin, local = chain[-1] if chain else (binding[0].resolved, binding[1].imported)
+                    export = self.index.modules[origin].exports.get(local) if origin in self.index.modules else None
+                    local = export.local if export is not None and export.local else local
+                    if local in self.querying.get(origin, ()):
+                        target = f"{name}() → {origin}"
+            if target is None:
+                continue
+            position = scan.scopes.enclosing(k)
+            if position is not None and scan.scopes.functions[position].params_start == k + 1:
+                continue  # a própria declaração
+            start = scan.expression_start(k)
+            if any(q.index == start for q in scan.queries):
+                continue
+            scan.queries.append(QuerySite(start, target, 'indireta', awaited=scan.value(start - 1) == 'await'))
+
+    # ----------------------------------------------------------------- laços
+    def find_loops(self, path: str) -> None:
+        scan = self.scan(path)
+        tokens = scan.tokens
+        for k, token in enumerate(tokens):
+            if token.kind != 'name':
+                continue
+            if token.value == 'for' and scan.value(k - 1) != '.':
+                paren = k + 1 + (scan.value(k + 1) == 'await')
+                if scan.value(paren) != '(' or scan.brackets[paren] < 0:
+                    continue
+                close = scan.brackets[paren]
+                body_end = scan.brackets[close + 1] if scan.value(close + 1) == '{' else scan.statement_end(close + 1)
+                kind, source = 'for', scan.text(paren + 1, close - 1)
+                for j in range(paren + 1, close):
+                    if scan.value(j) in ('of', 'in') and tokens[j].kind == 'name' and scan.value(j - 1) != '.':
+                        kind = f"for...{scan.value(j)}"
+                        source = scan.text(j + 1, close - 1)
+                        break
+                else:
+                    for j in range(paren + 1, close):
+                        if scan.value(j) == 'length' and scan.value(j - 1) == '.':
+                            source = scan.text(scan.expression_start(j - 2), j - 2)
+                            break
+                scan.loops.append(LoopScope(kind, close + 1, body_end, source, token.line,
+                                            scan.scopes.enclosing(k)))
+            elif token.value == 'while' and scan.value(k + 1) == '(' and scan.brackets[k + 1] > 0:
+                if scan.value(k - 1) == '}' and scan.value(scan.brackets[k - 1] - 1) == 'do':
+                    continue
+                close = scan.brackets[k + 1]
+                body_end = scan.brackets[close + 1] if scan.value(close + 1) == '{' else scan.statement_end(close + 1)
+                scan.loops.append(LoopScope('while', close + 1, body_end, scan.text(k + 2, close - 1), token.line,
+                                            scan.scopes.enclosing(k)))
+            elif token.value == 'do' and scan.value(k + 1) == '{' and scan.brackets[k + 1] > 0:
+                close = scan.brackets[k + 1]
+                condition = scan.text(close + 3, scan.brackets[close + 2] - 1) if scan.value(close + 2) == '(' else ''
+                scan.loops.append(LoopScope('do...while', k + 1, close, condition, token.line,
+                                            scan.scopes.enclosing(k)))
+
+        for position, scope in enumerate(scan.scopes.functions):
+            method = scope.call_context
+            if method not in ITERATION_METHODS:
+                continue
+            call_open = scan.opener(scope.start)
+            if scan.value(call_open - 1) != method or scan.value(call_open - 2) not in ('.', '?.'):
+                continue
+            receiver_end = call_open - 3
+            receiver_start = scan.expression_start(receiver_end)
+            outer = scan.opener(receiver_start)
+            parallel = outer >= 2 and scan.value(outer) == '(' and scan.value(outer - 1) in ('all', 'allSettled') \
+                and scan.value(outer - 3) == 'Promise'
+            if not parallel and scan.value(receiver_start - 1) == '=' and scan.tokens[receiver_start - 2].kind == 'name':
+                # const promises = items.map(...); await Promise.all(promises)
+                variable = scan.value(receiver_start - 2)
+                _, end = (scope.parent, scan.scopes.functions[scope.parent].body_end) if scope.parent is not None \
+                    else (None, len(tokens) - 1)
+                parallel = any(scan.value(j) in ('all', 'allSettled') and scan.value(j - 2) == 'Promise'
+                               and scan.value(j + 2) == variable
+                               for j in range(scope.body_end, min(end, len(tokens) - 2)))
+            scan.loops.append(LoopScope(f".{method}()", scope.body_start, scope.body_end,
+                                        scan.text(receiver_start, receiver_end), scope.line, position, parallel))
+
+    def _runs_per_iteration(self, scan: _ModuleScan, index: int, loop: LoopScope) -> bool:
+        """A consulta em ``index`` executa a cada iteração do laço (não está num handler adiado)?"""
+        if not loop.start <= index <= loop.end:
+            return False
+        position = scan.scopes.enclosing(index)
+        while position is not None and position != loop.function:
+            scope = scan.scopes.functions[position]
+            if scope.call_context not in INLINE_CALLBACKS and not self._is_iife(scan, scope):
+                return False
+            position = scope.parent
+        return position == loop.function
+
+    @staticmethod
+    def _is_iife(scan: _ModuleScan, scope: FunctionScope) -> bool:
+        first = scope.start
+        return scan.value(first - 1) == '(' and scan.value(scope.body_end + 1) == ')' \
+            and scan.value(scope.body_end + 2) == '('
+
+    # ----------------------------------------------------------- sugestões
+    def _loop_variable(self, scan: _ModuleScan, loop: LoopScope) -> Set[str]:
+        names: Set[str] = set()
+        if loop.function is not None and loop.kind.startswith('.'):
+            scope = scan.scopes.functions[loop.function]
+            names.update(scan.scopes.param_names(scope)[:1])
+            if scope.params_start != scope.params_end:
+                for j in range(scope.params_start, scope.params_end):
+                    if scan.tokens[j].kind == 'name' and scan.value(j + 1) in (',', '}', ':'):
+                        names.add(scan.value(j))
+        elif loop.kind.startswith('for'):
+            paren = loop.start - 1
+            open_index = scan.brackets[paren]
+            for j in range(open_index + 1, paren):
+                if scan.value(j - 1) in ('const', 'let', 'var') and scan.tokens[j].kind == 'name':
+                    names.add(scan.value(j))
+                if scan.value(j) in ('of', 'in'):
+                    break
+        return names
+
+    def suggest(self, scan: _ModuleScan, site: QuerySite, loop: LoopScope) -> str:
+        loop_names = self._loop_variable(scan, loop)
+        if site.kind == 'tabela' and site.chain is not None:
+            chain = site.chain
+            operation = chain.operation
+            per_item = [c for c in chain.calls if c.method == 'eq' and c.first_arg
+                        and any(name in c.args for name in loop_names)]
+            column = per_item[0].first_arg if per_item else (chain.equality_columns() or ('id',))[0]
+            if operation == 'insert':
+                return f"`.from('{chain.table}').insert(linhas)` com um array montado no laço"
+            if operation == 'upsert':
+                return f"`.from('{chain.table}').upsert(linhas)` em um único lote"
+            if operation == 'delete':
+                return f"`.from('{chain.table}').delete().in('{column}', ids)`"
+            if operation == 'update':
+                return f"`.upsert()` em lote ou RPC que recebe a lista de `{column}`"
+            return (f"`.from('{chain.table}').select(...).in('{column}', ids)` uma vez antes do laço "
+                    f"e agrupar por `{column}`")
+        if site.kind == 'rpc':
+            return "RPC que recebe um array (ex.: `p_ids uuid[]`) e devolve todas as linhas"
+        if site.kind == 'repositório':
+            method = site.label.rsplit('.', 1)[-1].rstrip('()')
+            if method in ('findById', 'exists'):
+                return "`findMany` / `.in('id', ids)` no repositório"
+            if method == 'create':
+                return "`bulkOperation` ou `insert([...])` em lote"
+            if method in ('update', 'delete'):
+                return f"`bulkOperation` ou `{'upsert([...])' if method == 'update' else 'delete().in(id, ids)'}`"
+            return "método de repositório que aceite a lista de ids"
+        return "expor uma variante em lote da função (lista de ids → `.in()`) e chamá-la fora do laço"
+
+    # ---------------------------------------------------------------- análise
+    def match_loops(self, path: str) -> None:
+        scan = self.scan(path)
+        for site in scan.queries:
+            enclosing = [loop for loop in scan.loops if self._runs_per_iteration(scan, site.index, loop)]
+            if not enclosing:
+                continue
+            loop = min(enclosing, key=lambda l: l.end - l.start)
+            if loop.parallel:
+                severity = 'paralelo'
+            elif loop.kind.startswith('.'):
+                severity = 'sem controle'  # callbacks não esperam uns pelos outros
+            else:
+                severity = 'sequencial' if site.awaited else 'sem controle'
+            owner = scan.scopes.named_ancestor(scan.scopes.enclosing(site.index))
+            self.findings.append(NPlusOneFinding(
+                path, scan.tokens[site.index].line, owner.name if owner else '(módulo)',
+                f"{loop.kind} (L{loop.line})", loop.source, site.label, severity,
+                self.suggest(scan, site, loop), nesting=len(enclosing),
+                via=site.label if site.kind == 'indireta' else ''))
+
+    def find_row_components(self, path: str) -> None:
+        """``items.map(item => <Linha />)`` onde Linha (ou um hook dela) faz consulta"""
+        scan = self.scan(path)
+        for loop in scan.loops:
+            if loop.kind != '.map()' or loop.function is None:
+                continue
+            for k in range(loop.start, loop.end):
+                token = scan.tokens[k]
+                if token.kind != 'jsx' or token.value != '<' or scan.tokens[k + 1].kind != 'name':
+                    continue
+                tag = scan.value(k + 1)
+                if not tag[:1].isupper() or scan.scopes.enclosing(k) != loop.function:
+                    continue
+                querying = self._component_queries(scan, tag)
+                if not querying:
+                    continue
+                owner = scan.scopes.named_ancestor(loop.function)
+                self.findings.append(NPlusOneFinding(
+                    path, token.line, owner.name if owner else '(módulo)', f"{loop.kind} (L{loop.line})",
+                    loop.source, f"<{tag}> → {querying}", 'componente por linha',
+                    f"buscar no pai com `.in()` para todos os itens e passar o resultado por prop para <{tag}>"))
+
+    def _component_queries(self, scan: _ModuleScan, tag: str) -> Optional[str]:
+        path, name = scan.module.path, tag
+        binding = scan.module.binding_for(tag)
+        if binding is not None:
+            if not binding[0].resolved:
+                return None
+            chain = self.index.resolve_export(binding[0].resolved, binding[1].imported)
+            path, name = chain[-1] if chain else (binding[0].resolved, binding[1].imported)
+            module = self.index.modules.get(path)
+            if module is None:
+                return None
+            export = module.exports.get(name)
+            name = export.local if export is not None and export.local else name
+        if path not in self.index.modules:
+            return None
+        if name in self.querying.get(path, ()):
+            return f"consulta em `{path}`"
+        component_scan = self.scan(path)
+        for scope in component_scan.scopes.functions:
+            if scope.name != name:
+                continue
+            for k in range(scope.body_start, scope.body_end):
+                if component_scan.value(k).startswith('use') and component_scan.value(k + 1) == '(':
+                    hook = component_scan.value(k)
+                    hook_binding = component_scan.module.binding_for(hook)
+                    if hook_binding is None or not hook_binding[0].resolved:
+                        continue
+                    chain = self.index.resolve_export(hook_binding[0].resolved, hook_binding[1].imported)
+                    origin, local = chain[-1] if chain else (hook_binding[0].resolved, hook_binding[1].imported)
+                    if local in self.querying.get(origin, ()):
+                        return f"`{hook}()` em `{origin}`"
+        return None
+
+    def run_analysis(self) -> List[NPlusOneFinding]:
+        print("🔍 Indexando módulos...")
+        if self.index is None:
+            self.index = SymbolIndex(str(self.project_root)).build()
+        paths = [p for p in sorted(self.index.modules) if self.include_tests or not is_test_file(p)]
+        self.collect_repository_methods()
+
+        print("🗄️ Localizando consultas...")
+        for path in paths:
+            self.find_direct_queries(path)
+        for path in paths:
+            self.find_indirect_queries(path)
+        total = sum(len(self.scan(p).queries) for p in paths)
+        print(f"   {total} chamadas de consulta (diretas e indiretas)")
+
+        print("🔁 Cruzando com laços e callbacks de iteração...")
+        self.findings = []
+        for path in paths:
+            scan = self.scan(path)
+            if not scan.queries and 'map(' not in scan.module.source:
+                continue
+            self.find_loops(path)
+            self.match_loops(path)
+            self.find_row_components(path)
+        self.findings.sort(key=lambda f: (SEVERITY[f.severity], -f.nesting, f.file_path, f.line))
+        print(f"⚠️ {len(self.findings)} consultas N+1 encontradas")
+        return self.findings
+
+    # -------------------------------------------------------------- relatório
+    def generate_report(self, output_file: str) -> None:
+        by_severity: Dict[str, List[NPlusOneFinding]] = defaultdict(list)
+        for finding in self.findings:
+            by_severity[finding.severity].append(finding)
+
+        report = f"""# Consultas N+1 - Doc Forge Buddy
+
+**Data da análise:** {datetime.now().strftime('%d/%m/%Y %H:%M')}
+**Consultas em laço encontradas:** {len(self.findings)}
+**Arquivos afetados:** {len({f.file_path for f in self.findings})}
+
+## 📊 Resumo por Tipo
+
+| Tipo | Ocorrências |
+|------|-------------|
+"""
+        for severity, label in SEVERITY_LABELS.items():
+            report += f"| {label} | {len(by_severity.get(severity, []))} |\n"
+
+        for severity, label in SEVERITY_LABELS.items():
+            findings = by_severity.get(severity)
+            if not findings:
+                continue
+            report += f"\n## {label}\n\n"
+            report += "| Local | Função | Laço | Origem do fan-out | Consulta | Sugestão de lote |\n"
+            report += "|-------|--------|------|-------------------|----------|------------------|\n"
+            for finding in findings:
+                nesting = f" ×{finding.nesting} níveis" if finding.nesting > 1 else ''
+                fan_out = finding.fan_out.replace('|', '\\|')[:60]
+                report += (f"| `{finding.file_path}`:{finding.line} | `{finding.function}` | {finding.loop}{nesting} | "
+                           f"`{fan_out}` | {finding.query.replace('|', '/')} | {finding.suggestion} |\n")
+
+        if not self.findings:
+            report += "\n## ✅ Nenhuma consulta disparada por iteração foi encontrada\n"
+
+        report += """
+## 💡 Recomendações
+
+1. **Comece pelos awaits sequenciais**: cada iteração soma uma ida e volta completa ao banco
+2. **Troque N consultas por uma** com `.in(coluna, ids)` e agrupe o resultado em um `Map` no cliente
+3. **Escritas em laço** devem virar `insert([...])`/`upsert([...])` em lote ou uma RPC transacional
+4. **Componentes por linha** devem receber os dados prontos do pai em vez de consultar sozinhos
+5. **Quando o lote não couber**, limite a concorrência (ex.: blocos de 10) em vez de `Promise.all` ilimitado
+
+---
+*Relatório gerado automaticamente pelo detector de consultas N+1*
+"""
+        Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(report)
+        print(f"📄 Relatório salvo em: {output_file}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Detector de consultas N+1 do Supabase')
+    parser.add_argument('--project-dir', default='/workspace/doc-forge-buddy-Cain',
+                        help='Diretório do projeto')
+    parser.add_argument('--output', default='docs/analise_consultas_n_mais_1.md',
+                        help='Arquivo de saída do relatório')
+    parser.add_argument('--include-tests', action='store_true',
+                        help='Inclui arquivos de teste')
+    args = parser.parse_args()
+
+    detector = NPlusOneDetector(args.project_dir, include_tests=args.include_tests)
+    findings = detector.run_analysis()
+    detector.generate_report(args.output)
+
+    for finding in findings[:10]:
+        print(f"   {finding.severity:20s} {finding.file_path}:{finding.line} {finding.query}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,14 +3,12 @@
 Análise de Dependências e Acoplamento para o projeto Doc Forge Buddy
 """
 
-import os
-import re
-import ast
-import json
 from collections import defaultdict, Counter
-from typing import Dict, List, Set, Tuple
+from typing import List, Optional, Set, Tuple
 from pathlib import Path
 
+from symbol_index import SymbolIndex, is_test_file
+
 class DependencyAnalyzer:
     def __init__(self, project_path: str):
         self.project_path = Path(project_path)
@@ -20,66 +18,36 @@ class DependencyAnalyzer:
         self.import_stats = Counter()
         self.circular_dependencies = []
         self.unused_imports = []
+        self.unused_exports = []
+        self.unreachable_files = []
         self.components_by_coupling = []
+        self.symbol_index: Optional[SymbolIndex] = None
         
     def analyze_file(self, file_path: Path) -> Tuple[Set[str], Set[str]]:
-        """Analisa um arquivo e extrai suas dependências"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Regex para capturar imports
-            import_pattern = r"^(?:import|from)\s+(.+?)\s+(?:import|;|$)"
-            matches = re.findall(import_pattern, content, re.MULTILINE)
-            
-            local_deps = set()
-            external_deps = set()
-            
-            for match in matches:
-                # Remove comentários e limpa o import
-                clean_match = re.sub(r'//.*$', '', match).strip()
-                if not clean_match:
-                    continue
-                    
-                # Identifica se é importação local (começa com @/ ou ./)
-                if clean_match.startswith(('@/', './', '../')):
-                    # Converte para caminho relativo
-                    dep_path = self._resolve_import_path(file_path, clean_match)
-                    if dep_path:
-                        local_deps.add(dep_path)
-                else:
-                    # É uma dependência externa
-                    external_deps.add(clean_match.split('/')[0].split()[0])
-            
-            return local_deps, external_deps
-            
-        except Exception as e:
-            print(f"Erro ao analisar {file_path}: {e}")
+        """Extrai as dependências de um arquivo a partir do índice de símbolos"""
+        rel_path = str(file_path.relative_to(self.project_path)).replace('\\', '/')
+        module = self.symbol_index.modules.get(rel_path) if self.symbol_index else None
+        if module is None:
+            print(f"Erro ao analisar {file_path}: arquivo fora do índice")
             return set(), set()
+        
+        local_deps = set()
+        external_deps = set()
+        
+        for statement in module.imports:
+            if statement.resolved:
+                local_deps.add(self._relative_to_src(statement.resolved))
+            elif statement.package:
+                external_deps.add(statement.package)
+        for reexport in module.reexports:
+            if reexport.resolved:
+                local_deps.add(self._relative_to_src(reexport.resolved))
+        
+        return local_deps, external_deps
     
-    def _resolve_import_path(self, file_path: Path, import_path: str) -> str:
-        """Resolve o caminho do import para um caminho relativo"""
-        # Remove @/ se presente
-        if import_path.startswith('@/'):
-            import_path = import_path[2:]
-        elif import_path.startswith('./'):
-            import_path = import_path[2:]
-        elif import_path.startswith('../'):
-            # Calcular caminho relativo
-            current_dir = file_path.parent
-            target_dir = current_dir / import_path
-            rel_path = os.path.relpath(target_dir, self.src_path)
-            return rel_path.replace('\\', '/')
-        
-        # Adiciona extensão .tsx se não tiver
-        if not import_path.endswith(('.tsx', '.ts', '.js', '.jsx')):
-            # Tenta diferentes extensões
-            for ext in ['.tsx', '.ts', '.js', '.jsx']:
-                potential_path = self.src_path / f"{import_path}{ext}"
-                if potential_path.exists():
-                    return f"{import_path}{ext}"
-        
-        return import_path
+    def _relative_to_src(self, rel_path: str) -> str:
+        """Converte caminho relativo à raiz do projeto para relativo a src/"""
+        return rel_path[4:] if rel_path.startswith('src/') else rel_path
     
     def find_circular_dependencies(self) -> List[List[str]]:
         """Encontra dependências circulares usando DFS"""
@@ -141,12 +109,15 @@ class DependencyAnalyzer:
         """Executa a análise completa"""
         print("🔍 Iniciando análise de dependências...")
         
-        # 1. Analisa todos os arquivos
-        for file_path in self.src_path.rglob('*.tsx'):
-            if 'node_modules' in str(file_path) or '__tests__' in str(file_path):
+        # 1. Indexa exports, imports e usos em uma única passada
+        self.symbol_index = SymbolIndex(str(self.project_path)).build()
+        
+        for rel_module in self.symbol_index.modules:
+            if is_test_file(rel_module) or rel_module.endswith('.d.ts'):
                 continue
-                
-            rel_path = str(file_path.relative_to(self.src_path))
+            
+            file_path = self.project_path / rel_module
+            rel_path = self._relative_to_src(rel_module)
             local_deps, external_deps = self.analyze_file(file_path)
             
             self.dependencies[rel_path] = local_deps
@@ -169,6 +140,17 @@ class DependencyAnalyzer:
         self.components_by_coupling = self.analyze_coupling()
         print(f"✅ Identificados {len(self.components_by_coupling)} componentes")
         
+        # 4. Imports não utilizados, exports órfãos e arquivos inalcançáveis
+        print("🗑️ Procurando código morto...")
+        entries = self.symbol_index.entry_points()
+        self.unused_imports = [item for item in self.symbol_index.unused_imports()
+                               if not is_test_file(item['file'])]
+        self.unused_exports = self.symbol_index.unused_exports(entries)
+        self.unreachable_files = self.symbol_index.unreachable_files(entries)
+        print(f"✅ {len(self.unused_imports)} imports não utilizados, "
+              f"{len(self.unused_exports)} exports nunca importados, "
+              f"{len(self.unreachable_files)} arquivos inalcançáveis")
+        
         return self.generate_report()
     
     def generate_report(self) -> str:
@@ -236,6 +218,49 @@ class DependencyAnalyzer:
         report.append("*Nota: Esta análise é baseada em padrões e pode gerar falsos positivos*")
         report.append("")
         
+        if self.unused_imports:
+            report.append(f"**Total:** {len(self.unused_imports)} bindings importados e nunca referenciados")
+            report.append("")
+            report.append("| Arquivo | Linha | Símbolo | Origem |")
+            report.append("|---------|-------|---------|--------|")
+            for item in self.unused_imports[:50]:
+                report.append(f"| {self._relative_to_src(item['file'])} | {item['line']} | `{item['name']}` | `{item['source']}` |")
+            if len(self.unused_imports) > 50:
+                report.append(f"| ... | | +{len(self.unused_imports) - 50} ocorrências | |")
+        else:
+            report.append("✅ **Nenhum import não utilizado encontrado!**")
+        report.append("")
+        
+        report.append("## 📤 Exports Nunca Importados")
+        report.append("*Exports que nenhum arquivo importa, direta ou indiretamente via barrel*")
+        report.append("")
+        if self.unused_exports:
+            exports_by_file = defaultdict(list)
+            for item in self.unused_exports:
+                exports_by_file[item['file']].append(item)
+            report.append(f"**Total:** {len(self.unused_exports)} exports em {len(exports_by_file)} arquivos")
+            report.append("")
+            for file, items in sorted(exports_by_file.items(), key=lambda x: len(x[1]), reverse=True)[:30]:
+                names = ', '.join(f"`{i['name']}`" + ('' if i['used_locally'] else '*') for i in items)
+                report.append(f"- **{self._relative_to_src(file)}**: {names}")
+            report.append("")
+            report.append("*\\* também não é usado dentro do próprio arquivo (candidato a remoção)*")
+        else:
+            report.append("✅ **Todos os exports são importados em algum lugar!**")
+        report.append("")
+        
+        report.append("## 🏝️ Arquivos Inalcançáveis")
+        report.append("*Arquivos que nenhuma página de entrada alcança pelo grafo de imports (estáticos e dinâmicos)*")
+        report.append("")
+        if self.unreachable_files:
+            report.append(f"**Total:** {len(self.unreachable_files)} arquivos")
+            report.append("")
+            for file in self.unreachable_files:
+                report.append(f"- `{self._relative_to_src(file)}`")
+        else:
+            report.append("✅ **Todos os arquivos são alcançáveis a partir das páginas!**")
+        report.append("")
+        
         # 4. Sugestões de Lazy Loading
         report.append("## ⚡ Componentes Candidatos para Lazy Loading")
         lazy_candidates = self.find_lazy_loadable_components()
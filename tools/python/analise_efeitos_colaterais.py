@@ -0,0 +1,556 @@
+#!/usr/bin/env python3
+"""
+Análise de Efeitos Colaterais de Módulos - Doc Forge Buddy
+Identifica módulos com instruções de nível superior que produzem efeitos
+(imports de CSS, service worker, polyfills, registros globais, chamadas no topo)
+e gera uma allowlist precisa de ``sideEffects`` para o package.json / Rollup
+"""
+
+import os
+import json
+import argparse
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from symbol_index import SymbolIndex, ModuleInfo, is_test_file, type_positions
+from ts_tokenizer import Token, matching_brackets
+
+STYLE_EXTENSIONS = ('.css', '.scss', '.sass', '.less', '.styl', '.pcss')
+
+# Objetos globais do navegador / worker
+GLOBAL_OBJECTS = {'window', 'self', 'globalThis', 'global', 'document', 'navigator', 'location',
+                  'localStorage', 'sessionStorage', 'console', 'history'}
+
+# Chamadas sem efeito observável fora do próprio valor retornado
+PURE_CALLS = {
+    'createContext', 'lazy', 'memo', 'forwardRef', 'create', 'createStore', 'createClient',
+    'cva', 'cn', 'clsx', 'styled', 'Symbol', 'freeze', 'keys', 'values', 'entries', 'fromEntries',
+    'from', 'of', 'parse', 'stringify', 'map', 'filter', 'reduce', 'join', 'split', 'concat',
+    'slice', 'replace', 'trim', 'toLowerCase', 'toUpperCase', 'String', 'Number', 'Boolean',
+    'parseInt', 'parseFloat', 'defineConfig', 'object', 'string', 'number', 'array', 'enum',
+    'optional', 'nullable', 'min', 'max', 'email', 'regex', 'refine', 'extend', 'pick', 'omit',
+    'partial', 'union', 'literal', 'boolean', 'date', 'infer', 'RegExp', 'Map', 'Set', 'WeakMap',
+    'WeakSet', 'Date', 'Error', 'QueryClient', 'NumberFormat', 'DateTimeFormat', 'Collator',
+    'createColumnHelper', 'createBrowserRouter', 'withProfiler', 'assign',
+}
+
+LISTENER_CALLS = {'addEventListener', 'on', 'once', 'onAuthStateChange'}
+SUBSCRIPTION_CALLS = {'setInterval', 'setTimeout', 'requestAnimationFrame', 'requestIdleCallback',
+                      'subscribe', 'observe'}
+REGISTRATION_CALLS = {'register', 'use', 'init', 'mount', 'render', 'configure', 'setup',
+                      'precacheAndRoute', 'clientsClaim', 'skipWaiting', 'setCatchHandler',
+                      'setDefaultHandler', 'cleanupOutdatedCaches', 'defineProperty', 'locale'}
+
+CONTROL_KEYWORDS = {'if', 'for', 'while', 'switch', 'catch', 'with', 'return', 'typeof', 'await',
+                    'function', 'void', 'delete', 'in', 'of', 'new', 'case', 'throw', 'yield', 'else',
+                    'async'}
+PURE_DECLARATIONS = {'function', 'class', 'interface', 'type', 'enum', 'declare', 'abstract',
+                     'namespace', 'module', 'async'}
+CONTINUATION_NAMES = {'else', 'catch', 'finally', 'as', 'satisfies', 'extends', 'implements',
+                      'instanceof', 'in', 'of', 'from', 'keyof'}
+# Palavras que nunca encerram uma instrução
+OPEN_ENDED_NAMES = CONTINUATION_NAMES | {'export', 'import', 'default', 'const', 'let', 'var', 'class',
+                                         'function', 'async', 'await', 'new', 'typeof', 'type',
+                                         'interface', 'enum', 'declare', 'abstract', 'delete', 'void'}
+ASSIGNMENT_OPERATORS = {'=', '+=', '-=', '*=', '/=', '%=', '**=', '<<=', '>>=', '>>>=', '&=', '|=',
+                        '^=', '&&=', '||=', '??='}
+
+# Categorias que obrigam o módulo a entrar na allowlist
+DEFINITE_CATEGORIES = ('css', 'service-worker', 'polyfill', 'global-assignment', 'imported-mutation',
+                       'listener', 'subscription', 'registration', 'top-level-call')
+CATEGORY_LABELS = {
+    'css': 'Folha de estilo importada',
+    'service-worker': 'Service worker',
+    'polyfill': 'Polyfill / alteração de protótipo',
+    'global-assignment': 'Atribuição em objeto global',
+    'imported-mutation': 'Mutação de módulo importado',
+    'listener': 'Registro de listener',
+    'subscription': 'Timer / assinatura',
+    'registration': 'Registro global',
+    'top-level-call': 'Chamada no nível superior',
+    'initializer': 'Inicializador com chamada (revisar)',
+}
+
+
+@dataclass
+class SideEffect:
+    category: str
+    line: int
+    snippet: str
+
+
+@dataclass
+class ModuleSideEffects:
+    path: str
+    effects: List[SideEffect] = field(default_factory=list)
+    bare_importers: List[str] = field(default_factory=list)
+
+    @property
+    def categories(self) -> Set[str]:
+        return {effect.category for effect in self.effects}
+
+    @property
+    def is_side_effectful(self) -> bool:
+        return any(category in DEFINITE_CATEGORIES for category in self.categories)
+
+
+def _starts_new_statement(prev: Token, token: Token, source: str) -> bool:
+    """Inserção automática de ponto e vírgula (aproximada) entre dois tokens de topo"""
+    if '\n' not in source[prev.end:token.start]:
+        return False
+    if prev.kind == 'punct' and prev.value not in (')', ']', '}', '++', '--'):
+        return False
+    if prev.kind == 'name' and prev.value in OPEN_ENDED_NAMES:
+        return False
+    if token.kind == 'punct':
+        return token.value == '@'
+    if token.kind == 'name' and token.value in CONTINUATION_NAMES:
+        return False
+    return True
+
+
+def top_level_statements(tokens: List[Token], brackets: List[int], source: str) -> List[Tuple[int, int]]:
+    """Divide os tokens em instruções de nível superior: lista de (início, fim exclusivo)"""
+    statements = []
+    n = len(tokens)
+    start = 0
+    i = 0
+    while i < n:
+        token = tokens[i]
+        if token.kind == 'punct' and token.value == ';':
+            if i > start:
+                statements.append((start, i))
+            start = i + 1
+            i += 1
+            continue
+        if i > start and _starts_new_statement(tokens[i - 1], token, source):
+            statements.append((start, i))
+            start = i
+        if token.kind == 'punct' and token.value in ('(', '[', '{') and brackets[i] > i:
+            i = brackets[i] + 1
+            continue
+        i += 1
+    if start < n:
+        statements.append((start, n))
+    return statements
+
+
+class SideEffectAnalyzer:
+    """Detecta efeitos colaterais de nível superior módulo a módulo"""
+
+    def __init__(self, project_root: str, index: Optional[SymbolIndex] = None, include_tests: bool = False):
+        self.project_root = Path(project_root)
+        self.index = index
+        self.include_tests = include_tests
+        self.results: Dict[str, ModuleSideEffects] = {}
+        self.stylesheets: Dict[str, List[str]] = defaultdict(list)
+        self.external_effect_imports: Dict[str, List[str]] = defaultdict(list)
+
+    # -------------------------------------------------------------- varredura
+    def _skip_function(self, tokens: List[Token], brackets: List[int], in_type: bytearray, i: int, end: int) -> int:
+        """Pula o corpo de uma função/método que começa após ``i`` (não é executado no topo)"""
+        k = i
+        while k < end and not (tokens[k].kind == 'punct' and tokens[k].value == '('):
+            k += 1
+        if k >= end or brackets[k] < 0:
+            return i + 1
+        k = brackets[k] + 1
+        while k < end and in_type[k]:
+            k += 1
+        if k < end and tokens[k].value == ':':
+            k += 1
+            while k < end and in_type[k]:
+                k += 1
+        if k < end and tokens[k].value == '{' and brackets[k] > 0:
+            return brackets[k] + 1
+        return k
+
+    def _skip_arrow_body(self, tokens: List[Token], brackets: List[int], k: int, end: int) -> int:
+        """Pula o corpo de uma arrow function; ``k`` aponta para o token após ``=>``"""
+        if k < end and tokens[k].value == '{' and brackets[k] > 0:
+            return brackets[k] + 1
+        while k < end:
+            token = tokens[k]
+            if token.kind == 'punct':
+                if token.value in ('(', '[', '{') and brackets[k] > 0:
+                    k = brackets[k] + 1
+                    continue
+                if token.value in (',', ';', ')', ']', '}'):
+                    return k
+            k += 1
+        return k
+
+    def _callee(self, tokens: List[Token], k: int) -> Tuple[List[str], int]:
+        """Cadeia ``a.b.c`` que termina no token ``k`` e o índice do primeiro token"""
+        chain = [tokens[k].value]
+        first = k
+        while first >= 2 and tokens[first - 1].value in ('.', '?.') and tokens[first - 2].kind == 'name':
+            first -= 2
+            chain.insert(0, tokens[first].value)
+        return chain, first
+
+    def _is_pure_annotated(self, source: str, tokens: List[Token], first: int) -> bool:
+        before = first - 1
+        if before >= 0 and tokens[before].value == 'new':
+            before -= 1
+        gap_start = tokens[before].end if before >= 0 else 0
+        gap = source[gap_start:tokens[first].start]
+        return '__PURE__' in gap
+
+    def _classify_call(self, chain: List[str], locals_: Set[str]) -> Optional[str]:
+        last = chain[-1]
+        if last in LISTENER_CALLS:
+            return 'listener'
+        if last in SUBSCRIPTION_CALLS:
+            return 'subscription'
+        if last in REGISTRATION_CALLS or last.startswith(('register', 'init', 'install', 'setup')):
+            if last == 'defineProperty' or 'prototype' in chain:
+                return 'polyfill'
+            return 'registration'
+        if chain[0] in GLOBAL_OBJECTS:
+            return 'top-level-call'
+        if last in PURE_CALLS:
+            return None
+        if len(chain) > 1 and chain[0] in locals_:
+            return 'initializer'  # método de um objeto do próprio módulo
+        return 'call'
+
+    def _scan_statement(self, module: ModuleInfo, brackets: List[int], in_type: bytearray,
+                        start: int, end: int, imported: Set[str], locals_: Set[str]) -> List[Tuple[str, int]]:
+        """Percorre os tokens executados de uma instrução; retorna (categoria, índice do token)"""
+        tokens = module.tokens
+        source = module.source
+        found = []
+        k = start
+        while k < end:
+            token = tokens[k]
+            if in_type[k]:
+                k += 1
+                continue
+            value = token.value
+            if token.kind == 'name':
+                if value == 'function':
+                    k = self._skip_function(tokens, brackets, in_type, k, end)
+                    continue
+                if value == 'class':
+                    j = k + 1
+                    while j < end and tokens[j].value != '{':
+                        j += 1
+                    k = brackets[j] + 1 if j < end and brackets[j] > 0 else j
+                    continue
+            elif token.kind == 'punct':
+                if value == '=>':
+                    k = self._skip_arrow_body(tokens, brackets, k + 1, end)
+                    continue
+                if value == '(' and brackets[k] > 0:
+                    prev = tokens[k - 1] if k > start else None
+                    close = brackets[k]
+                    after = close + 1
+                    while after < end and in_type[after]:
+                        after += 1
+                    if after < end and tokens[after].value == ':':
+                        after += 1
+                        while after < end and in_type[after]:
+                            after += 1
+                    is_method = (prev is not None and prev.kind == 'name' and prev.value not in CONTROL_KEYWORDS
+                                 and after < end and tokens[after].value == '{' and brackets[after] > 0)
+                    if is_method:
+                        k = brackets[after] + 1
+                        continue
+                    if prev is not None and prev.value == 'import' and k - 2 >= start \
+                            and tokens[k - 2].value == 'typeof':
+                        k = close + 1  # typeof import('x') é só tipo
+                        continue
+                    if prev is not None and (prev.kind == 'name' and prev.value not in CONTROL_KEYWORDS
+                                             or prev.value in (')', ']')):
+                        if prev.kind == 'name':
+                            chain, first = self._callee(tokens, k - 1)
+                        else:
+                            chain, first = ['<expressão>'], k - 1
+                        if not self._is_pure_annotated(source, tokens, first):
+                            category = self._classify_call(chain, locals_)
+                            if category:
+                                found.append((category, first))
+                elif value in ASSIGNMENT_OPERATORS and k > start and tokens[k - 1].kind == 'name' \
+                        and not in_type[k - 1]:
+                    chain, first = self._callee(tokens, k - 1)
+                    if first > start and tokens[first - 1].value in ('.', '?.', 'const', 'let', 'var'):
+                        pass
+                    elif chain[0] in GLOBAL_OBJECTS:
+                        found.append(('polyfill' if 'prototype' in chain else 'global-assignment', first))
+                    elif 'prototype' in chain:
+                        found.append(('polyfill', first))
+                    elif len(chain) > 1 and chain[0] in imported:
+                        found.append(('imported-mutation', first))
+            k += 1
+        return found
+
+    def _snippet(self, module: ModuleInfo, index: int) -> str:
+        token = module.tokens[index]
+        line_start = module.source.rfind('\n', 0, token.start) + 1
+        line_end = module.source.find('\n', token.start)
+        text = module.source[line_start:line_end if line_end >= 0 else None].strip()
+        return text if len(text) <= 90 else text[:87] + '...'
+
+    def analyze_module(self, module: ModuleInfo) -> ModuleSideEffects:
+        result = ModuleSideEffects(module.path)
+        tokens = module.tokens
+        if not tokens:
+            return result
+        brackets = matching_brackets(tokens)
+        in_type = type_positions(tokens)
+        imported = {b.local for s in module.imports for b in s.bindings}
+        is_polyfill_file = 'polyfill' in module.path.lower()
+
+        if module.path.endswith(('service-worker.ts', 'service-worker.js', 'sw.ts', 'sw.js')):
+            result.effects.append(SideEffect('service-worker', 1, module.path))
+
+        for statement in module.imports:
+            if statement.dynamic or statement.type_only or statement.bindings:
+                continue
+            target = statement.resolved
+            if statement.source.split('?')[0].endswith(STYLE_EXTENSIONS):
+                self.stylesheets[target or statement.source].append(module.path)
+            elif target is None:
+                self.external_effect_imports[statement.source].append(module.path)
+
+        statements = top_level_statements(tokens, brackets, module.source)
+        locals_ = set()
+        for start, end in statements:
+            k = start + 1 if tokens[start].value == 'export' else start
+            if k + 1 < end and tokens[k].value in ('const', 'let', 'var') and tokens[k + 1].kind == 'name':
+                locals_.add(tokens[k + 1].value)
+
+        seen = set()
+        for start, end in statements:
+            first = tokens[start]
+            head = first.value
+            if head in ('import', 'export'):
+                if head == 'import' and start + 1 < end and tokens[start + 1].value not in ('(', '.'):
+                    continue
+                if head == 'export':
+                    nxt = tokens[start + 1].value if start + 1 < end else ''
+                    if nxt in ('{', '*', 'type', 'interface', 'declare', 'enum', 'abstract'):
+                        continue
+                    if nxt in ('function', 'class', 'async'):
+                        continue
+                    if nxt == 'default':
+                        after = tokens[start + 2].value if start + 2 < end else ''
+                        if after in ('function', 'class', 'async', 'interface', 'abstract'):
+                            continue
+                        head = 'default'
+                    else:
+                        head = nxt  # export const/let/var
+                    start += 1
+            elif head in PURE_DECLARATIONS and head != 'async':
+                if head != 'type' or (start + 1 < end and tokens[start + 1].kind == 'name'):
+                    continue
+            elif head == 'async' and start + 1 < end and tokens[start + 1].value == 'function':
+                continue
+
+            declaration = head in ('const', 'let', 'var', 'default')
+            for category, index in self._scan_statement(module, brackets, in_type, start, end,
+                                                        imported, locals_):
+                if category == 'call':
+                    category = 'initializer' if declaration else 'top-level-call'
+                if is_polyfill_file and category in ('top-level-call', 'global-assignment'):
+                    category = 'polyfill'
+                line = tokens[index].line
+                if line in seen:
+                    continue
+                seen.add(line)
+                result.effects.append(SideEffect(category, tokens[index].line, self._snippet(module, index)))
+        return result
+
+    # ---------------------------------------------------------------- análise
+    def run_analysis(self) -> Dict[str, ModuleSideEffects]:
+        print("🔍 Indexando módulos...")
+        if self.index is None:
+            self.index = SymbolIndex(str(self.project_root)).build()
+
+        print("🧪 Procurando efeitos colaterais no nível superior...")
+        for path, module in sorted(self.index.modules.items()):
+            if path.endswith('.d.ts') or (not self.include_tests and is_test_file(path)):
+                continue
+            self.results[path] = self.analyze_module(module)
+
+        # Quem importa o módulo só pelos efeitos (import './x')
+        for path, module in self.index.modules.items():
+            for statement in module.imports:
+                if statement.bindings or statement.dynamic or statement.type_only:
+                    continue
+                if statement.resolved in self.results:
+                    self.results[statement.resolved].bare_importers.append(path)
+
+        effectful = [r for r in self.results.values() if r.is_side_effectful]
+        print(f"✅ {len(effectful)} módulos com efeitos colaterais de {len(self.results)} analisados")
+        return self.results
+
+    def allowlist(self) -> List[str]:
+        """Entradas para ``sideEffects`` do package.json (caminhos relativos à raiz)"""
+        entries = set()
+        for stylesheet in self.stylesheets:
+            if os.path.isfile(self.project_root / stylesheet):
+                entries.add(f"./{stylesheet}")
+            else:
+                entries.add('**/*.css')  # não resolvido: mantém todas as folhas de estilo
+        for path, result in self.results.items():
+            if result.is_side_effectful:
+                entries.add(f"./{path}")
+        return sorted(entries)
+
+    def suspicious_bare_imports(self) -> List[Tuple[str, str]]:
+        """Imports só por efeito de módulos sem efeito detectado: seriam removidos com sideEffects"""
+        findings = []
+        for path, result in sorted(self.results.items()):
+            if result.bare_importers and not result.is_side_effectful:
+                for importer in sorted(result.bare_importers):
+                    findings.append((importer, path))
+        return findings
+
+    # -------------------------------------------------------------- relatório
+    def generate_report(self, output_file: str, allowlist_file: Optional[str] = None) -> None:
+        allowlist = self.allowlist()
+        effectful = sorted((r for r in self.results.values() if r.is_side_effectful), key=lambda r: r.path)
+        review = sorted((r for r in self.results.values()
+                         if not r.is_side_effectful and 'initializer' in r.categories), key=lambda r: r.path)
+
+        by_category = defaultdict(int)
+        for result in effectful:
+            for category in result.categories & set(DEFINITE_CATEGORIES):
+                by_category[category] += 1
+        by_category['css'] = len(self.stylesheets)
+
+        report = f"""# Análise de Efeitos Colaterais de Módulos - Doc Forge Buddy
+
+**Data da análise:** {datetime.now().strftime('%d/%m/%Y %H:%M')}
+**Módulos analisados:** {len(self.results)}
+**Módulos com efeitos colaterais:** {len(effectful)}
+**Folhas de estilo importadas:** {len(self.stylesheets)}
+
+## 📊 Resumo por Categoria
+
+| Categoria | Módulos |
+|-----------|---------|
+"""
+        for category in DEFINITE_CATEGORIES:
+            if by_category.get(category):
+                report += f"| {CATEGORY_LABELS[category]} | {by_category[category]} |\n"
+
+        report += """
+## ✅ Allowlist `sideEffects`
+
+Todos os demais módulos podem ser tratados como livres de efeitos. Use no `package.json`:
+
+```json
+"""
+        report += json.dumps({'sideEffects': allowlist}, indent=2, ensure_ascii=False)
+        report += """
+```
+
+Ou no Rollup/Vite (`build.rollupOptions.treeshake`):
+
+```ts
+"""
+        report += f"const SIDE_EFFECT_MODULES = {json.dumps(allowlist, indent=2, ensure_ascii=False)};\n"
+        report += """
+// build.rollupOptions.treeshake
+moduleSideEffects: (id) =>
+  SIDE_EFFECT_MODULES.some((entry) =>
+    entry.startsWith('**/') ? id.endsWith(entry.slice('**/*'.length)) : id.endsWith(entry.slice(1))
+  ),
+```
+
+## 🧨 Módulos com Efeitos Colaterais
+
+"""
+        for result in effectful:
+            report += f"### `{result.path}`\n\n"
+            if result.bare_importers:
+                report += f"Importado por efeito em: {', '.join(f'`{p}`' for p in sorted(result.bare_importers))}\n\n"
+            for effect in result.effects[:10]:
+                if effect.category == 'initializer':
+                    continue
+                report += f"- L{effect.line} **{CATEGORY_LABELS[effect.category]}**: `{effect.snippet}`\n"
+            if len(result.effects) > 10:
+                report += f"- ... e mais {len(result.effects) - 10} instruções\n"
+            report += "\n"
+
+        if self.stylesheets:
+            report += "## 🎨 Folhas de Estilo\n\n| Arquivo | Importado por |\n|---------|---------------|\n"
+            for stylesheet, importers in sorted(self.stylesheets.items()):
+                report += f"| `{stylesheet}` | {', '.join(f'`{p}`' for p in sorted(set(importers)))} |\n"
+            report += "\n"
+
+        if self.external_effect_imports:
+            report += "## 📦 Pacotes Importados Apenas por Efeito\n\n"
+            report += "O `sideEffects` do próprio pacote decide se eles são preservados.\n\n"
+            for source, importers in sorted(self.external_effect_imports.items()):
+                report += f"- `{source}` ← {', '.join(f'`{p}`' for p in sorted(set(importers)))}\n"
+            report += "\n"
+
+        suspicious = self.suspicious_bare_imports()
+        if suspicious:
+            report += "## ⚠️ Imports por Efeito sem Efeito Detectado\n\n"
+            report += "Com `sideEffects` restrito estes imports seriam removidos; confirme se são necessários.\n\n"
+            for importer, target in suspicious:
+                report += f"- `{importer}` → `{target}`\n"
+            report += "\n"
+
+        if review:
+            report += "## 🔎 Inicializadores para Revisão\n\n"
+            report += ("Chamadas em inicializadores de `const`/`export default`. Só são executadas se o módulo "
+                       "for mantido; não exigem entrada na allowlist, a menos que o efeito seja necessário "
+                       "mesmo sem uso dos exports.\n\n")
+            for result in review[:40]:
+                effect = next(e for e in result.effects if e.category == 'initializer')
+                report += f"- `{result.path}`:{effect.line} `{effect.snippet}`\n"
+            if len(review) > 40:
+                report += f"- ... e mais {len(review) - 40} módulos\n"
+            report += "\n"
+
+        report += """## 💡 Recomendações
+
+1. **Declare `sideEffects`** no `package.json` com a allowlist acima em vez de `moduleSideEffects: false`
+2. **Mova registros globais** (listeners, `register`, atribuições em `window`) para funções `init*` chamadas pela entrada
+3. **Anote fábricas puras** com `/*#__PURE__*/` quando o bundler não puder inferir
+4. **Reexecute esta análise** sempre que um módulo novo tiver código no nível superior
+
+---
+*Relatório gerado automaticamente pela análise de efeitos colaterais*
+"""
+
+        Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(report)
+        print(f"📄 Relatório salvo em: {output_file}")
+
+        if allowlist_file:
+            with open(allowlist_file, 'w', encoding='utf-8') as f:
+                json.dump({'sideEffects': allowlist}, f, indent=2, ensure_ascii=False)
+                f.write('\n')
+            print(f"📄 Allowlist salva em: {allowlist_file}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Análise de efeitos colaterais de módulos')
+    parser.add_argument('--project-dir', default='/workspace/doc-forge-buddy-Cain',
+                        help='Diretório do projeto')
+    parser.add_argument('--output', default='docs/analise_efeitos_colaterais.md',
+                        help='Arquivo de saída do relatório')
+    parser.add_argument('--allowlist', default=None,
+                        help='Arquivo JSON para gravar a allowlist sideEffects')
+    parser.add_argument('--include-tests', action='store_true',
+                        help='Inclui arquivos de teste na análise')
+    args = parser.parse_args()
+
+    analyzer = SideEffectAnalyzer(args.project_dir, include_tests=args.include_tests)
+    analyzer.run_analysis()
+    analyzer.generate_report(args.output, args.allowlist)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,458 @@
+#!/usr/bin/env python3
+"""
+Hotspots de Churn x Complexidade - Doc Forge Buddy
+Combina o histórico do git com a complexidade do ``RefinedCyclomaticAnalyzer``: código
+complexo que muda com frequência é onde a refatoração tem mais retorno.
+
+O histórico é lido em uma única passada de ``git log --reverse -M -p -U0``, processada
+em streaming: só cabeçalhos de diff e de hunk são interpretados. Renomeações (``-M``)
+levam o histórico do caminho antigo para o novo, como o ``--follow`` faria para cada
+arquivo. Por arquivo são somados commits, linhas adicionadas/removidas, autores e um
+churn com decaimento exponencial (meia-vida configurável). Para o churn por função,
+cada hunk vira um segmento de linhas que é deslocado pelos hunks dos commits seguintes,
+de modo que no HEAD ele cai sobre os intervalos atuais das funções.
+
+O estado fica em cache por commit (``node_modules/.cache/doc-forge-tools/churn.json``):
+execuções seguintes só processam ``<último commit>..HEAD``.
+"""
+
+import argparse
+import json
+import math
+import os
+import subprocess
+import time
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from analise_complexidade_refinada import RefinedCyclomaticAnalyzer
+from results_store import ResultsStore
+
+CACHE_FILE = 'node_modules/.cache/doc-forge-tools/churn.json'
+CACHE_VERSION = 1
+COMMIT_MARKER = b'\x1e'
+SOURCE_EXTENSIONS = ('.ts', '.tsx')
+TEST_MARKERS = ('.test.', '.spec.', '/__tests__/', '/test/', '/tests/', '/stories/')
+SECONDS_PER_DAY = 86400.0
+
+# Segmento de churn: [linha inicial, comprimento, linhas alteradas, timestamp]
+Segment = List[float]
+
+
+def _new_file_state() -> Dict:
+    return {'commits': 0, 'added': 0, 'deleted': 0, 'authors': [], 'decayed': 0.0,
+            'decayed_ts': 0, 'first_ts': 0, 'last_ts': 0, 'segments': []}
+
+
+def _parse_hunk(line: bytes) -> Tuple[int, int, int, int]:
+    """b'@@ -a,b +c,d @@' -> (a, b, c, d); contagem omitida vale 1"""
+    old, new = line.split(b' ', 3)[1:3]
+    a, _, b = old[1:].partition(b',')
+    c, _, d = new[1:].partition(b',')
+    return int(a), int(b) if b else 1, int(c), int(d) if d else 1
+
+
+def _decode_path(raw: bytes) -> str:
+    path = raw.rstrip(b'\r\n').decode('utf-8', 'replace')
+    if path.startswith('"') and path.endswith('"'):
+        path = path[1:-1].encode('latin-1', 'replace').decode('unicode_escape', 'replace')
+    return path
+
+
+def shift_segments(segments: List[Segment], hunks: List[Tuple[int, int, int, int]]) -> List[Segment]:
+    """Leva segmentos das coordenadas antigas para as novas de um commit
+
+    Linhas dentro de um intervalo substituído por um hunk saem do segmento (o hunk
+    gera o próprio segmento); o restante é deslocado pelo saldo dos hunks anteriores.
+    O churn de um segmento cortado é dividido na proporção do comprimento.
+    """
+    ranges = []  # (início antigo, fim antigo exclusivo, saldo acumulado após o hunk)
+    delta = 0
+    for a, b, _c, d in sorted(hunks):
+        start = a + 1 if b == 0 else a
+        delta += d - b
+        ranges.append((start, start + b, delta))
+
+    result = []
+    for start, length, churn, ts in segments:
+        end = start + length
+        cursor, offset = start, 0
+        for old_start, old_end, after in ranges:
+            if old_end <= cursor:
+                offset = after
+                continue
+            if old_start >= end:
+                break
+            if old_start > cursor:
+                result.append([cursor + offset, old_start - cursor, churn * (old_start - cursor) / length, ts])
+            cursor = max(cursor, old_end)
+            offset = after
+            if cursor >= end:
+                break
+        if cursor < end:
+            result.append([cursor + offset, end - cursor, churn * (end - cursor) / length, ts])
+    return result
+
+
+class ChurnHotspotEngine:
+    """Churn por arquivo e por função a partir de uma passada incremental do git log"""
+
+    def __init__(self, project_root: str, half_life_days: float = 90.0, use_cache: bool = True):
+        self.project_root = Path(project_root).resolve()
+        self.half_life_days = half_life_days
+        self.use_cache = use_cache
+        self.git_root = Path(self._git('rev-parse', '--show-toplevel').strip())
+        prefix = self.project_root.relative_to(self.git_root).as_posix()
+        self.prefix = '' if prefix == '.' else prefix + '/'
+        self.head = ''
+        self.reference_ts = 0
+        self.files: Dict[str, Dict] = {}
+        self.stats = {'commits': 0, 'new_commits': 0, 'renames': 0, 'hunks': 0, 'seconds': 0.0, 'incremental': False}
+
+    @property
+    def cache_path(self) -> Path:
+        return self.project_root / CACHE_FILE
+
+    def _git(self, *args: str) -> str:
+        return subprocess.run(['git', *args], cwd=self.project_root, capture_output=True, text=True,
+                              check=True).stdout
+
+    def _is_ancestor(self, commit: str) -> bool:
+        return subprocess.run(['git', 'merge-base', '--is-ancestor', commit, 'HEAD'], cwd=self.project_root,
+                              capture_output=True).returncode == 0
+
+    def _decay(self, age_seconds: float) -> float:
+        return 0.5 ** (max(age_seconds, 0.0) / (self.half_life_days * SECONDS_PER_DAY))
+
+    # ------------------------------------------------------------------- cache
+    def _load_cache(self) -> bool:
+        if not self.use_cache or not self.cache_path.exists():
+            return False
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if (data.get('version') != CACHE_VERSION or data.get('prefix') != self.prefix
+                or data.get('half_life_days') != self.half_life_days or not self._is_ancestor(data.get('head', ''))):
+            return False
+        self.head = data['head']
+        self.reference_ts = data['reference_ts']
+        self.files = data['files']
+        self.stats['commits'] = data.get('commits', 0)
+        return True
+
+    def _save_cache(self) -> None:
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': CACHE_VERSION, 'prefix': self.prefix, 'half_life_days': self.half_life_days,
+                           'head': self.head, 'reference_ts': self.reference_ts, 'commits': self.stats['commits'],
+                           'files': self.files}, f, separators=(',', ':'))
+        except OSError as e:
+            print(f"⚠️  Não foi possível salvar o cache de churn: {e}")
+
+    # ------------------------------------------------------------------ stream
+    def _relative(self, path: Optional[str]) -> Optional[str]:
+        if path is None or not path.startswith(self.prefix):
+            return None
+        return path[len(self.prefix):]
+
+    def _stream(self, revision_range: Optional[str]) -> Iterator[bytes]:
+        command = ['git', '-c', 'core.quotePath=false', 'log', '--reverse', '-M', '-p', '-U0', '--no-color',
+                   '--no-ext-diff', '--no-textconv', '--format=%x1e%H%x1f%ct%x1f%aN']
+        if revision_range:
+            command.append(revision_range)
+        command += ['--', self.prefix or '.']
+        process = subprocess.Popen(command, cwd=self.git_root, stdout=subprocess.PIPE, bufsize=1 << 20)
+        try:
+            yield from process.stdout
+        finally:
+            process.stdout.close()
+            if process.wait() != 0:
+                raise RuntimeError(f"git log falhou (código {process.returncode})")
+
+    def _apply_file(self, commit: Tuple[str, int, str], old_path: Optional[str], new_path: Optional[str],
+                    hunks: List[Tuple[int, int, int, int]]) -> None:
+        _, ts, author = commit
+        old_path, new_path = self._relative(old_path), self._relative(new_path)
+        if new_path is None:  # removido (ou movido para fora do projeto)
+            if old_path:
+                self.files.pop(old_path, None)
+            return
+        if old_path and old_path != new_path and old_path in self.files:
+            self.files[new_path] = self.files.pop(old_path)
+            self.stats['renames'] += 1
+        if not hunks:
+            return
+        state = self.files.setdefault(new_path, _new_file_state())
+        added = sum(d for _, _, _, d in hunks)
+        deleted = sum(b for _, b, _, _ in hunks)
+        state['commits'] += 1
+        state['added'] += added
+        state['deleted'] += deleted
+        if author not in state['authors']:
+            state['authors'].append(author)
+        state['first_ts'] = state['first_ts'] or ts
+        state['last_ts'] = max(state['last_ts'], ts)
+        # Churn decaído mantido na referência do commit mais recente
+        state['decayed'] = state['decayed'] * self._decay(self.reference_ts - (state['decayed_ts'] or ts))
+        state['decayed'] += (added + deleted) * self._decay(self.reference_ts - ts)
+        state['decayed_ts'] = self.reference_ts
+
+        segments = shift_segments(state['segments'], hunks) if state['segments'] else []
+        for a, b, c, d in hunks:
+            start = c if d else max(c, 1)
+            segments.append([start, max(d, 1), float(b + d), ts])
+        state['segments'] = [s for s in segments if s[2] >= 0.01]
+        self.stats['hunks'] += len(hunks)
+
+    def update(self) -> None:
+        """Processa os commits que ainda não estão no cache"""
+        started = time.perf_counter()
+        head = self._git('rev-parse', 'HEAD').strip()
+        cached = self._load_cache()
+        self.stats['incremental'] = cached
+        if cached and self.head == head:
+            self.stats['seconds'] = time.perf_counter() - started
+            return
+        if not cached:
+            self.files, self.reference_ts, self.stats['commits'] = {}, 0, 0
+
+        commit: Optional[Tuple[str, int, str]] = None
+        old_path = new_path = None
+        hunks: List[Tuple[int, int, int, int]] = []
+        in_file = in_body = False
+
+        def flush():
+            if commit is not None and in_file:
+                self._apply_file(commit, old_path, new_path, hunks)
+
+        for line in self._stream(f"{self.head}..HEAD" if cached else None):
+            first = line[:1]
+            if in_body and first in (b'+', b'-', b' ', b'\\'):
+                continue
+            if first == COMMIT_MARKER:
+                flush()
+                sha, ts, author = line[1:].rstrip(b'\r\n').decode('utf-8', 'replace').split('\x1f', 2)
+                commit = (sha, int(ts), author)
+                self.reference_ts = max(self.reference_ts, int(ts))
+                self.stats['commits'] += 1
+                self.stats['new_commits'] += 1
+                in_file = in_body = False
+            elif line.startswith(b'diff --git '):
+                flush()
+                body = line[len(b'diff --git '):].rstrip(b'\r\n')
+                split = body.rfind(b' b/')
+                old_path = _decode_path(body[2:split]) if split > 0 else None
+                new_path = _decode_path(body[split + 3:]) if split > 0 else None
+                hunks, in_file, in_body = [], True, False
+            elif line.startswith(b'@@'):
+                hunks.append(_parse_hunk(line))
+                in_body = True
+            elif in_file and not in_body:
+                if line.startswith(b'--- '):
+                    old_path = None if line.startswith(b'--- /dev/null') else _decode_path(line[6:])
+                elif line.startswith(b'+++ '):
+                    new_path = None if line.startswith(b'+++ /dev/null') else _decode_path(line[6:])
+                elif line.startswith(b'rename from '):
+                    old_path = _decode_path(line[len(b'rename from '):])
+                elif line.startswith(b'rename to '):
+                    new_path = _decode_path(line[len(b'rename to '):])
+                elif line.startswith(b'deleted file mode'):
+                    new_path = None
+        flush()
+
+        self.head = head
+        self._save_cache()
+        self.stats['seconds'] = time.perf_counter() - started
+
+    # --------------------------------------------------------------- consultas
+    def file_churn(self, path: str) -> float:
+        state = self.files.get(path)
+        if not state:
+            return 0.0
+        return state['decayed'] * self._decay(self.reference_ts - state.get('decayed_ts', self.reference_ts))
+
+    def function_churn(self, path: str, line_start: int, line_end: int) -> float:
+        """Churn decaído dos segmentos que caem no intervalo da função no HEAD"""
+        total = 0.0
+        for start, length, churn, ts in self.files.get(path, {}).get('segments', []):
+            overlap = min(start + length, line_end + 1) - max(start, line_start)
+            if overlap > 0:
+                total += churn * overlap / length * self._decay(self.reference_ts - ts)
+        return total
+
+    def effort_factors(self) -> Dict[str, float]:
+        """Multiplicador de esforço por arquivo (0.75 a 1.5) pelo percentil de churn"""
+        churn = sorted((self.file_churn(path), path) for path in self.files)
+        if not churn:
+            return {}
+        return {str(self.project_root / path): 0.75 + 0.75 * i / max(len(churn) - 1, 1)
+                for i, (_, path) in enumerate(churn)}
+
+
+class HotspotAnalyzer:
+    """Junta churn e complexidade e ordena arquivos e funções por hotspot"""
+
+    def __init__(self, engine: ChurnHotspotEngine, store: ResultsStore, jobs: Optional[int] = None):
+        self.engine = engine
+        self.store = store
+        self.jobs = jobs
+        self.file_hotspots: List[Dict] = []
+        self.function_hotspots: List[Dict] = []
+        self.analyzed = 0
+
+    def _candidates(self) -> List[str]:
+        paths = []
+        for path in self.engine.files:
+            normalized = '/' + path
+            if (path.endswith(SOURCE_EXTENSIONS) and not path.endswith('.d.ts')
+                    and not any(marker in normalized for marker in TEST_MARKERS)
+                    and (self.engine.project_root / path).exists()):
+                paths.append(path)
+        return paths
+
+    def run(self) -> None:
+        candidates = self._candidates()
+        full_paths = [str(self.engine.project_root / path) for path in candidates]
+        self.analyzed = RefinedCyclomaticAnalyzer().analyze_files(full_paths, store=self.store, jobs=self.jobs)
+        files = self.store.load_files(full_paths)
+        functions = self.store.load_functions(full_paths)
+
+        for path in candidates:
+            info, state = files.get(path), self.engine.files[path]
+            if not info:
+                continue
+            self.file_hotspots.append({
+                'path': path,
+                'complexity': info['total_complexity'],
+                'lines_of_code': info['lines_of_code'],
+                'commits': state['commits'],
+                'added': state['added'],
+                'deleted': state['deleted'],
+                'authors': len(state['authors']),
+                'last_ts': state['last_ts'],
+                'churn': self.engine.file_churn(path),
+            })
+            for function in functions.get(path, []):
+                churn = self.engine.function_churn(path, function['line_start'], function['line_end'])
+                if churn > 0:
+                    self.function_hotspots.append({**function, 'churn': churn})
+
+        self._score(self.file_hotspots)
+        self._score(self.function_hotspots)
+
+    @staticmethod
+    def _score(rows: List[Dict]) -> None:
+        """Score 0-100: complexidade e churn normalizados (log do churn) multiplicados"""
+        if not rows:
+            return
+        max_complexity = max(row['complexity'] for row in rows) or 1
+        max_churn = max(math.log1p(row['churn']) for row in rows) or 1
+        for row in rows:
+            row['score'] = 100 * (row['complexity'] / max_complexity) * (math.log1p(row['churn']) / max_churn)
+        rows.sort(key=lambda row: row['score'], reverse=True)
+
+    def generate_report(self, output_file: str, top: int = 20) -> None:
+        engine = self.engine
+        s = engine.stats
+        mode = 'incremental' if s['incremental'] else 'completa'
+        report = f"""# Hotspots de Churn x Complexidade
+
+**Data da análise:** {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}
+**HEAD:** `{engine.head[:12]}` ({datetime.fromtimestamp(engine.reference_ts).strftime('%d/%m/%Y') if engine.reference_ts else '-'})
+**Commits no histórico:** {s['commits']} ({s['new_commits']} processados nesta execução, leitura {mode} em {s['seconds']:.2f}s)
+**Meia-vida do churn:** {engine.half_life_days:g} dias
+**Arquivos com histórico:** {len(engine.files)} ({s['renames']} renomeações seguidas nesta execução)
+
+## 📊 Arquivos: Hotspots
+
+> Score = complexidade normalizada x churn decaído normalizado (escala log), de 0 a 100
+
+| Rank | Arquivo | Complexidade | Commits | Linhas +/- | Churn decaído | Autores | Último commit | Score |
+|------|---------|--------------|---------|------------|---------------|---------|---------------|-------|
+"""
+        for i, row in enumerate(self.file_hotspots[:top], 1):
+            last = datetime.fromtimestamp(row['last_ts']).strftime('%d/%m/%Y') if row['last_ts'] else '-'
+            report += (f"| {i} | `{row['path']}` | {row['complexity']:.1f} | {row['commits']} | "
+                       f"+{row['added']}/-{row['deleted']} | {row['churn']:.0f} | {row['authors']} | {last} | "
+                       f"**{row['score']:.0f}** |\n")
+
+        report += """
+## 📊 Funções: Hotspots
+
+| Rank | Função | Arquivo | Linhas | Complexidade | Cognitiva | Aninhamento | Churn decaído | Score |
+|------|--------|---------|--------|--------------|-----------|-------------|---------------|-------|
+"""
+        for i, row in enumerate(self.function_hotspots[:top], 1):
+            report += (f"| {i} | `{row['name']}` | `{row['path']}` | {row['line_start']}-{row['line_end']} | "
+                       f"{row['complexity']:.1f} | {row['cognitive_complexity']} | {row['max_nesting']} | "
+                       f"{row['churn']:.0f} | **{row['score']:.0f}** |\n")
+
+        per_directory: Dict[str, float] = defaultdict(float)
+        for row in self.file_hotspots:
+            per_directory[os.path.dirname(row['path'])] += row['score']
+        report += """
+## 📊 Diretórios com Mais Hotspots
+
+| Diretório | Score somado |
+|-----------|--------------|
+"""
+        for directory, score in sorted(per_directory.items(), key=lambda item: -item[1])[:10]:
+            report += f"| `{directory or '.'}` | {score:.0f} |\n"
+
+        report += """
+## 💡 Recomendações
+
+1. **Refatore primeiro os hotspots do topo**: complexidade só custa caro onde o código continua mudando
+2. **Arquivos complexos e estáveis** (churn baixo) podem esperar; priorize testes de caracterização antes de tocá-los
+3. **Funções hotspot em arquivos grandes** indicam onde extrair módulos: o churn mostra qual parte do arquivo é realmente editada
+4. **Muitos autores em um hotspot** aumentam o risco de conflitos; dividir o arquivo por responsabilidade reduz a coordenação necessária
+5. **Use `--with-churn` no `analise_complexidade_refinada.py`** para pesar a estimativa de esforço pelo churn
+
+---
+*Relatório gerado automaticamente pela Análise de Hotspots de Churn x Complexidade*
+"""
+        os.makedirs(os.path.dirname(os.path.abspath(output_file)), exist_ok=True)
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(report)
+        print(f"📄 Relatório salvo em: {output_file}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Hotspots de churn do git x complexidade')
+    parser.add_argument('--project-dir', default='/workspace/doc-forge-buddy-Cain',
+                        help='Diretório do projeto')
+    parser.add_argument('--half-life-days', type=float, default=90.0,
+                        help='Meia-vida do decaimento do churn (dias)')
+    parser.add_argument('--no-cache', action='store_true', help='Relê todo o histórico')
+    parser.add_argument('--store', default=None, help='Banco de resultados (padrão: cache em node_modules)')
+    parser.add_argument('--jobs', type=int, default=None, help='Processos para a análise de complexidade')
+    parser.add_argument('--top', type=int, default=20, help='Itens por ranking')
+    parser.add_argument('--output', default='docs/analise_hotspots_churn.md',
+                        help='Arquivo de saída do relatório')
+    args = parser.parse_args()
+
+    engine = ChurnHotspotEngine(args.project_dir, half_life_days=args.half_life_days, use_cache=not args.no_cache)
+    print("📜 Lendo histórico do git...")
+    engine.update()
+    s = engine.stats
+    print(f"   {s['new_commits']} commits novos ({s['commits']} no total), {s['hunks']} hunks, "
+          f"{s['renames']} renomeações em {s['seconds']:.2f}s")
+
+    with ResultsStore(args.project_dir, args.store) as store:
+        analyzer = HotspotAnalyzer(engine, store, jobs=args.jobs)
+        analyzer.run()
+    print(f"🔬 {len(analyzer.file_hotspots)} arquivos e {len(analyzer.function_hotspots)} funções com churn "
+          f"({analyzer.analyzed} arquivos reanalisados)")
+    for row in analyzer.file_hotspots[:5]:
+        print(f"   🔥 {row['path']}: complexidade {row['complexity']:.1f}, churn {row['churn']:.0f}, "
+              f"score {row['score']:.0f}")
+    analyzer.generate_report(args.output, top=args.top)
+
+
+if __name__ == "__main__":
+    main()
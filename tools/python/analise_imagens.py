@@ -0,0 +1,570 @@
+#!/usr/bin/env python3
+"""
+Auditoria de Carregamento de Imagens - Doc Forge Buddy
+Encontra todos os ``<img>``, componentes que envolvem ``<img>`` e background-image
+(inline, CSS e Tailwind), verifica ``loading="lazy"``, dimensões explícitas, ``srcset``
+e se a imagem passa por ``useImageOptimizer``/``ImageService``. Em paralelo, lê o
+cabeçalho dos arquivos de public/ para obter tamanho e dimensões e estima a economia
+em bytes das imagens maiores do que o tamanho em que são exibidas.
+"""
+
+import argparse
+import os
+import re
+import struct
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from symbol_index import SymbolIndex, ModuleInfo, is_test_file
+from ts_scopes import SourceView
+from ts_tokenizer import string_value
+
+IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.gif', '.webp', '.avif', '.svg', '.ico'}
+RASTER_RECOMPRESSIBLE = {'.png', '.jpg', '.jpeg', '.gif'}
+OPTIMIZER_MODULES = {
+    'src/hooks/shared/useImageOptimizer.ts': 'useImageOptimizer',
+    'src/services/ImageService.ts': 'ImageService',
+}
+DEVICE_PIXEL_RATIO = 2
+WEBP_RATIO = 0.7  # WebP costuma ficar ~30% menor que PNG/JPEG equivalentes
+MAX_ASSET_KB = 100
+TAILWIND_UNIT = 4  # w-24 = 24 * 4px
+VISTORIA_HINTS = ('vistoria', 'ImageService', 'vistoria_images')
+
+CSS_BACKGROUND = re.compile(r'background(?:-image)?\s*:[^;{}]*url\(\s*[\'"]?([^\'")]+)', re.IGNORECASE)
+TAILWIND_BACKGROUND = re.compile(r'bg-\[url\([\'"]?([^\'")\]]+)')
+TAILWIND_SIZE = re.compile(r'(?<![\w-])(w|h|size)-(\d+(?:\.5)?|\[(\d+)px\])(?![\w/-])')
+ASSET_REFERENCE = re.compile(r'[\'"`(](/[\w./-]+\.(?:png|jpe?g|gif|webp|avif|svg|ico))')
+SIZES_ATTRIBUTE = re.compile(r'sizes["\']?\s*[:=]\s*["\'](\d+)x(\d+)')
+
+
+@dataclass
+class AssetInfo:
+    path: str
+    size: int
+    width: Optional[int] = None
+    height: Optional[int] = None
+    format: str = ''
+
+
+@dataclass
+class ImageSite:
+    file_path: str
+    line: int
+    component: str
+    kind: str  # img, componente, background
+    tag: str
+    src: str
+    lazy: bool = False
+    dimensions: bool = False
+    srcset: bool = False
+    pipeline: str = ''
+    display: Optional[Tuple[int, int]] = None
+    vistoria: bool = False
+    priority: bool = False  # eager intencional (priority/critical/loading="eager")
+
+    @property
+    def issues(self) -> List[str]:
+        problems = []
+        if self.kind == 'background':
+            problems.append('background não tem lazy nativo')
+        else:
+            if not self.lazy and not self.priority:
+                problems.append('sem lazy')
+            if not self.dimensions:
+                problems.append('sem dimensões')
+            if not self.srcset:
+                problems.append('sem srcset')
+        if not self.pipeline:
+            problems.append('fora do otimizador')
+        return problems
+
+
+@dataclass
+class WrapperInfo:
+    name: str
+    file_path: str
+    lazy: bool
+    srcset: bool
+    pipeline: str
+
+
+@dataclass
+class AssetFinding:
+    asset: AssetInfo
+    display: Optional[Tuple[int, int]]
+    references: List[str]
+    savings: int
+    reasons: List[str] = field(default_factory=list)
+
+
+# ------------------------------------------------------------------ cabeçalhos
+def _image_dimensions(data: bytes, suffix: str) -> Tuple[Optional[int], Optional[int], str]:
+    """Largura, altura e formato lidos do cabeçalho do arquivo (sem dependências externas)"""
+    if data[:8] == b'\x89PNG\r\n\x1a\n' and len(data) >= 24:
+        width, height = struct.unpack('>II', data[16:24])
+        return width, height, 'png'
+    if data[:6] in (b'GIF87a', b'GIF89a'):
+        width, height = struct.unpack('<HH', data[6:10])
+        return width, height, 'gif'
+    if data[:2] == b'\xff\xd8':
+        k = 2
+        while k + 9 < len(data):
+            if data[k] != 0xFF:
+                k += 1
+                continue
+            marker = data[k + 1]
+            if marker in (0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF):
+                height, width = struct.unpack('>HH', data[k + 5:k + 9])
+                return width, height, 'jpeg'
+            if marker in (0xD8, 0x01) or 0xD0 <= marker <= 0xD7:
+                k += 2
+                continue
+            k += 2 + struct.unpack('>H', data[k + 2:k + 4])[0]
+        return None, None, 'jpeg'
+    if data[:4] == b'RIFF' and data[8:12] == b'WEBP':
+        chunk = data[12:16]
+        if chunk == b'VP8 ' and len(data) >= 30:
+            width, height = struct.unpack('<HH', data[26:30])
+            return width & 0x3FFF, height & 0x3FFF, 'webp'
+        if chunk == b'VP8L' and len(data) >= 25:
+            bits = int.from_bytes(data[21:25], 'little')
+            return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1, 'webp'
+        if chunk == b'VP8X' and len(data) >= 30:
+            return int.from_bytes(data[24:27], 'little') + 1, int.from_bytes(data[27:30], 'little') + 1, 'webp'
+        return None, None, 'webp'
+    if data[:4] == b'\x00\x00\x01\x00' and len(data) >= 8:
+        return data[6] or 256, data[7] or 256, 'ico'
+    if suffix == '.svg':
+        text = data.decode('utf-8', errors='ignore')
+        root = re.search(r'<svg\b[^>]*>', text, re.DOTALL)
+        if root:
+            attrs = root.group(0)
+            width = re.search(r'\bwidth=["\']([\d.]+)(?:px)?["\']', attrs)
+            height = re.search(r'\bheight=["\']([\d.]+)(?:px)?["\']', attrs)
+            if width and height:
+                return int(float(width.group(1))), int(float(height.group(1))), 'svg'
+            view_box = re.search(r'viewBox=["\'][\d.\-]+[ ,]+[\d.\-]+[ ,]+([\d.]+)[ ,]+([\d.]+)', attrs)
+            if view_box:
+                return int(float(view_box.group(1))), int(float(view_box.group(2))), 'svg'
+        return None, None, 'svg'
+    return None, None, suffix.lstrip('.')
+
+
+def _scan_asset(args: Tuple[str, str]) -> AssetInfo:
+    """Executado nos workers: tamanho e dimensões de um arquivo de public/"""
+    full_path, rel_path = args
+    size = os.path.getsize(full_path)
+    with open(full_path, 'rb') as f:
+        head = f.read(size if rel_path.endswith('.svg') else 65536)
+    width, height, fmt = _image_dimensions(head, Path(rel_path).suffix.lower())
+    return AssetInfo(rel_path, size, width, height, fmt)
+
+
+class ImageLoadingAuditor:
+    """Imagens do código e arquivos de public/ com as otimizações que faltam"""
+
+    def __init__(self, project_root: str, index: Optional[SymbolIndex] = None, include_tests: bool = False,
+                 jobs: Optional[int] = None):
+        self.project_root = Path(project_root)
+        self.index = index
+        self.include_tests = include_tests
+        self.jobs = jobs or os.cpu_count() or 1
+        self.wrappers: Dict[Tuple[str, str], WrapperInfo] = {}
+        self.sites: List[ImageSite] = []
+        self.assets: Dict[str, AssetInfo] = {}
+        self.asset_findings: List[AssetFinding] = []
+
+    # ------------------------------------------------------------- auxiliares
+    def pipeline_of(self, module: ModuleInfo) -> str:
+        """``useImageOptimizer``/``ImageService`` quando o módulo os importa (direto ou por barrel)"""
+        used = []
+        for statement in module.imports:
+            for binding in statement.bindings:
+                origin = self.index.resolve_local(module, binding.local)[0]
+                if origin in OPTIMIZER_MODULES and module.value_usages.get(binding.local, 0):
+                    used.append(OPTIMIZER_MODULES[origin])
+        return ', '.join(sorted(set(used)))
+
+    def attributes(self, view: SourceView, tag_index: int) -> Dict[str, Tuple[int, int]]:
+        """Atributos de uma tag de abertura: nome -> faixa de tokens do valor"""
+        attributes = {}
+        k = tag_index + 1
+        while k < len(view.tokens):
+            token = view.tokens[k]
+            if token.kind == 'jsx' and token.value in ('>', '/>'):
+                break
+            if token.kind == 'jsx_attr':
+                if view.value(k + 1) == '=' and view.value(k + 2) == '{' and view.brackets[k + 2] > k:
+                    close = view.brackets[k + 2]
+                    attributes[token.value] = (k + 3, close - 1)
+                    k = close + 1
+                    continue
+                if view.value(k + 1) == '=':
+                    attributes[token.value] = (k + 2, k + 2)
+                    k += 3
+                    continue
+                attributes[token.value] = (k, k)  # booleano
+            elif token.value == '{' and view.value(k + 1) == '...' and view.brackets[k] > k:
+                attributes['...'] = (k + 2, view.brackets[k] - 1)
+                k = view.brackets[k] + 1
+                continue
+            k += 1
+        return attributes
+
+    def literal(self, view: SourceView, span: Tuple[int, int]) -> Optional[str]:
+        start, end = span
+        if start == end and view.tokens[start].kind in ('string', 'template'):
+            return string_value(view.tokens[start])
+        return None
+
+    def display_size(self, view: SourceView, attributes: Dict[str, Tuple[int, int]]) -> Optional[Tuple[int, int]]:
+        """Tamanho exibido (px) a partir de width/height, style ou classes Tailwind"""
+        width = height = None
+        for name in ('width', 'height'):
+            if name in attributes:
+                start, end = attributes[name]
+                raw = self.literal(view, (start, end)) or (view.value(start) if start == end else '')
+                if raw.replace('px', '').isdigit():
+                    if name == 'width':
+                        width = int(raw.replace('px', ''))
+                    else:
+                        height = int(raw.replace('px', ''))
+        if 'style' in attributes and view.value(attributes['style'][0]) == '{':
+            style = view.object_properties(attributes['style'][0])
+            for name in ('width', 'height'):
+                if name in style and view.tokens[style[name][0]].kind in ('number', 'string'):
+                    raw = view.value(style[name][0]).strip('\'"').replace('px', '')
+                    if raw.isdigit():
+                        width, height = (int(raw), height) if name == 'width' else (width, int(raw))
+        classes = self.literal(view, attributes['className']) if 'className' in attributes else None
+        if classes:
+            for axis, amount, pixels in TAILWIND_SIZE.findall(classes):
+                value = int(pixels) if pixels else int(float(amount) * TAILWIND_UNIT)
+                if axis in ('w', 'size'):
+                    width = width or value
+                if axis in ('h', 'size'):
+                    height = height or value
+        if width or height:
+            return width or height, height or width
+        return None
+
+    def has_dimensions(self, view: SourceView, attributes: Dict[str, Tuple[int, int]]) -> bool:
+        if 'width' in attributes and 'height' in attributes:
+            return True
+        if 'style' in attributes:
+            text = view.text(*attributes['style'])
+            if ('width' in text and 'height' in text) or 'aspectRatio' in text:
+                return True
+        classes = view.text(*attributes['className']) if 'className' in attributes else ''
+        axes = {axis for axis, _, _ in TAILWIND_SIZE.findall(classes)}
+        return 'size' in axes or {'w', 'h'} <= axes or ('aspect-' in classes and bool(axes))
+
+    # ---------------------------------------------------------------- wrappers
+    def _takes_src(self, view: SourceView, scope) -> bool:
+        """O componente recebe a prop ``src`` (``({ src, ... })`` ou ``props.src``)"""
+        if any(view.value(k) == 'src' and view.tokens[k].kind == 'name' and not view.in_type[k]
+               for k in range(scope.params_start, scope.params_end + 1)):
+            return True
+        return any(view.value(k) == 'props' and view.value(k + 2) == 'src'
+                   for k in range(scope.body_start, scope.body_end))
+
+    def discover_wrappers(self) -> None:
+        """Componentes com prop ``src`` que renderizam ``<img>`` (ou outro wrapper)"""
+        changed = True
+        while changed:
+            changed = False
+            for path, module in self.index.modules.items():
+                if not path.endswith('.tsx') or is_test_file(path):
+                    continue
+                view = self.index.view(path)
+                for k in range(len(view.tokens) - 1):
+                    if view.tokens[k].kind != 'jsx' or view.value(k) != '<' or view.tokens[k + 1].kind != 'name':
+                        continue
+                    tag = view.value(k + 1)
+                    inner = self.wrappers.get(self.index.resolve_local(module, tag)) if tag[:1].isupper() else None
+                    if tag != 'img' and inner is None:
+                        continue
+                    scope = view.scopes.named_ancestor(view.scopes.enclosing(k))
+                    if scope is None or not scope.name[:1].isupper() or (path, scope.name) in self.wrappers:
+                        continue
+                    attributes = self.attributes(view, k + 1)
+                    if 'src' not in attributes or not self._takes_src(view, scope):
+                        continue
+                    if tag == 'img':
+                        loading = view.text(*attributes['loading']) if 'loading' in attributes else ''
+                        lazy = 'lazy' in loading or 'IntersectionObserver' in module.source
+                        srcset = 'srcSet' in attributes or 'srcset' in attributes
+                        pipeline = self.pipeline_of(module)
+                    else:
+                        lazy = inner.lazy or 'IntersectionObserver' in module.source
+                        srcset = inner.srcset
+                        pipeline = inner.pipeline or self.pipeline_of(module)
+                    self.wrappers[(path, scope.name)] = WrapperInfo(scope.name, path, lazy, srcset, pipeline)
+                    changed = True
+
+    # --------------------------------------------------------------- varredura
+    def scan_module(self, path: str) -> None:
+        module = self.index.modules[path]
+        view = self.index.view(path)
+        module_pipeline = self.pipeline_of(module)
+        vistoria = any(hint in path or hint in module.source for hint in VISTORIA_HINTS)
+        for k in range(len(view.tokens) - 1):
+            token = view.tokens[k]
+            if token.kind == 'name' and token.value == 'backgroundImage' and view.value(k + 1) == ':':
+                value = view.text(k + 2, view.expression_end(k + 2))
+                if 'url(' in value:
+                    scope = view.scopes.named_ancestor(view.scopes.enclosing(k))
+                    self.sites.append(ImageSite(path, token.line, scope.name if scope else '(módulo)', 'background',
+                                                'style', value[:60], pipeline=module_pipeline, vistoria=vistoria))
+                continue
+            if token.kind in ('string', 'template') and 'bg-[url(' in token.value:
+                for match in TAILWIND_BACKGROUND.finditer(token.value):
+                    scope = view.scopes.named_ancestor(view.scopes.enclosing(k))
+                    self.sites.append(ImageSite(path, token.line, scope.name if scope else '(módulo)', 'background',
+                                                'className', match.group(1), pipeline=module_pipeline,
+                                                vistoria=vistoria))
+                continue
+            if token.kind != 'jsx' or token.value != '<' or view.tokens[k + 1].kind != 'name':
+                continue
+            tag = view.value(k + 1)
+            wrapper = self.wrappers.get(self.index.resolve_local(module, tag)) if tag[:1].isupper() else None
+            if tag != 'img' and wrapper is None:
+                continue
+            attributes = self.attributes(view, k + 1)
+            scope = view.scopes.named_ancestor(view.scopes.enclosing(k))
+            component = scope.name if scope else '(módulo)'
+            if (path, component) in self.wrappers:
+                continue  # a imagem interna do wrapper é avaliada nos sites que o usam
+            src = self.literal(view, attributes['src']) if 'src' in attributes else None
+            src_text = src if src is not None else (view.text(*attributes['src']) if 'src' in attributes else '')
+            loading = view.text(*attributes['loading']) if 'loading' in attributes else ''
+            priority = 'eager' in loading or any(
+                name in attributes and view.text(*attributes[name]) != 'false' for name in ('priority', 'critical'))
+            if wrapper is not None:
+                lazy = (wrapper.lazy and not priority) or 'lazy' in loading
+                srcset = wrapper.srcset or 'srcSet' in attributes
+                pipeline = wrapper.pipeline or module_pipeline
+                kind = 'componente'
+            else:
+                lazy = 'lazy' in loading
+                srcset = 'srcSet' in attributes or 'srcset' in attributes
+                pipeline = module_pipeline
+                kind = 'img'
+            self.sites.append(ImageSite(path, token.line, component, kind, tag, src_text[:80], lazy,
+                                        self.has_dimensions(view, attributes), srcset, pipeline,
+                                        self.display_size(view, attributes), vistoria, priority))
+
+    def scan_css(self) -> None:
+        for css in sorted((self.project_root / 'src').rglob('*.css')):
+            content = css.read_text(encoding='utf-8', errors='ignore')
+            rel_path = str(css.relative_to(self.project_root))
+            for match in CSS_BACKGROUND.finditer(content):
+                line = content.count('\n', 0, match.start()) + 1
+                self.sites.append(ImageSite(rel_path, line, '(css)', 'background', 'css', match.group(1)))
+
+    # ------------------------------------------------------------------ public
+    def scan_public(self) -> None:
+        public = self.project_root / 'public'
+        if not public.is_dir():
+            return
+        files = [(str(p), str(p.relative_to(self.project_root)))
+                 for p in sorted(public.rglob('*')) if p.is_file() and p.suffix.lower() in IMAGE_EXTENSIONS]
+        if not files:
+            return
+        if self.jobs > 1 and len(files) > 1:
+            with ProcessPoolExecutor(max_workers=min(self.jobs, len(files))) as executor:
+                results = list(executor.map(_scan_asset, files, chunksize=8))
+        else:
+            results = [_scan_asset(item) for item in files]
+        self.assets = {asset.path: asset for asset in results}
+
+    def asset_references(self) -> Dict[str, List[Tuple[str, Optional[Tuple[int, int]]]]]:
+        """URL pública -> (onde é referenciada, tamanho exibido declarado)"""
+        references: Dict[str, List[Tuple[str, Optional[Tuple[int, int]]]]] = defaultdict(list)
+        for site in self.sites:
+            if site.src.startswith('/'):
+                references[site.src.split('?')[0]].append((f"{site.file_path}:{site.line}", site.display))
+        seen = {(url, where.rsplit(':', 1)[0]) for url, entries in references.items() for where, _ in entries}
+        sources = [(path, module.source) for path, module in self.index.modules.items()]
+        for extra in ('index.html', 'public/manifest.json'):
+            candidate = self.project_root / extra
+            if candidate.is_file():
+                sources.append((extra, candidate.read_text(encoding='utf-8', errors='ignore')))
+        for path, content in sources:
+            for match in ASSET_REFERENCE.finditer(content):
+                url = match.group(1)
+                if (url, path) in seen:
+                    continue
+                seen.add((url, path))
+                # sizes="192x192" / "sizes": "72x72" na mesma entrada (ícones do manifest e <link>)
+                window = content[max(0, match.start() - 160):match.end() + 160]
+                sizes = SIZES_ATTRIBUTE.search(window)
+                display = (int(sizes.group(1)), int(sizes.group(2))) if sizes else None
+                references[url].append((path, display))
+        return references
+
+    def evaluate_assets(self) -> None:
+        references = self.asset_references()
+        for rel_path, asset in sorted(self.assets.items()):
+            url = '/' + rel_path[len('public/'):]
+            used = references.get(url, [])
+            displays = [d for _, d in used if d]
+            display = (max(d[0] for d in displays), max(d[1] for d in displays)) if displays else None
+            reasons = []
+            savings = 0
+            if not used:
+                reasons.append('não referenciado')
+                savings = asset.size
+            else:
+                if display and asset.width and asset.height:
+                    needed = display[0] * DEVICE_PIXEL_RATIO * display[1] * DEVICE_PIXEL_RATIO
+                    ratio = needed / (asset.width * asset.height)
+                    if ratio < 1:
+                        savings = int(asset.size * (1 - ratio))
+                        reasons.append(f"{asset.width}x{asset.height} exibido em {display[0]}x{display[1]}")
+                is_icon = any('manifest' in where or where == 'index.html' for where, _ in used)
+                if Path(rel_path).suffix.lower() in RASTER_RECOMPRESSIBLE and not is_icon:
+                    remaining = asset.size - savings
+                    savings += int(remaining * (1 - WEBP_RATIO))
+                    reasons.append('converter para WebP')
+                if asset.size > MAX_ASSET_KB * 1024:
+                    reasons.append(f"> {MAX_ASSET_KB} KB")
+            if reasons:
+                self.asset_findings.append(AssetFinding(asset, display, [w for w, _ in used], savings, reasons))
+        self.asset_findings.sort(key=lambda f: -f.savings)
+
+    # ---------------------------------------------------------------- análise
+    def run_analysis(self) -> List[ImageSite]:
+        print("🔍 Indexando módulos...")
+        if self.index is None:
+            self.index = SymbolIndex(str(self.project_root)).build()
+
+        print("🖼️ Procurando imagens no código...")
+        self.discover_wrappers()
+        for path in sorted(self.index.modules):
+            if not path.endswith('.tsx') or (not self.include_tests and is_test_file(path)):
+                continue
+            self.scan_module(path)
+        self.scan_css()
+
+        print(f"📁 Lendo arquivos de public/ ({self.jobs} workers)...")
+        self.scan_public()
+        self.evaluate_assets()
+
+        with_issues = [site for site in self.sites if site.issues]
+        savings = sum(finding.savings for finding in self.asset_findings)
+        print(f"⚠️ {len(with_issues)}/{len(self.sites)} usos de imagem com problemas; "
+              f"economia estimada em public/: {savings / 1024:.1f} KB")
+        return self.sites
+
+    # -------------------------------------------------------------- relatório
+    def generate_report(self, output_file: str) -> None:
+        total = len(self.sites) or 1
+        rendered = [s for s in self.sites if s.kind != 'background']
+        issues_count: Dict[str, int] = defaultdict(int)
+        for site in self.sites:
+            for issue in site.issues:
+                issues_count[issue] += 1
+        savings = sum(f.savings for f in self.asset_findings)
+        public_size = sum(a.size for a in self.assets.values())
+
+        report = f"""# Auditoria de Carregamento de Imagens - Doc Forge Buddy
+
+**Data da análise:** {datetime.now().strftime('%d/%m/%Y %H:%M')}
+**Usos de imagem:** {len(self.sites)} ({len(rendered)} elementos, {len(self.sites) - len(rendered)} backgrounds)
+**Componentes wrapper de imagem:** {len(self.wrappers)}
+**Arquivos de imagem em public/:** {len(self.assets)} ({public_size / 1024:.1f} KB)
+**Economia estimada em public/:** {savings / 1024:.1f} KB
+
+## 📊 Cobertura das Boas Práticas
+
+| Verificação | Atendem | % |
+|-------------|---------|---|
+"""
+        checks = [
+            ('loading="lazy"', sum(1 for s in rendered if s.lazy), len(rendered)),
+            ('Dimensões explícitas', sum(1 for s in rendered if s.dimensions), len(rendered)),
+            ('srcset', sum(1 for s in rendered if s.srcset), len(rendered)),
+            ('useImageOptimizer/ImageService', sum(1 for s in self.sites if s.pipeline), total),
+        ]
+        for label, ok, count in checks:
+            report += f"| {label} | {ok}/{count} | {ok / max(count, 1) * 100:.0f}% |\n"
+
+        if self.wrappers:
+            report += "\n## 🧩 Componentes Wrapper\n\n| Componente | Arquivo | Lazy | srcset | Pipeline |\n"
+            report += "|------------|---------|------|--------|----------|\n"
+            for wrapper in self.wrappers.values():
+                report += (f"| `{wrapper.name}` | `{wrapper.file_path}` | {'✅' if wrapper.lazy else '❌'} | "
+                           f"{'✅' if wrapper.srcset else '❌'} | {wrapper.pipeline or '-'} |\n")
+
+        report += "\n## 🖼️ Usos de Imagem\n\n"
+        report += "Imagens de vistoria (🏠, módulos de vistoria ou que usam ImageService) aparecem primeiro; "
+        report += "⚡ = carregamento prioritário intencional.\n\n"
+        report += "| Local | Componente | Tipo | src | Lazy | Dimensões | srcset | Pipeline | Problemas |\n"
+        report += "|-------|------------|------|-----|------|-----------|--------|----------|-----------|\n"
+        ordered = sorted(self.sites, key=lambda s: (not s.vistoria, -len(s.issues), s.file_path, s.line))
+        for site in ordered:
+            flag = lambda ok: '✅' if ok else '❌'
+            marker = ' 🏠' if site.vistoria else ''
+            if site.kind == 'background':
+                checks_text = '- | - | -'
+            else:
+                lazy = '⚡' if site.priority and not site.lazy else flag(site.lazy)
+                checks_text = f"{lazy} | {flag(site.dimensions)} | {flag(site.srcset)}"
+            report += (f"| `{site.file_path}`:{site.line}{marker} | `{site.component}` | {site.kind} (`{site.tag}`) | "
+                       f"`{site.src[:40]}` | {checks_text} | {site.pipeline or '-'} | "
+                       f"{', '.join(site.issues) or '✅'} |\n")
+
+        report += "\n## 📁 Arquivos de public/\n\n"
+        report += f"Economia considera exibição em {DEVICE_PIXEL_RATIO}x DPR e WebP ~{int((1 - WEBP_RATIO) * 100)}% menor.\n\n"
+        report += "| Arquivo | Tamanho | Dimensões | Exibido em | Economia estimada | Motivo | Referências |\n"
+        report += "|---------|---------|-----------|------------|-------------------|--------|-------------|\n"
+        for finding in self.asset_findings:
+            asset = finding.asset
+            dims = f"{asset.width}x{asset.height}" if asset.width else '?'
+            display = f"{finding.display[0]}x{finding.display[1]}" if finding.display else '-'
+            report += (f"| `{asset.path}` | {asset.size / 1024:.1f} KB | {dims} | {display} | "
+                       f"{finding.savings / 1024:.1f} KB | {'; '.join(finding.reasons)} | {len(finding.references)} |\n")
+
+        report += """
+## 💡 Recomendações
+
+1. **Use `loading="lazy"`** em imagens abaixo da dobra (miniaturas, galerias, previews de vistoria)
+2. **Declare `width`/`height`** (ou `aspect-ratio`) para evitar layout shift
+3. **Gere `srcset`** para fotos de vistoria: o navegador baixa só a resolução exibida
+4. **Passe uploads por `useImageOptimizer`** antes de salvar em `vistoria_images`
+5. **Redimensione e converta para WebP** os arquivos de public/ listados acima; remova os não referenciados
+
+---
+*Relatório gerado automaticamente pela auditoria de imagens*
+"""
+        Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(report)
+        print(f"📄 Relatório salvo em: {output_file}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Auditoria de carregamento de imagens e arquivos de public/')
+    parser.add_argument('--project-dir', default='/workspace/doc-forge-buddy-Cain',
+                        help='Diretório do projeto')
+    parser.add_argument('--output', default='docs/analise_imagens.md',
+                        help='Arquivo de saída do relatório')
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='Processos para ler public/ (padrão: número de CPUs)')
+    parser.add_argument('--include-tests', action='store_true',
+                        help='Inclui arquivos de teste')
+    args = parser.parse_args()
+
+    auditor = ImageLoadingAuditor(args.project_dir, include_tests=args.include_tests, jobs=args.jobs)
+    auditor.run_analysis()
+    auditor.generate_report(args.output)
+
+
+if __name__ == "__main__":
+    main()
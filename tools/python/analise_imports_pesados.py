@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Guarda de Imports Estáticos de Bibliotecas Pesadas - Doc Forge Buddy
+Percorre o grafo de imports a partir de cada página e encontra as cadeias
+estáticas que puxam bibliotecas pesadas (chart.js, exceljs, jspdf, openai,
+framer-motion...) para o carregamento inicial, em vez de src/utils/lazyImports.ts
+"""
+
+import argparse
+import json
+import re
+import sys
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from symbol_index import SymbolIndex, ModuleInfo, package_name
+
+# Tamanho minificado aproximado (bytes) de cada pacote pesado
+DEFAULT_HEAVY_PACKAGES = {
+    'chart.js': 205_000,
+    'exceljs': 940_000,
+    'jspdf': 360_000,
+    'openai': 130_000,
+    'framer-motion': 125_000,
+    'html2canvas': 200_000,
+    'docx': 420_000,
+    'xlsx': 430_000,
+}
+# Medição menor que esta fração da estimativa é descartada (entrada que delega a outro pacote)
+MIN_PLAUSIBLE_FRACTION = 0.1
+JS_EXTENSIONS = ('.js', '.mjs', '.cjs')
+_RELATIVE_SPECIFIER = re.compile(
+    r'''(?:\bfrom\s*|\bimport\s*\(?\s*|\brequire\s*\(\s*)(['"])(\.{1,2}/[^'"]*)\1''')
+
+ENTRY_PATTERNS = ['src/main.tsx', 'src/pages/*']
+
+
+def _resolve_js(base: Path) -> Optional[Path]:
+    candidates = [base] + [base.with_name(base.name + ext) for ext in JS_EXTENSIONS] \
+        + [base / f"index{ext}" for ext in JS_EXTENSIONS]
+    return next((c for c in candidates if c.is_file()), None)
+
+
+def package_graph_size(entry: Path, package_dir: Path) -> int:
+    """Bytes dos arquivos do pacote alcançados por imports/requires relativos a partir da entrada"""
+    seen = set()
+    pending = [entry.resolve()]
+    root = package_dir.resolve()
+    total = 0
+    while pending:
+        path = pending.pop()
+        if path in seen:
+            continue
+        seen.add(path)
+        try:
+            content = path.read_text(encoding='utf-8', errors='ignore')
+        except OSError:
+            continue
+        total += path.stat().st_size
+        for match in _RELATIVE_SPECIFIER.finditer(content):
+            target = _resolve_js(path.parent / match.group(2))
+            if target is not None and root in target.resolve().parents:
+                pending.append(target.resolve())
+    return total
+
+
+@dataclass
+class HeavyChain:
+    entry: str
+    package: str
+    chain: List[str]  # entrada -> ... -> módulo que importa o pacote
+    line: int
+
+    def render(self) -> str:
+        return ' -> '.join([p[4:] if p.startswith('src/') else p for p in self.chain] + [self.package])
+
+
+class HeavyImportGuard:
+    """Encontra caminhos estáticos das páginas até bibliotecas pesadas"""
+
+    def __init__(self, project_root: str, heavy_packages: Optional[Dict[str, int]] = None,
+                 index: Optional[SymbolIndex] = None):
+        self.project_root = Path(project_root)
+        self.heavy_packages = dict(heavy_packages or DEFAULT_HEAVY_PACKAGES)
+        self.index = index
+        self._edges: Dict[str, List[Tuple[str, int]]] = {}
+        self._heavy_imports: Dict[str, List[Tuple[str, int]]] = {}
+        self.chains: List[HeavyChain] = []
+        self.entry_bytes: Dict[str, int] = {}
+
+    # ------------------------------------------------------------------ grafo
+    def measure_installed_sizes(self) -> None:
+        """Substitui a estimativa pelo tamanho do pacote instalado: soma dos arquivos
+        alcançados a partir da entrada (``module``/``main``), já que a entrada costuma ser
+        só um stub que re-exporta o ``dist``"""
+        node_modules = self.project_root / 'node_modules'
+        for package, estimate in self.heavy_packages.items():
+            package_dir = node_modules / package
+            manifest = package_dir / 'package.json'
+            if not manifest.exists():
+                continue
+            try:
+                data = json.loads(manifest.read_text(encoding='utf-8'))
+            except (OSError, ValueError):
+                continue
+            for key in ('module', 'main'):
+                entry = data.get(key)
+                if isinstance(entry, str) and (package_dir / entry).is_file():
+                    measured = package_graph_size(package_dir / entry, package_dir)
+                    # Entrada que só reexporta outros pacotes: o grafo local não reflete o custo
+                    if measured >= estimate * MIN_PLAUSIBLE_FRACTION:
+                        self.heavy_packages[package] = measured
+                    break
+
+    def _runtime_edges(self, module: ModuleInfo) -> Tuple[List[Tuple[str, int]], List[Tuple[str, int]]]:
+        """Arestas estáticas que sobrevivem à compilação: (módulo, linha) e (pacote, linha)"""
+        modules: List[Tuple[str, int]] = []
+        packages: List[Tuple[str, int]] = []
+        for statement in module.imports:
+            if statement.dynamic or statement.type_only:
+                continue
+            value_bindings = [b for b in statement.bindings
+                              if not b.type_only and module.binding_usage(b.local) == 'value']
+            if statement.bindings and not value_bindings:
+                continue  # só tipos: o TypeScript remove o import
+            if statement.resolved is None:
+                if not statement.is_relative:
+                    packages.append((package_name(statement.source), statement.line))
+                continue
+            if not value_bindings or any(b.imported in ('*', 'default') for b in value_bindings):
+                modules.append((statement.resolved, statement.line))
+                continue
+            # Import nomeado de barrel: segue só os exports usados até o módulo que os declara
+            for binding in value_bindings:
+                chain = self.index.resolve_export(statement.resolved, binding.imported)
+                origin = chain[-1][0] if chain else statement.resolved
+                modules.append((origin, statement.line))
+                origin_module = self.index.modules.get(origin)
+                if origin_module is not None and binding.imported not in origin_module.exports:
+                    modules.append((statement.resolved, statement.line))
+        for reexport in module.reexports:
+            if reexport.type_only:
+                continue
+            if reexport.resolved is None and not reexport.source.startswith('.'):
+                packages.append((package_name(reexport.source), reexport.line))
+        return modules, packages
+
+    def build_graph(self) -> None:
+        for path, module in self.index.modules.items():
+            modules, packages = self._runtime_edges(module)
+            self._edges[path] = modules
+            self._heavy_imports[path] = [(p, line) for p, line in packages if p in self.heavy_packages]
+
+    def find_chains(self, entry: str) -> List[HeavyChain]:
+        """BFS a partir da entrada: menor cadeia até cada módulo que importa um pacote pesado"""
+        parents: Dict[str, Optional[str]] = {entry: None}
+        queue = deque([entry])
+        chains = []
+        while queue:
+            current = queue.popleft()
+            for package, line in self._heavy_imports.get(current, ()):
+                path = [current]
+                while parents[path[-1]] is not None:
+                    path.append(parents[path[-1]])
+                chains.append(HeavyChain(entry, package, list(reversed(path)), line))
+            for dep, _ in self._edges.get(current, ()):
+                if dep not in parents and dep in self.index.modules:
+                    parents[dep] = current
+                    queue.append(dep)
+        return chains
+
+    def run_analysis(self, entries: Optional[Iterable[str]] = None) -> List[HeavyChain]:
+        print("🔍 Indexando módulos...")
+        if self.index is None:
+            self.index = SymbolIndex(str(self.project_root)).build()
+        self.measure_installed_sizes()
+        self.build_graph()
+
+        entries = list(entries) if entries else self.index.entry_points(ENTRY_PATTERNS)
+        print(f"🧭 Percorrendo imports estáticos de {len(entries)} entradas...")
+        self.chains = []
+        for entry in entries:
+            chains = self.find_chains(entry)
+            self.chains.extend(chains)
+            self.entry_bytes[entry] = sum(self.heavy_packages[p] for p in {c.package for c in chains})
+
+        offending = {c.entry for c in self.chains}
+        print(f"⚠️ {len(self.chains)} cadeias estáticas em {len(offending)} entradas")
+        return self.chains
+
+    # -------------------------------------------------------------- relatório
+    def generate_report(self, output_file: str) -> None:
+        by_package: Dict[str, List[HeavyChain]] = {}
+        for chain in self.chains:
+            by_package.setdefault(chain.package, []).append(chain)
+        offending = sorted(((entry, size) for entry, size in self.entry_bytes.items() if size),
+                           key=lambda item: item[1], reverse=True)
+
+        report = f"""# Imports Estáticos de Bibliotecas Pesadas - Doc Forge Buddy
+
+**Data da análise:** {datetime.now().strftime('%d/%m/%Y %H:%M')}
+**Entradas analisadas:** {len(self.entry_bytes)}
+**Entradas afetadas:** {len(offending)}
+**Cadeias estáticas encontradas:** {len(self.chains)}
+
+## 📦 Pacotes Monitorados
+
+| Pacote | Tamanho estimado | Entradas afetadas | Importadores diretos |
+|--------|------------------|-------------------|----------------------|
+"""
+        for package, size in sorted(self.heavy_packages.items()):
+            chains = by_package.get(package, [])
+            entries = {c.entry for c in chains}
+            importers = {c.chain[-1] for c in chains}
+            report += f"| `{package}` | {size / 1024:.0f} KB | {len(entries)} | {len(importers)} |\n"
+
+        if offending:
+            report += "\n## 🚨 Entradas com Bibliotecas Pesadas no Carregamento Inicial\n\n"
+            report += "| Entrada | Bytes adicionados (est.) | Pacotes |\n|---------|--------------------------|---------|\n"
+            for entry, size in offending:
+                packages = sorted({c.package for c in self.chains if c.entry == entry})
+                report += f"| `{entry}` | {size / 1024:.0f} KB | {', '.join(packages)} |\n"
+
+            report += "\n## 🔗 Cadeias de Import\n\n"
+            for package, chains in sorted(by_package.items()):
+                report += f"### `{package}` (~{self.heavy_packages[package] / 1024:.0f} KB)\n\n"
+                for chain in sorted(chains, key=lambda c: (c.entry, len(c.chain))):
+                    report += f"- `{chain.render()}` (L{chain.line} em `{chain.chain[-1]}`)\n"
+                report += "\n"
+        else:
+            report += "\n## ✅ Nenhuma biblioteca pesada é importada estaticamente pelas entradas\n\n"
+
+        report += """## 💡 Recomendações
+
+1. **Troque o import estático** no último módulo da cadeia por `import()` ou pelos wrappers de `src/utils/lazyImports.ts`
+2. **Evite barrels** que reexportam utilitários pesados junto com utilitários leves
+3. **Importe só tipos** (`import type`) quando o módulo pesado for usado apenas em anotações
+4. **Rode esta guarda no CI** com `--fail-on-violation` para impedir regressões
+
+---
+*Relatório gerado automaticamente pela guarda de imports pesados*
+"""
+        Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(report)
+        print(f"📄 Relatório salvo em: {output_file}")
+
+
+def parse_heavy_packages(values: List[str]) -> Dict[str, int]:
+    """'pacote' ou 'pacote=bytes' -> dicionário somado aos pacotes padrão"""
+    packages = dict(DEFAULT_HEAVY_PACKAGES)
+    for value in values:
+        name, _, size = value.partition('=')
+        packages[name] = int(size) if size else packages.get(name, 100_000)
+    return packages
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Guarda de imports estáticos de bibliotecas pesadas')
+    parser.add_argument('--project-dir', default='/workspace/doc-forge-buddy-Cain',
+                        help='Diretório do projeto')
+    parser.add_argument('--output', default='docs/analise_imports_pesados.md',
+                        help='Arquivo de saída do relatório')
+    parser.add_argument('--heavy', action='append', default=[], metavar='PACOTE[=BYTES]',
+                        help='Pacote pesado adicional (pode repetir)')
+    parser.add_argument('--entry', action='append', default=[],
+                        help='Entrada específica (padrão: src/main.tsx e src/pages/*)')
+    parser.add_argument('--fail-on-violation', action='store_true',
+                        help='Sai com código 1 se alguma cadeia for encontrada')
+    args = parser.parse_args()
+
+    guard = HeavyImportGuard(args.project_dir, parse_heavy_packages(args.heavy))
+    chains = guard.run_analysis(args.entry or None)
+    guard.generate_report(args.output)
+
+    for chain in chains[:10]:
+        print(f"   {chain.render()}")
+    if args.fail_on_violation and chains:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
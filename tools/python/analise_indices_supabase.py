@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Consultor de Índices Supabase - Doc Forge Buddy
+Cruza as cadeias de query do frontend (``.from().select().eq().order()...``)
+com os CREATE TABLE / CREATE INDEX de supabase/migrations e aponta os conjuntos
+de colunas de filtro/ordenação mais usados que não têm índice de apoio
+"""
+
+import argparse
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from symbol_index import SymbolIndex, is_test_file
+from supabase_queries import (QueryChain, SchemaCatalog, IndexDef, extract_query_chains,
+                              load_schema, index_support)
+
+
+@dataclass
+class QueryShape:
+    table: str
+    equality: Tuple[str, ...]
+    ranges: Tuple[str, ...]
+    order: Optional[str]
+    descending: bool = False
+    call_sites: List[QueryChain] = field(default_factory=list)
+    best_index: Optional[IndexDef] = None
+    covered: int = 0
+
+    @property
+    def needed(self) -> int:
+        return len(self.equality) + (1 if self.ranges or self.order else 0)
+
+    @property
+    def status(self) -> str:
+        if self.covered >= self.needed:
+            return 'coberto'
+        return 'parcial' if self.covered else 'sem índice'
+
+    def describe(self) -> str:
+        parts = [f"{c} =" for c in self.equality]
+        parts += [f"{c} <>" for c in self.ranges]
+        if self.order:
+            parts.append(f"ORDER BY {self.order}{' DESC' if self.descending else ''}")
+        return ', '.join(parts)
+
+    def suggested_index(self) -> str:
+        columns = list(self.equality)
+        tail = self.ranges[0] if self.ranges else self.order
+        if tail and tail not in columns:
+            columns.append(f"{tail} DESC" if tail == self.order and self.descending else tail)
+        name = f"idx_{self.table}_{'_'.join(c.split()[0] for c in columns)}"
+        return f"CREATE INDEX IF NOT EXISTS {name} ON {self.table} ({', '.join(columns)});"
+
+
+class SupabaseIndexAdvisor:
+    """Relaciona queries do código às definições de índice das migrations"""
+
+    def __init__(self, project_root: str, extra_sql: Optional[List[str]] = None,
+                 index: Optional[SymbolIndex] = None, include_tests: bool = False):
+        self.project_root = Path(project_root)
+        self.extra_sql = extra_sql or []
+        self.index = index
+        self.include_tests = include_tests
+        self.schema: Optional[SchemaCatalog] = None
+        self.chains: List[QueryChain] = []
+        self.shapes: Dict[Tuple, QueryShape] = {}
+        self.text_filters: Dict[Tuple[str, Tuple[str, ...]], List[QueryChain]] = defaultdict(list)
+        self.unfiltered: Dict[str, List[QueryChain]] = defaultdict(list)
+
+    def collect_chains(self) -> List[QueryChain]:
+        if self.index is None:
+            self.index = SymbolIndex(str(self.project_root)).build()
+        chains = []
+        for path, module in sorted(self.index.modules.items()):
+            if not self.include_tests and is_test_file(path):
+                continue
+            if '.from(' not in module.source and '.from (' not in module.source:
+                continue
+            chains.extend(extract_query_chains(path, module.tokens, module.source))
+        return chains
+
+    def _indexes_for(self, table: str) -> List[IndexDef]:
+        indexes = self.schema.indexes_for(table)
+        if not any(index.columns == ('id',) for index in indexes):
+            # Convenção Supabase: toda tabela tem chave primária em id
+            indexes.append(IndexDef(f"{table}_pkey", table, ('id',), unique=True, source='convenção (id)'))
+        return indexes
+
+    def classify(self) -> None:
+        for chain in self.chains:
+            equality = chain.equality_columns()
+            ranges = tuple(c for c in chain.range_columns() if c not in equality)
+            order = chain.order_columns()
+            text = chain.text_columns()
+            if text:
+                self.text_filters[(chain.table, text)].append(chain)
+            if not equality and not ranges and not order:
+                if chain.operation == 'select' and not text:
+                    self.unfiltered[chain.table].append(chain)
+                continue
+            descending = any(c.method == 'order' and 'ascending: false' in c.args.replace('  ', ' ')
+                             for c in chain.calls)
+            key = (chain.table, equality, ranges, order[0] if order else None)
+            shape = self.shapes.get(key)
+            if shape is None:
+                shape = QueryShape(chain.table, equality, ranges, order[0] if order else None, descending)
+                self.shapes[key] = shape
+            shape.call_sites.append(chain)
+
+        for shape in self.shapes.values():
+            tail = tuple(shape.ranges) + ((shape.order,) if shape.order else ())
+            for index in self._indexes_for(shape.table):
+                if index.method != 'btree':
+                    continue
+                if index.unique and set(index.columns) <= set(shape.equality):
+                    shape.covered, shape.best_index = shape.needed, index  # no máximo uma linha
+                    break
+                covered = index_support(index.columns, set(shape.equality), tail)
+                if covered > shape.covered:
+                    shape.covered, shape.best_index = covered, index
+
+    def run_analysis(self) -> List[QueryShape]:
+        print("🗄️ Lendo migrations...")
+        self.schema = load_schema(self.project_root, self.extra_sql)
+        print(f"   {len(self.schema.tables)} tabelas, {len(self.schema.indexes)} índices")
+
+        print("🔍 Extraindo cadeias de query...")
+        self.chains = self.collect_chains()
+        print(f"   {len(self.chains)} queries em {len({c.file_path for c in self.chains})} arquivos")
+
+        self.classify()
+        missing = [s for s in self.shapes.values() if s.status != 'coberto']
+        print(f"⚠️ {len(missing)} conjuntos de colunas sem índice completo")
+        return self.ranked()
+
+    def ranked(self) -> List[QueryShape]:
+        return sorted((s for s in self.shapes.values() if s.status != 'coberto'),
+                      key=lambda s: (-len(s.call_sites), s.status != 'sem índice', s.table))
+
+    def generate_report(self, output_file: str) -> None:
+        ranked = self.ranked()
+        covered = [s for s in self.shapes.values() if s.status == 'coberto']
+        tables = defaultdict(int)
+        for chain in self.chains:
+            tables[chain.table] += 1
+
+        report = f"""# Consultor de Índices Supabase - Doc Forge Buddy
+
+**Data da análise:** {datetime.now().strftime('%d/%m/%Y %H:%M')}
+**Queries encontradas:** {len(self.chains)}
+**Formatos de query (tabela + filtros + ordenação):** {len(self.shapes)}
+**Sem índice completo:** {len(ranked)}
+**Índices nas migrations:** {len(self.schema.indexes)}
+
+## 📊 Tabelas Mais Consultadas
+
+| Tabela | Queries | Índices conhecidos | DDL nas migrations |
+|--------|---------|--------------------|--------------------|
+"""
+        for table, count in sorted(tables.items(), key=lambda item: item[1], reverse=True)[:20]:
+            known = self.schema.tables.get(table)
+            defined = '✅' if known and known.defined else '❌'
+            report += f"| `{table}` | {count} | {len(self.schema.indexes_for(table))} | {defined} |\n"
+
+        report += """
+## 🚨 Filtros/Ordenações sem Índice de Apoio
+
+Ranking por número de chamadas. "parcial" significa que o melhor índice atende só parte das colunas.
+
+| # | Tabela | Colunas | Chamadas | Situação | Melhor índice atual |
+|---|--------|---------|----------|----------|---------------------|
+"""
+        for position, shape in enumerate(ranked[:50], 1):
+            best = f"`{shape.best_index.name}`" if shape.best_index else '-'
+            report += (f"| {position} | `{shape.table}` | {shape.describe()} | {len(shape.call_sites)} | "
+                       f"{shape.status} | {best} |\n")
+
+        if ranked:
+            report += "\n## 🛠️ Índices Sugeridos\n\n```sql\n"
+            seen = set()
+            for shape in ranked[:25]:
+                statement = shape.suggested_index()
+                if statement not in seen:
+                    seen.add(statement)
+                    report += f"-- {len(shape.call_sites)} chamadas: {shape.describe()}\n{statement}\n"
+            report += "```\n\n## 📍 Locais das Chamadas\n\n"
+            for shape in ranked[:25]:
+                report += f"### `{shape.table}`: {shape.describe()}\n\n"
+                for chain in shape.call_sites[:10]:
+                    report += f"- `{chain.file_path}`:{chain.line}\n"
+                if len(shape.call_sites) > 10:
+                    report += f"- ... e mais {len(shape.call_sites) - 10}\n"
+                report += "\n"
+
+        if self.text_filters:
+            report += "## 🔤 Filtros de Texto (ilike / or / contains)\n\n"
+            report += "Um índice btree não atende estes filtros; considere `pg_trgm` (GIN) ou busca full-text.\n\n"
+            report += "| Tabela | Colunas | Chamadas |\n|--------|---------|----------|\n"
+            for (table, columns), chains in sorted(self.text_filters.items(), key=lambda item: -len(item[1])):
+                report += f"| `{table}` | {', '.join(columns)} | {len(chains)} |\n"
+            report += "\n"
+
+        if self.unfiltered:
+            report += "## 📥 Leituras sem Filtro nem Ordenação\n\n"
+            report += "Varrem a tabela inteira (limitadas apenas pelo RLS); confirme se precisam de paginação.\n\n"
+            for table, chains in sorted(self.unfiltered.items(), key=lambda item: -len(item[1])):
+                report += f"- `{table}`: {len(chains)} chamadas\n"
+            report += "\n"
+
+        report += f"""## ✅ Formatos Cobertos
+
+{len(covered)} formatos de query já têm índice de apoio completo.
+
+## 💡 Recomendações
+
+1. **Crie os índices sugeridos** em uma nova migration, começando pelos mais chamados
+2. **Ordene as colunas de igualdade** da mais seletiva para a menos seletiva antes de aplicar
+3. **Confira com `EXPLAIN ANALYZE`** no banco: tabelas sem DDL nas migrations podem ter índices criados pelo painel
+4. **Reexecute esta análise** após novas queries ou migrations
+
+---
+*Relatório gerado automaticamente pelo consultor de índices Supabase*
+"""
+        Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(report)
+        print(f"📄 Relatório salvo em: {output_file}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Consultor de índices Supabase (queries x migrations)')
+    parser.add_argument('--project-dir', default='/workspace/doc-forge-buddy-Cain',
+                        help='Diretório do projeto')
+    parser.add_argument('--output', default='docs/analise_indices_supabase.md',
+                        help='Arquivo de saída do relatório')
+    parser.add_argument('--sql', action='append', default=[],
+                        help='Arquivo SQL adicional (relativo ao projeto), aplicado após as migrations')
+    parser.add_argument('--include-tests', action='store_true',
+                        help='Inclui queries de arquivos de teste')
+    args = parser.parse_args()
+
+    advisor = SupabaseIndexAdvisor(args.project_dir, args.sql, include_tests=args.include_tests)
+    ranked = advisor.run_analysis()
+    advisor.generate_report(args.output)
+
+    for shape in ranked[:10]:
+        print(f"   {len(shape.call_sites):3d}x {shape.table}: {shape.describe()} ({shape.status})")
+
+
+if __name__ == "__main__":
+    main()
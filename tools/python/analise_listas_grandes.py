@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+"""
+Detector de Listas Grandes sem Virtualização - Doc Forge Buddy
+Encontra renderizações JSX com ``.map(...)`` cuja fonte é resultado de consulta,
+coleção de store ou array recebido por prop, sem ``slice``/paginação e sem
+``useVirtualScrolling``/``useInfiniteScroll`` (advanced-utility-hooks/), e gera
+uma lista priorizada de candidatos à virtualização
+"""
+
+import argparse
+import math
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from symbol_index import SymbolIndex, is_test_file
+from ts_scopes import SourceView, FunctionScope
+
+QUERY_HOOKS = {'useQuery', 'useInfiniteQuery', 'useSuspenseQuery', 'useOptimizedQuery', 'useQueries'}
+VIRTUALIZATION_HOOKS = {'useVirtualScrolling', 'useInfiniteScroll', 'useOptimizedVirtualization',
+                        'useOptimizedListVirtualization', 'useOptimizedTableVirtualization'}
+PAGINATION_CALLS = {'slice', 'take', 'paginate', 'getPage'}
+STATIC_ROOTS = {'Array', 'Object'}
+PAGINATION_NAMES = re.compile(r'paginat|pageItems|currentPage(?:Items|Data)', re.IGNORECASE)
+KIND_WEIGHTS = {
+    'consulta': 3.0,
+    'store': 2.5,
+    'prop': 2.0,
+    'estado': 1.5,
+    'hook': 1.5,
+    'desconhecida': 1.0,
+}
+MAX_DEPTH = 5
+
+
+@dataclass
+class ListSource:
+    kind: str  # consulta, store, prop, estado, hook, estático, virtualizado, desconhecida
+    detail: str = ''
+    paginated: bool = False
+    trace: List[str] = field(default_factory=list)
+
+
+@dataclass
+class MapSite:
+    file_path: str
+    line: int
+    component: str
+    expression: str
+    row_elements: int
+    nested: bool
+    source: ListSource
+
+    @property
+    def flagged(self) -> bool:
+        return self.source.kind in KIND_WEIGHTS and not self.source.paginated
+
+    @property
+    def score(self) -> float:
+        weight = KIND_WEIGHTS.get(self.source.kind, 0.0)
+        page = 1.5 if self.file_path.startswith('src/pages/') else 1.0
+        return weight * (1 + math.log2(1 + self.row_elements)) * (2 if self.nested else 1) * page
+
+
+class LargeListDetector:
+    """Sites ``.map`` que renderizam JSX e a origem dos dados que percorrem"""
+
+    def __init__(self, project_root: str, index: Optional[SymbolIndex] = None, include_tests: bool = False):
+        self.project_root = Path(project_root)
+        self.index = index
+        self.include_tests = include_tests
+        self.sites: List[MapSite] = []
+        self._hook_kinds: Dict[Tuple[str, str], str] = {}
+        self._jsx_callers: Optional[Dict[Tuple[str, str], List[Tuple[str, int]]]] = None
+
+    # ------------------------------------------------------------- auxiliares
+    def hook_kind(self, view: SourceView, name: str) -> str:
+        """Classifica um hook: consulta, store, virtualizado ou hook genérico"""
+        if name in QUERY_HOOKS:
+            return 'consulta'
+        if name in VIRTUALIZATION_HOOKS:
+            return 'virtualizado'
+        if name in ('useState', 'useReducer'):
+            return 'estado'
+        module = self.index.modules.get(view.path)
+        origin = self.index.resolve_local(module, name) if module is not None else (view.path, name)
+        if origin in self._hook_kinds:
+            return self._hook_kinds[origin]
+        self._hook_kinds[origin] = 'hook'
+        target = self.index.modules.get(origin[0])
+        kind = 'hook'
+        if target is not None:
+            if origin[0].startswith('src/stores/') or 'Store' in name or 'useContext(' in target.source \
+                    and 'Store' in target.source:
+                kind = 'store'
+            elif any(f"{hook}(" in target.source or f"{hook}<" in target.source for hook in QUERY_HOOKS) \
+                    or ('supabase' in target.source and '.from(' in target.source):
+                kind = 'consulta'
+            elif any(hook in target.source for hook in VIRTUALIZATION_HOOKS):
+                kind = 'virtualizado'
+        self._hook_kinds[origin] = kind
+        return kind
+
+    def _chain_scopes(self, view: SourceView, position: int) -> List[FunctionScope]:
+        return view.scopes.chain(view.scopes.enclosing(position))
+
+    def find_declaration(self, view: SourceView, name: str, before: int) -> Optional[Tuple[str, int, int, str]]:
+        """Declaração visível de ``name`` antes de ``before``: (forma, início do inicializador, fim, chave)
+
+        Formas: ``simples`` (const x = ...), ``objeto`` (const { chave: x } = ...),
+        ``array`` (const [x, setX] = ..., chave = posição) e ``parâmetro``.
+        """
+        scopes = self._chain_scopes(view, before)
+        for scope in scopes:
+            if scope.params_start <= before and any(
+                    view.value(k) == name and view.tokens[k].kind == 'name'
+                    for k in range(scope.params_start, scope.params_end + 1)):
+                return 'parâmetro', scope.params_start, scope.params_end, scope.name
+        visible = {id(scope) for scope in scopes}
+        for k in range(min(before, len(view.tokens)) - 1, -1, -1):
+            if view.value(k) != name or view.tokens[k].kind != 'name':
+                continue
+            position = view.scopes.enclosing(k)
+            owner = view.scopes.functions[position] if position is not None else None
+            if owner is not None and id(owner) not in visible:
+                continue
+            if view.value(k - 1) in ('const', 'let', 'var'):
+                equals = k + 1
+                if view.value(equals) == ':':
+                    equals += 1
+                    while equals < len(view.tokens) and view.in_type[equals]:
+                        equals += 1
+                if view.value(equals) == '=':
+                    return 'simples', equals + 1, view.expression_end(equals + 1), name
+                continue
+            opener = view.opener(k)
+            if opener < 0 or view.value(opener) not in ('{', '['):
+                continue
+            close = view.brackets[opener]
+            if view.value(opener - 1) not in ('const', 'let', 'var') or view.value(close + 1) != '=':
+                continue
+            if view.value(opener) == '[':
+                position_in = sum(1 for s, _ in view.split_top_level(opener) if s < k)
+                return 'array', close + 2, view.expression_end(close + 2), str(position_in - 1)
+            key = view.value(k - 2) if view.value(k - 1) == ':' else name
+            return 'objeto', close + 2, view.expression_end(close + 2), key
+        return None
+
+    # ----------------------------------------------------------------- origem
+    def trace(self, view: SourceView, start: int, end: int, depth: int = 0) -> ListSource:
+        """Origem dos dados de uma expressão de array"""
+        if depth > MAX_DEPTH or start > end:
+            return ListSource('desconhecida')
+        text = view.text(start, end)
+        paginated = any(view.value(k) in PAGINATION_CALLS and view.value(k - 1) in ('.', '?.')
+                        for k in range(start, end + 1))
+        source = self._trace_root(view, start, end, depth)
+        source.paginated = source.paginated or paginated
+        source.trace.insert(0, text[:60])
+        return source
+
+    def _trace_root(self, view: SourceView, start: int, end: int, depth: int) -> ListSource:
+        first = view.value(start)
+        if first == '(' and view.brackets[start] >= 0:
+            inner_end = view.brackets[start] - 1
+            k = start + 1
+            while k <= inner_end and view.value(k) not in ('||', '??'):
+                if view.value(k) in ('(', '[', '{') and view.brackets[k] > k:
+                    k = view.brackets[k]
+                k += 1
+            return self.trace(view, start + 1, k - 1, depth + 1)
+        if first == '[':
+            spreads = [s + 1 for s, _ in view.split_top_level(start) if view.value(s) == '...']
+            if spreads and view.value(spreads[0]) not in STATIC_ROOTS:
+                return self.trace(view, spreads[0], view.expression_end(spreads[0]), depth + 1)
+            return ListSource('estático')
+        if view.tokens[start].kind != 'name':
+            return ListSource('estático' if view.tokens[start].kind in ('string', 'number') else 'desconhecida')
+        if first == 'Object' and view.value(start + 2) in ('entries', 'values', 'keys') and view.value(start + 3) == '(':
+            close = view.brackets[start + 3]
+            return self.trace(view, start + 4, close - 1, depth + 1)
+        if first in STATIC_ROOTS:
+            return ListSource('estático')
+        if first == 'props' and view.value(start + 1) == '.':
+            return ListSource('prop', view.value(start + 2))
+        if first.startswith('use') and view.value(start + 1) in ('(', '<'):
+            kind = self.hook_kind(view, first)
+            return ListSource(kind, first)
+        if first[:1].isupper() and first.upper() == first:
+            return ListSource('estático')  # constante de módulo (LISTA_FIXA)
+        if PAGINATION_NAMES.search(first):
+            return ListSource('desconhecida', first, paginated=True)
+        declaration = self.find_declaration(view, first, start)
+        if declaration is None:
+            return ListSource('desconhecida', first)
+        form, init_start, init_end, key = declaration
+        if form == 'parâmetro':
+            return self._trace_prop(view, first, key, depth)
+        if view.scopes.enclosing(init_start) is None and form == 'simples' and view.value(init_start) == '[':
+            return ListSource('estático')
+        callee = view.value(init_start)
+        paren = self._call_paren(view, init_start, init_end)
+        if callee in ('useMemo', 'useCallback') and paren is not None:
+            return self._trace_memo(view, paren, depth)
+        if callee in ('useState', 'useReducer') and form == 'array' and key == '0':
+            if paren is not None and view.brackets[paren] > paren + 1:
+                origin = self.trace(view, paren + 1, view.brackets[paren] - 1, depth + 1)
+                if origin.kind in ('consulta', 'store', 'prop'):
+                    origin.detail = f"{origin.detail} via useState".strip()
+                    return origin
+                if origin.kind == 'estático' and view.value(paren + 1) == '[' \
+                        and view.brackets[paren + 1] == view.brackets[paren] - 1 \
+                        and view.brackets[paren + 1] > paren + 2:
+                    return ListSource('estático')
+            return ListSource('estado', first)
+        if callee.startswith('use') and view.value(init_start + 1) in ('(', '<'):
+            kind = self.hook_kind(view, callee)
+            if form == 'objeto' and key in ('data', 'pages') and kind in ('hook', 'consulta'):
+                kind = 'consulta'
+            return ListSource(kind, f"{callee}().{key}" if form == 'objeto' else callee)
+        # const { contracts } = props / = store.state
+        return self.trace(view, init_start, init_end, depth + 1)
+
+    def _call_paren(self, view: SourceView, callee: int, end: int) -> Optional[int]:
+        """``(`` da chamada ``callee(...)``/``callee<T>(...)``"""
+        k = callee + 1
+        if view.value(k) == '<':
+            while k <= end and (view.value(k) != '(' or view.in_type[k]):
+                k += 1
+        return k if view.value(k) == '(' and view.brackets[k] > k else None
+
+    def _trace_memo(self, view: SourceView, paren: int, depth: int) -> ListSource:
+        """Origem do valor de ``useMemo(() => expr | { return expr }, deps)``"""
+        items = view.split_top_level(paren)
+        if not items:
+            return ListSource('desconhecida')
+        start, end = items[0]
+        arrow = next((k for k in range(start, end + 1) if view.value(k) == '=>'), None)
+        if arrow is None:
+            return ListSource('desconhecida')
+        if view.value(arrow + 1) != '{':
+            return self.trace(view, arrow + 1, end, depth + 1)
+        returns = [k for k in range(arrow + 1, end) if view.value(k) == 'return']
+        for k in reversed(returns):
+            source = self.trace(view, k + 1, view.expression_end(k + 1), depth + 1)
+            if source.kind != 'estático':
+                # a fonte pode ter sido filtrada/paginada antes do return
+                body = view.text(arrow + 1, end)
+                if '.slice(' in body:
+                    source.paginated = True
+                return source
+        return ListSource('desconhecida')
+
+    def _trace_prop(self, view: SourceView, name: str, component: str, depth: int) -> ListSource:
+        """Prop de componente: consulta os elementos JSX que o montam para achar a origem"""
+        if not component[:1].isupper():
+            return ListSource('prop', name)
+        callers = self.jsx_callers().get((view.path, component), [])
+        origins = []
+        for caller_path, tag_index in callers:
+            caller = self.index.view(caller_path)
+            k = tag_index + 1
+            while k < len(caller.tokens) and not (caller.tokens[k].kind == 'jsx' and caller.value(k) in ('>', '/>')):
+                if caller.tokens[k].kind == 'jsx_attr' and caller.value(k) == name and caller.value(k + 2) == '{':
+                    close = caller.brackets[k + 2]
+                    origins.append(self.trace(caller, k + 3, close - 1, depth + 1))
+                    break
+                k += 1
+        if not origins:
+            return ListSource('prop', name)
+        if all(origin.paginated or origin.kind in ('virtualizado', 'estático') for origin in origins):
+            return ListSource('prop', f"{name} (paginado no pai)", paginated=True)
+        strongest = max(origins, key=lambda o: KIND_WEIGHTS.get(o.kind, 0))
+        return ListSource(strongest.kind if strongest.kind in KIND_WEIGHTS else 'prop',
+                          f"{name} ← {strongest.detail or strongest.kind}", trace=strongest.trace)
+
+    def jsx_callers(self) -> Dict[Tuple[str, str], List[Tuple[str, int]]]:
+        """(arquivo, componente) -> elementos JSX que o montam"""
+        if self._jsx_callers is None:
+            self._jsx_callers = defaultdict(list)
+            for path, module in self.index.modules.items():
+                if not path.endswith('.tsx') or (not self.include_tests and is_test_file(path)):
+                    continue
+                view = self.index.view(path)
+                for k in range(len(view.tokens) - 1):
+                    if view.tokens[k].kind == 'jsx' and view.value(k) == '<' and view.tokens[k + 1].kind == 'name' \
+                            and view.value(k + 1)[:1].isupper():
+                        self._jsx_callers[self.index.resolve_local(module, view.value(k + 1))].append((path, k + 1))
+        return self._jsx_callers
+
+    # -------------------------------------------------------------- varredura
+    def scan_module(self, path: str) -> None:
+        view = self.index.view(path)
+        tokens = view.tokens
+        callbacks: List[Tuple[int, int]] = []
+        found: List[Tuple[int, int, int, int]] = []
+        for k in range(2, len(tokens) - 1):
+            if view.value(k) != 'map' or view.value(k - 1) not in ('.', '?.') or view.value(k + 1) != '(':
+                continue
+            close = view.brackets[k + 1]
+            if close < 0:
+                continue
+            elements = sum(1 for j in range(k + 2, close) if tokens[j].kind == 'jsx' and tokens[j].value == '<')
+            if not elements:
+                continue
+            found.append((k, close, elements, view.expression_start(k - 2)))
+            callbacks.append((k + 1, close))
+        for k, close, elements, start in found:
+            nested = any(open_ < k < end for open_, end in callbacks if (open_, end) != (k + 1, close))
+            source = self.trace(view, start, k - 2)
+            scope = view.scopes.named_ancestor(view.scopes.enclosing(k))
+            self.sites.append(MapSite(path, tokens[k].line, scope.name if scope else '(módulo)',
+                                      view.text(start, k - 2)[:60], elements, nested, source))
+
+    def run_analysis(self) -> List[MapSite]:
+        print("🔍 Indexando módulos...")
+        if self.index is None:
+            self.index = SymbolIndex(str(self.project_root)).build()
+
+        print("📜 Procurando renderizações de listas com .map...")
+        for path in sorted(self.index.modules):
+            if not path.endswith('.tsx') or (not self.include_tests and is_test_file(path)):
+                continue
+            self.scan_module(path)
+
+        flagged = [site for site in self.sites if site.flagged]
+        print(f"⚠️ {len(flagged)} listas sem paginação nem virtualização (de {len(self.sites)} .map com JSX)")
+        return flagged
+
+    # -------------------------------------------------------------- relatório
+    def generate_report(self, output_file: str) -> None:
+        flagged = sorted((s for s in self.sites if s.flagged), key=lambda s: -s.score)
+        handled = [s for s in self.sites if s.source.paginated or s.source.kind == 'virtualizado']
+        by_kind: Dict[str, int] = defaultdict(int)
+        for site in self.sites:
+            key = 'paginado' if site.source.paginated else site.source.kind
+            by_kind[key] += 1
+
+        report = f"""# Listas Grandes sem Virtualização - Doc Forge Buddy
+
+**Data da análise:** {datetime.now().strftime('%d/%m/%Y %H:%M')}
+**Renderizações `.map` com JSX:** {len(self.sites)}
+**Candidatas à virtualização:** {len(flagged)}
+**Já paginadas ou virtualizadas:** {len(handled)}
+
+## 📊 Origem dos Dados
+
+| Origem | Sites |
+|--------|-------|
+"""
+        for kind, count in sorted(by_kind.items(), key=lambda item: -item[1]):
+            report += f"| {kind} | {count} |\n"
+
+        report += """
+## 🎯 Lista Priorizada para Virtualização
+
+Pontuação = peso da origem × (1 + log2(1 + elementos por item)) × 2 se aninhada × 1.5 se página.
+Nenhum destes sites usa `useVirtualScrolling`/`useInfiniteScroll`.
+
+| # | Local | Componente | Expressão | Origem | Elementos/item | Pontuação |
+|---|-------|------------|-----------|--------|----------------|-----------|
+"""
+        for position, site in enumerate(flagged[:60], 1):
+            origin = site.source.kind + (f" (`{site.source.detail}`)" if site.source.detail else '')
+            nested = ' 🔁' if site.nested else ''
+            report += (f"| {position} | `{site.file_path}`:{site.line} | `{site.component}` | "
+                       f"`{site.expression}` | {origin} | {site.row_elements}{nested} | {site.score:.1f} |\n")
+
+        if handled:
+            report += "\n## ✅ Listas Paginadas ou Virtualizadas\n\n"
+            report += "| Local | Componente | Expressão | Situação |\n|-------|------------|-----------|----------|\n"
+            for site in handled:
+                state = 'virtualizada' if site.source.kind == 'virtualizado' else 'paginada'
+                detail = f" (`{site.source.detail}`)" if site.source.detail else ''
+                report += (f"| `{site.file_path}`:{site.line} | `{site.component}` | `{site.expression}` | "
+                           f"{state}{detail} |\n")
+
+        report += """
+## 💡 Recomendações
+
+1. **Use `useVirtualScrolling`** (advanced-utility-hooks/) nas listas de consultas com itens de altura fixa
+2. **Use `useInfiniteScroll`** quando a consulta puder ser paginada no Supabase (`.range()`)
+3. **Comece pelas páginas** (src/pages): são as listas que crescem com os dados do usuário
+4. **Listas aninhadas (🔁)** multiplicam o custo: virtualize a externa e memoize o item
+5. **Listas estáticas ou curtas** (opções, meses, skeletons) foram ignoradas
+
+---
+*Relatório gerado automaticamente pelo detector de listas grandes*
+"""
+        Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(report)
+        print(f"📄 Relatório salvo em: {output_file}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Detector de listas grandes sem virtualização')
+    parser.add_argument('--project-dir', default='/workspace/doc-forge-buddy-Cain',
+                        help='Diretório do projeto')
+    parser.add_argument('--output', default='docs/analise_listas_grandes.md',
+                        help='Arquivo de saída do relatório')
+    parser.add_argument('--include-tests', action='store_true',
+                        help='Inclui arquivos de teste')
+    args = parser.parse_args()
+
+    detector = LargeListDetector(args.project_dir, include_tests=args.include_tests)
+    detector.run_analysis()
+    detector.generate_report(args.output)
+
+
+if __name__ == "__main__":
+    main()
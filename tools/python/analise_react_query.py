@@ -0,0 +1,541 @@
+#!/usr/bin/env python3
+"""
+Analisador de Uso do React Query - Doc Forge Buddy
+Extrai chave, queryFn e opções (staleTime, gcTime, enabled, select) de cada
+useQuery e aponta: a mesma tabela/filtro buscada sob chaves diferentes (o cache
+não deduplica), dados que quase não mudam com staleTime efetivo 0 e queries
+montadas várias vezes na mesma página, com um relatório por página baseado no
+grafo de imports
+"""
+
+import ast
+import operator
+import re
+import argparse
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from symbol_index import SymbolIndex, is_test_file
+from supabase_queries import QueryChain, extract_query_chains
+from ts_scopes import SourceView, FunctionScope
+
+QUERY_HOOKS = {'useQuery', 'useSuspenseQuery', 'useInfiniteQuery', 'useSuspenseInfiniteQuery'}
+# Wrappers do projeto com assinatura posicional (chave, queryFn, opções)
+POSITIONAL_WRAPPERS = {'useOptimizedQuery'}
+TRACKED_OPTIONS = ('staleTime', 'gcTime', 'cacheTime', 'enabled', 'select', 'refetchOnMount',
+                   'refetchOnWindowFocus', 'refetchInterval')
+# Indícios de dados de referência (mudam raramente)
+REFERENCE_HINTS = ('types', 'type', 'reasons', 'settings', 'config', 'templates', 'categories', 'options',
+                   'permissions', 'roles', 'privacy', 'profile')
+PAGE_PATTERNS = ['src/pages/*']
+_NUMERIC = re.compile(r'^[\d\s*+().]+$')
+_ARITHMETIC = {ast.Mult: operator.mul, ast.Add: operator.add}
+
+
+@dataclass
+class QueryDefinition:
+    file_path: str
+    line: int
+    hook: str
+    owner: str
+    key_shape: str
+    key_root: Optional[str]
+    options: Dict[str, str] = field(default_factory=dict)
+    spreads: List[str] = field(default_factory=list)
+    fetches: Set[str] = field(default_factory=set)  # "tabela operação [filtros]"
+    tables: Set[str] = field(default_factory=set)
+    calls: List[str] = field(default_factory=list)
+    effective_stale: Optional[int] = None  # ms; None = desconhecido (spread/variável)
+    refetch_on_mount: str = 'true'
+
+    @property
+    def label(self) -> str:
+        return f"{self.key_shape} ({self.file_path}:{self.line})"
+
+
+@dataclass
+class MountSite:
+    file_path: str
+    component: str
+    line: int
+
+
+def parse_duration(text: Optional[str]) -> Optional[int]:
+    """``5 * 60 * 1000`` -> 300000; expressões não numéricas -> None"""
+    if text is None:
+        return None
+    text = text.replace('_', '')
+    if text == 'Infinity':
+        return 10 ** 12
+    if not _NUMERIC.match(text):
+        return None
+    try:
+        return int(_evaluate_product(ast.parse(text, mode='eval').body))
+    except (SyntaxError, ValueError):
+        return None
+
+
+def _evaluate_product(node: ast.AST) -> float:
+    """Avalia só literais numéricos, ``*`` e ``+`` (sem ``eval`` sobre código do projeto)"""
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) \
+            and not isinstance(node.value, bool):
+        return node.value
+    if isinstance(node, ast.BinOp) and type(node.op) in _ARITHMETIC:
+        return _ARITHMETIC[type(node.op)](_evaluate_product(node.left), _evaluate_product(node.right))
+    raise ValueError(f"expressão não suportada: {ast.dump(node)}")
+
+
+def format_duration(ms: Optional[int]) -> str:
+    if ms is None:
+        return '?'
+    if ms >= 10 ** 12:
+        return '∞'
+    if ms >= 60_000:
+        return f"{ms / 60_000:g} min"
+    return f"{ms / 1000:g} s" if ms else '0'
+
+
+class ReactQueryAnalyzer:
+    """Catálogo de queries do React Query cruzado com o grafo de imports"""
+
+    def __init__(self, project_root: str, index: Optional[SymbolIndex] = None, include_tests: bool = False):
+        self.project_root = Path(project_root)
+        self.index = index
+        self.include_tests = include_tests
+        self.chains: Dict[str, List[QueryChain]] = {}
+        self.defaults: Dict[str, str] = {}
+        self.default_source: Optional[str] = None
+        self.definitions: List[QueryDefinition] = []
+        self.written_tables: Set[str] = set()
+        self.callers: Dict[Tuple[str, str], List[MountSite]] = defaultdict(list)
+        self.mounts: Dict[int, List[MountSite]] = {}
+        self.pages: Dict[str, Dict[int, List[MountSite]]] = {}
+
+    # ------------------------------------------------------------- auxiliares
+    def module_chains(self, path: str) -> List[QueryChain]:
+        if path not in self.chains:
+            view = self.index.view(path)
+            self.chains[path] = extract_query_chains(path, view.tokens, view.source, view.brackets) \
+                if view is not None and '.from(' in view.source else []
+        return self.chains[path]
+
+    def function_named(self, path: str, name: str) -> Optional[FunctionScope]:
+        view = self.index.view(path)
+        if view is None:
+            return None
+        for scope in view.scopes.functions:
+            if scope.name == name:
+                return scope
+        return None
+
+    # --------------------------------------------------------------- padrões
+    def load_defaults(self) -> None:
+        """defaultOptions.queries do QueryClient entregue ao QueryClientProvider"""
+        candidates = []
+        for path, module in self.index.modules.items():
+            if is_test_file(path) or 'new QueryClient' not in module.source:
+                continue
+            candidates.append((0 if 'QueryClientProvider' in module.source else 1, path))
+        for _, path in sorted(candidates):
+            view = self.index.view(path)
+            for k in range(len(view.tokens) - 3):
+                if view.value(k) != 'QueryClient' or view.value(k - 1) != 'new' or view.value(k + 2) != '{':
+                    continue
+                options = view.object_properties(k + 2)
+                if 'defaultOptions' not in options or view.value(options['defaultOptions'][0]) != '{':
+                    continue
+                default_options = view.object_properties(options['defaultOptions'][0])
+                if 'queries' in default_options and view.value(default_options['queries'][0]) == '{':
+                    for name, (start, end) in view.object_properties(default_options['queries'][0]).items():
+                        self.defaults[name] = view.text(start, end)
+                    self.default_source = path
+                    return
+
+    # -------------------------------------------------------------- extração
+    def _key(self, view: SourceView, start: int, end: int) -> Tuple[str, Optional[str]]:
+        """Formato normalizado da chave: literais ficam, expressões viram ``{expr}``"""
+        if start == end and view.tokens[start].kind == 'name':
+            # const queryKey = [...] no mesmo arquivo, antes do uso
+            for k in range(start - 1, 1, -1):
+                if view.value(k) == view.value(start) and view.value(k - 1) in ('const', 'let') \
+                        and view.value(k + 1) == '=' and view.value(k + 2) == '[':
+                    start, end = k + 2, view.brackets[k + 2]
+                    break
+        if view.value(start) == '[' and view.brackets[start] == end:
+            elements = []
+            for item_start, item_end in view.split_top_level(start):
+                token = view.tokens[item_start]
+                if item_start == item_end and token.kind == 'string':
+                    elements.append(token.value)
+                else:
+                    elements.append(f"{{{view.text(item_start, item_end)}}}")
+            root = elements[0].strip('\'"`') if elements and not elements[0].startswith('{') else None
+            return f"[{', '.join(elements)}]", root
+        text = view.text(start, end)
+        return f"{{{text}}}", None
+
+    def _fetches(self, view: SourceView, start: int, end: int, definition: QueryDefinition, hops: int = 1) -> None:
+        """Consultas Supabase feitas pelo queryFn (diretas ou a um salto de chamada)"""
+        for chain in self.module_chains(view.path):
+            if start <= chain.token_start <= end:
+                filters = ', '.join(f"{method}({column})" for column, method in chain.filters())
+                definition.fetches.add(f"{chain.table} {chain.operation}" + (f" [{filters}]" if filters else ''))
+                definition.tables.add(chain.table)
+        if hops <= 0:
+            return
+        module = self.index.modules[view.path]
+        for k in range(start, end):
+            if view.tokens[k].kind != 'name' or view.value(k + 1) != '(' or view.in_type[k]:
+                continue
+            receiver = view.value(k - 2) if view.value(k - 1) in ('.', '?.') else None
+            if receiver is not None and view.value(k - 3) in ('.', '?.'):
+                continue
+            name = view.value(k)
+            if receiver is None:
+                origin, local = self.index.resolve_local(module, name)
+            elif receiver == 'this':
+                origin, local = view.path, name
+            else:
+                origin, _ = self.index.resolve_local(module, receiver)
+                local = name
+            if origin == view.path and receiver is None and local == name and module.binding_for(name) is None \
+                    and self.function_named(origin, local) is None:
+                continue
+            target = self.function_named(origin, local)
+            if target is None:
+                continue
+            label = f"{receiver + '.' if receiver else ''}{name}()"
+            if label not in definition.calls:
+                definition.calls.append(label)
+            self._fetches(self.index.view(origin), target.body_start, target.body_end, definition, hops - 1)
+
+    def extract(self, path: str) -> List[QueryDefinition]:
+        view = self.index.view(path)
+        definitions = []
+        for k, token in enumerate(view.tokens[:-1]):
+            if token.kind != 'name' or (token.value not in QUERY_HOOKS and token.value not in POSITIONAL_WRAPPERS):
+                continue
+            if view.value(k - 1) in ('.', 'function', 'import') or view.in_type[k]:
+                continue
+            paren = k + 1
+            while paren < len(view.tokens) and view.in_type[paren] and view.value(paren) != '(':
+                paren += 1
+            if view.value(paren) != '(' or view.brackets[paren] < 0:
+                continue
+            args = view.split_top_level(paren)
+            if not args:
+                continue
+            position = view.scopes.enclosing(k)
+            owner = view.scopes.named_ancestor(position)
+            if owner is not None and owner.name == token.value:
+                continue  # a definição do próprio wrapper
+            if token.value in POSITIONAL_WRAPPERS or view.value(args[0][0]) != '{':
+                properties = {'queryKey': args[0]}
+                if len(args) > 1:
+                    properties['queryFn'] = args[1]
+                if len(args) > 2 and view.value(args[2][0]) == '{':
+                    properties.update(view.object_properties(args[2][0]))
+            else:
+                properties = view.object_properties(args[0][0])
+            if 'queryKey' not in properties:
+                continue
+            key_shape, key_root = self._key(view, *properties['queryKey'])
+            definition = QueryDefinition(path, token.line, token.value, owner.name if owner else '(módulo)',
+                                         key_shape, key_root)
+            for name, (start, end) in properties.items():
+                if name.startswith('...'):
+                    definition.spreads.append(name[3:])
+                elif name in TRACKED_OPTIONS:
+                    definition.options[name] = view.text(start, end)
+            if 'queryFn' in properties:
+                start, end = properties['queryFn']
+                if start == end and view.tokens[start].kind == 'name':
+                    target = self.function_named(path, view.value(start))
+                    if target is not None:
+                        start, end = target.body_start, target.body_end
+                    else:
+                        end = start - 1
+                        origin, local = self.index.resolve_local(self.index.modules[path], view.value(properties['queryFn'][0]))
+                        target = self.function_named(origin, local)
+                        if target is not None:
+                            definition.calls.append(f"{local}()")
+                            self._fetches(self.index.view(origin), target.body_start, target.body_end, definition, 0)
+                if end >= start:
+                    self._fetches(view, start, end, definition)
+            stale = definition.options.get('staleTime', self.defaults.get('staleTime', '0'))
+            definition.effective_stale = parse_duration(stale)
+            if 'staleTime' not in definition.options and definition.spreads:
+                definition.effective_stale = None  # pode vir do spread
+            definition.refetch_on_mount = definition.options.get('refetchOnMount',
+                                                                 self.defaults.get('refetchOnMount', 'true'))
+            definitions.append(definition)
+        return definitions
+
+    # ------------------------------------------------------------- montagens
+    def build_callers(self) -> None:
+        """(módulo, função) -> locais onde é chamada como hook ou renderizada como componente"""
+        for path, module in self.index.modules.items():
+            if not self.include_tests and is_test_file(path):
+                continue
+            if not module.imports and 'use' not in module.source:
+                continue
+            view = self.index.view(path)
+            tokens = view.tokens
+            for k, token in enumerate(tokens[:-1]):
+                if token.kind != 'name':
+                    continue
+                is_hook = token.value.startswith('use') and tokens[k + 1].value == '(' \
+                    and view.value(k - 1) not in ('.', 'function')
+                is_tag = view.value(k - 1) == '<' and tokens[k - 1].kind == 'jsx' and token.value[:1].isupper()
+                if not is_hook and not is_tag:
+                    continue
+                position = view.scopes.enclosing(k)
+                if is_hook and position is not None and view.scopes.functions[position].params_start == k + 1:
+                    continue
+                owner = view.scopes.named_ancestor(position)
+                target = self.index.resolve_local(module, token.value)
+                self.callers[target].append(MountSite(path, owner.name if owner else '(módulo)', token.line))
+
+    def mount_sites(self, definition: QueryDefinition) -> List[MountSite]:
+        """Componentes que montam a query, subindo pela cadeia de hooks customizados"""
+        if not definition.owner.startswith('use'):
+            return [MountSite(definition.file_path, definition.owner, definition.line)]
+        sites = []
+        queue = deque([(definition.file_path, definition.owner)])
+        seen = {(definition.file_path, definition.owner)}
+        while queue:
+            key = queue.popleft()
+            for site in self.callers.get(key, []):
+                if site.component.startswith('use'):
+                    nxt = (site.file_path, site.component)
+                    if nxt not in seen:
+                        seen.add(nxt)
+                        queue.append(nxt)
+                elif site.file_path != definition.file_path or site.component != definition.owner:
+                    sites.append(site)
+        return sites
+
+    def runtime_reachable(self, entry: str) -> Set[str]:
+        """Módulos alcançados por imports de valor (barrels seguidos só pelos nomes usados)"""
+        seen = {entry}
+        queue = deque([entry])
+        while queue:
+            module = self.index.modules.get(queue.popleft())
+            if module is None:
+                continue
+            for statement in module.imports:
+                if statement.type_only or not statement.resolved:
+                    continue
+                targets = []
+                bindings = [b for b in statement.bindings if not b.type_only]
+                if statement.dynamic or not bindings or any(b.imported in ('*', 'default') for b in bindings):
+                    targets.append(statement.resolved)
+                else:
+                    for binding in bindings:
+                        chain = self.index.resolve_export(statement.resolved, binding.imported)
+                        targets.append(chain[-1][0] if chain else statement.resolved)
+                for target in targets:
+                    if target not in seen:
+                        seen.add(target)
+                        queue.append(target)
+        return seen
+
+    # ---------------------------------------------------------------- achados
+    def duplicate_groups(self) -> List[Tuple[str, List[QueryDefinition]]]:
+        """Mesma consulta (tabela + operação + filtros) sob formatos de chave diferentes"""
+        groups: Dict[str, List[QueryDefinition]] = defaultdict(list)
+        for definition in self.definitions:
+            for fetch in definition.fetches:
+                if ' select' in fetch:
+                    groups[fetch].append(definition)
+        result = []
+        for fetch, definitions in sorted(groups.items()):
+            shapes = {d.key_shape for d in definitions}
+            if len(shapes) > 1:
+                result.append((fetch, definitions))
+        return result
+
+    def is_reference_data(self, definition: QueryDefinition) -> Optional[str]:
+        if definition.tables and not definition.tables & self.written_tables:
+            return 'tabela sem escrita no frontend'
+        words = ' '.join([definition.key_shape] + sorted(definition.tables)).lower()
+        for hint in REFERENCE_HINTS:
+            if re.search(rf'(^|[^a-z]){hint}([^a-z]|$)', words.replace('-', ' ').replace('_', ' ')):
+                return f"dados de referência ({hint})"
+        return None
+
+    def stale_zero(self) -> List[Tuple[QueryDefinition, str]]:
+        return [(d, reason) for d in self.definitions
+                if d.effective_stale == 0 and (reason := self.is_reference_data(d))]
+
+    def refetches_on_mount(self, definition: QueryDefinition) -> bool:
+        mode = definition.refetch_on_mount.strip('\'"')
+        if mode == 'always':
+            return True
+        return mode not in ('false',) and definition.effective_stale == 0
+
+    def run_analysis(self) -> List[QueryDefinition]:
+        print("🔍 Indexando módulos...")
+        if self.index is None:
+            self.index = SymbolIndex(str(self.project_root)).build()
+        self.load_defaults()
+        if self.default_source:
+            print(f"   Padrões do QueryClient em {self.default_source}: staleTime={self.defaults.get('staleTime', '0')}")
+
+        print("🗂️ Extraindo queries...")
+        paths = [p for p in sorted(self.index.modules) if self.include_tests or not is_test_file(p)]
+        for path in paths:
+            source = self.index.modules[path].source
+            if any(hook in source for hook in QUERY_HOOKS | POSITIONAL_WRAPPERS):
+                self.definitions.extend(self.extract(path))
+            for chain in self.module_chains(path) if '.from(' in source else []:
+                if chain.operation != 'select':
+                    self.written_tables.add(chain.table)
+        print(f"   {len(self.definitions)} queries em {len({d.file_path for d in self.definitions})} arquivos")
+
+        print("🧭 Calculando montagens por página...")
+        self.build_callers()
+        for position, definition in enumerate(self.definitions):
+            self.mounts[position] = self.mount_sites(definition)
+        for page in self.index.entry_points(PAGE_PATTERNS):
+            reachable = self.runtime_reachable(page)
+            mounted = {}
+            for position, sites in self.mounts.items():
+                local = [s for s in sites if s.file_path in reachable]
+                if local:
+                    mounted[position] = local
+            if mounted:
+                self.pages[page] = mounted
+
+        print(f"⚠️ {len(self.duplicate_groups())} consultas duplicadas sob chaves diferentes, "
+              f"{len(self.stale_zero())} dados de referência com staleTime 0")
+        return self.definitions
+
+    # -------------------------------------------------------------- relatório
+    def page_findings(self, page: str) -> List[Tuple[QueryDefinition, int, List[str]]]:
+        mounted = self.pages[page]
+        fetch_keys: Dict[str, Set[str]] = defaultdict(set)
+        for position in mounted:
+            for fetch in self.definitions[position].fetches:
+                fetch_keys[fetch].add(self.definitions[position].key_shape)
+        rows = []
+        for position, sites in sorted(mounted.items(), key=lambda item: -len(item[1])):
+            definition = self.definitions[position]
+            flags = []
+            if len(sites) > 1 and self.refetches_on_mount(definition):
+                flags.append(f"refetch em cada uma das {len(sites)} montagens")
+            duplicated = sorted({fetch for fetch in definition.fetches
+                                 if ' select' in fetch and len(fetch_keys[fetch]) > 1})
+            if duplicated:
+                flags.append(f"mesma consulta sob outra chave ({duplicated[0].split(' [')[0]})")
+            rows.append((definition, len(sites), flags))
+        return rows
+
+    def generate_report(self, output_file: str) -> None:
+        duplicates = self.duplicate_groups()
+        stale_zero = self.stale_zero()
+        without_stale = [d for d in self.definitions if 'staleTime' not in d.options]
+
+        report = f"""# Uso do React Query - Doc Forge Buddy
+
+**Data da análise:** {datetime.now().strftime('%d/%m/%Y %H:%M')}
+**Queries encontradas:** {len(self.definitions)}
+**Arquivos com queries:** {len({d.file_path for d in self.definitions})}
+**Padrões do QueryClient:** {f'`{self.default_source}`' if self.default_source else 'não encontrados (staleTime 0)'}
+**Consultas duplicadas sob chaves diferentes:** {len(duplicates)}
+**Dados de referência com staleTime 0:** {len(stale_zero)}
+
+## 📊 Padrões Globais
+
+| Opção | Valor |
+|-------|-------|
+"""
+        for option in ('staleTime', 'gcTime', 'refetchOnMount', 'refetchOnWindowFocus'):
+            value = self.defaults.get(option, '-')
+            report += f"| `{option}` | `{value}` |\n"
+
+        report += """
+## 🗂️ Catálogo de Queries
+
+| Local | Dono | Chave | staleTime | gcTime | enabled | select | Consultas |
+|-------|------|-------|-----------|--------|---------|--------|-----------|
+"""
+        for definition in self.definitions:
+            stale = definition.options.get('staleTime')
+            stale_text = f"`{stale}`" if stale else f"padrão ({format_duration(definition.effective_stale)})"
+            fetched = '; '.join(sorted(definition.fetches)) or ', '.join(definition.calls) or '-'
+            report += (f"| `{definition.file_path}`:{definition.line} | `{definition.owner}` | "
+                       f"`{definition.key_shape.replace('|', '/')}` | {stale_text} | "
+                       f"{'`' + definition.options['gcTime'] + '`' if 'gcTime' in definition.options else '-'} | "
+                       f"{'sim' if 'enabled' in definition.options else '-'} | "
+                       f"{'sim' if 'select' in definition.options else '-'} | {fetched.replace('|', '/')} |\n")
+
+        if duplicates:
+            report += "\n## 🔁 Mesma Consulta sob Chaves Diferentes\n\n"
+            report += "Cada formato de chave ocupa uma entrada própria no cache e dispara sua própria requisição.\n\n"
+            for fetch, definitions in duplicates:
+                report += f"### `{fetch}`\n\n"
+                for definition in definitions:
+                    report += f"- `{definition.key_shape}` em `{definition.file_path}`:{definition.line} (`{definition.owner}`)\n"
+                report += "\n"
+
+        if stale_zero:
+            report += "## 🧊 Dados Estáveis com staleTime 0\n\n"
+            report += "| Local | Chave | Motivo | Sugestão |\n|-------|-------|--------|----------|\n"
+            for definition, reason in stale_zero:
+                report += (f"| `{definition.file_path}`:{definition.line} | `{definition.key_shape}` | {reason} | "
+                           f"`staleTime: 30 * 60 * 1000` |\n")
+            report += "\n"
+
+        if self.pages:
+            report += "## 📄 Relatório por Página\n\n"
+            for page in sorted(self.pages, key=lambda p: -len(self.pages[p])):
+                rows = self.page_findings(page)
+                flagged = [row for row in rows if row[2]]
+                report += f"### `{page}` — {len(rows)} queries, {len(flagged)} com busca redundante\n\n"
+                report += "| Chave | Montagens | Definida em | Alertas |\n|-------|-----------|-------------|---------|\n"
+                for definition, count, flags in rows[:25]:
+                    report += (f"| `{definition.key_shape.replace('|', '/')}` | {count} | "
+                               f"`{definition.file_path}`:{definition.line} | {'; '.join(flags) or '-'} |\n")
+                report += "\n"
+
+        report += f"""## 💡 Recomendações
+
+1. **Centralize as chaves** em uma fábrica (`queryKeys.contracts.list(filtros)`) para que a mesma consulta use sempre a mesma chave
+2. **Dados de referência** (tipos, motivos, configurações) devem ter `staleTime` longo ou `Infinity` com invalidação explícita
+3. **Evite `refetchOnMount: 'always'`** em queries montadas por vários componentes da mesma página
+4. **Use `select`** para derivar recortes do mesmo cache em vez de criar uma nova query por recorte
+5. **{len(without_stale)} queries dependem do staleTime global**; defina o valor explicitamente onde o dado tiver ritmo próprio
+
+---
+*Relatório gerado automaticamente pelo analisador de uso do React Query*
+"""
+        Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(report)
+        print(f"📄 Relatório salvo em: {output_file}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Analisador de uso do React Query (chaves, cache e montagens)')
+    parser.add_argument('--project-dir', default='/workspace/doc-forge-buddy-Cain',
+                        help='Diretório do projeto')
+    parser.add_argument('--output', default='docs/analise_react_query.md',
+                        help='Arquivo de saída do relatório')
+    parser.add_argument('--include-tests', action='store_true',
+                        help='Inclui arquivos de teste')
+    args = parser.parse_args()
+
+    analyzer = ReactQueryAnalyzer(args.project_dir, include_tests=args.include_tests)
+    analyzer.run_analysis()
+    analyzer.generate_report(args.output)
+
+    for fetch, definitions in analyzer.duplicate_groups()[:10]:
+        print(f"   {fetch}: {', '.join(sorted({d.key_shape for d in definitions}))}")
+
+
+if __name__ == "__main__":
+    main()
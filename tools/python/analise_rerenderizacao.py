@@ -0,0 +1,481 @@
+#!/usr/bin/env python3
+"""
+Analisador de Risco de Re-renderização - Doc Forge Buddy
+Encontra props instáveis passadas a componentes filhos (objetos/arrays literais,
+arrow functions, spreads novos, arrays derivados a cada render), pondera pelo
+número de lugares em que o filho é usado e por ele estar em ``memo``, e aponta
+valores de contexto criados sem ``useMemo`` nos providers montados por
+src/providers/AppProviders.tsx
+"""
+
+import argparse
+import math
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from symbol_index import SymbolIndex, is_test_file
+from ts_scopes import SourceView
+
+APP_PROVIDERS = 'src/providers/AppProviders.tsx'
+STABLE_HOOKS = {'useCallback', 'useMemo', 'useRef', 'useState', 'useReducer', 'useContext', 'useId',
+                'useQueryClient', 'useNavigate', 'useForm'}
+DERIVING_METHODS = {'map', 'filter', 'slice', 'concat', 'sort', 'reduce', 'flatMap', 'entries', 'keys',
+                    'values', 'toSorted', 'reverse'}
+IGNORED_PROPS = {'key', 'ref', 'children', 'className'}
+KIND_WEIGHTS = {
+    'objeto literal': 1.0,
+    'array literal': 1.0,
+    'função inline': 1.0,
+    'bind': 1.0,
+    'spread novo': 1.2,
+    'array derivado': 1.5,
+}
+MEMO_FACTOR = 3.0
+
+
+@dataclass
+class ComponentInfo:
+    file_path: str
+    name: str
+    memo: bool
+    importers: int  # arquivos que dependem do módulo (reverse_dependencies)
+    jsx_sites: int  # elementos <Componente> no projeto
+
+
+@dataclass
+class UnstableProp:
+    file_path: str
+    line: int
+    parent: str
+    child: str
+    prop: str
+    kind: str
+    via: str = ''  # variável local instável, quando não é literal no JSX
+    child_info: Optional[ComponentInfo] = None
+
+    @property
+    def score(self) -> float:
+        weight = KIND_WEIGHTS.get(self.kind, 1.0)
+        if self.child_info is None:
+            return weight
+        memo = MEMO_FACTOR if self.child_info.memo else 1.0
+        return weight * memo * (1 + math.log2(1 + max(self.child_info.jsx_sites, self.child_info.importers)))
+
+
+@dataclass
+class ContextValue:
+    file_path: str
+    line: int
+    provider: str
+    component: str
+    kind: str  # 'objeto inline', 'objeto sem useMemo', 'função sem useCallback', 'estável'
+    detail: str = ''
+    from_app_providers: bool = False
+    consumers: int = 0
+
+
+class RerenderRiskAnalyzer:
+    """Props instáveis em elementos JSX e valores de contexto sem memoização"""
+
+    def __init__(self, project_root: str, index: Optional[SymbolIndex] = None, include_tests: bool = False):
+        self.project_root = Path(project_root)
+        self.index = index
+        self.include_tests = include_tests
+        self.components: Dict[Tuple[str, str], ComponentInfo] = {}
+        self.jsx_sites: Dict[Tuple[str, str], int] = defaultdict(int)
+        self.findings: List[UnstableProp] = []
+        self.contexts: List[ContextValue] = []
+
+    # ------------------------------------------------------------- auxiliares
+    def is_stable_hook(self, view: SourceView, init_start: int) -> bool:
+        """Inicializador é ``useMemo(...)`` etc. ou ``React.useMemo(...)`` (incluindo aliases de ``react``)"""
+        callee = view.value(init_start)
+        if callee in STABLE_HOOKS:
+            return True
+        if view.value(init_start + 1) != '.' or view.value(init_start + 2) not in STABLE_HOOKS:
+            return False
+        if callee == 'React':
+            return True
+        binding = self.index.modules[view.path].binding_for(callee)
+        return binding is not None and binding[0].source == 'react' and binding[1].imported in ('default', '*')
+
+    def is_memo(self, path: str, name: str) -> bool:
+        """Componente declarado como ``memo(...)``/``React.memo(...)`` ou exportado como ``memo(Nome)``"""
+        view = self.index.view(path)
+        if view is None:
+            return False
+        for scope in view.scopes.functions:
+            if scope.name == name and scope.call_context == 'memo':
+                return True
+        tokens = view.tokens
+        for k in range(len(tokens) - 2):
+            if tokens[k].value == 'memo' and tokens[k + 1].value == '(':
+                if tokens[k + 2].value == name and view.value(k + 3) in (')', ','):
+                    return True
+                # const Nome = memo(forwardRef(...)) / memo<Props>(...)
+                j = k - 2 if view.value(k - 1) == '.' else k
+                if view.value(j - 1) == '=' and view.value(j - 2) == name:
+                    return True
+        return False
+
+    def component_info(self, path: str, name: str) -> ComponentInfo:
+        key = (path, name)
+        if key not in self.components:
+            self.components[key] = ComponentInfo(path, name, self.is_memo(path, name),
+                                                 len({p for p, _ in self.index.importers.get(path, [])}),
+                                                 self.jsx_sites.get(key, 0))
+        return self.components[key]
+
+    # ----------------------------------------------------- classificação
+    def classify_expression(self, view: SourceView, start: int, end: int) -> Optional[str]:
+        """Tipo de instabilidade de uma expressão recriada a cada render (None se estável/desconhecida)"""
+        first = view.value(start)
+        if first == '{' and view.brackets[start] == end:
+            inner = view.split_top_level(start)
+            if any(view.value(s) == '...' for s, _ in inner):
+                return 'spread novo'
+            return 'objeto literal'
+        if first == '[' and view.brackets[start] == end:
+            return 'array literal'
+        if first in ('async', 'function') or (first == '(' and view.value(view.brackets[start] + 1) == '=>'):
+            return 'função inline'
+        if start + 1 <= end and view.tokens[start].kind == 'name' and view.value(start + 1) == '=>':
+            return 'função inline'
+        if view.value(end) == ')' and view.brackets[end] > start:
+            callee = view.brackets[end] - 1
+            if view.value(callee) == 'bind':
+                return 'bind'
+            if view.value(callee) in DERIVING_METHODS and view.value(callee - 1) in ('.', '?.'):
+                return 'array derivado'
+        return None
+
+    def local_declaration(self, view: SourceView, name: str, component: Optional[int],
+                          before: int) -> Optional[Tuple[int, int]]:
+        """Faixa do inicializador de ``const name = ...`` declarado no corpo do componente"""
+        if component is None:
+            return None
+        scope = view.scopes.functions[component]
+        for k in range(scope.body_start, min(before, scope.body_end)):
+            if view.value(k) != name or view.value(k - 1) not in ('const', 'let') \
+                    or view.scopes.enclosing(k) != component:
+                continue
+            equals = k + 1
+            if view.value(equals) == ':':  # const store: ContractStore = ...
+                equals += 1
+                while equals < scope.body_end and view.in_type[equals]:
+                    equals += 1
+            if view.value(equals) == '=':
+                start = equals + 1
+                end = start
+                while end < scope.body_end and view.value(end) not in (';',):
+                    if view.value(end) in ('(', '[', '{') and view.brackets[end] > end:
+                        end = view.brackets[end] + 1
+                        continue
+                    if end > start and view.tokens[end].line > view.tokens[end - 1].line \
+                            and view.value(end) in ('const', 'let', 'return', 'if', 'useEffect'):
+                        break
+                    end += 1
+                return start, end - 1
+        return None
+
+    def classify_value(self, view: SourceView, start: int, end: int, component: Optional[int]) -> Tuple[Optional[str], str]:
+        """Classifica o valor de uma prop; identificadores são seguidos até a declaração local"""
+        kind = self.classify_expression(view, start, end)
+        if kind is not None or start != end or view.tokens[start].kind != 'name':
+            return kind, ''
+        declaration = self.local_declaration(view, view.value(start), component, start)
+        if declaration is None:
+            return None, ''
+        init_start, init_end = declaration
+        if self.is_stable_hook(view, init_start):
+            return None, ''
+        kind = self.classify_expression(view, init_start, init_end)
+        return kind, view.value(start) if kind else ''
+
+    # -------------------------------------------------------------- varredura
+    def count_jsx_sites(self) -> None:
+        for path, module in self.index.modules.items():
+            if not path.endswith('.tsx') or (not self.include_tests and is_test_file(path)):
+                continue
+            view = self.index.view(path)
+            tokens = view.tokens
+            for k in range(len(tokens) - 1):
+                if tokens[k].kind == 'jsx' and tokens[k].value == '<' and tokens[k + 1].kind == 'name' \
+                        and tokens[k + 1].value[:1].isupper() and view.value(k + 2) != '.':
+                    self.jsx_sites[self.index.resolve_local(module, tokens[k + 1].value)] += 1
+
+    def _attributes(self, view: SourceView, tag_index: int) -> List[Tuple[str, int, int]]:
+        """(nome, início, fim) dos atributos ``nome={expr}`` e ``{...expr}`` de uma tag de abertura"""
+        attributes = []
+        k = tag_index + 1
+        while k < len(view.tokens):
+            token = view.tokens[k]
+            if token.kind == 'jsx' and token.value in ('>', '/>'):
+                break
+            if token.kind == 'jsx_attr' and view.value(k + 1) == '=' and view.value(k + 2) == '{':
+                close = view.brackets[k + 2]
+                attributes.append((token.value, k + 3, close - 1))
+                k = close + 1
+                continue
+            if token.value == '{' and view.value(k + 1) == '...' and view.brackets[k] > k:
+                close = view.brackets[k]
+                attributes.append(('...', k + 2, close - 1))
+                k = close + 1
+                continue
+            k += 1
+        return attributes
+
+    def scan_module(self, path: str) -> None:
+        module = self.index.modules[path]
+        view = self.index.view(path)
+        tokens = view.tokens
+        for k in range(len(tokens) - 1):
+            if tokens[k].kind != 'jsx' or tokens[k].value != '<' or tokens[k + 1].kind != 'name':
+                continue
+            tag = tokens[k + 1].value
+            tag_end = k + 1
+            while view.value(tag_end + 1) == '.' and tokens[tag_end + 2].kind == 'name':
+                tag_end += 2
+            full_tag = view.text(k + 1, tag_end)
+            position = view.scopes.enclosing(k)
+            parent = view.scopes.named_ancestor(position)
+            component = view.scopes.functions.index(parent) if parent is not None else None
+            if full_tag.endswith('.Provider') or (tag.endswith('Provider') and tag_end == k + 1):
+                self.scan_provider(view, k, tag_end, full_tag, component)
+            if not tag[:1].isupper() or tag_end != k + 1:
+                continue
+            attributes = self._attributes(view, tag_end)
+            if not attributes:
+                continue
+            origin = self.index.resolve_local(module, tag)
+            if origin[0] not in self.index.modules:
+                continue  # componente de pacote externo
+            info = self.component_info(*origin)
+            for prop, start, end in attributes:
+                if prop in IGNORED_PROPS or end < start:
+                    continue
+                if prop == '...':
+                    kind = 'spread novo' if view.value(start) == '{' else None
+                    if kind is None:
+                        continue
+                    via = ''
+                else:
+                    kind, via = self.classify_value(view, start, end, component)
+                if kind is None:
+                    continue
+                self.findings.append(UnstableProp(path, tokens[start].line, parent.name if parent else '(módulo)',
+                                                  tag, prop, kind, via, info))
+
+    def scan_provider(self, view: SourceView, k: int, tag_end: int, tag: str, component: Optional[int]) -> None:
+        for prop, start, end in self._attributes(view, tag_end):
+            if prop != 'value' or end < start:
+                continue
+            owner = view.scopes.functions[component].name if component is not None else '(módulo)'
+            kind = self.classify_expression(view, start, end)
+            if kind in ('objeto literal', 'spread novo'):
+                self.contexts.append(ContextValue(view.path, view.line(k), tag, owner, 'objeto inline',
+                                                  view.text(start, end)[:80]))
+                continue
+            if start == end and view.tokens[start].kind == 'name':
+                declaration = self.local_declaration(view, view.value(start), component, start)
+                if declaration is None:
+                    continue
+                init_start, init_end = declaration
+                callee = view.value(init_start)
+                if self.is_stable_hook(view, init_start):
+                    self.contexts.append(ContextValue(view.path, view.line(k), tag, owner, 'estável',
+                                                      f"`{view.value(start)}` via {callee}"))
+                    continue
+                declared = self.classify_expression(view, init_start, init_end)
+                if declared in ('objeto literal', 'spread novo'):
+                    self.contexts.append(ContextValue(view.path, view.line(k), tag, owner, 'objeto sem useMemo',
+                                                      f"`const {view.value(start)} = {{...}}`"))
+                elif declared == 'função inline':
+                    self.contexts.append(ContextValue(view.path, view.line(k), tag, owner, 'função sem useCallback',
+                                                      f"`{view.value(start)}`"))
+
+    def mark_app_providers(self) -> None:
+        """Providers renderizados por AppProviders.tsx e número de consumidores de cada contexto"""
+        module = self.index.modules.get(APP_PROVIDERS)
+        mounted: Set[Tuple[str, str]] = set()
+        if module is not None:
+            view = self.index.view(APP_PROVIDERS)
+            for k in range(len(view.tokens) - 1):
+                if view.tokens[k].kind == 'jsx' and view.value(k) == '<' and view.tokens[k + 1].kind == 'name':
+                    mounted.add(self.index.resolve_local(module, view.value(k + 1)))
+        for context in self.contexts:
+            if (context.file_path, context.component) in mounted or context.file_path == APP_PROVIDERS:
+                context.from_app_providers = True
+            context.consumers = self.count_consumers(context)
+
+    def _calling_hooks(self, path: str, callee: str) -> Set[Tuple[str, str]]:
+        """Hooks (``use*``) de ``path`` que chamam ``callee``"""
+        view = self.index.view(path)
+        hooks = set()
+        for k, token in enumerate(view.tokens):
+            if token.value == callee and view.value(k + 1) == '(':
+                scope = view.scopes.named_ancestor(view.scopes.enclosing(k))
+                if scope is not None and scope.name.startswith('use') and scope.name != callee:
+                    hooks.add((path, scope.name))
+        return hooks
+
+    def count_consumers(self, context: ContextValue) -> int:
+        """Módulos que leem o contexto: ``useContext(Ctx)`` direto ou via hooks que o envolvem (transitivo)"""
+        context_name = context.provider.split('.')[0]
+        hooks: Set[Tuple[str, str]] = set()
+        view = self.index.view(context.file_path)
+        for k in range(len(view.tokens) - 2):
+            if view.value(k) == 'useContext' and view.value(k + 1) == '(' and view.value(k + 2) == context_name:
+                scope = view.scopes.named_ancestor(view.scopes.enclosing(k))
+                if scope is not None:
+                    hooks.add((context.file_path, scope.name))
+        readers: Set[str] = set()
+        frontier = set(hooks)
+        while frontier:
+            found: Set[Tuple[str, str]] = set()
+            for path, name in frontier:
+                found |= self._calling_hooks(path, name)
+            for path, module in self.index.modules.items():
+                if not self.include_tests and is_test_file(path):
+                    continue
+                for statement in module.imports:
+                    for binding in statement.bindings:
+                        if not module.value_usages.get(binding.local, 0) \
+                                or self.index.resolve_local(module, binding.local) not in frontier:
+                            continue
+                        readers.add(path)
+                        # hooks do leitor que chamam o hook importado também são consumidores
+                        found |= self._calling_hooks(path, binding.local)
+            frontier = found - hooks
+            hooks |= found
+        readers.discard(context.file_path)
+        return len(readers)
+
+    # ---------------------------------------------------------------- análise
+    def run_analysis(self) -> List[UnstableProp]:
+        print("🔍 Indexando módulos...")
+        if self.index is None:
+            self.index = SymbolIndex(str(self.project_root)).build()
+        self.count_jsx_sites()
+
+        print("🧪 Procurando props instáveis...")
+        for path in sorted(self.index.modules):
+            if not path.endswith('.tsx') or (not self.include_tests and is_test_file(path)):
+                continue
+            self.scan_module(path)
+        self.mark_app_providers()
+
+        unstable_contexts = [c for c in self.contexts if c.kind != 'estável']
+        broken = [f for f in self.findings if f.child_info and f.child_info.memo]
+        print(f"⚠️ {len(self.findings)} props instáveis ({len(broken)} quebram memo), "
+              f"{len(unstable_contexts)} valores de contexto sem memoização")
+        return self.findings
+
+    def hotspots(self) -> List[Tuple[Tuple[str, str], float, List[UnstableProp]]]:
+        """Componentes pais ordenados pela soma dos pesos das props instáveis que passam"""
+        grouped: Dict[Tuple[str, str], List[UnstableProp]] = defaultdict(list)
+        for finding in self.findings:
+            grouped[(finding.file_path, finding.parent)].append(finding)
+        ranked = [(key, sum(f.score for f in findings), findings) for key, findings in grouped.items()]
+        return sorted(ranked, key=lambda item: -item[1])
+
+    # -------------------------------------------------------------- relatório
+    def generate_report(self, output_file: str) -> None:
+        hotspots = self.hotspots()
+        broken = sorted((f for f in self.findings if f.child_info and f.child_info.memo),
+                        key=lambda f: -f.score)
+        by_kind: Dict[str, int] = defaultdict(int)
+        for finding in self.findings:
+            by_kind[finding.kind] += 1
+        unstable_contexts = sorted((c for c in self.contexts if c.kind != 'estável'),
+                                   key=lambda c: (not c.from_app_providers, -c.consumers))
+
+        report = f"""# Risco de Re-renderização - Doc Forge Buddy
+
+**Data da análise:** {datetime.now().strftime('%d/%m/%Y %H:%M')}
+**Props instáveis encontradas:** {len(self.findings)}
+**Props que quebram `memo` do filho:** {len(broken)}
+**Valores de contexto sem memoização:** {len(unstable_contexts)}
+
+## 📊 Props Instáveis por Tipo
+
+| Tipo | Ocorrências | Peso |
+|------|-------------|------|
+"""
+        for kind, count in sorted(by_kind.items(), key=lambda item: -item[1]):
+            report += f"| {kind} | {count} | {KIND_WEIGHTS.get(kind, 1.0)} |\n"
+
+        report += """
+## 🔥 Hotspots de Cascata de Render
+
+Pontuação = peso do tipo × 3 se o filho usa `memo` × (1 + log2(1 + usos do filho)).
+
+| # | Componente pai | Arquivo | Pontuação | Props instáveis | Filhos afetados |
+|---|----------------|---------|-----------|-----------------|-----------------|
+"""
+        for position, ((path, parent), score, findings) in enumerate(hotspots[:30], 1):
+            children = sorted({f.child for f in findings})
+            report += (f"| {position} | `{parent}` | `{path}` | {score:.1f} | {len(findings)} | "
+                       f"{', '.join(children[:5])}{'...' if len(children) > 5 else ''} |\n")
+
+        if broken:
+            report += "\n## 🧱 Props que Anulam `memo`\n\n"
+            report += "| Local | Filho (memo) | Prop | Tipo | Usos do filho |\n|-------|--------------|------|------|---------------|\n"
+            for finding in broken[:40]:
+                via = f" (`{finding.via}`)" if finding.via else ''
+                report += (f"| `{finding.file_path}`:{finding.line} | `<{finding.child}>` | `{finding.prop}` | "
+                           f"{finding.kind}{via} | {finding.child_info.jsx_sites} |\n")
+
+        if self.contexts:
+            report += "\n## 🌐 Valores de Contexto\n\n"
+            report += "Um `value` novo a cada render re-renderiza todos os consumidores do contexto.\n\n"
+            report += "| Provider | Componente | Local | Situação | Módulos consumidores | Montado em AppProviders |\n"
+            report += "|----------|------------|-------|----------|----------------------|-------------------------|\n"
+            for context in unstable_contexts + [c for c in self.contexts if c.kind == 'estável']:
+                icon = '✅' if context.kind == 'estável' else '⚠️'
+                detail = f" {context.detail}" if context.detail and context.kind != 'objeto inline' else ''
+                report += (f"| `{context.provider}` | `{context.component}` | `{context.file_path}`:{context.line} | "
+                           f"{icon} {context.kind}{detail} | {context.consumers} | "
+                           f"{'sim' if context.from_app_providers else '-'} |\n")
+
+        report += """
+## 💡 Recomendações
+
+1. **Envolva handlers em `useCallback`** e objetos/arrays em `useMemo` quando o filho estiver em `memo`
+2. **Mova literais constantes** (opções, estilos, colunas) para fora do componente
+3. **Memoize o `value` dos providers** montados em AppProviders: eles re-renderizam a árvore inteira
+4. **Divida contextos grandes** em estado e ações para que consumidores de ações não re-renderizem com o estado
+5. **Comece pelos hotspots do topo**: são os pais que mais invalidam filhos reutilizados
+
+---
+*Relatório gerado automaticamente pelo analisador de risco de re-renderização*
+"""
+        Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(report)
+        print(f"📄 Relatório salvo em: {output_file}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Analisador de risco de re-renderização (props e contextos)')
+    parser.add_argument('--project-dir', default='/workspace/doc-forge-buddy-Cain',
+                        help='Diretório do projeto')
+    parser.add_argument('--output', default='docs/analise_rerenderizacao.md',
+                        help='Arquivo de saída do relatório')
+    parser.add_argument('--include-tests', action='store_true',
+                        help='Inclui arquivos de teste')
+    args = parser.parse_args()
+
+    analyzer = RerenderRiskAnalyzer(args.project_dir, include_tests=args.include_tests)
+    analyzer.run_analysis()
+    analyzer.generate_report(args.output)
+
+    for (path, parent), score, findings in analyzer.hotspots()[:10]:
+        print(f"   {score:6.1f} {parent} ({path}): {len(findings)} props instáveis")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,946 @@
+#!/usr/bin/env python3
+"""
+Detector de Over-fetch em select('*') - Doc Forge Buddy
+Para cada ``.select('*')`` segue o resultado pelo componente, hook ou repositório
+(destructuring, aliases, callbacks de map/filter, setters de estado, retorno para
+quem chama e props JSX) para descobrir quais campos são realmente lidos, e propõe
+uma lista explícita de colunas com base em src/integrations/supabase/types.ts e
+supabase/migrations
+"""
+
+import argparse
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from symbol_index import SymbolIndex, ModuleInfo, is_test_file
+from supabase_queries import QueryChain, extract_query_chains, load_schema
+from ts_scopes import FunctionScope, SourceView
+from ts_tokenizer import tokenize, matching_brackets
+
+TYPES_FILE = 'src/integrations/supabase/types.ts'
+
+# Métodos de array: o callback recebe cada linha no parâmetro indicado
+ROW_CALLBACKS = {'map': 0, 'forEach': 0, 'filter': 0, 'find': 0, 'findLast': 0, 'findIndex': 0,
+                 'findLastIndex': 0, 'some': 0, 'every': 0, 'flatMap': 0, 'reduce': 1, 'sort': 0,
+                 'toSorted': 0}
+# Métodos que devolvem uma coleção das mesmas linhas ou uma única linha
+ROWS_RESULT = {'filter', 'slice', 'concat', 'reverse', 'sort', 'toSorted', 'toReversed'}
+ROW_RESULT = {'find', 'findLast', 'at', 'pop', 'shift'}
+NEUTRAL_MEMBERS = {'length', 'includes', 'indexOf', 'join', 'keys', 'findIndex', 'findLastIndex', 'some',
+                   'every', 'forEach'}
+# Chamadas do builder do supabase antes do await: o resultado continua sendo a query
+BUILDER_METHODS = {'eq', 'neq', 'gt', 'gte', 'lt', 'lte', 'like', 'ilike', 'is', 'in', 'contains',
+                   'containedBy', 'overlaps', 'match', 'not', 'or', 'filter', 'order', 'limit', 'range',
+                   'textSearch', 'abortSignal', 'returns', 'throwOnError', 'select'}
+SINGLE_METHODS = {'single', 'maybeSingle'}
+# Funções que consomem o valor sem ler campos específicos
+HARMLESS_CALLEES = {'Boolean', 'isArray', 'log', 'warn', 'error', 'info', 'debug', 'throw', 'Error',
+                    'isEmpty', 'String', 'Number'}
+QUERY_HOOKS = {'useQuery', 'useSuspenseQuery', 'useInfiniteQuery', 'useSuspenseInfiniteQuery'}
+DEPENDENCY_HOOKS = {'useEffect', 'useLayoutEffect', 'useCallback', 'useMemo', 'useImperativeHandle'}
+CONTROL_CALLEES = {'if', 'while', 'for', 'switch', 'catch', 'return', 'typeof', 'await', 'void'}
+COMPARISONS = {'===', '!==', '==', '!=', '<', '>', '<=', '>=', 'instanceof', 'in'}
+MAX_DEPTH = 4
+
+Kind = Tuple[str, ...]  # chaves até o dado seguidas de 'rows' ou 'row'; ex.: ('data', 'rows')
+
+
+@dataclass
+class TableColumns:
+    name: str
+    columns: List[str]
+    json_columns: Set[str] = field(default_factory=set)
+    source: str = ''
+
+
+@dataclass
+class FieldUsage:
+    fields: Set[str] = field(default_factory=set)
+    escapes: List[Tuple[str, str]] = field(default_factory=list)  # (motivo, local)
+    followed: List[str] = field(default_factory=list)
+
+    def escape(self, reason: str, where: str) -> None:
+        if (reason, where) not in self.escapes:
+            self.escapes.append((reason, where))
+
+
+@dataclass
+class SelectStarSite:
+    chain: QueryChain
+    function: str
+    shape: str  # 'lista' ou 'linha'
+    usage: FieldUsage
+    table: Optional[TableColumns] = None
+
+    @property
+    def unknown_fields(self) -> List[str]:
+        if self.table is None:
+            return []
+        return sorted(f for f in self.usage.fields if f not in self.table.columns)
+
+    @property
+    def status(self) -> str:
+        if self.usage.escapes:
+            return 'parcial' if self.usage.fields else 'opaco'
+        if self.unknown_fields:
+            return 'parcial'
+        return 'completo' if self.usage.fields else 'sem leitura'
+
+    def proposed_columns(self) -> List[str]:
+        columns = set(self.usage.fields) | {'id'}
+        if self.table is None:
+            return sorted(columns)
+        return [c for c in self.table.columns if c in columns]
+
+    def proposal(self) -> str:
+        return f".select('{', '.join(self.proposed_columns())}')"
+
+    @property
+    def saved_columns(self) -> int:
+        if self.table is None or self.status not in ('completo', 'sem leitura'):
+            return 0
+        return len(self.table.columns) - len(self.proposed_columns())
+
+    @property
+    def dropped_json(self) -> List[str]:
+        if self.table is None or self.status not in ('completo', 'sem leitura'):
+            return []
+        kept = set(self.proposed_columns())
+        return sorted(c for c in self.table.json_columns if c not in kept)
+
+
+def load_table_columns(project_root: Path) -> Dict[str, TableColumns]:
+    """Colunas de ``Tables: { nome: { Row: {...} } }`` no types.ts gerado pelo Supabase"""
+    path = project_root / TYPES_FILE
+    if not path.exists():
+        return {}
+    source = path.read_text(encoding='utf-8')
+    tokens = tokenize(source, jsx=False)
+    brackets = matching_brackets(tokens)
+    tables: Dict[str, TableColumns] = {}
+    for i, token in enumerate(tokens[:-2]):
+        if token.value != 'Tables' or tokens[i + 1].value != ':' or tokens[i + 2].value != '{':
+            continue
+        k, end = i + 3, brackets[i + 2]
+        while 0 <= k < end:
+            if tokens[k].kind == 'name' and tokens[k + 1].value == ':' and tokens[k + 2].value == '{':
+                name, body_end = tokens[k].value, brackets[k + 2]
+                j = k + 3
+                while j < body_end:
+                    if tokens[j].value == 'Row' and tokens[j + 1].value == ':' and tokens[j + 2].value == '{':
+                        table = TableColumns(name, [], source=TYPES_FILE)
+                        c, row_end = j + 3, brackets[j + 2]
+                        while c < row_end:
+                            if tokens[c].kind in ('name', 'string') and tokens[c + 1].value in (':', '?'):
+                                column = tokens[c].value.strip('\'"')
+                                c += 1
+                                type_start = c
+                                while c < row_end and tokens[c].value != ';':
+                                    c = brackets[c] + 1 if tokens[c].value in ('{', '(', '[') else c + 1
+                                if any(t.value == 'Json' for t in tokens[type_start:c]):
+                                    table.json_columns.add(column)
+                                table.columns.append(column)
+                            c += 1
+                        tables[name] = table
+                        break
+                    j += 1
+                k = body_end + 1
+            else:
+                k += 1
+    return tables
+
+
+class _ModuleView(SourceView):
+    """``SourceView`` de um módulo do índice, com os utilitários de rastreamento de valores"""
+
+    def __init__(self, module: ModuleInfo):
+        super().__init__(module.path, module.source, module.tokens)
+        self.module = module
+
+    def where(self, i: int) -> str:
+        return f"{self.path}:{self.tokens[min(i, len(self.tokens) - 1)].line}"
+
+    def scope_range(self, i: int) -> Tuple[Optional[int], int]:
+        """Função mais interna que contém o token e o fim do seu corpo"""
+        position = self.scopes.enclosing(i)
+        if position is None:
+            return None, len(self.tokens) - 1
+        return position, self.scopes.functions[position].body_end
+
+    def is_declaration(self, i: int) -> bool:
+        """O nome em ``i`` é declarado ali (const/let/var, padrão de desestruturação ou parâmetro)?"""
+        prev = self.value(i - 1)
+        if prev in ('const', 'let', 'var', 'function', 'class'):
+            return True
+        if self.value(i + 1) == ':' and prev in ('{', ','):
+            return False  # chave de padrão/objeto
+        if prev == '...' or prev in ('{', ',', '[', ':'):
+            k = self.opener(i)
+            while k >= 0 and self.value(k) in ('{', '['):
+                before = self.value(k - 1)
+                if before in ('const', 'let', 'var'):
+                    return True
+                if before in (':', ',', '{', '['):
+                    k = self.opener(k)
+                    continue
+                break
+        return False
+
+    def pattern_bindings(self, open_index: int) -> Tuple[List[Tuple[str, str]], bool]:
+        """Pares (chave, nome local) de ``{ a, b: c, d = 1, ...rest }``; indica se há rest"""
+        pairs = []
+        has_rest = False
+        for start, end in self.split_top_level(open_index):
+            token = self.tokens[start]
+            if token.value == '...':
+                has_rest = True
+                continue
+            if token.kind not in ('name', 'string'):
+                continue
+            key = token.value.strip('\'"')
+            local = key
+            if self.value(start + 1) == ':':
+                renamed = self.tokens[start + 2] if start + 2 <= end else None
+                simple = renamed is not None and renamed.kind == 'name' \
+                    and (start + 2 == end or self.value(start + 3) == '=')
+                local = renamed.value if simple else ''  # '' = padrão aninhado
+            pairs.append((key, local))
+        return pairs, has_rest
+
+
+class SelectStarAnalyzer:
+    """Segue o resultado de cada select('*') até os campos lidos"""
+
+    def __init__(self, project_root: str, index: Optional[SymbolIndex] = None, include_tests: bool = False):
+        self.project_root = Path(project_root)
+        self.index = index
+        self.include_tests = include_tests
+        self.tables: Dict[str, TableColumns] = {}
+        self.sites: List[SelectStarSite] = []
+        self._views: Dict[str, _ModuleView] = {}
+        self._visited: Set[Tuple[str, int, Kind]] = set()
+
+    # ------------------------------------------------------------- auxiliares
+    def view(self, path: str) -> Optional[_ModuleView]:
+        if path not in self._views:
+            module = self.index.modules.get(path)
+            if module is None:
+                return None
+            self._views[path] = _ModuleView(module)
+        return self._views[path]
+
+    def load_tables(self) -> None:
+        self.tables = load_table_columns(self.project_root)
+        schema = load_schema(self.project_root)
+        for name, table in schema.tables.items():
+            if name not in self.tables and table.columns:
+                self.tables[name] = TableColumns(name, list(table.columns), source='migrations')
+
+    # ------------------------------------------------------ fluxo de um valor
+    def _unwrap(self, view: _ModuleView, i: int, j: int) -> Tuple[int, int]:
+        """Remove ``await``, parênteses, ``as Tipo``, ``!`` e fallbacks ``|| []`` em volta da expressão"""
+        while True:
+            changed = False
+            if view.value(i - 1) == 'await':
+                i -= 1
+                changed = True
+            if view.value(j) == '!' and view.value(j + 1) not in ('=', '=='):
+                j += 1
+                changed = True
+            if view.value(j) in ('as', 'satisfies'):
+                j += 1
+                while j < len(view.tokens) and view.in_type[j]:
+                    j += 1
+                changed = True
+            if view.value(j) in ('||', '??') and view.value(j + 1) in ('[', '{') \
+                    and view.brackets[j + 1] == j + 2:
+                j += 3
+                changed = True
+            elif view.value(j) in ('||', '??') and view.value(j + 1) in ('null', 'undefined'):
+                j += 2
+                changed = True
+            if view.value(i - 1) == '(' and view.value(j) == ')' and view.brackets[j] == i - 1 \
+                    and not (i >= 2 and view.tokens[i - 2].kind == 'name'
+                             and view.value(i - 2) not in ('return', 'await', 'typeof')):
+                i -= 1
+                j += 1
+                changed = True
+            if not changed:
+                return i, j
+
+    def _postfix(self, view: _ModuleView, j: int, kind: Kind, usage: FieldUsage,
+                 depth: int) -> Tuple[int, Optional[Kind]]:
+        """Consome acessos encadeados após a expressão; retorna (fim, tipo restante ou None)"""
+        while j < len(view.tokens):
+            value = view.value(j)
+            if value == '!' and view.value(j + 1) in ('.', '?.', '['):
+                j += 1
+                continue
+            if value in ('.', '?.') and view.value(j + 1) == '[':
+                j += 1
+                value = '['
+            if value == '[' and view.brackets[j] > j:
+                close = view.brackets[j]
+                if kind[0] == 'rows':
+                    kind, j = ('row',), close + 1
+                    continue
+                if kind[0] == 'row':
+                    key = view.tokens[j + 1]
+                    if close == j + 2 and key.kind == 'string':
+                        usage.fields.add(key.value.strip('\'"`'))
+                    else:
+                        usage.escape('acesso com chave dinâmica', view.where(j))
+                    return close + 1, None
+                return close + 1, None
+            if value not in ('.', '?.') or view.tokens[j + 1].kind != 'name':
+                return j, kind
+            prop = view.value(j + 1)
+            after = j + 2
+            if view.value(after) == '<':  # chamada genérica: .returns<T>()
+                while after < len(view.tokens) and view.in_type[after]:
+                    after += 1
+            head = kind[0]
+            if head == 'row':
+                usage.fields.add(prop)
+                return after, None
+            if head == 'rows':
+                if prop in ROW_CALLBACKS and view.value(after) == '(':
+                    close = view.brackets[after]
+                    self._callback(view, after, close, prop, ROW_CALLBACKS[prop], usage, depth)
+                    j = close + 1
+                    if prop in ROWS_RESULT:
+                        continue
+                    if prop in ROW_RESULT:
+                        kind = ('row',)
+                        continue
+                    if prop in ('map', 'flatMap', 'reduce'):
+                        return j, None  # o callback já foi seguido; o resultado é outro dado
+                    return j, None
+                if prop in ROWS_RESULT or prop in ROW_RESULT:
+                    if view.value(after) == '(':
+                        after = view.brackets[after] + 1
+                    if prop in ROW_RESULT:
+                        kind = ('row',)
+                    j = after
+                    continue
+                if prop in NEUTRAL_MEMBERS:
+                    return after, None
+                usage.escape(f"método .{prop}() na coleção", view.where(j))
+                return after, None
+            # Objeto que contém o dado: ``resultado.data``, query antes do await...
+            if prop == head:
+                kind, j = kind[1:], after
+                continue
+            if head == 'data' and prop in BUILDER_METHODS | SINGLE_METHODS and view.value(after) == '(':
+                if prop in SINGLE_METHODS:
+                    kind = kind[:-1] + ('row',)
+                j = view.brackets[after] + 1
+                continue
+            if head == 'data' and prop == 'then' and view.value(after) == '(':
+                close = view.brackets[after]
+                self._callback(view, after, close, 'then', 0, usage, depth, kind)
+                return close + 1, None
+            return after, None  # outra propriedade (error, count...): não é o dado
+        return j, kind
+
+    def _callback(self, view: _ModuleView, open_index: int, close: int, method: str, param: int,
+                  usage: FieldUsage, depth: int, kind: Kind = ('row',)) -> None:
+        """Segue o parâmetro de um callback (``rows.map(item => item.x)``)"""
+        first = open_index + 1
+        scope = None
+        for candidate in view.scopes.functions:
+            if candidate.start == first or (candidate.start > first and candidate.params_start == first + 1
+                                            and view.value(first) == 'async'):
+                scope = candidate
+                break
+            if candidate.start > first:
+                break
+        if scope is None:
+            if view.tokens[first].kind == 'name' and view.value(first + 1) in (')', ','):
+                target = self._local_function(view, view.value(first), None)
+                if target is not None:
+                    self._bind_param(view, target, param, kind, usage, depth + 1)
+                    return
+            usage.escape(f"callback de .{method}() não inline", view.where(first))
+            return
+        self._bind_param(view, scope, param, kind, usage, depth)
+
+    def _bind_param(self, view: _ModuleView, scope: FunctionScope, position: int, kind: Kind,
+                    usage: FieldUsage, depth: int) -> None:
+        """Rastreia o parâmetro ``position`` de ``scope`` (identificador ou padrão)"""
+        if scope.params_start == scope.params_end:
+            if position == 0:
+                self._track(view, scope.params_start, view.value(scope.params_start), kind, usage, depth)
+            return
+        k = scope.params_start + 1
+        current = 0
+        while k < scope.params_end:
+            value = view.value(k)
+            if value == ',':
+                current += 1
+            elif current == position:
+                if value == '{' and kind == ('row',):
+                    pairs, has_rest = view.pattern_bindings(k)
+                    self._bind_pattern(view, k, pairs, has_rest, kind, usage, depth)
+                    return
+                if view.tokens[k].kind == 'name' and view.value(k + 1) in (',', ')', ':', '=', '?'):
+                    self._track(view, k, value, kind, usage, depth)
+                    return
+                usage.escape('parâmetro desestruturado de forma não suportada', view.where(k))
+                return
+            if value in ('(', '[', '{') and view.brackets[k] > k:
+                k = view.brackets[k]
+            k += 1
+
+    def _bind_pattern(self, view: _ModuleView, open_index: int, pairs: List[Tuple[str, str]], has_rest: bool,
+                      kind: Kind, usage: FieldUsage, depth: int) -> None:
+        """``{ a, b: c } = valor``: campos lidos de uma linha ou chaves de um objeto"""
+        head = kind[0]
+        if head == 'row':
+            for key, _ in pairs:
+                usage.fields.add(key)
+            if has_rest:
+                usage.escape('rest em desestruturação', view.where(open_index))
+            return
+        if head == 'rows':
+            usage.escape('desestruturação de objeto sobre a lista', view.where(open_index))
+            return
+        for key, local in pairs:
+            if key != head:
+                continue
+            if not local:
+                inner = open_index + 1
+                while inner < view.brackets[open_index] and not (view.value(inner) == key
+                                                                  and view.value(inner + 1) == ':'):
+                    inner += 1
+                if view.value(inner + 2) == '{':
+                    sub_pairs, sub_rest = view.pattern_bindings(inner + 2)
+                    self._bind_pattern(view, inner + 2, sub_pairs, sub_rest, kind[1:], usage, depth)
+                else:
+                    usage.escape('padrão aninhado', view.where(inner))
+                continue
+            k = open_index + 1
+            while k < view.brackets[open_index]:
+                if view.value(k) == local and view.tokens[k].kind == 'name' \
+                        and (view.value(k - 1) == ':' or view.value(k + 1) in (',', '}', '=')):
+                    self._track(view, k, local, kind[1:], usage, depth)
+                    break
+                k += 1
+        if has_rest:
+            usage.escape('rest em desestruturação', view.where(open_index))
+
+    def _local_function(self, view: _ModuleView, name: str, receiver: Optional[str]) -> Optional[FunctionScope]:
+        for scope in view.scopes.functions:
+            if scope.name == name and (receiver is None or scope.kind == 'method'):
+                return scope
+        return None
+
+    def _shadowed(self, view: _ModuleView, occurrence: int, name: str, home: Optional[int]) -> bool:
+        """Outro ``name`` declarado entre a função da ocorrência e a função da declaração original"""
+        position = view.scopes.enclosing(occurrence)
+        while position is not None and position != home:
+            scope = view.scopes.functions[position]
+            if any(view.value(k) == name and view.tokens[k].kind == 'name'
+                   for k in range(scope.params_start, scope.params_end + 1)):
+                return True
+            for k in range(scope.body_start, min(occurrence, scope.body_end)):
+                if view.tokens[k].kind == 'name' and view.value(k) == name and view.is_declaration(k) \
+                        and view.scopes.enclosing(k) == position:
+                    return True
+            position = scope.parent
+        return False
+
+    def _track(self, view: _ModuleView, declared_at: int, name: str, kind: Kind, usage: FieldUsage,
+               depth: int, scan_from: Optional[int] = None) -> None:
+        """Segue todas as leituras de ``name`` no escopo em que foi declarado"""
+        if depth > MAX_DEPTH or not name:
+            return
+        key = (view.path, declared_at, kind)
+        if key in self._visited:
+            return
+        self._visited.add(key)
+        home, end = view.scope_range(declared_at)
+        k = (scan_from if scan_from is not None else declared_at) + 1
+        while k <= end:
+            token = view.tokens[k]
+            if token.kind == 'name' and token.value == name and view.value(k - 1) not in ('.', '?.') \
+                    and not view.in_type[k]:
+                if view.is_declaration(k):
+                    if view.scopes.enclosing(k) == home:
+                        return  # redeclarado no mesmo escopo
+                    k += 1
+                    continue
+                if view.value(k + 1) == ':' and view.value(k - 1) in ('{', ','):
+                    k += 1  # chave de objeto literal
+                    continue
+                if self._shadowed(view, k, name, home):
+                    k += 1
+                    continue
+                self._occurrence(view, k, kind, usage, depth)
+            k += 1
+
+    def _occurrence(self, view: _ModuleView, i: int, kind: Kind, usage: FieldUsage, depth: int) -> None:
+        j, remaining = self._postfix(view, i + 1, kind, usage, depth)
+        if remaining is None:
+            return
+        self._context(view, i, j, remaining, usage, depth)
+
+    def _context(self, view: _ModuleView, i: int, j: int, kind: Kind, usage: FieldUsage, depth: int) -> None:
+        """Classifica o uso de uma expressão [i, j) que carrega o dado rastreado"""
+        while True:
+            i, j = self._unwrap(view, i, j)
+            nxt, remaining = self._postfix(view, j, kind, usage, depth)
+            if remaining is None:
+                return
+            if nxt == j:
+                break
+            j, kind = nxt, remaining
+        prev, after = view.value(i - 1), view.value(j)
+        where = view.where(i)
+
+        if prev == '...':
+            open_index = view.opener(i)
+            if kind[0] == 'rows' and view.value(open_index) == '[' and view.value(i - 2) in ('[', ','):
+                # [...rows] continua sendo a lista: a cópia é seguida como alias
+                self._context(view, open_index, view.brackets[open_index] + 1, kind, usage, depth)
+                return
+            usage.escape('spread do objeto', where)
+            return
+        if prev in ('=', ':=') and after not in ('=', '==', '==='):
+            target = i - 2
+            if view.value(target) == ']' or view.value(target) == '}':
+                open_index = view.brackets[target]
+                if view.value(target) == '}':
+                    pairs, has_rest = view.pattern_bindings(open_index)
+                    self._bind_pattern(view, open_index, pairs, has_rest, kind, usage, depth)
+                elif kind[0] == 'rows' and view.tokens[open_index + 1].kind == 'name':
+                    self._track(view, open_index + 1, view.value(open_index + 1), ('row',), usage, depth)
+                else:
+                    usage.escape('desestruturação de array', where)
+                return
+            while target >= 0 and view.in_type[target]:
+                target -= 1
+            if view.value(target) == ':':
+                target -= 1
+            if view.tokens[target].kind == 'name' and view.value(target - 1) not in ('.', '?.'):
+                self._track(view, target, view.value(target), kind, usage, depth)
+                return
+            usage.escape('atribuído a propriedade de objeto', where)
+            return
+        if prev == 'of' and view.value(i - 2) != '(':
+            k = i - 2
+            if view.tokens[k].kind == 'name' and kind[0] == 'rows':
+                self._track(view, k, view.value(k), ('row',), usage, depth)
+                return
+            if view.value(k) == '}' and kind[0] == 'rows':
+                pairs, has_rest = view.pattern_bindings(view.brackets[k])
+                self._bind_pattern(view, view.brackets[k], pairs, has_rest, ('row',), usage, depth)
+                return
+        if prev == 'return' or (prev == '=>' and view.value(i) != '{'):
+            self._follow_return(view, i, kind, usage, depth)
+            return
+        if prev == '{' and view.value(i - 2) == '=' and view.tokens[i - 3].kind == 'jsx_attr' and after == '}':
+            self._follow_prop(view, i - 3, kind, usage, depth)
+            return
+        if (prev == ':' and view.tokens[i - 2].kind in ('name', 'string')) or \
+                (prev in ('{', ',') and after in ('}', ',') and view.value(view.opener(i)) == '{'):
+            key = view.value(i - 2).strip('\'"') if prev == ':' else view.value(i)
+            self._follow_object(view, view.opener(i), key, kind, usage, depth)
+            return
+        if prev in ('(', ',', '['):
+            open_index = view.opener(i)
+            if view.value(open_index) == '(' and open_index > 0 and view.tokens[open_index - 1].kind == 'name':
+                self._follow_argument(view, open_index, i, kind, usage, depth)
+                return
+            if view.value(open_index) == '[':
+                outer = view.opener(open_index)
+                if view.value(outer) == '(' and view.value(outer - 1) in DEPENDENCY_HOOKS:
+                    return  # lista de dependências de hook
+                usage.escape('incluído em array literal', where)
+                return
+        # Testes de existência e comparações não leem campos: ``!x``, ``x ? ...``, ``x &&``, ``x === y``
+        if prev in ('!', 'typeof') or prev in COMPARISONS or after in COMPARISONS or after in ('?', '&&'):
+            return
+        if prev in ('?', ':') or after == ':':
+            usage.escape('valor de ternário', where)
+            return
+        if prev in ('&&', '||', '??') or after in ('||', '??'):
+            open_index = view.opener(i)
+            if view.value(open_index) == '(' and view.value(open_index - 1) in ('if', 'while'):
+                return  # só a condição
+            usage.escape('valor de expressão lógica', where)
+            return
+        if prev in (';', '{', '}'):
+            if after == ';':
+                return  # resultado descartado
+            if after == '=':
+                return  # reatribuição: o valor antigo não é lido
+        # Qualquer outro contexto pode ler o dado inteiro: nunca conta como "sem leitura"
+        usage.escape(f"uso não reconhecido (`{prev} … {after}`)", where)
+
+    # ------------------------------------------------------------- saltos
+    def _follow_argument(self, view: _ModuleView, open_index: int, i: int, kind: Kind,
+                         usage: FieldUsage, depth: int) -> None:
+        callee = view.value(open_index - 1)
+        receiver = view.value(open_index - 3) if view.value(open_index - 2) in ('.', '?.') else None
+        if callee in HARMLESS_CALLEES or callee in CONTROL_CALLEES or receiver == 'console':
+            return
+        if callee == 'from' and receiver == 'Array' and kind[0] == 'rows' \
+                and len(view.split_top_level(open_index)) == 1:
+            # Array.from(rows) é uma cópia da lista: seguida como alias
+            self._context(view, open_index - 3, view.brackets[open_index] + 1, kind, usage, depth)
+            return
+        position = 0
+        k = open_index + 1
+        while k < i:
+            if view.value(k) == ',':
+                position += 1
+            if view.value(k) in ('(', '[', '{') and view.brackets[k] > k:
+                k = view.brackets[k]
+            k += 1
+        if callee.startswith('set') and receiver is None and position == 0:
+            state = self._state_for_setter(view, callee)
+            if state is not None:
+                usage.followed.append(f"estado `{view.value(state)}` ({view.where(state)})")
+                self._track(view, state, view.value(state), kind, usage, depth + 1)
+                return
+        if receiver in (None, 'this'):
+            target = self._local_function(view, callee, receiver)
+            if target is not None and depth < MAX_DEPTH:
+                usage.followed.append(f"`{callee}()` ({view.where(target.params_start)})")
+                self._bind_param(view, target, position, kind, usage, depth + 1)
+                return
+        usage.escape(f"passado para `{callee}()`", view.where(i))
+
+    def _state_for_setter(self, view: _ModuleView, setter: str) -> Optional[int]:
+        """Índice do nome do estado em ``const [x, setX] = useState(...)``"""
+        tokens = view.tokens
+        for k in range(2, len(tokens) - 2):
+            if tokens[k].value == setter and tokens[k - 1].value == ',' and tokens[k + 1].value == ']' \
+                    and tokens[k - 2].kind == 'name' and tokens[k - 3].value == '[':
+                return k - 2
+        return None
+
+    def _follow_object(self, view: _ModuleView, open_index: int, key: str, kind: Kind,
+                       usage: FieldUsage, depth: int) -> None:
+        """Dado guardado em ``{ chave: valor }``: segue o objeto quando ele é retornado ou atribuído"""
+        before = view.value(open_index - 1)
+        wrapped = kind if key == '' else (key,) + kind
+        if before == '(' and view.value(open_index - 2) == '=>':
+            self._follow_return(view, open_index - 1, wrapped, usage, depth)
+            return
+        if before in ('return', '=>'):
+            self._follow_return(view, open_index, wrapped, usage, depth)
+            return
+        if before == '=':
+            # ``const x: Tipo = {...}``: o nome vem antes da anotação de tipo
+            target = open_index - 2
+            while target >= 0 and view.in_type[target]:
+                target -= 1
+            if view.value(target) == ':':
+                target -= 1
+            if view.tokens[target].kind == 'name' and view.value(target - 1) not in ('.', '?.'):
+                self._track(view, target, view.value(target), wrapped, usage, depth)
+                return
+        if before == '(' and view.tokens[open_index - 2].kind == 'name':
+            callee = view.value(open_index - 2)
+            if callee.startswith('set'):
+                state = self._state_for_setter(view, callee)
+                if state is not None:
+                    self._track(view, state, view.value(state), wrapped, usage, depth + 1)
+                    return
+            usage.escape(f"propriedade `{key}` do objeto passado para `{callee}()`", view.where(open_index))
+            return
+        usage.escape(f"guardado na propriedade `{key}` de um objeto", view.where(open_index))
+
+    def _follow_return(self, view: _ModuleView, i: int, kind: Kind, usage: FieldUsage, depth: int) -> None:
+        """Valor retornado: segue até quem chama a função (ou o ``data`` do useQuery)"""
+        position = view.scopes.enclosing(i)
+        if position is None:
+            usage.escape('retornado no nível do módulo', view.where(i))
+            return
+        scope = view.scopes.functions[position]
+        if depth >= MAX_DEPTH:
+            usage.escape(f"retornado por `{scope.name}` (profundidade máxima)", view.where(i))
+            return
+        if scope.name == 'queryFn':
+            call = self._query_hook_call(view, scope)
+            if call is not None and view.value(call[0]) in QUERY_HOOKS:
+                usage.followed.append(f"`data` do {view.value(call[0])} ({view.where(call[0])})")
+                self._context(view, call[0], view.brackets[call[1]] + 1, ('data',) + kind, usage, depth + 1)
+                return
+            if call is not None:
+                usage.escape(f"queryFn de `{view.value(call[0])}` (lido do cache em outro ponto)", view.where(i))
+                return
+        if scope.call_context == 'useMemo' and scope.name != '<callback useMemo>':
+            declared = view.scopes.functions[position].start
+            while declared > 0 and view.value(declared) != scope.name:
+                declared -= 1
+            usage.followed.append(f"useMemo `{scope.name}` ({view.where(declared)})")
+            self._track(view, declared, scope.name, kind, usage, depth + 1)
+            return
+        if scope.name.startswith('<'):
+            usage.escape('retornado por função anônima', view.where(i))
+            return
+        sites = self._call_sites(view, scope)
+        if not sites:
+            usage.escape(f"retornado por `{scope.name}` sem chamadas encontradas", view.where(i))
+            return
+        for caller_view, start, end in sites:
+            usage.followed.append(f"retorno de `{scope.name}` em {caller_view.where(start)}")
+            self._context(caller_view, start, end, kind, usage, depth + 1)
+
+    def _query_hook_call(self, view: _ModuleView, scope: FunctionScope) -> Optional[Tuple[int, int]]:
+        """(chamada, parêntese) do ``useQuery``/``prefetchQuery`` cujo objeto de opções contém o queryFn"""
+        k = view.opener(scope.start)
+        if view.value(k) != '{' or view.value(k - 1) != '(':
+            return None
+        callee = k - 2
+        if view.value(callee) == '>':  # useQuery<Tipo>({...})
+            while callee > 0 and view.in_type[callee]:
+                callee -= 1
+        return (callee, k - 1) if view.tokens[callee].kind == 'name' else None
+
+    def _call_sites(self, view: _ModuleView, scope: FunctionScope) -> List[Tuple[_ModuleView, int, int]]:
+        """Chamadas de ``scope.name`` no próprio módulo e nos importadores (métodos: em todo o projeto)"""
+        name = scope.name
+        member = scope.kind == 'method' or view.value(scope.start - 1) == ':' or \
+            (scope.kind == 'arrow' and view.value(scope.start - 2) == ':')
+        candidates = {view.path}
+        if member:
+            candidates |= {path for path, module in self.index.modules.items() if f".{name}(" in module.source}
+        else:
+            candidates |= {path for path, _ in self.index.importers.get(view.path, [])}
+        sites = []
+        for path in sorted(candidates):
+            other = self.view(path)
+            if other is None or (self.include_tests is False and is_test_file(path)):
+                continue
+            tokens = other.tokens
+            for k in range(len(tokens) - 1):
+                if tokens[k].value != name or tokens[k + 1].value != '(' or tokens[k].kind != 'name':
+                    continue
+                dotted = other.value(k - 1) in ('.', '?.')
+                if dotted != member or other.value(k - 1) in ('function',) or other.is_declaration(k):
+                    continue
+                if other is view and scope.params_start == k + 1:
+                    continue
+                start = k
+                while other.value(start - 1) in ('.', '?.') and other.tokens[start - 2].kind == 'name':
+                    start -= 2
+                sites.append((other, start, other.brackets[k + 1] + 1))
+        return sites
+
+    def _follow_prop(self, view: _ModuleView, attr_index: int, kind: Kind, usage: FieldUsage, depth: int) -> None:
+        """``<Filho prop={dado} />``: segue a prop dentro do componente filho"""
+        attr = view.value(attr_index)
+        k = attr_index
+        while k >= 0 and not (view.tokens[k].kind == 'jsx' and view.tokens[k].value == '<'):
+            k -= 1
+        tag = view.value(k + 1)
+        if view.value(k + 2) == '.' or depth >= MAX_DEPTH:
+            usage.escape(f"prop `{attr}` de <{tag}>", view.where(attr_index))
+            return
+        target_view, component = self._component(view, tag)
+        if component is None:
+            usage.escape(f"prop `{attr}` de <{tag}>", view.where(attr_index))
+            return
+        usage.followed.append(f"prop `{attr}` de <{tag}> ({target_view.where(component.params_start)})")
+        if component.params_start == component.params_end:
+            name = target_view.value(component.params_start)
+            self._track(target_view, component.params_start, name, (attr,) + kind, usage, depth + 1)
+            return
+        first = component.params_start + 1
+        if target_view.value(first) == '{':
+            pairs, has_rest = target_view.pattern_bindings(first)
+            for key, local in pairs:
+                if key == attr and local:
+                    self._bind_pattern(target_view, first, [(key, local)], False, (attr,) + kind, usage, depth + 1)
+                    return
+            if has_rest:
+                usage.escape(f"prop `{attr}` repassada via rest em <{tag}>", target_view.where(first))
+            return
+        if target_view.tokens[first].kind == 'name':
+            self._track(target_view, first, target_view.value(first), (attr,) + kind, usage, depth + 1)
+            return
+        usage.escape(f"prop `{attr}` de <{tag}>", view.where(attr_index))
+
+    def _component(self, view: _ModuleView, tag: str) -> Tuple[Optional[_ModuleView], Optional[FunctionScope]]:
+        target_view, name = view, tag
+        binding = view.module.binding_for(tag)
+        if binding is not None:
+            statement, imported = binding
+            if not statement.resolved:
+                return None, None
+            chain = self.index.resolve_export(statement.resolved, imported.imported)
+            origin = chain[-1] if chain else (statement.resolved, imported.imported)
+            target_view = self.view(origin[0])
+            if target_view is None:
+                return None, None
+            export = target_view.module.exports.get(origin[1])
+            name = export.local if export is not None and export.local else origin[1]
+        for scope in target_view.scopes.functions:
+            if scope.name == name and scope.kind in ('function', 'arrow'):
+                return target_view, scope
+        return target_view, None
+
+    # ---------------------------------------------------------------- análise
+    def analyze_chain(self, view: _ModuleView, chain: QueryChain) -> SelectStarSite:
+        self._visited = set()
+        usage = FieldUsage()
+        shape = 'linha' if any(c.method in SINGLE_METHODS for c in chain.calls) else 'lista'
+        start = chain.token_start
+        end = start
+        tokens = view.tokens
+        while end < len(tokens):
+            if tokens[end].kind == 'name' and (end == start or view.value(end - 1) in ('.', '?.')):
+                end += 1
+            elif view.value(end) in ('.', '?.') and end + 1 < len(tokens) and tokens[end + 1].kind == 'name':
+                end += 1
+            elif view.value(end) in ('(', '[') and view.brackets[end] > end:
+                end = view.brackets[end] + 1
+            elif view.value(end) == '<' and view.in_type[end + 1 if end + 1 < len(tokens) else end]:
+                end += 1
+                while end < len(tokens) and view.in_type[end]:
+                    end += 1
+            else:
+                break
+        self._context(view, start, end, ('data', 'row' if shape == 'linha' else 'rows'), usage, 0)
+        position = view.scopes.enclosing(start)
+        owner = view.scopes.named_ancestor(position)
+        return SelectStarSite(chain, owner.name if owner else '(módulo)', shape, usage, self.tables.get(chain.table))
+
+    def run_analysis(self) -> List[SelectStarSite]:
+        print("🗄️ Lendo colunas das tabelas...")
+        self.load_tables()
+        print(f"   {len(self.tables)} tabelas com colunas conhecidas")
+
+        print("🔍 Procurando select('*')...")
+        if self.index is None:
+            self.index = SymbolIndex(str(self.project_root)).build()
+        self.sites = []
+        for path, module in sorted(self.index.modules.items()):
+            if not self.include_tests and is_test_file(path):
+                continue
+            if '.select(' not in module.source:
+                continue
+            view = self.view(path)
+            for chain in extract_query_chains(path, view.tokens, module.source, view.brackets):
+                if chain.operation != 'select' or chain.selected_columns != '*':
+                    continue
+                select = next(c for c in chain.calls if c.method == 'select')
+                if 'head: true' in select.args.replace('  ', ' '):
+                    continue  # só contagem: nenhuma linha trafega
+                self.sites.append(self.analyze_chain(view, chain))
+
+        complete = [s for s in self.sites if s.status in ('completo', 'sem leitura')]
+        print(f"⚠️ {len(self.sites)} select('*') em leituras; {len(complete)} com lista de colunas inferida")
+        return self.sites
+
+    # -------------------------------------------------------------- relatório
+    def generate_report(self, output_file: str) -> None:
+        by_status: Dict[str, List[SelectStarSite]] = defaultdict(list)
+        for site in self.sites:
+            by_status[site.status].append(site)
+        proposals = sorted(by_status['completo'] + by_status['sem leitura'],
+                           key=lambda s: (-len(s.dropped_json), -s.saved_columns))
+        saved = sum(s.saved_columns for s in proposals)
+
+        report = f"""# Over-fetch em select('*') - Doc Forge Buddy
+
+**Data da análise:** {datetime.now().strftime('%d/%m/%Y %H:%M')}
+**select('*') em leituras:** {len(self.sites)}
+**Com lista de colunas inferida:** {len(proposals)}
+**Parciais / opacos:** {len(by_status['parcial'])} / {len(by_status['opaco'])}
+**Colunas deixadas de buscar (propostas completas):** {saved}
+
+## 📊 Resumo por Tabela
+
+| Tabela | select('*') | Colunas na tabela | Colunas JSON | Fonte do schema |
+|--------|-------------|-------------------|--------------|-----------------|
+"""
+        by_table: Dict[str, List[SelectStarSite]] = defaultdict(list)
+        for site in self.sites:
+            by_table[site.chain.table].append(site)
+        for table, sites in sorted(by_table.items(), key=lambda item: -len(item[1])):
+            columns = self.tables.get(table)
+            if columns is None:
+                report += f"| `{table}` | {len(sites)} | ? | ? | não encontrada |\n"
+            else:
+                report += (f"| `{table}` | {len(sites)} | {len(columns.columns)} | {len(columns.json_columns)} | "
+                           f"{columns.source} |\n")
+
+        if proposals:
+            report += "\n## ✂️ Listas de Colunas Propostas\n\n"
+            report += "Todos os usos do resultado foram seguidos; os campos lidos cabem na tabela.\n\n"
+            report += "| Local | Função | Tabela | Proposta | Colunas evitadas | JSON evitado |\n"
+            report += "|-------|--------|--------|----------|------------------|--------------|\n"
+            for site in proposals:
+                json_text = ', '.join(site.dropped_json) or '-'
+                report += (f"| `{site.chain.file_path}`:{site.chain.line} | `{site.function}` | "
+                           f"`{site.chain.table}` | `{site.proposal()}` | {site.saved_columns} | {json_text} |\n")
+
+        partial = by_status['parcial'] + by_status['opaco']
+        if partial:
+            report += "\n## 🔎 Inferência Parcial\n\n"
+            report += "O resultado sai do alcance da análise; revise os pontos indicados antes de restringir colunas.\n\n"
+            for site in partial:
+                report += f"### `{site.chain.file_path}`:{site.chain.line} (`{site.chain.table}`, {site.shape})\n\n"
+                report += f"- **Função:** `{site.function}`\n"
+                fields = ', '.join(sorted(site.usage.fields)) or 'nenhum'
+                report += f"- **Campos lidos:** {fields}\n"
+                if site.unknown_fields:
+                    report += f"- **Campos fora da tabela:** {', '.join(site.unknown_fields)}\n"
+                for reason, where in site.usage.escapes[:6]:
+                    report += f"- ⚠️ {reason} (`{where}`)\n"
+                if len(site.usage.escapes) > 6:
+                    report += f"- ... e mais {len(site.usage.escapes) - 6} pontos\n"
+                report += "\n"
+
+        followed = [s for s in self.sites if s.usage.followed]
+        if followed:
+            report += "## 🧭 Caminhos Seguidos\n\n"
+            for site in followed[:30]:
+                path = ' → '.join(dict.fromkeys(site.usage.followed))
+                report += f"- `{site.chain.file_path}`:{site.chain.line}: {path}\n"
+            report += "\n"
+
+        report += """## 💡 Recomendações
+
+1. **Aplique as listas propostas** começando pelas que evitam colunas JSON (payloads maiores)
+2. **Mantenha `id`** na lista mesmo quando não é lido: chaves de cache e `key` de listas costumam depender dele
+3. **Nos casos parciais**, tipe o retorno com `Pick<Row, ...>` para que o compilador acuse campos faltantes
+4. **Regenere `types.ts`** (`supabase gen types`) após migrations para manter as colunas conhecidas atualizadas
+
+---
+*Relatório gerado automaticamente pelo detector de over-fetch em select('*')*
+"""
+        Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(report)
+        print(f"📄 Relatório salvo em: {output_file}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Detector de over-fetch em select('*') do Supabase")
+    parser.add_argument('--project-dir', default='/workspace/doc-forge-buddy-Cain',
+                        help='Diretório do projeto')
+    parser.add_argument('--output', default='docs/analise_select_estrela.md',
+                        help='Arquivo de saída do relatório')
+    parser.add_argument('--include-tests', action='store_true',
+                        help='Inclui queries de arquivos de teste')
+    args = parser.parse_args()
+
+    analyzer = SelectStarAnalyzer(args.project_dir, include_tests=args.include_tests)
+    sites = analyzer.run_analysis()
+    analyzer.generate_report(args.output)
+
+    for site in sites[:10]:
+        print(f"   {site.status:11s} {site.chain.file_path}:{site.chain.line} -> {site.proposal()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Servidor local que imita os endpoints de autenticação do Supabase (GoTrue)
+Permite rodar o gerador de carga do ``test_supabase_auth.py`` sem rede:
+
+- ``POST /auth/v1/signup``
+- ``POST /auth/v1/token?grant_type=password``
+- ``POST /auth/v1/token?grant_type=refresh_token`` (o refresh token é rotacionado)
+- ``GET  /auth/v1/user`` (``Authorization: Bearer <access_token>``)
+
+Todas as rotas exigem o header ``apikey``. Usuários e tokens ficam em memória. A
+latência e uma taxa de erros 500 podem ser simuladas para exercitar o relatório.
+"""
+
+import argparse
+import json
+import random
+import secrets
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+ACCESS_TOKEN_TTL = 3600
+
+
+class AuthState:
+    """Usuários, access tokens e refresh tokens em memória"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.users: Dict[str, Dict] = {}  # email -> usuário (com senha)
+        self.access_tokens: Dict[str, str] = {}  # token -> email
+        self.refresh_tokens: Dict[str, str] = {}
+
+    def public_user(self, user: Dict) -> Dict:
+        return {k: v for k, v in user.items() if k != 'password'}
+
+    def session(self, email: str) -> Dict:
+        access_token = secrets.token_urlsafe(24)
+        refresh_token = secrets.token_urlsafe(16)
+        self.access_tokens[access_token] = email
+        self.refresh_tokens[refresh_token] = email
+        return {
+            'access_token': access_token,
+            'token_type': 'bearer',
+            'expires_in': ACCESS_TOKEN_TTL,
+            'expires_at': int(time.time()) + ACCESS_TOKEN_TTL,
+            'refresh_token': refresh_token,
+            'user': self.public_user(self.users[email]),
+        }
+
+
+def _error(status: int, code: str, message: str) -> Tuple[int, Dict]:
+    return status, {'code': status, 'error_code': code, 'msg': message}
+
+
+class AuthStubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive
+    server_version = 'GoTrueStub/1.0'
+    disable_nagle_algorithm = True  # headers e corpo saem em writes separados
+
+    def log_message(self, format, *args):  # noqa: A002 - assinatura da classe base
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _body(self) -> Optional[Dict]:
+        length = int(self.headers.get('Content-Length') or 0)
+        raw = self.rfile.read(length) if length else b''
+        try:
+            return json.loads(raw or b'{}')
+        except ValueError:
+            return None
+
+    def _send(self, status: int, payload: Dict) -> None:
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _simulate(self) -> Optional[Tuple[int, Dict]]:
+        server = self.server
+        delay = server.latency_ms + random.uniform(0, server.jitter_ms)
+        if delay > 0:
+            time.sleep(delay / 1000)
+        if server.error_rate and random.random() < server.error_rate:
+            return _error(500, 'unexpected_failure', 'Simulated failure')
+        if not self.headers.get('apikey'):
+            return _error(401, 'no_api_key', 'No API key found in request')
+        return None
+
+    def do_POST(self):
+        parts = urlsplit(self.path)
+        body = self._body()
+        status, payload = self._simulate() or self.route_post(parts.path, parse_qs(parts.query), body)
+        self._send(status, payload)
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        status, payload = self._simulate() or self.route_get(parts.path)
+        self._send(status, payload)
+
+    def route_post(self, path: str, query: Dict, body: Optional[Dict]) -> Tuple[int, Dict]:
+        state: AuthState = self.server.state
+        if body is None:
+            return _error(400, 'bad_json', 'Could not parse request body as JSON')
+
+        if path == '/auth/v1/signup':
+            email, password = body.get('email'), body.get('password')
+            if not email or not password:
+                return _error(400, 'validation_failed', 'Signup requires a valid password')
+            if len(password) < 6:
+                return _error(422, 'weak_password', 'Password should be at least 6 characters')
+            with state.lock:
+                if email in state.users:
+                    return _error(422, 'user_already_exists', 'User already registered')
+                now = datetime.now(timezone.utc).isoformat()
+                state.users[email] = {
+                    'id': str(uuid.uuid4()), 'aud': 'authenticated', 'role': 'authenticated',
+                    'email': email, 'password': password, 'email_confirmed_at': now,
+                    'user_metadata': body.get('data', {}), 'created_at': now,
+                }
+                return 200, state.session(email)
+
+        if path == '/auth/v1/token':
+            grant_type = (query.get('grant_type') or [''])[0]
+            with state.lock:
+                if grant_type == 'password':
+                    user = state.users.get(body.get('email', ''))
+                    if user is None or user['password'] != body.get('password'):
+                        return _error(400, 'invalid_credentials', 'Invalid login credentials')
+                    return 200, state.session(user['email'])
+                if grant_type == 'refresh_token':
+                    email = state.refresh_tokens.pop(body.get('refresh_token', ''), None)
+                    if email is None:
+                        return _error(400, 'refresh_token_not_found', 'Invalid Refresh Token: Refresh Token Not Found')
+                    return 200, state.session(email)
+            return _error(400, 'unsupported_grant_type', f'Unsupported grant type: {grant_type}')
+
+        return _error(404, 'not_found', f'No route for POST {path}')
+
+    def route_get(self, path: str) -> Tuple[int, Dict]:
+        state: AuthState = self.server.state
+        if path == '/auth/v1/user':
+            authorization = self.headers.get('Authorization', '')
+            token = authorization[len('Bearer '):] if authorization.startswith('Bearer ') else ''
+            with state.lock:
+                email = state.access_tokens.get(token)
+                if email is None:
+                    return _error(401, 'bad_jwt', 'invalid JWT: unable to parse or verify signature')
+                return 200, state.public_user(state.users[email])
+        if path == '/auth/v1/health':
+            return 200, {'name': 'GoTrueStub', 'description': 'stub'}
+        return _error(404, 'not_found', f'No route for GET {path}')
+
+
+class AuthStubServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128  # o padrão (5) derruba conexões simultâneas no connect
+
+    def __init__(self, address, latency_ms: float = 0.0, jitter_ms: float = 0.0,
+                 error_rate: float = 0.0, verbose: bool = False):
+        super().__init__(address, AuthStubHandler)
+        self.state = AuthState()
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.verbose = verbose
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+def start_in_thread(port: int = 0, **options) -> AuthStubServer:
+    """Sobe o servidor em uma thread daemon (porta 0 = porta livre)"""
+    server = AuthStubServer(('127.0.0.1', port), **options)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Servidor local que imita a API de autenticação do Supabase')
+    parser.add_argument('--port', type=int, default=54321, help='Porta HTTP')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='Latência fixa por requisição')
+    parser.add_argument('--jitter-ms', type=float, default=0.0, help='Latência aleatória adicional (0..N)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fração de respostas 500 simuladas')
+    parser.add_argument('--verbose', action='store_true', help='Mostra cada requisição')
+    args = parser.parse_args()
+
+    server = AuthStubServer(('127.0.0.1', args.port), latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+                            error_rate=args.error_rate, verbose=args.verbose)
+    print(f"🔐 Stub de autenticação em {server.url} (qualquer apikey é aceita)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Encerrado")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Codemod: converte imports usados apenas como tipo em ``import type`` / ``type`` inline
+Usa o índice de símbolos para classificar cada binding (valor x tipo) e elimina
+arestas de runtime que o bundler manteria
+"""
+
+import re
+import argparse
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from symbol_index import SymbolIndex, ModuleInfo, ImportStatement
+from ts_tokenizer import string_value
+
+
+@dataclass
+class ImportConversion:
+    file_path: str
+    line: int
+    source: str
+    mode: str  # 'statement' (import type), 'split' (default + nomeados) ou 'inline'
+    names: List[str]
+    edits: List[Tuple[int, int, str]] = field(repr=False)
+
+
+def _strip_inline_type(text: str) -> str:
+    """Remove modificadores ``type`` inline de uma lista ``{ type A, B }``"""
+    return re.sub(r'([{,]\s*)type\s+(?=[\w$\'"])(?!as\b)', r'\1', text)
+
+
+class TypeImportConverter:
+    """Converte imports somente de tipo em ``import type`` sem alterar a formatação"""
+
+    def __init__(self, project_root: str, index: Optional[SymbolIndex] = None):
+        self.project_root = project_root
+        self.index = index
+        self.conversions: List[ImportConversion] = []
+
+    def plan_statement(self, module: ModuleInfo, statement: ImportStatement) -> Optional[ImportConversion]:
+        """Calcula as edições de um import (ou None se não houver o que converter)"""
+        if statement.dynamic or statement.type_only or not statement.bindings:
+            return None
+
+        usage = {b.local: module.binding_usage(b.local) for b in statement.bindings}
+        type_bindings = [b for b in statement.bindings if usage[b.local] == 'type' and not b.type_only]
+        if not type_bindings:
+            return None
+
+        source_text = module.source
+        tokens = module.tokens
+        import_keyword = tokens[statement.token_start]
+        all_types = all(usage[b.local] != 'value' for b in statement.bindings)
+
+        if all_types:
+            default = [b for b in statement.bindings if b.imported == 'default']
+            named = [b for b in statement.bindings if b.imported != 'default']
+            if default and named:
+                # ``import type A, { B }`` / ``import type A, * as B`` são inválidos: separa em dois imports
+                brace = next(k for k in range(statement.token_start, statement.token_end)
+                             if tokens[k].value in ('{', '*') and tokens[k].kind == 'punct')
+                specifier = next(tokens[k] for k in range(statement.token_start, statement.token_end)
+                                 if string_value(tokens[k]) == statement.source)
+                quote = source_text[specifier.start]
+                tail = source_text[tokens[brace].start:statement.end]
+                replacement = (f"import type {default[0].local} from {quote}{statement.source}{quote};\n"
+                               f"import type {_strip_inline_type(tail)}")
+                return ImportConversion(module.path, statement.line, statement.source, 'split',
+                                        [b.local for b in statement.bindings],
+                                        [(statement.start, statement.end, replacement)])
+            edits = [(import_keyword.end, import_keyword.end, ' type')]
+            for binding in statement.bindings:
+                if binding.type_only:
+                    # Remove ``type`` inline: inválido dentro de ``import type``
+                    end = binding.start + len('type')
+                    while end < len(source_text) and source_text[end].isspace():
+                        end += 1
+                    edits.append((binding.start, end, ''))
+            return ImportConversion(module.path, statement.line, statement.source, 'statement',
+                                    [b.local for b in statement.bindings], edits)
+
+        # Import misto: marca só os especificadores nomeados que são tipo
+        inline = [b for b in type_bindings if b.imported not in ('default', '*')]
+        if not inline:
+            return None
+        edits = [(b.start, b.start, 'type ') for b in inline]
+        return ImportConversion(module.path, statement.line, statement.source, 'inline',
+                                [b.local for b in inline], edits)
+
+    def plan(self) -> List[ImportConversion]:
+        if self.index is None:
+            self.index = SymbolIndex(self.project_root).build()
+        conversions = []
+        for path, module in sorted(self.index.modules.items()):
+            if path.endswith('.d.ts') or not path.endswith(('.ts', '.tsx')):
+                continue
+            for statement in module.imports:
+                conversion = self.plan_statement(module, statement)
+                if conversion:
+                    conversions.append(conversion)
+        self.conversions = conversions
+        return conversions
+
+    def apply(self, conversions: List[ImportConversion]) -> int:
+        """Aplica as edições com uma única escrita por arquivo"""
+        by_file: Dict[str, List[ImportConversion]] = defaultdict(list)
+        for conversion in conversions:
+            by_file[conversion.file_path].append(conversion)
+
+        written = 0
+        for path, file_conversions in by_file.items():
+            content = self.index.modules[path].source
+            edits = sorted((e for c in file_conversions for e in c.edits), key=lambda e: (e[0], e[1]), reverse=True)
+            for start, end, text in edits:
+                content = content[:start] + text + content[end:]
+            try:
+                with open(self.index.project_root / path, 'w', encoding='utf-8') as f:
+                    f.write(content)
+                written += 1
+                print(f"✅ Convertido: {path} ({sum(len(c.names) for c in file_conversions)} bindings)")
+            except OSError as e:
+                print(f"❌ Erro ao escrever {path}: {e}")
+        return written
+
+    def run(self, dry_run: bool = False) -> Dict:
+        print("🔍 Indexando símbolos e classificando bindings...")
+        conversions = self.plan()
+        by_mode = defaultdict(int)
+        for conversion in conversions:
+            by_mode[conversion.mode] += 1
+        files = {c.file_path for c in conversions}
+        removed_edges = sum(1 for c in conversions if c.mode in ('statement', 'split'))
+
+        print(f"📦 {len(conversions)} imports convertíveis em {len(files)} arquivos")
+        print(f"   • import type (statement inteiro): {by_mode['statement'] + by_mode['split']}")
+        print(f"   • type inline: {by_mode['inline']}")
+        print(f"   • arestas de runtime removidas: {removed_edges}")
+
+        if dry_run:
+            for conversion in conversions[:40]:
+                print(f"   {conversion.file_path}:{conversion.line} [{conversion.mode}] "
+                      f"{', '.join(conversion.names)} from '{conversion.source}'")
+            written = 0
+        else:
+            written = self.apply(conversions)
+            print(f"\n✅ {written} arquivos atualizados")
+
+        return {
+            'conversions': len(conversions),
+            'files': len(files),
+            'runtime_edges_removed': removed_edges,
+            'written': written,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Converte imports usados só como tipo em import type')
+    parser.add_argument('--project-dir', default='/workspace/doc-forge-buddy-Cain',
+                        help='Diretório do projeto')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='Apenas lista as conversões, sem alterar arquivos')
+    args = parser.parse_args()
+
+    TypeImportConverter(args.project_dir).run(dry_run=args.dry_run)
+
+
+if __name__ == "__main__":
+    main()
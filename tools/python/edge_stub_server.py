@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Servidor local que substitui as Edge Functions do Supabase nos benchmarks
+Responde em ``/functions/v1/<função>`` com respostas prontas no formato de cada função
+(openai-proxy, prompt-analytics, prompt-learning, send-email, upscale-image e
+check-notifications), depois de um atraso configurável por função. ``--workers``
+limita quantas requisições são atendidas ao mesmo tempo, de modo que a fila e o ponto
+de saturação aparecem no ``replay_edge_functions.py`` mesmo sem rede.
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+
+FUNCTIONS_PREFIX = '/functions/v1/'
+
+# Atraso médio (ms) de cada função: as que chamam a OpenAI/Replicate são bem mais lentas
+DEFAULT_DELAYS_MS = {
+    'openai-proxy': 400.0,
+    'prompt-analytics': 120.0,
+    'prompt-learning': 80.0,
+    'send-email': 60.0,
+    'upscale-image': 250.0,
+    'check-notifications': 150.0,
+}
+
+CORS_HEADERS = {
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Headers': 'authorization, x-client-info, apikey, content-type',
+}
+
+
+def canned_response(function: str, body: Optional[Dict]) -> Tuple[int, Dict]:
+    """Resposta no formato que a função real devolve"""
+    body = body if isinstance(body, dict) else {}
+    action = body.get('action')
+    if function == 'openai-proxy':
+        if not action:
+            return 400, {'success': False, 'error': 'Campo "action" é obrigatório'}
+        size = {'chatCompletion': 1200, 'generateDailySummary': 2400, 'analyzeContracts': 3200}.get(action, 600)
+        return 200, {'success': True, 'content': ('Resposta simulada da OpenAI. ' * (size // 30 + 1))[:size]}
+    if function == 'prompt-analytics':
+        return 200, {'data': {'action': action, 'metrics': [
+            {'date': f'2025-01-{d:02d}', 'prompts': random.randint(0, 40), 'effectiveness': round(random.random(), 2)}
+            for d in range(1, 31)]}}
+    if function == 'prompt-learning':
+        return 200, {'data': {'action': action, 'effectivenessScore': round(random.random(), 2),
+                              'recommendations': ['Seja mais específico', 'Inclua exemplos']}}
+    if function == 'send-email':
+        if not body.get('to') or not body.get('subject'):
+            return 400, {'success': False, 'error': 'Campos obrigatórios: to, subject, htmlContent'}
+        return 200, {'success': True, 'messageId': f'stub-{random.randint(1, 10 ** 9)}'}
+    if function == 'upscale-image':
+        if action == 'status':
+            return 200, {'id': body.get('predictionId', 'stub'), 'status': 'succeeded',
+                         'output': 'https://example.com/upscaled.png'}
+        return 200, {'id': f'stub-{random.randint(1, 10 ** 9)}', 'status': 'starting'}
+    if function == 'check-notifications':
+        return 200, {'success': True, 'notificationsCreated': random.randint(0, 5), 'errors': [],
+                     'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())}
+    return 404, {'error': f'Função não encontrada: {function}'}
+
+
+class EdgeStubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    server_version = 'EdgeStub/1.0'
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):  # noqa: A002 - assinatura da classe base
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send(self, status: int, payload: Optional[Dict]) -> None:
+        body = json.dumps(payload).encode('utf-8') if payload is not None else b'ok'
+        self.send_response(status)
+        for name, value in CORS_HEADERS.items():
+            self.send_header(name, value)
+        self.send_header('Content-Type', 'application/json' if payload is not None else 'text/plain')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _function(self) -> str:
+        path = self.path.split('?')[0]
+        return path[len(FUNCTIONS_PREFIX):].strip('/') if path.startswith(FUNCTIONS_PREFIX) else ''
+
+    def do_OPTIONS(self):
+        self._send(200, None)
+
+    def do_GET(self):
+        self.handle_function(None)
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        raw = self.rfile.read(length) if length else b''
+        try:
+            body = json.loads(raw) if raw else None
+        except ValueError:
+            body = None
+        self.handle_function(body)
+
+    def handle_function(self, body: Optional[Dict]) -> None:
+        server: EdgeStubServer = self.server
+        function = self._function()
+        with server.workers:
+            mean = server.delays_ms.get(function, server.default_delay_ms)
+            delay = max(0.0, random.gauss(mean, mean * server.jitter))
+            time.sleep(delay / 1000)
+            if server.error_rate and random.random() < server.error_rate:
+                status, payload = 500, {'success': False, 'error': 'Falha simulada'}
+            elif not self.headers.get('Authorization') and not self.headers.get('apikey'):
+                status, payload = 401, {'code': 401, 'message': 'Missing authorization header'}
+            else:
+                status, payload = canned_response(function, body)
+        self._send(status, payload)
+
+
+class EdgeStubServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(self, address, delays_ms: Optional[Dict[str, float]] = None, default_delay_ms: float = 100.0,
+                 jitter: float = 0.2, workers: int = 32, error_rate: float = 0.0, verbose: bool = False):
+        super().__init__(address, EdgeStubHandler)
+        self.delays_ms = {**DEFAULT_DELAYS_MS, **(delays_ms or {})}
+        self.default_delay_ms = default_delay_ms
+        self.jitter = jitter
+        self.workers = threading.BoundedSemaphore(workers)
+        self.error_rate = error_rate
+        self.verbose = verbose
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+def parse_delays(spec: str) -> Dict[str, float]:
+    """'openai-proxy=800,send-email=30' -> {'openai-proxy': 800.0, 'send-email': 30.0}"""
+    delays = {}
+    for item in filter(None, (part.strip() for part in spec.split(','))):
+        name, _, value = item.partition('=')
+        delays[name.strip()] = float(value)
+    return delays
+
+
+def start_in_thread(port: int = 0, **options) -> EdgeStubServer:
+    """Sobe o servidor em uma thread daemon (porta 0 = porta livre)"""
+    server = EdgeStubServer(('127.0.0.1', port), **options)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Servidor local com respostas prontas das Edge Functions')
+    parser.add_argument('--port', type=int, default=54322, help='Porta HTTP')
+    parser.add_argument('--delays', default='', help='Atraso médio por função, ex.: openai-proxy=800,send-email=30')
+    parser.add_argument('--jitter', type=float, default=0.2, help='Desvio padrão relativo do atraso')
+    parser.add_argument('--workers', type=int, default=32, help='Requisições atendidas ao mesmo tempo')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fração de respostas 500 simuladas')
+    parser.add_argument('--verbose', action='store_true', help='Mostra cada requisição')
+    args = parser.parse_args()
+
+    server = EdgeStubServer(('127.0.0.1', args.port), delays_ms=parse_delays(args.delays), jitter=args.jitter,
+                            workers=args.workers, error_rate=args.error_rate, verbose=args.verbose)
+    print(f"⚡ Stand-in das Edge Functions em {server.url}{FUNCTIONS_PREFIX}<função> ({args.workers} workers)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Encerrado")
+
+
+if __name__ == "__main__":
+    main()
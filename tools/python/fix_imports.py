@@ -1,68 +1,211 @@
 #!/usr/bin/env python3
+"""
+Corrige imports quebrados depois de mover arquivos
+Usa o índice persistido de localização de símbolos: um especificador que não resolve é
+trocado pelo caminho atual do módulo (movimentação detectada por hash de conteúdo) ou,
+na falta dela, pelo único módulo que exporta todos os nomes importados com o tipo certo
+(valor ou tipo). Esse último caso só é aplicado quando o arquivo tem o mesmo nome do
+especificador original; os demais viram sugestões. Tudo em uma passada, editando só o
+literal do especificador.
+"""
+
+import argparse
 import os
-import re
-import glob
-
-# Mapear arquivos que foram movidos
-moved_files = {}
-
-# Encontrar todos os arquivos no diretório src
-for root, dirs, files in os.walk('/workspace/doc-forge-buddy-Cain/src'):
-    # Ignorar node_modules e __tests__
-    if 'node_modules' in root or '__tests__' in root:
-        continue
-    
-    for file in files:
-        if file.endswith(('.tsx', '.ts')) and not file.endswith('.d.ts'):
-            full_path = os.path.join(root, file)
-            # Remover extensão
-            name_without_ext = file.replace('.tsx', '').replace('.ts', '')
-            # Criar caminho relativo
-            rel_path = full_path.replace('/workspace/doc-forge-buddy-Cain/src/', '')
-            # Remover extensão do caminho relativo
-            rel_path_no_ext = rel_path.replace('.tsx', '').replace('.ts', '')
-            
-            # Armazenar mapeamento
-            moved_files[name_without_ext] = '@/'+rel_path_no_ext
-
-# Lista de imports que precisam ser corrigidos
-common_issues = [
-    ("from '@/components/ContractBillsStatus'", "from '@/features/contracts/components/ContractBillsStatus'"),
-    ("from '../components/ContractBillsStatus'", "from '@/features/contracts/components/ContractBillsStatus'"),
-]
-
-# Adicionar imports que precisam trocar caminho de componentes
-for name, path in moved_files.items():
-    if '/components/' in path and '/modals/' not in path and '/ui/' not in path and '/common/' not in path and '/layout/' not in path:
-        if 'components/'+name in path:
-            common_issues.append((f"from '@/components/{name}'", f"from '{path}'"))
-
-# Processar todos os arquivos
-for root, dirs, files in os.walk('/workspace/doc-forge-buddy-Cain/src'):
-    if 'node_modules' in root or '__tests__' in root:
-        continue
-    
-    for file in files:
-        if file.endswith(('.tsx', '.ts')) and not file.endswith('.d.ts'):
-            full_path = os.path.join(root, file)
-            
+import posixpath
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from import_validator import ImportValidator, ImportProblem
+from symbol_index import ModuleParser, ModuleInfo, ImportStatement, ImportBinding
+from symbol_locations import SymbolLocationIndex, module_stem
+from ts_tokenizer import string_value
+
+
+def alias_specifier(path: str) -> str:
+    """'src/hooks/shared/index.ts' -> '@/hooks/shared'"""
+    stem = path
+    for ext in ('.d.ts', '.tsx', '.ts', '.jsx', '.js'):
+        if stem.endswith(ext):
+            stem = stem[:-len(ext)]
+            break
+    if stem.endswith('/index'):
+        stem = stem[:-len('/index')]
+    if stem.startswith('src/'):
+        return '@/' + stem[len('src/'):]
+    return stem
+
+
+class ImportFixer:
+    """Repara especificadores quebrados consultando o índice de símbolos"""
+
+    def __init__(self, project_root: str, dry_run: bool = False):
+        self.project_root = project_root
+        self.dry_run = dry_run
+        self.validator = ImportValidator(project_root).build()
+        self.index = SymbolLocationIndex(project_root, self.validator).build()
+        self.fixed: List[Dict] = []
+        self.unresolved: List[Dict] = []
+        self.suggested: List[Dict] = []
+
+    def _old_base(self, path: str, source: str) -> Optional[str]:
+        if source.startswith('.'):
+            return posixpath.normpath(posixpath.join(posixpath.dirname(path), source))
+        targets = self.validator.resolver.alias_targets(source)
+        return posixpath.normpath(targets[0]) if targets else None
+
+    @staticmethod
+    def required_kind(module: ModuleInfo, statement: ImportStatement, binding: ImportBinding) -> Optional[str]:
+        """'type' para import de tipo ou nome só usado como tipo, 'value' para uso em JSX/expressões"""
+        if statement.type_only or binding.type_only:
+            return 'type'
+        usage = module.binding_usage(binding.local)
+        return None if usage == 'unused' else usage
+
+    def _exports_kind(self, path: str, name: str, kind: Optional[str]) -> bool:
+        """Classes e enums são exportados como valor e também servem como tipo"""
+        facts = self.validator.facts.get(path)
+        if kind is None or facts is None:
+            return True
+        exported = facts.exports.get(name)
+        return exported in ('type', 'value') if kind == 'type' else exported == kind
+
+    def locate(self, path: str, statement: ImportStatement, module: ModuleInfo) -> Tuple[Optional[str], str, bool]:
+        """(novo módulo, motivo, aplicar automaticamente) para o especificador de ``statement``"""
+        base = self._old_base(path, statement.source)
+        if base:
+            moved = self.index.moved_module(base)
+            if moved:
+                return moved, 'movido', True
+
+        wanted: Dict[str, Optional[str]] = {}  # nome exportado -> 'value' | 'type' | None
+        for binding in statement.bindings:
+            if binding.imported != '*':
+                wanted[binding.imported] = self.required_kind(module, statement, binding)
+        stem = module_stem(base or statement.source)
+        if wanted:
+            candidates = None
+            for name, kind in wanted.items():
+                exporting = {c for c in self.index.modules_exporting(name) if self._exports_kind(c, name, kind)}
+                candidates = exporting if candidates is None else candidates & exporting
+            candidates = sorted(candidates or [])
+            if len(candidates) > 1:
+                same_name = [c for c in candidates if module_stem(c) == stem]
+                if same_name:
+                    candidates = same_name
+            if len(candidates) == 1:
+                # Outro nome de arquivo pode ser só um homônimo (ícone, classe): fica como sugestão
+                return candidates[0], 'exports', module_stem(candidates[0]) == stem
+            if len(candidates) > 1:
+                return None, f"ambíguo: {', '.join(candidates[:3])}", False
+            return None, 'nenhum módulo exporta todos os nomes como valor/tipo usados', False
+
+        same_name = self.index.modules_named(stem)
+        if len(same_name) == 1:
+            return same_name[0], 'nome do arquivo', True
+        return None, 'sem nomes importados para localizar o módulo', False
+
+    def fix_file(self, path: str, problems: List[ImportProblem]) -> int:
+        full_path = os.path.join(self.project_root, path)
+        with open(full_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        parser = ModuleParser(path, content, self.validator.resolver)
+        module = parser.parse()
+        imports, reexports = module.imports, module.reexports
+        broken = {(p.line, p.source) for p in problems}
+
+        edits: List[Tuple[int, int, str]] = []
+        for statement in imports:
+            if statement.dynamic or (statement.line, statement.source) not in broken:
+                continue
+            if statement.resolved:
+                # O módulo existe mas não exporta os nomes: só troca se nenhum nome estiver lá
+                if any(self.validator.has_export(statement.resolved, b.imported)
+                       for b in statement.bindings if b.imported != '*'):
+                    self.unresolved.append({'file': path, 'line': statement.line, 'source': statement.source,
+                                            'reason': 'só parte dos nomes mudou de módulo'})
+                    continue
+            target, reason, automatic = self.locate(path, statement, module)
+            if target is None or target == path:
+                self.unresolved.append({'file': path, 'line': statement.line,
+                                        'source': statement.source, 'reason': reason})
+                continue
+            new_source = alias_specifier(target)
+            if not automatic:
+                self.suggested.append({'file': path, 'line': statement.line, 'old': statement.source,
+                                       'new': new_source, 'reason': 'exporta os nomes, mas com outro nome de arquivo'})
+                continue
+            for token in parser.tokens[statement.token_start:statement.token_end]:
+                if string_value(token) == statement.source:
+                    edits.append((token.start + 1, token.end - 1, new_source))
+                    break
+            self.fixed.append({'file': path, 'line': statement.line, 'old': statement.source,
+                               'new': new_source, 'reason': reason})
+
+        for reexport in reexports:
+            if (reexport.line, reexport.source) not in broken or reexport.resolved:
+                continue
+            base = self._old_base(path, reexport.source)
+            target = self.index.moved_module(base) if base else None
+            if target is None:
+                self.unresolved.append({'file': path, 'line': reexport.line, 'source': reexport.source,
+                                        'reason': 're-export sem movimentação registrada'})
+                continue
+            new_source = alias_specifier(target)
+            for token in parser.tokens:
+                if token.line == reexport.line and string_value(token) == reexport.source:
+                    edits.append((token.start + 1, token.end - 1, new_source))
+                    break
+            self.fixed.append({'file': path, 'line': reexport.line, 'old': reexport.source,
+                               'new': new_source, 'reason': 'movido'})
+
+        if edits and not self.dry_run:
+            for start, end, replacement in sorted(edits, reverse=True):
+                content = content[:start] + replacement + content[end:]
+            with open(full_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+        return len(edits)
+
+    def run(self) -> int:
+        problems_by_file: Dict[str, List[ImportProblem]] = defaultdict(list)
+        for problem in self.validator.validate():
+            if problem.kind in ('modulo', 'export'):
+                problems_by_file[problem.file].append(problem)
+        total = 0
+        for path, problems in sorted(problems_by_file.items()):
             try:
-                with open(full_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                original_content = content
-                
-                # Aplicar correções
-                for old, new in common_issues:
-                    content = content.replace(old, new)
-                
-                # Se houver mudanças, salvar
-                if content != original_content:
-                    with open(full_path, 'w', encoding='utf-8') as f:
-                        f.write(content)
-                    print(f"Fixed: {full_path}")
-                    
-            except Exception as e:
-                print(f"Error processing {full_path}: {e}")
-
-print("Done!")
+                total += self.fix_file(path, problems)
+            except (OSError, UnicodeDecodeError) as e:
+                print(f"Error processing {path}: {e}")
+        return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Corrige imports quebrados usando o índice de símbolos')
+    parser.add_argument('--project-dir', default='/workspace/doc-forge-buddy-Cain',
+                        help='Diretório do projeto')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='Só mostra as correções')
+    parser.add_argument('--show-unresolved', action='store_true',
+                        help='Lista os imports que não puderam ser corrigidos')
+    args = parser.parse_args()
+
+    fixer = ImportFixer(args.project_dir, dry_run=args.dry_run)
+    fixer.run()
+    stats = fixer.index.stats
+    print(f"📚 Índice: {stats['files']} módulos, {stats['moved']} movimentações novas, "
+          f"{len(fixer.index.moves)} registradas")
+    verb = 'Would fix' if args.dry_run else 'Fixed'
+    for fix in fixer.fixed:
+        print(f"{verb}: {fix['file']}:{fix['line']} '{fix['old']}' → '{fix['new']}' ({fix['reason']})")
+    print(f"✅ {len(fixer.fixed)} imports corrigidos, 💡 {len(fixer.suggested)} sugestões, "
+          f"⚠️  {len(fixer.unresolved)} sem correção automática")
+    for item in fixer.suggested:
+        print(f"   💡 {item['file']}:{item['line']} '{item['old']}' → '{item['new']}'? ({item['reason']})")
+    if args.show_unresolved:
+        for item in fixer.unresolved:
+            print(f"   - {item['file']}:{item['line']} '{item['source']}': {item['reason']}")
+    print("Done!")
+
+
+if __name__ == "__main__":
+    main()
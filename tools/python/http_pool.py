@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Cliente HTTP/1.1 assíncrono com pool de conexões keep-alive
+Implementado só com ``asyncio`` (sem aiohttp/httpx) para os geradores de carga: cada
+conexão é reaproveitada entre requisições, e o tamanho do pool limita quantas ficam
+abertas ao mesmo tempo. Suporta ``Content-Length`` e ``Transfer-Encoding: chunked``.
+"""
+
+import asyncio
+import json
+import ssl
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+class HTTPError(Exception):
+    """Falha de transporte (conexão, timeout ou resposta malformada)"""
+
+
+@dataclass
+class Response:
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+    elapsed: float  # segundos, do envio ao último byte
+    request_bytes: int = 0
+
+    def json(self):
+        return json.loads(self.body.decode('utf-8') or 'null')
+
+
+@dataclass
+class _Connection:
+    reader: asyncio.StreamReader
+    writer: asyncio.StreamWriter
+    requests: int = 0
+
+
+@dataclass
+class PoolStats:
+    opened: int = 0
+    reused: int = 0
+    closed: int = 0
+
+
+class AsyncHTTPPool:
+    """Pool de conexões keep-alive para um único host"""
+
+    def __init__(self, base_url: str, size: int = 10, timeout: float = 30.0,
+                 default_headers: Optional[Dict[str, str]] = None):
+        parts = urlsplit(base_url)
+        self.scheme = parts.scheme or 'http'
+        self.host = parts.hostname or 'localhost'
+        self.port = parts.port or (443 if self.scheme == 'https' else 80)
+        self.base_path = parts.path.rstrip('/')
+        self.size = size
+        self.timeout = timeout
+        self.default_headers = default_headers or {}
+        self.stats = PoolStats()
+        self._idle: List[_Connection] = []
+        self._slots = asyncio.Semaphore(size)
+        self._ssl = ssl.create_default_context() if self.scheme == 'https' else None
+
+    @property
+    def host_header(self) -> str:
+        default_port = 443 if self.scheme == 'https' else 80
+        return self.host if self.port == default_port else f"{self.host}:{self.port}"
+
+    async def _open(self) -> _Connection:
+        reader, writer = await asyncio.open_connection(self.host, self.port, ssl=self._ssl)
+        self.stats.opened += 1
+        return _Connection(reader, writer)
+
+    def _discard(self, connection: _Connection) -> None:
+        self.stats.closed += 1
+        connection.writer.close()
+
+    async def _read_response(self, reader: asyncio.StreamReader) -> Tuple[int, Dict[str, str], bytes]:
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionResetError('conexão fechada pelo servidor')
+        parts = status_line.decode('latin-1').split(' ', 2)
+        if len(parts) < 2 or not parts[1].isdigit():
+            raise HTTPError(f'linha de status inválida: {status_line!r}')
+        status = int(parts[1])
+        headers: Dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get('transfer-encoding', '').lower() == 'chunked':
+            chunks = []
+            while True:
+                size_line = await reader.readline()
+                size = int(size_line.split(b';')[0].strip() or b'0', 16)
+                if size == 0:
+                    await reader.readline()
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readline()
+            body = b''.join(chunks)
+        elif 'content-length' in headers:
+            body = await reader.readexactly(int(headers['content-length']))
+        elif status in (204, 304) or 100 <= status < 200:
+            body = b''
+        else:
+            body = await reader.read()
+            headers['connection'] = 'close'
+        return status, headers, body
+
+    async def request(self, method: str, path: str, headers: Optional[Dict[str, str]] = None,
+                      body: Optional[bytes] = None, json_body=None) -> Response:
+        if json_body is not None:
+            body = json.dumps(json_body).encode('utf-8')
+        all_headers = {'Host': self.host_header, 'Connection': 'keep-alive', **self.default_headers}
+        if json_body is not None:
+            all_headers['Content-Type'] = 'application/json'
+        all_headers.update(headers or {})
+        if body is not None:
+            all_headers['Content-Length'] = str(len(body))
+        head = f"{method} {self.base_path}{path} HTTP/1.1\r\n" + \
+            ''.join(f"{k}: {v}\r\n" for k, v in all_headers.items()) + '\r\n'
+        payload = head.encode('latin-1') + (body or b'')
+
+        async with self._slots:
+            for attempt in range(2):
+                # Na segunda tentativa a conexão é sempre nova
+                connection = self._idle.pop() if self._idle and attempt == 0 else None
+                reused = connection is not None
+                try:
+                    if connection is None:
+                        connection = await asyncio.wait_for(self._open(), self.timeout)
+                    else:
+                        self.stats.reused += 1
+                    start = time.perf_counter()
+                    connection.writer.write(payload)
+                    await connection.writer.drain()
+                    status, response_headers, response_body = await asyncio.wait_for(
+                        self._read_response(connection.reader), self.timeout)
+                    elapsed = time.perf_counter() - start
+                except (ConnectionError, asyncio.IncompleteReadError) as e:
+                    if connection is not None:
+                        self._discard(connection)
+                    # Conexão ociosa fechada pelo servidor: tenta uma vez com conexão nova
+                    if reused and attempt == 0:
+                        continue
+                    raise HTTPError(f'{type(e).__name__}: {e}') from e
+                except asyncio.TimeoutError as e:
+                    if connection is not None:
+                        self._discard(connection)
+                    raise HTTPError(f'timeout após {self.timeout}s') from e
+                except HTTPError:
+                    self._discard(connection)
+                    raise
+                except OSError as e:
+                    if connection is not None:
+                        self._discard(connection)
+                    raise HTTPError(f'{type(e).__name__}: {e}') from e
+
+                connection.requests += 1
+                if response_headers.get('connection', '').lower() == 'close':
+                    self._discard(connection)
+                else:
+                    self._idle.append(connection)
+                return Response(status, response_headers, response_body, elapsed, len(payload))
+        raise HTTPError('falha ao obter conexão')
+
+    async def close(self) -> None:
+        while self._idle:
+            connection = self._idle.pop()
+            self._discard(connection)
+            try:
+                await connection.writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+
+    async def __aenter__(self) -> 'AsyncHTTPPool':
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Percentil com interpolação linear sobre uma lista já ordenada"""
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * q
+    low = int(position)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (position - low)
+
+
+@dataclass
+class LatencyHistogram:
+    """Latências (ms) em buckets logarítmicos, mais as amostras para os percentis"""
+    bounds: Tuple[float, ...] = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+    samples: List[float] = field(default_factory=list)
+
+    def add(self, milliseconds: float) -> None:
+        self.samples.append(milliseconds)
+
+    def summary(self) -> Dict[str, float]:
+        ordered = sorted(self.samples)
+        return {
+            'count': len(ordered),
+            'p50': percentile(ordered, 0.50),
+            'p95': percentile(ordered, 0.95),
+            'p99': percentile(ordered, 0.99),
+            'max': ordered[-1] if ordered else 0.0,
+        }
+
+    def buckets(self) -> List[Tuple[str, int]]:
+        counts = [0] * (len(self.bounds) + 1)
+        for value in self.samples:
+            for i, bound in enumerate(self.bounds):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            else:
+                counts[-1] += 1
+        labels = [f"≤{b:g}ms" for b in self.bounds] + [f">{self.bounds[-1]:g}ms"]
+        return list(zip(labels, counts))
+
+    def render(self, width: int = 40) -> str:
+        buckets = [(label, count) for label, count in self.buckets() if count]
+        peak = max((count for _, count in buckets), default=0) or 1
+        return '\n'.join(f"{label:>9} | {'█' * max(1, round(count / peak * width)):<{width}} {count}"
+                         for label, count in buckets)
@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+Validador rápido de imports - Doc Forge Buddy
+Confere, sem chamar o compilador, se cada especificador de import/re-export resolve
+para um arquivo do projeto (caminhos relativos, ``paths`` do tsconfig e barrels
+``index.ts``) ou para um pacote declarado, e se os nomes importados existem entre os
+exports do módulo de destino (seguindo ``export *`` e re-exports).
+
+As declarações de cada arquivo ficam em cache (``node_modules/.cache``) por data de
+modificação e tamanho: só os arquivos alterados são tokenizados de novo, e a validação
+em si roda inteiramente em memória. O ``tsc`` completo fica para o portão final.
+"""
+
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from symbol_index import (ModuleParser, ModuleResolver, SymbolIndex, load_jsonc,
+                          package_name)
+from ts_tokenizer import string_value
+
+CACHE_FILE = 'node_modules/.cache/doc-forge-tools/import_facts.json'
+CACHE_VERSION = 1
+IGNORED_PREFIXES = ('node:', 'virtual:', 'http:', 'https:', 'data:')
+NODE_BUILTINS = {
+    'assert', 'buffer', 'child_process', 'crypto', 'events', 'fs', 'http', 'https', 'module', 'net',
+    'os', 'path', 'perf_hooks', 'process', 'querystring', 'stream', 'url', 'util', 'worker_threads', 'zlib',
+}
+
+
+@dataclass
+class ImportFacts:
+    """Declarações de import/export de um arquivo (o que vai para o cache)"""
+    imports: List[Dict]
+    exports: Dict[str, str]  # nome -> 'value' | 'type'
+    reexports: List[Dict]
+    opaque: bool = False  # module.exports, export = ou declare module: exports desconhecidos
+
+    def to_dict(self) -> Dict:
+        return {'imports': self.imports, 'exports': self.exports,
+                'reexports': self.reexports, 'opaque': self.opaque}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'ImportFacts':
+        return cls(data['imports'], data['exports'], data['reexports'], data.get('opaque', False))
+
+
+@dataclass
+class ImportProblem:
+    file: str
+    line: int
+    kind: str  # 'modulo' | 'export' | 'pacote'
+    source: str
+    name: Optional[str] = None
+
+    @property
+    def message(self) -> str:
+        if self.kind == 'export':
+            return f"'{self.source}' não exporta '{self.name}'"
+        if self.kind == 'pacote':
+            return f"pacote '{package_name(self.source)}' não declarado em package.json"
+        return f"módulo '{self.source}' não encontrado"
+
+
+def extract_facts(path: str, content: str, resolver: ModuleResolver) -> ImportFacts:
+    parser = ModuleParser(path, content, resolver)
+    imports, exports, reexports, _ = parser.scan_statements()
+    tokens = parser.tokens
+    opaque = False
+    for i in range(len(tokens) - 2):
+        value = tokens[i].value
+        if value == 'module' and tokens[i + 1].value == '.' and tokens[i + 2].value == 'exports':
+            opaque = True
+        elif value == 'export' and tokens[i + 1].value == '=':
+            opaque = True
+        elif value == 'declare' and tokens[i + 1].value == 'module' and string_value(tokens[i + 2]) is not None:
+            opaque = True
+    return ImportFacts(
+        imports=[{
+            'source': s.source,
+            'line': s.line,
+            'dynamic': s.dynamic,
+            'names': [[b.imported, b.line] for b in s.bindings if b.imported != '*'],
+        } for s in imports],
+        exports={name: entry.kind for name, entry in exports.items()},
+        reexports=[{
+            'source': r.source,
+            'line': r.line,
+            'names': r.names,
+            'star': r.star,
+        } for r in reexports],
+        opaque=opaque,
+    )
+
+
+_worker_state: Dict[str, object] = {}
+
+
+def _init_worker(project_root: str) -> None:
+    _worker_state['resolver'] = ModuleResolver(Path(project_root))
+
+
+def _extract_job(job: Tuple[str, str]) -> Tuple[str, Optional[Dict]]:
+    rel_path, full_path = job
+    try:
+        with open(full_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+    except (OSError, UnicodeDecodeError):
+        return rel_path, None
+    return rel_path, extract_facts(rel_path, content, _worker_state['resolver']).to_dict()
+
+
+class ImportValidator:
+    """Valida imports contra o índice de módulos em memória"""
+
+    def __init__(self, project_root: str, source_dirs=('src',), jobs: Optional[int] = None,
+                 use_cache: bool = True):
+        self.project_root = Path(project_root)
+        self.source_dirs = list(source_dirs)
+        self.jobs = jobs or os.cpu_count() or 1
+        self.use_cache = use_cache
+        self.facts: Dict[str, ImportFacts] = {}
+        self.resolver: Optional[ModuleResolver] = None
+        self.packages: Set[str] = set()
+        self.problems: List[ImportProblem] = []
+        self.stats = {'files': 0, 'parsed': 0, 'imports': 0, 'names': 0, 'seconds': 0.0}
+        self._export_memo: Dict[Tuple[str, str], bool] = {}
+
+    # ------------------------------------------------------------------ cache
+    @property
+    def cache_path(self) -> Path:
+        return self.project_root / CACHE_FILE
+
+    def _load_cache(self) -> Dict[str, Dict]:
+        if not self.use_cache or not self.cache_path.exists():
+            return {}
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get('version') != CACHE_VERSION:
+            return {}
+        return data.get('files', {})
+
+    def _save_cache(self, entries: Dict[str, Dict]) -> None:
+        if not self.use_cache:
+            return
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': CACHE_VERSION, 'files': entries}, f, separators=(',', ':'))
+        except OSError as e:
+            print(f"⚠️  Não foi possível gravar o cache de imports: {e}")
+
+    # ------------------------------------------------------------------ índice
+    def load_packages(self) -> Set[str]:
+        packages: Set[str] = set()
+        package_json = self.project_root / 'package.json'
+        if package_json.exists():
+            try:
+                data = load_jsonc(package_json)
+            except (ValueError, OSError) as e:
+                print(f"Erro ao ler {package_json}: {e}")
+                data = {}
+            for key in ('dependencies', 'devDependencies', 'peerDependencies', 'optionalDependencies'):
+                packages.update(data.get(key, {}))
+            if data.get('name'):
+                packages.add(data['name'])
+        return packages
+
+    def build(self) -> 'ImportValidator':
+        files = SymbolIndex(str(self.project_root), self.source_dirs).find_source_files()
+        self.resolver = ModuleResolver(self.project_root, set(files))
+        self.packages = self.load_packages()
+
+        cached = self._load_cache()
+        entries: Dict[str, Dict] = {}
+        pending: List[Tuple[str, str]] = []
+        for rel_path in files:
+            full_path = str(self.project_root / rel_path)
+            try:
+                stat = os.stat(full_path)
+            except OSError:
+                continue
+            entry = cached.get(rel_path)
+            if entry and entry['mtime'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+                entries[rel_path] = entry
+            else:
+                entries[rel_path] = {'mtime': stat.st_mtime_ns, 'size': stat.st_size}
+                pending.append((rel_path, full_path))
+
+        if pending:
+            if self.jobs <= 1 or len(pending) < 8:
+                _init_worker(str(self.project_root))
+                results = [_extract_job(job) for job in pending]
+            else:
+                with ProcessPoolExecutor(max_workers=self.jobs, initializer=_init_worker,
+                                         initargs=(str(self.project_root),)) as executor:
+                    results = list(executor.map(_extract_job, pending, chunksize=16))
+            for rel_path, facts in results:
+                if facts is None:
+                    entries.pop(rel_path, None)
+                    print(f"Erro ao ler {rel_path}")
+                else:
+                    entries[rel_path]['facts'] = facts
+            self._save_cache(entries)
+
+        self.facts = {path: ImportFacts.from_dict(entry['facts']) for path, entry in entries.items()}
+        self.stats['files'] = len(self.facts)
+        self.stats['parsed'] = len(pending)
+        return self
+
+    # --------------------------------------------------------------- validação
+    def has_export(self, path: str, name: str, _seen: Optional[Set[Tuple[str, str]]] = None) -> bool:
+        """``name`` existe em ``path`` (diretamente, por re-export ou por ``export *``)?"""
+        key = (path, name)
+        if key in self._export_memo:
+            return self._export_memo[key]
+        seen = _seen if _seen is not None else set()
+        if key in seen:
+            return False
+        seen.add(key)
+
+        facts = self.facts.get(path)
+        if facts is None or facts.opaque or name in facts.exports:
+            found = True  # arquivo fora do índice (json, css, d.ts de fora) não é verificável
+        else:
+            found = False
+            for reexport in facts.reexports:
+                if name in reexport['names']:
+                    target = self.resolver.resolve(path, reexport['source'])
+                    imported = reexport['names'][name]
+                    found = target is None or imported == '*' or self.has_export(target, imported, seen)
+                    break
+            else:
+                if name != 'default':
+                    for reexport in facts.reexports:
+                        if not reexport['star']:
+                            continue
+                        target = self.resolver.resolve(path, reexport['source'])
+                        if target is None or self.has_export(target, name, seen):
+                            found = True
+                            break
+        if _seen is None or found:
+            self._export_memo[key] = found
+        return found
+
+    def check_specifier(self, path: str, source: str, line: int) -> Tuple[Optional[str], Optional[ImportProblem]]:
+        """Resolve ``source``; devolve (arquivo, problema)"""
+        if source.startswith(IGNORED_PREFIXES):
+            return None, None
+        resolved = self.resolver.resolve(path, source)
+        if resolved:
+            return resolved, None
+        bare = source.split('?')[0]
+        if bare.startswith('.') or bare.startswith('/') or self.resolver.alias_targets(bare):
+            return None, ImportProblem(path, line, 'modulo', source)
+        package = package_name(bare)
+        if package in self.packages or package in NODE_BUILTINS or package.startswith('@types/'):
+            return None, None
+        if (self.project_root / 'node_modules' / package).exists():
+            return None, None
+        return None, ImportProblem(path, line, 'pacote', source)
+
+    def validate(self) -> List[ImportProblem]:
+        start = time.perf_counter()
+        if not self.facts:
+            self.build()
+        problems: List[ImportProblem] = []
+        for path, facts in sorted(self.facts.items()):
+            for statement in facts.imports:
+                self.stats['imports'] += 1
+                resolved, problem = self.check_specifier(path, statement['source'], statement['line'])
+                if problem:
+                    problems.append(problem)
+                    continue
+                if resolved is None or statement['dynamic']:
+                    continue
+                for name, line in statement['names']:
+                    self.stats['names'] += 1
+                    if not self.has_export(resolved, name):
+                        problems.append(ImportProblem(path, line, 'export', statement['source'], name))
+            for reexport in facts.reexports:
+                self.stats['imports'] += 1
+                resolved, problem = self.check_specifier(path, reexport['source'], reexport['line'])
+                if problem:
+                    problems.append(problem)
+                    continue
+                if resolved is None:
+                    continue
+                for name in reexport['names'].values():
+                    if name == '*':
+                        continue
+                    self.stats['names'] += 1
+                    if not self.has_export(resolved, name):
+                        problems.append(ImportProblem(path, reexport['line'], 'export', reexport['source'], name))
+        self.stats['seconds'] = time.perf_counter() - start
+        self.problems = problems
+        return problems
+
+    def print_summary(self, limit: int = 30) -> None:
+        stats = self.stats
+        print(f"   📁 {stats['files']} arquivos ({stats['parsed']} tokenizados, o resto veio do cache)")
+        print(f"   🔗 {stats['imports']} especificadores e {stats['names']} nomes verificados "
+              f"em {stats['seconds']:.2f}s")
+        if not self.problems:
+            print("   ✅ Todos os imports resolvem")
+            return
+        print(f"   ❌ {len(self.problems)} problemas:")
+        for problem in self.problems[:limit]:
+            print(f"      - {problem.file}:{problem.line} - {problem.message}")
+        if len(self.problems) > limit:
+            print(f"      ... e mais {len(self.problems) - limit} problemas")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Validador rápido de imports (sem tsc)')
+    parser.add_argument('--project-dir', default='/workspace/doc-forge-buddy-Cain',
+                        help='Diretório do projeto')
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='Processos para tokenizar arquivos alterados (padrão: número de CPUs)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Ignora o cache de declarações e tokeniza tudo de novo')
+    args = parser.parse_args()
+
+    print("🔍 Validando imports...")
+    validator = ImportValidator(args.project_dir, jobs=args.jobs, use_cache=not args.no_cache)
+    build_start = time.perf_counter()
+    validator.build()
+    print(f"   ⏱️  Índice carregado em {time.perf_counter() - build_start:.2f}s")
+    validator.validate()
+    validator.print_summary()
+    raise SystemExit(1 if validator.problems else 0)
+
+
+if __name__ == "__main__":
+    main()
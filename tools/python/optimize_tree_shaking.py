@@ -1,180 +1,319 @@
 #!/usr/bin/env python3
 """
 Script de Otimização de Tree Shaking
-Automatiza a otimização de imports em massa
+Reescreve imports de bibliotecas pesadas (lucide-react, date-fns, framer-motion)
+para imports profundos por símbolo, guiado pelo uso real de cada identificador
 """
 
 import os
 import re
-import glob
-
-def optimize_lucide_imports(file_path):
-    """Otimiza imports de lucide-react para imports específicos"""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Padrões de otimização
-    optimization_patterns = [
-        # Prompt components
-        (r'import {\s*([^}]+)\s*}\s*from\s*[\'"]lucide-react[\'"]', 
-         lambda m: optimize_lucide_import_content(m.group(1), file_path)),
-        
-        # Other components
-        (r'import\s*{([^}]+)}\s*from\s*[\'"]lucide-react[\'"]', 
-         lambda m: optimize_lucide_import_content(m.group(1), file_path)),
-    ]
-    
-    optimized = False
-    for pattern, replacement_func in optimization_patterns:
-        matches = re.findall(pattern, content, re.MULTILINE | re.DOTALL)
-        if matches:
-            for match in matches:
-                new_import = replacement_func(match)
-                if new_import:
-                    content = content.replace(f"import {{ {match} }} from 'lucide-react'", new_import)
-                    optimized = True
-                    break
-    
-    if optimized:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        print(f"✅ Otimizado: {file_path}")
-        return True
-    return False
-
-def optimize_lucide_import_content(imports, file_path):
-    """Otimiza conteúdo específico de import do lucide-react"""
-    # Lista de ícones mais comuns para manter específicos
-    keep_specific = [
-        'Sparkles', 'Wand2', 'Loader2', 'Check', 'ChevronDown', 'ChevronUp', 'Copy', 'Save',
-        'AlertCircle', 'CheckCircle2', 'Lightbulb', 'TrendingUp', 'TrendingDown', 'Activity',
-        'Target', 'Clock', 'Users', 'BarChart3', 'PieChart', 'Calendar', 'Download', 'RefreshCw',
-        'CheckCircle', 'Zap', 'Home', 'Settings', 'User', 'Menu', 'X', 'Eye', 'EyeOff', 'Mail',
-        'Lock', 'Building2', 'Plus', 'FileText', 'Star', 'Droplets', 'Key', 'Bell', 'Flame'
-    ]
-    
-    # Remover imports desnecessários
-    imports_list = [i.strip() for i in imports.split(',')]
-    kept_imports = [i for i in imports_list if any(k in i for k in keep_specific)]
-    
-    if kept_imports:
-        return f"import {{ {', '.join(kept_imports)} }} from 'lucide-react'"
-    return f"import {{ {imports} }} from 'lucide-react'"
-
-def optimize_framer_motion_imports(file_path):
-    """Otimiza imports de framer-motion"""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Padrão de import de framer-motion
-    if "from 'framer-motion'" in content:
-        # Manter apenas imports essenciais
-        optimized_imports = [
-            'AnimatePresence' if 'AnimatePresence' in content else None,
-            'motion' if 'motion' in content else None,
-        ]
-        optimized_imports = [i for i in optimized_imports if i]
-        
-        if optimized_imports:
-            old_pattern = r"import\s*{[^}]*}\s*from\s*['\"]framer-motion['\"]"
-            new_import = f"import {{ {', '.join(optimized_imports)} }} from 'framer-motion'"
-            content = re.sub(old_pattern, new_import, content)
-            
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            print(f"✅ Framer Motion otimizado: {file_path}")
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from symbol_index import ModuleParser, ModuleResolver, ImportStatement, ModuleInfo, SOURCE_EXTENSIONS, IGNORED_DIRS
+
+# Tipos de lucide-react para os imports profundos (gerado quando houver reescrita)
+LUCIDE_DECLARATION_FILE = 'src/types/lucide-deep-imports.d.ts'
+LUCIDE_DECLARATION = """// Gerado por tools/python/optimize_tree_shaking.py
+declare module 'lucide-react/dist/esm/icons/*' {
+  import type { LucideIcon } from 'lucide-react';
+  const icon: LucideIcon;
+  export default icon;
+}
+"""
+
+# Utilitários de DOM do framer-motion com entrada própria
+FRAMER_DOM_EXPORTS = {'animate', 'scroll', 'inView', 'stagger', 'hover', 'press', 'resize'}
+
+
+@dataclass
+class DeepImportManifest:
+    """Mapeia cada símbolo de um pacote para (caminho profundo, nome exportado)"""
+    package: str
+    specifiers: Tuple[str, ...]
+    symbols: Dict[str, Tuple[str, str]] = field(default_factory=dict)
+    rule: Optional[str] = None  # 'date-fns' / 'date-fns-locale': caminho derivado do nome
+    available: bool = True
+    note: str = ''
+    package_dir: Optional[Path] = None  # confere caminhos derivados quando instalado
+
+    def _exists(self, path: str) -> bool:
+        if self.package_dir is None:
             return True
-    return False
-
-def optimize_date_fns_imports(file_path):
-    """Otimiza imports de date-fns"""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    if "from 'date-fns'" in content:
-        # Padrão de otimização para date-fns
-        if 'format' in content and 'from' in content:
-            # Substituir import bulk por imports específicos quando possível
-            old_imports = re.findall(r'import\s*{\s*([^}]+)\s*}\s*from\s*[\'"]date-fns[\'"]', content)
-            if old_imports:
-                imports = old_imports[0]
-                imports_list = [i.strip() for i in imports.split(',')]
-                
-                # Manter apenas funções realmente usadas
-                specific_imports = []
-                for imp in imports_list:
-                    if imp in ['format', 'parseISO', 'isValid', 'ptBR']:
-                        specific_imports.append(imp)
-                
-                if specific_imports:
-                    # Substituir por imports específicos otimizados
-                    new_imports = []
-                    for imp in specific_imports:
-                        if imp == 'ptBR':
-                            new_imports.append("ptBR from 'date-fns/locale/pt-BR'")
-                        else:
-                            new_imports.append(f"{imp} from 'date-fns/{imp}'")
-                    
-                    # Remover import antigo e adicionar novos
-                    content = re.sub(r"import\s*{\s*[^}]+\s*}\s*from\s*['\"]date-fns['\"]", "", content)
-                    
-                    # Adicionar imports otimizados no início
-                    import_section = content.find('import')
-                    if import_section != -1:
-                        import_end = content.find('\n', import_section)
-                        content = (content[:import_end] + 
-                                 '\n' + '\n'.join(new_imports) + 
-                                 content[import_end:])
-                    
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        f.write(content)
-                    print(f"✅ Date-fns otimizado: {file_path}")
-                    return True
-    return False
+        subpath = self.package_dir / path[len(self.package) + 1:]
+        return subpath.with_suffix('.js').exists() or (subpath / 'index.js').exists()
+
+    def resolve(self, specifier: str, symbol: str) -> Optional[Tuple[str, str]]:
+        if not self.available:
+            return None
+        if symbol in self.symbols:
+            return self.symbols[symbol]
+        path = None
+        if self.rule == 'date-fns':
+            if specifier == 'date-fns/locale':
+                code = _locale_code(symbol)
+                path = f"date-fns/locale/{code}" if code else None
+            elif re.fullmatch(r'[a-z][A-Za-z0-9]*', symbol):
+                path = f"date-fns/{symbol}"
+        if path is None or not self._exists(path):
+            return None
+        return path, symbol
+
+
+def _locale_code(symbol: str) -> Optional[str]:
+    """'ptBR' -> 'pt-BR', 'es' -> 'es', 'enUS' -> 'en-US'"""
+    match = re.fullmatch(r'([a-z]{2,3})([A-Z][A-Za-z]*)?', symbol)
+    if not match:
+        return None
+    return f"{match.group(1)}-{match.group(2)}" if match.group(2) else match.group(1)
+
+
+def build_manifests(project_root: Path) -> Dict[str, DeepImportManifest]:
+    """Monta os manifestos a partir de node_modules (quando instalado)"""
+    node_modules = project_root / 'node_modules'
+    manifests: Dict[str, DeepImportManifest] = {}
+
+    # lucide-react: índice ESM lista "export { default as Nome, ... } from './icons/arquivo.js'"
+    lucide = DeepImportManifest('lucide-react', ('lucide-react',))
+    index_file = node_modules / 'lucide-react' / 'dist' / 'esm' / 'lucide-react.js'
+    if index_file.exists():
+        content = index_file.read_text(encoding='utf-8')
+        for names, icon_file in re.findall(r"export\s*\{([^}]*)\}\s*from\s*['\"]\./icons/([\w-]+)\.js['\"]", content):
+            for spec in names.split(','):
+                parts = spec.split(' as ')
+                if len(parts) == 2 and parts[0].strip() == 'default':
+                    lucide.symbols[parts[1].strip()] = (f"lucide-react/dist/esm/icons/{icon_file}", 'default')
+        lucide.note = f"{len(lucide.symbols)} ícones mapeados"
+    else:
+        # Nomes de ícones mudam entre versões: sem o índice instalado não há mapeamento seguro
+        lucide.available = False
+        lucide.note = 'node_modules/lucide-react ausente: reescrita desativada'
+    manifests['lucide-react'] = lucide
+
+    date_fns = DeepImportManifest('date-fns', ('date-fns', 'date-fns/locale'), rule='date-fns')
+    if (node_modules / 'date-fns').exists():
+        date_fns.package_dir = node_modules / 'date-fns'
+        date_fns.note = 'caminhos derivados do nome e conferidos em node_modules'
+    else:
+        date_fns.note = 'caminhos derivados do nome (date-fns v3: um módulo por função)'
+    manifests['date-fns'] = date_fns
+
+    # framer-motion não expõe componentes por símbolo: só os utilitários de DOM têm entrada própria
+    framer = DeepImportManifest('framer-motion', ('framer-motion',),
+                                symbols={name: ('framer-motion/dom', name) for name in FRAMER_DOM_EXPORTS})
+    framer.note = "componentes ficam no import raiz, reduzido aos nomes usados"
+    manifests['framer-motion'] = framer
+    return manifests
+
+
+@dataclass
+class FileRewrite:
+    file_path: str
+    content: str
+    deep_imports: int = 0
+    dropped: List[str] = field(default_factory=list)
+    libraries: List[str] = field(default_factory=list)
+
+
+def _format_statement(names: List[str], source: str, quote: str, semicolon: str) -> str:
+    return f"import {{ {', '.join(names)} }} from {quote}{source}{quote}{semicolon}"
+
+
+def rewrite_statement(module: ModuleInfo, statement: ImportStatement,
+                      manifest: DeepImportManifest) -> Optional[Tuple[str, int, List[str]]]:
+    """Texto de substituição de um import (ou None se não houver mudança)"""
+    if statement.dynamic or statement.type_only or not statement.bindings:
+        return None
+    if any(b.imported in ('default', '*') for b in statement.bindings):
+        return None
+
+    original = module.source[statement.start:statement.end]
+    quote = '"' if f'"{statement.source}"' in original else "'"
+    semicolon = ';' if original.rstrip().endswith(';') else ''
+
+    residual: List[str] = []
+    deep: List[str] = []
+    dropped: List[str] = []
+    for binding in statement.bindings:
+        usage = module.binding_usage(binding.local)
+        alias = f" as {binding.local}" if binding.local != binding.imported else ''
+        if usage == 'unused':
+            dropped.append(binding.local)
+            continue
+        if binding.type_only or usage == 'type':
+            residual.append(f"type {binding.imported}{alias}")
+            continue
+        target = manifest.resolve(statement.source, binding.imported)
+        if target is None:
+            residual.append(f"{binding.imported}{alias}")
+            continue
+        path, export_name = target
+        if export_name == 'default':
+            deep.append(f"import {binding.local} from {quote}{path}{quote}{semicolon}")
+        else:
+            spec = export_name if binding.local == export_name else f"{export_name} as {binding.local}"
+            deep.append(_format_statement([spec], path, quote, semicolon))
+
+    if not deep and not dropped:
+        return None
+    lines = []
+    if residual:
+        if all(name.startswith('type ') for name in residual):
+            lines.append(f"import type {{ {', '.join(n[5:] for n in residual)} }} from "
+                         f"{quote}{statement.source}{quote}{semicolon}")
+        else:
+            lines.append(_format_statement(residual, statement.source, quote, semicolon))
+    lines.extend(deep)
+    return '\n'.join(lines), len(deep), dropped
+
+
+# Estado de cada processo do pool
+_worker_state: Dict[str, object] = {}
+
+
+def _init_worker(project_root: str, manifests: Dict[str, DeepImportManifest]) -> None:
+    _worker_state['resolver'] = ModuleResolver(Path(project_root))
+    _worker_state['manifests'] = manifests
+
+
+def plan_file(rel_path: str, content: str) -> Optional[FileRewrite]:
+    """Reescreve todos os imports elegíveis de um arquivo em memória"""
+    manifests: Dict[str, DeepImportManifest] = _worker_state['manifests']
+    by_specifier = {spec: m for m in manifests.values() for spec in m.specifiers}
+    module = ModuleParser(rel_path, content, _worker_state['resolver']).parse()
+
+    edits = []
+    rewrite = FileRewrite(rel_path, content)
+    for statement in module.imports:
+        manifest = by_specifier.get(statement.source)
+        if manifest is None or not manifest.available:
+            continue
+        result = rewrite_statement(module, statement, manifest)
+        if result is None:
+            continue
+        text, deep_count, dropped = result
+        edits.append((statement.start, statement.end, text))
+        rewrite.deep_imports += deep_count
+        rewrite.dropped.extend(dropped)
+        if manifest.package not in rewrite.libraries:
+            rewrite.libraries.append(manifest.package)
+
+    if not edits:
+        return None
+    for start, end, text in sorted(edits, reverse=True):
+        content = content[:start] + text + content[end:]
+    rewrite.content = content
+    return rewrite
+
+
+def _plan_file_job(job: Tuple[str, str]) -> Optional[FileRewrite]:
+    rel_path, content = job
+    try:
+        return plan_file(rel_path, content)
+    except Exception as e:  # um arquivo problemático não interrompe o lote
+        print(f"❌ Erro ao processar {rel_path}: {e}")
+        return None
+
+
+class TreeShakingOptimizer:
+    """Aplica os manifestos em paralelo, com uma escrita por arquivo"""
+
+    def __init__(self, project_root: str, jobs: Optional[int] = None):
+        self.project_root = Path(project_root)
+        self.jobs = jobs or os.cpu_count() or 1
+        self.manifests = build_manifests(self.project_root)
+
+    def candidate_files(self) -> List[Tuple[str, str]]:
+        """Arquivos que mencionam algum dos pacotes (filtro barato antes do parse)"""
+        needles = tuple(f"'{spec}'" for m in self.manifests.values() if m.available for spec in m.specifiers) + \
+            tuple(f'"{spec}"' for m in self.manifests.values() if m.available for spec in m.specifiers)
+        jobs = []
+        for root, dirs, names in os.walk(self.project_root / 'src'):
+            dirs[:] = [d for d in dirs if d not in IGNORED_DIRS]
+            for name in names:
+                if not name.endswith(SOURCE_EXTENSIONS) or name.endswith('.d.ts'):
+                    continue
+                full_path = os.path.join(root, name)
+                try:
+                    with open(full_path, 'r', encoding='utf-8') as f:
+                        content = f.read()
+                except (OSError, UnicodeDecodeError) as e:
+                    print(f"Erro ao ler {full_path}: {e}")
+                    continue
+                if any(needle in content for needle in needles):
+                    rel_path = os.path.relpath(full_path, self.project_root).replace('\\', '/')
+                    jobs.append((rel_path, content))
+        return sorted(jobs)
+
+    def plan(self) -> List[FileRewrite]:
+        jobs = self.candidate_files()
+        if self.jobs <= 1 or len(jobs) < 2:
+            _init_worker(str(self.project_root), self.manifests)
+            results = [_plan_file_job(job) for job in jobs]
+        else:
+            with ProcessPoolExecutor(max_workers=self.jobs, initializer=_init_worker,
+                                     initargs=(str(self.project_root), self.manifests)) as pool:
+                results = list(pool.map(_plan_file_job, jobs, chunksize=8))
+        return [r for r in results if r is not None]
+
+    def write(self, rewrites: List[FileRewrite]) -> int:
+        written = 0
+        for rewrite in rewrites:
+            try:
+                with open(self.project_root / rewrite.file_path, 'w', encoding='utf-8') as f:
+                    f.write(rewrite.content)
+                written += 1
+                print(f"✅ Otimizado: {rewrite.file_path} ({', '.join(rewrite.libraries)})")
+            except OSError as e:
+                print(f"❌ Erro ao escrever {rewrite.file_path}: {e}")
+
+        if any("lucide-react/dist/esm/icons/" in r.content for r in rewrites):
+            declaration = self.project_root / LUCIDE_DECLARATION_FILE
+            if not declaration.exists():
+                declaration.parent.mkdir(parents=True, exist_ok=True)
+                declaration.write_text(LUCIDE_DECLARATION, encoding='utf-8')
+                print(f"✅ Declaração de tipos criada: {LUCIDE_DECLARATION_FILE}")
+        return written
+
+    def run(self, dry_run: bool = False) -> Dict:
+        print("🚀 Iniciando otimização de Tree Shaking...")
+        for manifest in self.manifests.values():
+            status = "✅" if manifest.available else "⚠️"
+            print(f"{status} Manifesto {manifest.package}: {manifest.note}")
+
+        rewrites = self.plan()
+        deep_imports = sum(r.deep_imports for r in rewrites)
+        dropped = sum(len(r.dropped) for r in rewrites)
+        print(f"📁 {len(rewrites)} arquivos com imports reescritos")
+        print(f"   • imports profundos gerados: {deep_imports}")
+        print(f"   • bindings não usados removidos: {dropped}")
+
+        if dry_run:
+            for rewrite in rewrites:
+                print(f"   {rewrite.file_path}: {rewrite.deep_imports} profundos ({', '.join(rewrite.libraries)})")
+            written = 0
+        else:
+            written = self.write(rewrites)
+            print(f"\n✅ Otimização concluída! {written} arquivos otimizados.")
+
+        return {'files': len(rewrites), 'deep_imports': deep_imports, 'dropped': dropped, 'written': written}
+
 
 def main():
-    """Executa otimização em massa"""
-    print("🚀 Iniciando otimização de Tree Shaking...")
-    
-    # Diretórios para processar
-    src_dir = "/workspace/doc-forge-buddy-Cain/src"
-    
-    # Arquivos para processar
-    files_to_process = []
-    
-    # Encontrar todos os arquivos TypeScript/JavaScript
-    for pattern in ['**/*.tsx', '**/*.ts']:
-        files_to_process.extend(glob.glob(f"{src_dir}/{pattern}", recursive=True))
-    
-    print(f"📁 Processando {len(files_to_process)} arquivos...")
-    
-    # Otimizações por tipo
-    optimized_count = 0
-    
-    for file_path in files_to_process:
-        try:
-            # 1. Otimizar lucide-react
-            if optimize_lucide_imports(file_path):
-                optimized_count += 1
-            
-            # 2. Otimizar framer-motion
-            if optimize_framer_motion_imports(file_path):
-                optimized_count += 1
-            
-            # 3. Otimizar date-fns
-            if optimize_date_fns_imports(file_path):
-                optimized_count += 1
-                
-        except Exception as e:
-            print(f"❌ Erro ao processar {file_path}: {e}")
-    
-    print(f"\n✅ Otimização concluída! {optimized_count} arquivos otimizados.")
-    print("\n📊 Resumo das otimizações:")
-    print("• Imports específicos do lucide-react")
-    print("• Tree-shaking otimizado no Vite")
-    print("• Dynamic imports para bibliotecas pesadas")
-    print("• Imports específicos do date-fns")
-    print("• Chunks otimizados para carregamento")
+    parser = argparse.ArgumentParser(description='Reescreve imports de bibliotecas pesadas para imports por símbolo')
+    parser.add_argument('--project-dir', default='/workspace/doc-forge-buddy-Cain',
+                        help='Diretório do projeto')
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='Número de processos (padrão: CPUs disponíveis)')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='Apenas lista as mudanças, sem alterar arquivos')
+    args = parser.parse_args()
+
+    TreeShakingOptimizer(args.project_dir, args.jobs).run(dry_run=args.dry_run)
+
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
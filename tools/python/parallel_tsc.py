@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""
+Checagem de tipos em paralelo - Doc Forge Buddy
+Divide o projeto em shards usando os componentes fortemente conexos (SCCs) do grafo
+de imports, roda ``tsc --noEmit --incremental`` por shard em paralelo, cada um com o
+seu ``.tsbuildinfo``, e junta os diagnósticos sem duplicatas.
+
+Cada shard é um tsconfig gerado que estende ``tsconfig.app.json`` e lista apenas os
+arquivos do shard em ``files``; o tsc puxa as dependências sozinho. Um ciclo de imports
+nunca é dividido entre shards, e a distribuição leva em conta o fecho de dependências de
+cada SCC (o que o tsc de fato vai checar), preferindo o shard que já cobre esse fecho.
+
+O compilador é configurável (``--compiler``), o que permite testar o driver com o
+``tsc_stub.py`` sem Node instalado.
+"""
+
+import argparse
+import json
+import os
+import re
+import shlex
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from import_validator import ImportValidator
+
+SHARD_DIR = 'node_modules/.cache/doc-forge-tools/tsc-shards'
+DEFAULT_BASE_CONFIG = 'tsconfig.app.json'
+
+DIAGNOSTIC = re.compile(r'^(?P<file>.+?)\((?P<line>\d+),(?P<column>\d+)\): '
+                        r'(?P<category>error|warning|message) (?P<code>TS\d+): (?P<message>.*)$')
+GLOBAL_DIAGNOSTIC = re.compile(r'^(?P<category>error|warning|message) (?P<code>TS\d+): (?P<message>.*)$')
+
+
+@dataclass(frozen=True)
+class Diagnostic:
+    file: str
+    line: int
+    column: int
+    category: str
+    code: str
+    message: str
+
+    def format(self) -> str:
+        where = f"{self.file}({self.line},{self.column}): " if self.file else ''
+        return f"{where}{self.category} {self.code}: {self.message}"
+
+
+@dataclass
+class Shard:
+    index: int
+    files: List[str] = field(default_factory=list)
+    weight: int = 0  # bytes dos arquivos do shard
+    load: int = 0  # bytes que o tsc vai checar (fecho de dependências)
+    covered: int = 0  # bitset de SCCs já cobertos pelo fecho
+    diagnostics: List[Diagnostic] = field(default_factory=list)
+    seconds: float = 0.0
+    returncode: Optional[int] = None
+    error: Optional[str] = None
+
+
+def strongly_connected_components(graph: Dict[str, List[str]]) -> List[List[str]]:
+    """Tarjan iterativo; devolve os SCCs com as dependências antes dos dependentes"""
+    index: Dict[str, int] = {}
+    lowlink: Dict[str, int] = {}
+    on_stack: Set[str] = set()
+    stack: List[str] = []
+    components: List[List[str]] = []
+    counter = 0
+
+    for root in sorted(graph):
+        if root in index:
+            continue
+        work = [(root, iter(graph.get(root, ())))]
+        index[root] = lowlink[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+        while work:
+            node, children = work[-1]
+            advanced = False
+            for child in children:
+                if child not in index:
+                    index[child] = lowlink[child] = counter
+                    counter += 1
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(graph.get(child, ()))))
+                    advanced = True
+                    break
+                if child in on_stack:
+                    lowlink[node] = min(lowlink[node], index[child])
+            if advanced:
+                continue
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[node])
+            if lowlink[node] == index[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(sorted(component))
+    return components
+
+
+def parse_diagnostics(output: str, project_root: Path, cwd: Path) -> List[Diagnostic]:
+    """Lê a saída do tsc em ``--pretty false`` (linhas indentadas continuam a mensagem)"""
+    diagnostics: List[Diagnostic] = []
+    current: Optional[Dict] = None
+
+    def flush():
+        if current is not None:
+            diagnostics.append(Diagnostic(**current))
+
+    for raw in output.splitlines():
+        if current is not None and raw[:1] in (' ', '\t') and raw.strip():
+            current['message'] += '\n' + raw.rstrip()
+            continue
+        match = DIAGNOSTIC.match(raw.strip())
+        if match:
+            flush()
+            full_path = os.path.normpath(os.path.join(cwd, match.group('file')))
+            current = {
+                'file': os.path.relpath(full_path, project_root).replace('\\', '/'),
+                'line': int(match.group('line')),
+                'column': int(match.group('column')),
+                'category': match.group('category'),
+                'code': match.group('code'),
+                'message': match.group('message'),
+            }
+            continue
+        match = GLOBAL_DIAGNOSTIC.match(raw.strip())
+        if match:
+            flush()
+            current = {'file': '', 'line': 0, 'column': 0, 'category': match.group('category'),
+                       'code': match.group('code'), 'message': match.group('message')}
+            continue
+        flush()
+        current = None
+    flush()
+    return diagnostics
+
+
+class ShardedTypeChecker:
+    """Particiona o grafo de imports e roda um tsc por shard"""
+
+    def __init__(self, project_root: str, shards: Optional[int] = None, jobs: Optional[int] = None,
+                 compiler: Optional[List[str]] = None, base_config: str = DEFAULT_BASE_CONFIG,
+                 timeout: int = 900):
+        self.project_root = Path(project_root).resolve()
+        self.jobs = jobs or os.cpu_count() or 1
+        self.shard_count = shards or self.jobs
+        self.compiler = compiler or self.default_compiler()
+        self.base_config = base_config
+        self.timeout = timeout
+        self.graph: Dict[str, List[str]] = {}
+        self.sizes: Dict[str, int] = {}
+        self.ambient: List[str] = []
+        self.components: List[List[str]] = []
+        self.shards: List[Shard] = []
+        self.diagnostics: List[Diagnostic] = []
+        self.seconds = 0.0
+
+    def default_compiler(self) -> List[str]:
+        local = self.project_root / 'node_modules' / '.bin' / 'tsc'
+        if local.exists():
+            return [str(local)]
+        return ['npx', 'tsc']
+
+    # ------------------------------------------------------------------ grafo
+    def build_graph(self) -> None:
+        validator = ImportValidator(str(self.project_root)).build()
+        for path, facts in validator.facts.items():
+            deps = set()
+            for statement in list(facts.imports) + list(facts.reexports):
+                resolved = validator.resolver.resolve(path, statement['source'])
+                if resolved in validator.facts and resolved != path:
+                    deps.add(resolved)
+            self.graph[path] = sorted(deps)
+            try:
+                self.sizes[path] = os.path.getsize(self.project_root / path)
+            except OSError:
+                self.sizes[path] = 0
+            # .d.ts globais (sem import/export ou com declare module) entram em todos os shards
+            if path.endswith('.d.ts') and (facts.opaque or not (facts.imports or facts.exports or facts.reexports)):
+                self.ambient.append(path)
+
+    # -------------------------------------------------------------- partição
+    def partition(self) -> List[Shard]:
+        if not self.graph:
+            self.build_graph()
+        ambient = set(self.ambient)
+        self.components = [c for c in strongly_connected_components(self.graph)
+                           if not set(c) <= ambient]
+        component_of = {path: i for i, component in enumerate(self.components) for path in component}
+
+        # Fecho de dependências como bitset; Tarjan entrega as dependências primeiro
+        own = [sum(self.sizes[p] for p in component) for component in self.components]
+        closure = [0] * len(self.components)
+        for i, component in enumerate(self.components):
+            bits = 1 << i
+            for path in component:
+                for dep in self.graph[path]:
+                    j = component_of.get(dep)
+                    if j is not None and j != i:
+                        bits |= closure[j]
+            closure[i] = bits
+
+        def weight(bits: int) -> int:
+            total = 0
+            while bits:
+                low = bits & -bits
+                total += own[low.bit_length() - 1]
+                bits ^= low
+            return total
+
+        closure_weight = [weight(bits) for bits in closure]
+        shards = [Shard(i) for i in range(max(1, self.shard_count))]
+        # LPT: SCCs mais caros primeiro, no shard onde o custo final fica menor
+        for i in sorted(range(len(self.components)), key=lambda k: (-closure_weight[k], self.components[k][0])):
+            best, best_cost, best_extra = None, None, 0
+            for shard in shards:
+                extra = weight(closure[i] & ~shard.covered)
+                cost = shard.load + extra
+                if best_cost is None or cost < best_cost:
+                    best, best_cost, best_extra = shard, cost, extra
+            best.files.extend(self.components[i])
+            best.weight += own[i]
+            best.load += best_extra
+            best.covered |= closure[i]
+        self.shards = [shard for shard in shards if shard.files]
+        for shard in self.shards:
+            shard.files.sort()
+        return self.shards
+
+    # -------------------------------------------------------------- execução
+    @property
+    def shard_dir(self) -> Path:
+        return self.project_root / SHARD_DIR
+
+    def write_config(self, shard: Shard) -> Path:
+        self.shard_dir.mkdir(parents=True, exist_ok=True)
+        config_path = self.shard_dir / f'shard-{shard.index}.json'
+        config = {
+            'extends': str(self.project_root / self.base_config),
+            'compilerOptions': {
+                'noEmit': True,
+                'incremental': True,
+                'tsBuildInfoFile': str(self.shard_dir / f'shard-{shard.index}.tsbuildinfo'),
+            },
+            'files': [str(self.project_root / p) for p in sorted(set(shard.files) | set(self.ambient))],
+            'include': [],
+        }
+        with open(config_path, 'w', encoding='utf-8') as f:
+            json.dump(config, f, indent=2)
+        return config_path
+
+    def run_shard(self, shard: Shard) -> Shard:
+        config_path = self.write_config(shard)
+        command = self.compiler + ['-p', str(config_path), '--noEmit', '--incremental', '--pretty', 'false']
+        start = time.perf_counter()
+        try:
+            process = subprocess.run(command, cwd=self.project_root, capture_output=True,
+                                     text=True, timeout=self.timeout)
+        except subprocess.TimeoutExpired:
+            shard.error = f'Timeout após {self.timeout}s'
+        except OSError as e:
+            shard.error = f'Erro ao executar {command[0]}: {e}'
+        else:
+            shard.returncode = process.returncode
+            shard.diagnostics = parse_diagnostics(process.stdout + process.stderr,
+                                                  self.project_root, self.project_root)
+            if process.returncode != 0 and not shard.diagnostics:
+                tail = (process.stdout + process.stderr).strip().splitlines()[-5:]
+                shard.error = '\n'.join(tail) or f'código de saída {process.returncode}'
+        shard.seconds = time.perf_counter() - start
+        return shard
+
+    def run(self) -> List[Diagnostic]:
+        start = time.perf_counter()
+        if not self.shards:
+            self.partition()
+        with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            list(executor.map(self.run_shard, self.shards))
+        unique: Dict[Diagnostic, None] = {}
+        for shard in self.shards:
+            for diagnostic in shard.diagnostics:
+                unique.setdefault(diagnostic, None)
+        self.diagnostics = sorted(unique, key=lambda d: (d.file, d.line, d.column, d.code))
+        self.seconds = time.perf_counter() - start
+        return self.diagnostics
+
+    @property
+    def success(self) -> bool:
+        return not any(d.category == 'error' for d in self.diagnostics) and \
+            not any(shard.error for shard in self.shards)
+
+    def print_summary(self, limit: int = 30) -> None:
+        total = sum(self.sizes.values()) or 1
+        print(f"   🧩 {len(self.components)} SCCs em {len(self.shards)} shards "
+              f"({self.jobs} processos em paralelo)")
+        for shard in self.shards:
+            status = '❌' if shard.error or shard.diagnostics else '✅'
+            print(f"   {status} shard {shard.index}: {len(shard.files)} arquivos, "
+                  f"checa {shard.load / total:.0%} do código, {len(shard.diagnostics)} diagnósticos, "
+                  f"{shard.seconds:.1f}s")
+            if shard.error:
+                print(f"      ⚠️  {shard.error}")
+        overlap = sum(shard.load for shard in self.shards) / total
+        print(f"   🔁 Fecho somado dos shards: {overlap:.1f}x o código "
+              f"(maior shard: {max((s.load for s in self.shards), default=0) / total:.0%})")
+        duplicated = sum(len(s.diagnostics) for s in self.shards) - len(self.diagnostics)
+        print(f"   ⏱️  {self.seconds:.1f}s no total; {len(self.diagnostics)} diagnósticos únicos "
+              f"({duplicated} duplicados removidos)")
+        for diagnostic in self.diagnostics[:limit]:
+            print(f"      - {diagnostic.format()}")
+        if len(self.diagnostics) > limit:
+            print(f"      ... e mais {len(self.diagnostics) - limit} diagnósticos")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Checagem de tipos em shards paralelos (tsc --incremental)')
+    parser.add_argument('--project-dir', default='/workspace/doc-forge-buddy-Cain',
+                        help='Diretório do projeto')
+    parser.add_argument('--shards', type=int, default=None,
+                        help='Número de shards (padrão: número de processos)')
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='Processos tsc simultâneos (padrão: número de CPUs)')
+    parser.add_argument('--compiler', default=None,
+                        help='Comando do compilador, ex.: "python tools/python/tsc_stub.py" (caminhos '
+                             'relativos ao diretório atual; padrão: node_modules/.bin/tsc ou npx tsc)')
+    parser.add_argument('--base-config', default=DEFAULT_BASE_CONFIG,
+                        help='tsconfig estendido por cada shard')
+    parser.add_argument('--timeout', type=int, default=900,
+                        help='Tempo máximo por shard, em segundos')
+    args = parser.parse_args()
+
+    # O compilador roda com cwd na raiz do projeto: caminhos relativos valem a partir de onde
+    # a ferramenta foi chamada
+    compiler = [os.path.abspath(part) if not os.path.isabs(part) and os.path.exists(part) else part
+                for part in shlex.split(args.compiler)] if args.compiler else None
+    checker = ShardedTypeChecker(args.project_dir, shards=args.shards, jobs=args.jobs,
+                                 compiler=compiler, base_config=args.base_config, timeout=args.timeout)
+    print("🔍 Checando tipos em shards...")
+    checker.run()
+    checker.print_summary()
+    sys.exit(0 if checker.success else 1)
+
+
+if __name__ == "__main__":
+    main()
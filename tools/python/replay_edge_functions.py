@@ -0,0 +1,456 @@
+#!/usr/bin/env python3
+"""
+Benchmark por replay das Edge Functions do Supabase - Doc Forge Buddy
+Reproduz um corpus gravado de requisições (JSONL com method, path, headers e body)
+contra uma URL base, com chegadas em malha aberta: cada requisição sai no instante
+agendado, sem esperar as anteriores, e a latência é medida a partir desse instante
+(o tempo de fila conta). Com ``--rates`` o replay roda em estágios de taxa crescente
+para encontrar o ponto de saturação de cada endpoint.
+
+Registra, por endpoint (função + ``action``), a distribuição de latência, o tamanho
+dos payloads de requisição e resposta e os erros. ``--stand-in`` sobe o
+``edge_stub_server`` local com respostas prontas para testar o harness sem rede.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import string
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from http_pool import AsyncHTTPPool, HTTPError, LatencyHistogram, percentile
+
+FUNCTIONS_PREFIX = '/functions/v1/'
+THROUGHPUT_FLOOR = 0.9  # vazão abaixo de 90% da oferecida = saturado
+LATENCY_KNEE = 3.0  # p50 acima de 3x o do primeiro estágio = saturado
+ERROR_CEILING = 0.05
+
+SAMPLE_CORPUS = [
+    {'path': '/functions/v1/openai-proxy', 'body': {'action': 'correctText', 'data': {'text': 'Texto com erro de digitasao.'}}},
+    {'path': '/functions/v1/openai-proxy', 'body': {'action': 'chatCompletion', 'data': {
+        'messages': [{'role': 'user', 'content': 'Resuma o contrato 123 em três tópicos.'}]}}},
+    {'path': '/functions/v1/openai-proxy', 'body': {'action': 'generateDailySummary', 'data': {'tasks': ['Vistoria', 'Orçamento']}}},
+    {'path': '/functions/v1/prompt-analytics', 'body': {'action': 'get_analytics_dashboard', 'dateRange': '30d'}},
+    {'path': '/functions/v1/prompt-analytics', 'body': {'action': 'generate_heatmap', 'metricType': 'usage'}},
+    {'path': '/functions/v1/prompt-learning', 'body': {'action': 'log_learning_event', 'promptData': {
+        'actionType': 'prompt_created', 'userSatisfaction': 4}}},
+    {'path': '/functions/v1/prompt-learning', 'body': {'action': 'generate_recommendations'}},
+    {'path': '/functions/v1/send-email', 'body': {'to': 'locatario@example.com', 'subject': 'Aviso de vistoria',
+                                                  'htmlContent': '<p>' + 'Sua vistoria foi agendada. ' * 20 + '</p>'}},
+    {'path': '/functions/v1/upscale-image', 'body': {'action': 'create', 'imageUrl': 'https://example.com/foto.jpg'}},
+    {'path': '/functions/v1/upscale-image', 'body': {'action': 'status', 'predictionId': 'abc123'}},
+    {'path': '/functions/v1/check-notifications', 'body': {}},
+]
+
+
+@dataclass
+class CorpusEntry:
+    method: str
+    path: str
+    headers: Dict[str, str]
+    body: Optional[bytes]
+    endpoint: str
+
+
+@dataclass
+class EndpointStats:
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)  # desde a chegada agendada
+    service: LatencyHistogram = field(default_factory=LatencyHistogram)  # só envio -> último byte
+    request_bytes: List[int] = field(default_factory=list)
+    response_bytes: List[int] = field(default_factory=list)
+    errors: Counter = field(default_factory=Counter)
+    ok: int = 0
+
+    @property
+    def total(self) -> int:
+        return len(self.latency.samples)
+
+    @property
+    def error_rate(self) -> float:
+        return sum(self.errors.values()) / self.total if self.total else 0.0
+
+
+@dataclass
+class Stage:
+    rate: float
+    sent: int = 0
+    completed: int = 0
+    completed_in_window: int = 0  # respostas recebidas antes do fim da janela de chegadas
+    window: float = 0.0  # duração da janela de chegadas (s)
+    window_end: float = 0.0
+    arrivals: List[float] = field(default_factory=list)  # instantes de chegada (s) na janela
+    peak_in_flight: int = 0
+    endpoints: Dict[str, EndpointStats] = field(default_factory=lambda: defaultdict(EndpointStats))
+    overall: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    @property
+    def throughput(self) -> float:
+        """Respostas por segundo dentro da janela de chegadas (sem o esvaziamento final)"""
+        return self.completed_in_window / self.window if self.window else 0.0
+
+    @property
+    def errors(self) -> int:
+        return sum(sum(s.errors.values()) for s in self.endpoints.values())
+
+    @property
+    def mean_in_flight(self) -> float:
+        """Lei de Little: concorrência média = vazão x latência média"""
+        samples = self.overall.samples
+        return self.throughput * (sum(samples) / len(samples) / 1000) if samples else 0.0
+
+
+def endpoint_label(path: str, body) -> str:
+    name = path.split('?')[0]
+    name = name[len(FUNCTIONS_PREFIX):] if name.startswith(FUNCTIONS_PREFIX) else name.strip('/')
+    if isinstance(body, dict) and body.get('action'):
+        return f"{name}:{body['action']}"
+    return name
+
+
+def load_corpus(path: str) -> List[CorpusEntry]:
+    """Lê o JSONL; ``${VAR}`` em headers é trocado pela variável de ambiente"""
+    entries = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                print(f"⚠️  Linha {number} ignorada: {e}")
+                continue
+            body = record.get('body')
+            if isinstance(body, (dict, list)):
+                raw = json.dumps(body).encode('utf-8')
+            elif isinstance(body, str):
+                raw = body.encode('utf-8')
+            else:
+                raw = None
+            headers = {k: string.Template(str(v)).safe_substitute(os.environ)
+                       for k, v in (record.get('headers') or {}).items()}
+            if raw is not None and not any(k.lower() == 'content-type' for k in headers):
+                headers['Content-Type'] = 'application/json'
+            entries.append(CorpusEntry(
+                method=record.get('method', 'POST' if raw is not None else 'GET').upper(),
+                path=record['path'],
+                headers=headers,
+                body=raw,
+                endpoint=record.get('endpoint') or endpoint_label(record['path'], body),
+            ))
+    return entries
+
+
+def write_sample_corpus(path: str) -> None:
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        for record in SAMPLE_CORPUS:
+            f.write(json.dumps({
+                'method': 'POST',
+                'path': record['path'],
+                'headers': {'Authorization': 'Bearer ${SUPABASE_ANON_KEY}', 'apikey': '${SUPABASE_ANON_KEY}'},
+                'body': record['body'],
+            }, ensure_ascii=False) + '\n')
+
+
+class ReplayBenchmark:
+    """Replay em malha aberta, um estágio por taxa de chegada"""
+
+    def __init__(self, base_url: str, corpus: List[CorpusEntry], rates: List[float], stage_duration: float = 10.0,
+                 connections: int = 64, timeout: float = 60.0, arrival: str = 'poisson', shuffle: bool = True,
+                 seed: Optional[int] = None):
+        self.base_url = base_url.rstrip('/')
+        self.corpus = corpus
+        self.rates = rates
+        self.stage_duration = stage_duration
+        self.connections = connections
+        self.timeout = timeout
+        self.arrival = arrival
+        self.shuffle = shuffle
+        self.random = random.Random(seed)
+        self.stages: List[Stage] = []
+        self.pool: Optional[AsyncHTTPPool] = None
+        self._in_flight = 0
+
+    def _schedule(self, rate: float) -> List[float]:
+        """Instantes de chegada (s) dentro do estágio"""
+        times, t = [], 0.0
+        while True:
+            t += self.random.expovariate(rate) if self.arrival == 'poisson' else 1.0 / rate
+            if t >= self.stage_duration:
+                return times
+            times.append(t)
+
+    async def _send(self, stage: Stage, entry: CorpusEntry, scheduled: float) -> None:
+        self._in_flight += 1
+        stage.peak_in_flight = max(stage.peak_in_flight, self._in_flight)
+        stats = stage.endpoints[entry.endpoint]
+        stats.request_bytes.append(len(entry.body or b''))
+        try:
+            response = await self.pool.request(entry.method, entry.path, headers=entry.headers, body=entry.body)
+        except HTTPError as e:
+            stats.errors[str(e).split(':')[0]] += 1
+            response = None
+        finally:
+            self._in_flight -= 1
+        latency = (time.perf_counter() - scheduled) * 1000
+        stats.latency.add(latency)
+        stage.overall.add(latency)
+        stage.completed += 1
+        if time.perf_counter() <= stage.window_end:
+            stage.completed_in_window += 1
+        if response is None:
+            return
+        stats.service.add(response.elapsed * 1000)
+        stats.response_bytes.append(len(response.body))
+        if response.status >= 400:
+            stats.errors[f"HTTP {response.status}"] += 1
+        else:
+            stats.ok += 1
+
+    async def run_stage(self, rate: float) -> Stage:
+        stage = Stage(rate)
+        order = list(self.corpus)
+        if self.shuffle:
+            self.random.shuffle(order)
+        tasks = []
+        start = time.perf_counter()
+        stage.window = self.stage_duration
+        stage.window_end = start + self.stage_duration
+        for i, offset in enumerate(self._schedule(rate)):
+            scheduled = start + offset
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.ensure_future(self._send(stage, order[i % len(order)], scheduled)))
+            stage.arrivals.append(offset)
+            stage.sent += 1
+        await asyncio.gather(*tasks)
+        return stage
+
+    async def run(self) -> List[Stage]:
+        self.pool = AsyncHTTPPool(self.base_url, size=self.connections, timeout=self.timeout)
+        try:
+            for rate in self.rates:
+                stage = await self.run_stage(rate)
+                self.stages.append(stage)
+                summary = stage.overall.summary()
+                print(f"   ▶️  {rate:g} req/s: {stage.completed} respostas, vazão {stage.throughput:.1f} req/s, "
+                      f"p50 {summary['p50']:.0f}ms p99 {summary['p99']:.0f}ms, pico {stage.peak_in_flight} em voo, "
+                      f"{stage.errors} erros")
+        finally:
+            await self.pool.close()
+        return self.stages
+
+    # -------------------------------------------------------------- saturação
+    def _saturated(self, stage: Stage, baseline: Dict[str, float], p50: float, error_rate: float) -> bool:
+        # Vazão medida só dentro da janela de chegadas: conta as respostas recebidas na
+        # janela contra as chegadas que, com a latência do primeiro estágio (p99), já
+        # deveriam ter voltado nela; o esvaziamento depois da janela não é perda de vazão
+        cutoff = self.stage_duration - baseline['p99'] / 1000
+        due = sum(1 for offset in stage.arrivals if offset <= cutoff)
+        return ((due > 0 and stage.completed_in_window < THROUGHPUT_FLOOR * due)
+                or (baseline['p50'] > 0 and p50 > LATENCY_KNEE * baseline['p50'])
+                or error_rate > ERROR_CEILING)
+
+    def saturation_point(self) -> Optional[Stage]:
+        if not self.stages:
+            return None
+        baseline = self.stages[0].overall.summary()
+        for stage in self.stages:
+            total = stage.completed or 1
+            if self._saturated(stage, baseline, stage.overall.summary()['p50'], stage.errors / total):
+                return stage
+        return None
+
+    def endpoint_saturation(self) -> Dict[str, Optional[float]]:
+        """Primeira taxa em que o p50 do endpoint passa do joelho ou os erros do teto"""
+        result: Dict[str, Optional[float]] = {}
+        for name in sorted({n for s in self.stages for n in s.endpoints}):
+            baseline = None
+            result[name] = None
+            for stage in self.stages:
+                stats = stage.endpoints.get(name)
+                if not stats or not stats.total:
+                    continue
+                p50 = stats.latency.summary()['p50']
+                baseline = baseline or p50
+                if p50 > LATENCY_KNEE * baseline or stats.error_rate > ERROR_CEILING:
+                    result[name] = stage.rate
+                    break
+        return result
+
+    def combined(self) -> Dict[str, EndpointStats]:
+        merged: Dict[str, EndpointStats] = defaultdict(EndpointStats)
+        for stage in self.stages:
+            for name, stats in stage.endpoints.items():
+                target = merged[name]
+                target.latency.samples.extend(stats.latency.samples)
+                target.service.samples.extend(stats.service.samples)
+                target.request_bytes.extend(stats.request_bytes)
+                target.response_bytes.extend(stats.response_bytes)
+                target.errors.update(stats.errors)
+                target.ok += stats.ok
+        return merged
+
+    # ---------------------------------------------------------------- relatório
+    def generate_report(self, output_file: str) -> None:
+        knee = self.saturation_point()
+        healthy = [s for s in self.stages if knee is None or s.rate < knee.rate]
+        report = f"""# Benchmark das Edge Functions (replay)
+
+**Data da análise:** {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}
+**Alvo:** {self.base_url}
+**Corpus:** {len(self.corpus)} requisições, {len({e.endpoint for e in self.corpus})} endpoints
+**Chegadas:** {self.arrival}, {self.stage_duration:g}s por estágio, até {self.connections} conexões
+
+## 📊 Estágios de Carga
+
+| Taxa oferecida (req/s) | Enviadas | Vazão na janela (req/s) | p50 (ms) | p95 (ms) | p99 (ms) | Pico em voo | Concorrência média | Erros |
+|------------------------|----------|-------------------------|----------|----------|----------|-------------|--------------------|-------|
+"""
+        for stage in self.stages:
+            summary = stage.overall.summary()
+            marker = ' 🔴' if knee is stage else ''
+            report += (f"| {stage.rate:g}{marker} | {stage.sent} | {stage.throughput:.1f} | {summary['p50']:.0f} | "
+                       f"{summary['p95']:.0f} | {summary['p99']:.0f} | {stage.peak_in_flight} | "
+                       f"{stage.mean_in_flight:.1f} | {stage.errors} |\n")
+
+        if knee is not None:
+            capacity = healthy[-1] if healthy else None
+            report += f"\n**Ponto de saturação:** {knee.rate:g} req/s"
+            if capacity:
+                report += (f" — última taxa saudável {capacity.rate:g} req/s, com ~{capacity.mean_in_flight:.0f} "
+                           f"requisições em voo em média")
+            report += "\n"
+        else:
+            report += "\n**Ponto de saturação:** não atingido nas taxas testadas\n"
+
+        endpoint_knees = self.endpoint_saturation()
+        report += """
+## 📊 Latência por Endpoint (todos os estágios)
+
+| Endpoint | Requisições | OK | p50 (ms) | p95 (ms) | p99 (ms) | Serviço p50 (ms) | Satura em (req/s) | Erros |
+|----------|-------------|----|----------|----------|----------|------------------|-------------------|-------|
+"""
+        merged = self.combined()
+        for name, stats in sorted(merged.items(), key=lambda item: -item[1].latency.summary()['p99']):
+            summary = stats.latency.summary()
+            knee_rate = endpoint_knees.get(name)
+            errors = ', '.join(f"{k} ({v})" for k, v in stats.errors.most_common(3)) or '-'
+            report += (f"| `{name}` | {stats.total} | {stats.ok} | {summary['p50']:.0f} | {summary['p95']:.0f} | "
+                       f"{summary['p99']:.0f} | {stats.service.summary()['p50']:.0f} | "
+                       f"{f'{knee_rate:g}' if knee_rate else '-'} | {errors} |\n")
+
+        report += """
+## 📊 Tamanho dos Payloads
+
+| Endpoint | Requisição média (B) | Requisição máx (B) | Resposta média (B) | Resposta p95 (B) | Resposta máx (B) |
+|----------|----------------------|--------------------|--------------------|------------------|------------------|
+"""
+        for name, stats in sorted(merged.items()):
+            req, resp = stats.request_bytes, sorted(stats.response_bytes)
+            report += (f"| `{name}` | {sum(req) / len(req) if req else 0:.0f} | {max(req, default=0)} | "
+                       f"{sum(resp) / len(resp) if resp else 0:.0f} | {percentile(resp, 0.95):.0f} | "
+                       f"{max(resp, default=0)} |\n")
+
+        report += "\n## 📊 Histogramas por Estágio\n\n"
+        for stage in self.stages:
+            if stage.overall.samples:
+                report += f"### {stage.rate:g} req/s\n\n```\n{stage.overall.render()}\n```\n\n"
+
+        slowest = max(merged.items(), key=lambda item: item[1].service.summary()['p50'], default=None)
+        report += """## 💡 Recomendações
+
+1. **Dimensione pela última taxa saudável**, não pelo pico: acima dela a fila cresce e o p99 dispara
+2. **Endpoints que saturam primeiro** (coluna "Satura em") são candidatos a cache, fila assíncrona ou limite de taxa no cliente
+3. **Latência total muito acima do tempo de serviço** indica fila (conexões ou workers da função), não lentidão da função
+"""
+        if slowest:
+            report += (f"4. **`{slowest[0]}` tem o maior tempo de serviço**: respostas longas podem usar streaming "
+                       f"para reduzir o tempo até o primeiro byte\n")
+        report += """5. **Payloads grandes** de resposta pedem paginação ou campos sob demanda; os de requisição (HTML de e-mail, imagens) podem ir por URL
+6. **Grave o corpus a partir de tráfego real** (método, path, headers e body) para que o mix de endpoints reflita o uso
+
+---
+*Relatório gerado automaticamente pelo Benchmark de Replay das Edge Functions*
+"""
+        os.makedirs(os.path.dirname(os.path.abspath(output_file)), exist_ok=True)
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(report)
+        print(f"\n📄 Relatório salvo em: {output_file}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark por replay das Edge Functions do Supabase')
+    parser.add_argument('--corpus', default=None, help='JSONL com method, path, headers e body')
+    parser.add_argument('--write-sample-corpus', default=None, metavar='ARQUIVO',
+                        help='Grava um corpus de exemplo com as seis funções e sai')
+    parser.add_argument('--base-url', default=os.environ.get('SUPABASE_URL') or os.environ.get('VITE_SUPABASE_URL'),
+                        help='URL base (padrão: SUPABASE_URL)')
+    parser.add_argument('--rates', default='2,5,10,20,40', help='Taxas de chegada por estágio (req/s)')
+    parser.add_argument('--stage-duration', type=float, default=10.0, help='Duração de cada estágio (s)')
+    parser.add_argument('--arrival', choices=('poisson', 'uniform'), default='poisson',
+                        help='Processo de chegada')
+    parser.add_argument('--connections', type=int, default=64, help='Conexões keep-alive no pool')
+    parser.add_argument('--timeout', type=float, default=60.0, help='Timeout por requisição (s)')
+    parser.add_argument('--seed', type=int, default=None, help='Semente para chegadas e embaralhamento')
+    parser.add_argument('--stand-in', action='store_true', help='Sobe o stand-in local e usa-o como alvo')
+    parser.add_argument('--stand-in-workers', type=int, default=16, help='Capacidade do stand-in')
+    parser.add_argument('--stand-in-error-rate', type=float, default=0.0,
+                        help='Fração de respostas 500 simuladas pelo stand-in')
+    parser.add_argument('--stand-in-delays', default='', help='Atrasos do stand-in, ex.: openai-proxy=800')
+    parser.add_argument('--output', default='docs/benchmark_edge_functions.md',
+                        help='Arquivo de saída do relatório')
+    args = parser.parse_args()
+
+    if args.write_sample_corpus:
+        write_sample_corpus(args.write_sample_corpus)
+        print(f"📝 Corpus de exemplo gravado em {args.write_sample_corpus}")
+        return
+
+    server = None
+    if args.stand_in:
+        from edge_stub_server import start_in_thread, parse_delays
+        server = start_in_thread(workers=args.stand_in_workers, delays_ms=parse_delays(args.stand_in_delays),
+                                 error_rate=args.stand_in_error_rate)
+        args.base_url = server.url
+        os.environ.setdefault('SUPABASE_ANON_KEY', 'stand-in-key')
+    if not args.base_url:
+        print("❌ Defina SUPABASE_URL, use --base-url ou --stand-in")
+        sys.exit(2)
+
+    if args.corpus:
+        corpus = load_corpus(args.corpus)
+    else:
+        sample_path = os.path.join(tempfile.gettempdir(), 'doc-forge-edge_functions_corpus.jsonl')
+        write_sample_corpus(sample_path)
+        print(f"📝 Sem --corpus: usando o corpus de exemplo ({sample_path})")
+        corpus = load_corpus(sample_path)
+    if not corpus:
+        print("❌ Corpus vazio")
+        sys.exit(2)
+
+    rates = [float(r) for r in args.rates.split(',') if r.strip()]
+    benchmark = ReplayBenchmark(args.base_url, corpus, rates, stage_duration=args.stage_duration,
+                                connections=args.connections, timeout=args.timeout, arrival=args.arrival,
+                                seed=args.seed)
+    print(f"🚀 Replay de {len(corpus)} requisições em {args.base_url} ({len(rates)} estágios)")
+    asyncio.run(benchmark.run())
+    benchmark.generate_report(args.output)
+    knee = benchmark.saturation_point()
+    print(f"🔴 Saturação em {knee.rate:g} req/s" if knee else "✅ Sem saturação nas taxas testadas")
+    if server:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
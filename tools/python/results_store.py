@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Armazém de resultados das análises - Doc Forge Buddy
+Banco SQLite (só biblioteca padrão) em ``node_modules/.cache/doc-forge-tools`` onde as
+ferramentas gravam o que calculam, para que execuções seguintes e outras ferramentas
+possam reaproveitar os dados:
+
+- ``files`` / ``functions``: complexidade por arquivo e por função (ciclomática,
+  cognitiva e aninhamento máximo, nome qualificado e impressão digital do corpo), com
+  data de modificação e tamanho do arquivo; só arquivos alterados precisam ser reanalisados
+- ``runs``: cada execução de uma ferramenta (nome, data, metadados em JSON)
+- ``coverage_functions``: junção cobertura x complexidade de cada execução
+- ``baseline_functions``: cópia das funções no momento de uma baseline, para comparação
+
+Caminhos são gravados relativos à raiz do projeto.
+"""
+
+import json
+import os
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+STORE_FILE = 'node_modules/.cache/doc-forge-tools/results.sqlite'
+SCHEMA_VERSION = 3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    total_complexity REAL NOT NULL,
+    average_complexity REAL NOT NULL,
+    lines_of_code INTEGER NOT NULL,
+    is_component INTEGER NOT NULL,
+    category TEXT NOT NULL,
+    analyzed_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS functions (
+    path TEXT NOT NULL REFERENCES files(path) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    function_type TEXT NOT NULL,
+    line_start INTEGER NOT NULL,
+    line_end INTEGER NOT NULL,
+    complexity REAL NOT NULL,
+    breakdown TEXT NOT NULL,
+    cognitive_complexity INTEGER NOT NULL DEFAULT 0,
+    max_nesting INTEGER NOT NULL DEFAULT 0,
+    qualified_name TEXT NOT NULL DEFAULT '',
+    fingerprint TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS functions_path ON functions(path);
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    tool TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    meta TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS coverage_functions (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    path TEXT NOT NULL,
+    name TEXT NOT NULL,
+    line_start INTEGER NOT NULL,
+    line_end INTEGER NOT NULL,
+    complexity REAL NOT NULL,
+    lines_found INTEGER NOT NULL,
+    lines_hit INTEGER NOT NULL,
+    branches_found INTEGER NOT NULL,
+    branches_hit INTEGER NOT NULL,
+    uncovered_branches INTEGER NOT NULL,
+    estimated INTEGER NOT NULL,
+    score REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS coverage_functions_run ON coverage_functions(run_id, score);
+CREATE TABLE IF NOT EXISTS baseline_functions (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    path TEXT NOT NULL,
+    name TEXT NOT NULL,
+    qualified_name TEXT NOT NULL,
+    function_type TEXT NOT NULL,
+    line_start INTEGER NOT NULL,
+    line_end INTEGER NOT NULL,
+    complexity REAL NOT NULL,
+    cognitive_complexity INTEGER NOT NULL,
+    max_nesting INTEGER NOT NULL,
+    fingerprint TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS baseline_functions_run ON baseline_functions(run_id);
+"""
+BASELINE_COLUMNS = ('path', 'name', 'qualified_name', 'function_type', 'line_start', 'line_end',
+                    'complexity', 'cognitive_complexity', 'max_nesting', 'fingerprint')
+
+
+class ResultsStore:
+    """Acesso ao banco de resultados de um projeto"""
+
+    def __init__(self, project_root: str, path: Optional[str] = None):
+        self.project_root = Path(project_root).resolve()
+        self.path = Path(path) if path else self.project_root / STORE_FILE
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(str(self.path))
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute('PRAGMA foreign_keys = ON')
+        self.connection.execute('PRAGMA journal_mode = WAL')
+        self.connection.execute('PRAGMA synchronous = NORMAL')
+        self._migrate()
+
+    def _migrate(self) -> None:
+        version = self.connection.execute('PRAGMA user_version').fetchone()[0]
+        if version != SCHEMA_VERSION:
+            # Cache descartável: esquema antigo é recriado em vez de migrado
+            tables = [row[0] for row in self.connection.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'")]
+            for table in tables:
+                self.connection.execute(f'DROP TABLE IF EXISTS {table}')
+        self.connection.executescript(SCHEMA)
+        self.connection.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+        self.connection.commit()
+
+    def relative(self, file_path: str) -> str:
+        """Chave do arquivo: caminho relativo à raiz do projeto (``src/...``)"""
+        path = Path(file_path)
+        if not path.is_absolute() and (self.project_root / path).exists():
+            return path.as_posix()  # já relativo ao projeto
+        # Relativo ao diretório atual (``--project-dir ../projeto``): resolvido antes de cortar a raiz
+        try:
+            return path.resolve().relative_to(self.project_root).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self) -> 'ResultsStore':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ------------------------------------------------------------ complexidade
+    def stale_files(self, file_paths: Iterable[str]) -> List[str]:
+        """Arquivos sem resultado gravado ou alterados desde a última análise"""
+        known = {row['path']: (row['mtime_ns'], row['size'])
+                 for row in self.connection.execute('SELECT path, mtime_ns, size FROM files')}
+        stale = []
+        for file_path in file_paths:
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                continue
+            if known.get(self.relative(file_path)) != (stat.st_mtime_ns, stat.st_size):
+                stale.append(file_path)
+        return stale
+
+    def save_file_complexity(self, results: Iterable) -> int:
+        """Grava ``FileComplexity`` (e as funções) substituindo o resultado anterior"""
+        now = datetime.now().isoformat(timespec='seconds')
+        saved = 0
+        with self.connection:
+            for result in results:
+                try:
+                    stat = os.stat(result.file_path)
+                except OSError:
+                    continue
+                path = self.relative(result.file_path)
+                self.connection.execute('DELETE FROM files WHERE path = ?', (path,))
+                self.connection.execute(
+                    'INSERT INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                    (path, stat.st_mtime_ns, stat.st_size, result.total_complexity, result.average_complexity,
+                     result.lines_of_code, int(bool(result.is_component)), result.category, now))
+                self.connection.executemany(
+                    'INSERT INTO functions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                    [(path, f.name, f.function_type, f.line_start, f.line_end, f.complexity,
+                      json.dumps(f.complexity_breakdown), f.cognitive_complexity, f.max_nesting,
+                      f.qualified_name, f.fingerprint)
+                     for f in result.functions])
+                saved += 1
+        return saved
+
+    def load_files(self, file_paths: Iterable[str]) -> Dict[str, Dict]:
+        """Resultado por arquivo (caminho relativo) dos que já foram analisados"""
+        wanted = {self.relative(p) for p in file_paths}
+        return {row['path']: dict(row) for row in self.connection.execute('SELECT * FROM files')
+                if row['path'] in wanted}
+
+    def load_functions(self, file_paths: Iterable[str]) -> Dict[str, List[Dict]]:
+        """Funções gravadas por caminho relativo, ordenadas pela linha inicial"""
+        wanted = {self.relative(p) for p in file_paths}
+        functions: Dict[str, List[Dict]] = {path: [] for path in wanted}
+        for row in self.connection.execute('SELECT * FROM functions ORDER BY path, line_start'):
+            if row['path'] in wanted:
+                entry = dict(row)
+                entry['breakdown'] = json.loads(entry['breakdown'])
+                functions[row['path']].append(entry)
+        return functions
+
+    # ------------------------------------------------------------- execuções
+    def start_run(self, tool: str, meta: Optional[Dict] = None) -> int:
+        with self.connection:
+            cursor = self.connection.execute(
+                'INSERT INTO runs (tool, created_at, meta) VALUES (?, ?, ?)',
+                (tool, datetime.now().isoformat(timespec='seconds'), json.dumps(meta or {})))
+        return cursor.lastrowid
+
+    def latest_run(self, tool: str, before: Optional[int] = None) -> Optional[Dict]:
+        query = 'SELECT * FROM runs WHERE tool = ?' + (' AND id < ?' if before else '') + ' ORDER BY id DESC LIMIT 1'
+        row = self.connection.execute(query, (tool, before) if before else (tool,)).fetchone()
+        if row is None:
+            return None
+        run = dict(row)
+        run['meta'] = json.loads(run['meta'])
+        return run
+
+    def prune_runs(self, tool: str, keep: int = 20) -> None:
+        """Mantém só as ``keep`` execuções mais recentes de uma ferramenta"""
+        with self.connection:
+            self.connection.execute(
+                'DELETE FROM runs WHERE tool = ? AND id NOT IN '
+                '(SELECT id FROM runs WHERE tool = ? ORDER BY id DESC LIMIT ?)', (tool, tool, keep))
+
+    # --------------------------------------------------------------- cobertura
+    def save_coverage_functions(self, run_id: int, rows: Iterable[Dict]) -> None:
+        columns = ('path', 'name', 'line_start', 'line_end', 'complexity', 'lines_found', 'lines_hit',
+                   'branches_found', 'branches_hit', 'uncovered_branches', 'estimated', 'score')
+        with self.connection:
+            self.connection.executemany(
+                f"INSERT INTO coverage_functions (run_id, {', '.join(columns)}) "
+                f"VALUES (?, {', '.join('?' for _ in columns)})",
+                [(run_id, *(row[c] for c in columns)) for row in rows])
+
+    def coverage_functions(self, run_id: int, limit: Optional[int] = None) -> List[Dict]:
+        query = 'SELECT * FROM coverage_functions WHERE run_id = ? ORDER BY score DESC, complexity DESC'
+        if limit:
+            query += f' LIMIT {int(limit)}'
+        return [dict(row) for row in self.connection.execute(query, (run_id,))]
+
+    # ---------------------------------------------------------------- baseline
+    def save_baseline_functions(self, run_id: int, file_paths: Iterable[str]) -> int:
+        """Copia as funções atuais dos arquivos para a baseline ``run_id``"""
+        wanted = {self.relative(p) for p in file_paths}
+        columns = ', '.join(BASELINE_COLUMNS)
+        rows = [row for row in self.connection.execute(f'SELECT {columns} FROM functions')
+                if row['path'] in wanted]
+        with self.connection:
+            self.connection.executemany(
+                f"INSERT INTO baseline_functions (run_id, {columns}) "
+                f"VALUES (?, {', '.join('?' for _ in BASELINE_COLUMNS)})",
+                [(run_id, *row) for row in rows])
+        return len(rows)
+
+    def baseline_functions(self, run_id: int) -> List[Dict]:
+        return [dict(row) for row in self.connection.execute(
+            'SELECT * FROM baseline_functions WHERE run_id = ? ORDER BY path, line_start', (run_id,))]
@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+Extração de queries Supabase e do schema das migrations
+Fornece as cadeias ``supabase.from(...).select().eq()...`` de cada arquivo (com
+colunas de filtro e ordenação) e o catálogo de tabelas/índices de supabase/migrations
+"""
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from ts_tokenizer import Token, string_value, matching_brackets
+
+# Filtros que um índice btree atende por igualdade
+EQUALITY_FILTERS = {'eq', 'in', 'is', 'match'}
+# Filtros de intervalo (atendidos pela coluna seguinte às de igualdade)
+RANGE_FILTERS = {'gt', 'gte', 'lt', 'lte'}
+# Filtros que um btree comum não atende
+TEXT_FILTERS = {'like', 'ilike', 'textSearch', 'contains', 'containedBy', 'overlaps', 'neq', 'not',
+                'likeAllOf', 'likeAnyOf', 'ilikeAllOf', 'ilikeAnyOf'}
+OPERATIONS = {'select', 'insert', 'update', 'upsert', 'delete'}
+# Operadores usados dentro de .or('col.op.valor,...')
+_OR_FILTER = re.compile(r'(?:^|[,(])\s*([A-Za-z_][\w]*)\.(eq|neq|gt|gte|lt|lte|like|ilike|is|in|cs|cd|fts)\.')
+
+
+@dataclass
+class QueryCall:
+    method: str
+    args: str
+    first_arg: Optional[str]
+    line: int
+
+
+@dataclass
+class QueryChain:
+    file_path: str
+    line: int
+    table: str
+    calls: List[QueryCall] = field(default_factory=list)
+    variable: Optional[str] = None
+    token_start: int = 0
+    token_end: int = 0
+
+    @property
+    def operation(self) -> str:
+        for call in self.calls:
+            if call.method in ('insert', 'update', 'upsert', 'delete'):
+                return call.method
+        return 'select'
+
+    @property
+    def selected_columns(self) -> Optional[str]:
+        """Argumento de ``.select()`` (None se não houver select)"""
+        for call in self.calls:
+            if call.method == 'select':
+                return call.first_arg if call.first_arg is not None else ('*' if not call.args.strip() else None)
+        return None
+
+    def filters(self) -> List[Tuple[str, str]]:
+        """(coluna, operador) de todos os filtros da cadeia"""
+        found = []
+        for call in self.calls:
+            method = call.method
+            if method in EQUALITY_FILTERS | RANGE_FILTERS | TEXT_FILTERS and method != 'match':
+                if call.first_arg:
+                    column = call.first_arg.split('->')[0].strip()
+                    found.append((column, method))
+            elif method == 'match':
+                for column in re.findall(r'([A-Za-z_]\w*)\s*:', call.args):
+                    found.append((column, 'eq'))
+            elif method == 'filter' and call.first_arg:
+                op = re.search(r",\s*['\"](\w+)['\"]", call.args)
+                found.append((call.first_arg, op.group(1) if op else 'eq'))
+            elif method == 'or':
+                for column, op in _OR_FILTER.findall(call.args):
+                    found.append((column, 'or:' + op))
+        return found
+
+    def equality_columns(self) -> Tuple[str, ...]:
+        return tuple(sorted({c for c, op in self.filters() if op in EQUALITY_FILTERS}))
+
+    def range_columns(self) -> Tuple[str, ...]:
+        return tuple(sorted({c for c, op in self.filters() if op in RANGE_FILTERS}))
+
+    def order_columns(self) -> Tuple[str, ...]:
+        return tuple(call.first_arg for call in self.calls if call.method == 'order' and call.first_arg)
+
+    def text_columns(self) -> Tuple[str, ...]:
+        return tuple(sorted({c for c, op in self.filters()
+                             if op in TEXT_FILTERS or op.startswith('or:')}))
+
+
+def _call_args(tokens: List[Token], source: str, open_index: int, close_index: int) -> Tuple[str, Optional[str]]:
+    args = source[tokens[open_index].end:tokens[close_index].start] if close_index > open_index + 1 else ''
+    first = string_value(tokens[open_index + 1]) if close_index > open_index + 1 else None
+    if first is not None and open_index + 2 < close_index and tokens[open_index + 2].value not in (',', ')'):
+        first = None  # 'a' + b: argumento não literal
+    return args, first
+
+
+def repository_table(source: str) -> Optional[str]:
+    """Tabela de um repositório derivado de BaseRepository (``super('tabela', ...)``)"""
+    match = re.search(r'\bsuper\(\s*[\'"](\w+)[\'"]', source)
+    return match.group(1) if match else None
+
+
+def extract_query_chains(file_path: str, tokens: List[Token], source: str,
+                         brackets: Optional[List[int]] = None) -> List[QueryChain]:
+    """Encontra ``.from('tabela')`` e segue a cadeia de chamadas, inclusive por variável
+    (``let query = supabase.from(...)``; ``query = query.eq(...)``).
+    ``.from(this.tableName)`` usa a tabela passada a ``super()`` no mesmo arquivo"""
+    brackets = brackets if brackets is not None else matching_brackets(tokens)
+    own_table = repository_table(source)
+    n = len(tokens)
+    chains: List[QueryChain] = []
+    by_variable: Dict[str, QueryChain] = {}
+
+    def follow(chain: QueryChain, j: int) -> int:
+        """Consome ``.metodo(...)`` a partir de ``j``; retorna o índice após a cadeia"""
+        while j + 2 < n and tokens[j].value in ('.', '?.') and tokens[j + 1].kind == 'name':
+            k = j + 2
+            if tokens[k].value == '<':
+                depth = 0
+                while k < n:
+                    depth += tokens[k].value == '<'
+                    depth -= tokens[k].value == '>'
+                    k += 1
+                    if depth == 0:
+                        break
+            if k >= n or tokens[k].value != '(' or brackets[k] < 0:
+                break
+            args, first = _call_args(tokens, source, k, brackets[k])
+            chain.calls.append(QueryCall(tokens[j + 1].value, args, first, tokens[j + 1].line))
+            j = brackets[k] + 1
+        chain.token_end = j
+        return j
+
+    i = 0
+    while i < n - 3:
+        token = tokens[i]
+        if token.kind == 'name' and token.value == 'from' and i and tokens[i - 1].value in ('.', '?.') \
+                and tokens[i + 1].value == '(' and tokens[i - 2].value not in ('Array', 'Buffer', 'storage'):
+            table = string_value(tokens[i + 2])
+            close = brackets[i + 1]
+            if table is None and own_table and close == i + 6 and tokens[i + 2].value == 'this' \
+                    and tokens[i + 4].value == 'tableName':
+                table = own_table
+            if table is None or close < 0:
+                i += 1
+                continue
+            # Início da expressão (cliente) para achar a variável que recebe a query
+            k = i - 1
+            while k >= 1 and tokens[k].value in ('.', '?.') and tokens[k - 1].kind == 'name':
+                k -= 2
+            start = k + 1
+            variable = None
+            if k >= 0 and tokens[k].value == 'await':
+                k -= 1
+            if k >= 1 and tokens[k].value == '=' and tokens[k - 1].kind == 'name':
+                variable = tokens[k - 1].value
+            chain = QueryChain(file_path, token.line, table, variable=variable, token_start=start)
+            i = follow(chain, close + 1)
+            chains.append(chain)
+            if variable:
+                by_variable[variable] = chain
+            continue
+
+        # Continuação por variável: query = query.eq(...) / await query.order(...)
+        if token.kind == 'name' and token.value in by_variable and i + 1 < n \
+                and tokens[i + 1].value in ('.', '?.') and (i == 0 or tokens[i - 1].value not in ('.', '?.')):
+            chain = by_variable[token.value]
+            before = len(chain.calls)
+            end = chain.token_end
+            nxt = follow(chain, i + 1)
+            chain.token_end = max(end, nxt)
+            if len(chain.calls) > before:
+                i = nxt
+                continue
+        if token.kind == 'name' and token.value in ('const', 'let', 'var') and i + 1 < n:
+            by_variable.pop(tokens[i + 1].value, None)
+        i += 1
+    return chains
+
+
+# ---------------------------------------------------------------------- schema
+@dataclass
+class IndexDef:
+    name: str
+    table: str
+    columns: Tuple[str, ...]
+    unique: bool = False
+    method: str = 'btree'
+    partial: bool = False
+    source: str = ''
+
+
+@dataclass
+class TableDef:
+    name: str
+    columns: List[str] = field(default_factory=list)
+    defined: bool = False  # CREATE TABLE presente nas migrations
+    source: str = ''
+
+
+def _split_top_level(text: str, separator: str = ',') -> List[str]:
+    parts, depth, current = [], 0, []
+    for char in text:
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        if char == separator and depth == 0:
+            parts.append(''.join(current).strip())
+            current = []
+        else:
+            current.append(char)
+    if ''.join(current).strip():
+        parts.append(''.join(current).strip())
+    return parts
+
+
+def _identifier(text: str) -> str:
+    """'public."Tabela"' -> 'tabela'; remove schema e aspas"""
+    name = text.strip().split('.')[-1]
+    return name.strip('"').lower() if name.startswith('"') else name.lower()
+
+
+def _index_columns(text: str) -> Tuple[str, ...]:
+    columns = []
+    for part in _split_top_level(text):
+        match = re.match(r'"?([A-Za-z_]\w*)"?(?:\s+(?:ASC|DESC|NULLS\s+\w+|\w+_ops))*\s*$', part, re.I)
+        columns.append(match.group(1).lower() if match else part.strip())
+    return tuple(columns)
+
+
+class SchemaCatalog:
+    """Tabelas e índices declarados nas migrations SQL"""
+
+    def __init__(self):
+        self.tables: Dict[str, TableDef] = {}
+        self.indexes: Dict[str, IndexDef] = {}
+
+    def table(self, name: str) -> TableDef:
+        if name not in self.tables:
+            self.tables[name] = TableDef(name)
+        return self.tables[name]
+
+    def add_index(self, index: IndexDef) -> None:
+        self.indexes[index.name] = index
+        self.table(index.table)
+
+    def indexes_for(self, table: str) -> List[IndexDef]:
+        return [index for index in self.indexes.values() if index.table == table]
+
+    @staticmethod
+    def _statements(sql: str) -> List[str]:
+        sql = re.sub(r'\$(\w*)\$[\s\S]*?\$\1\$', "''", sql)  # corpos de função
+        sql = re.sub(r'--[^\n]*|/\*[\s\S]*?\*/', ' ', sql)
+        return [s.strip() for s in sql.split(';') if s.strip()]
+
+    def _parse_create_table(self, statement: str, source: str) -> None:
+        match = re.match(r'CREATE\s+(?:UNLOGGED\s+|TEMP(?:ORARY)?\s+)?TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?'
+                         r'([\w."]+)\s*\(([\s\S]*)\)', statement, re.I)
+        if not match:
+            return
+        table = self.table(_identifier(match.group(1)))
+        table.defined = True
+        table.source = source
+        for part in _split_top_level(match.group(2)):
+            upper = part.upper()
+            constraint = re.match(r'(?:CONSTRAINT\s+\S+\s+)?(PRIMARY\s+KEY|UNIQUE)\s*\(([^)]*)\)', part, re.I)
+            if constraint:
+                columns = _index_columns(constraint.group(2))
+                kind = 'pkey' if 'PRIMARY' in constraint.group(1).upper() else 'key'
+                self.add_index(IndexDef(f"{table.name}_{'_'.join(columns)}_{kind}", table.name, columns,
+                                        unique=True, source=source))
+                continue
+            if upper.startswith(('CONSTRAINT', 'FOREIGN KEY', 'CHECK', 'EXCLUDE')):
+                continue
+            column = _identifier(part.split()[0])
+            table.columns.append(column)
+            if 'PRIMARY KEY' in upper:
+                self.add_index(IndexDef(f"{table.name}_pkey", table.name, (column,), unique=True, source=source))
+            elif re.search(r'\bUNIQUE\b', upper):
+                self.add_index(IndexDef(f"{table.name}_{column}_key", table.name, (column,), unique=True,
+                                        source=source))
+
+    def _parse_alter_table(self, statement: str, source: str) -> None:
+        match = re.match(r'ALTER\s+TABLE\s+(?:IF\s+EXISTS\s+)?(?:ONLY\s+)?([\w."]+)\s+([\s\S]*)', statement, re.I)
+        if not match:
+            return
+        table = self.table(_identifier(match.group(1)))
+        for action in _split_top_level(match.group(2)):
+            column = re.match(r'ADD\s+(?:COLUMN\s+)?(?:IF\s+NOT\s+EXISTS\s+)?"?(\w+)"?\s+([\s\S]*)', action, re.I)
+            constraint = re.match(r'ADD\s+(?:CONSTRAINT\s+(\S+)\s+)?(PRIMARY\s+KEY|UNIQUE)\s*\(([^)]*)\)',
+                                  action, re.I)
+            if constraint:
+                columns = _index_columns(constraint.group(3))
+                name = constraint.group(1) or f"{table.name}_{'_'.join(columns)}_key"
+                self.add_index(IndexDef(name.strip('"'), table.name, columns, unique=True, source=source))
+            elif column and column.group(1).upper() not in ('CONSTRAINT', 'PRIMARY', 'UNIQUE', 'FOREIGN', 'CHECK'):
+                table.columns.append(column.group(1).lower())
+                if re.search(r'\bUNIQUE\b', column.group(2), re.I):
+                    self.add_index(IndexDef(f"{table.name}_{column.group(1).lower()}_key", table.name,
+                                            (column.group(1).lower(),), unique=True, source=source))
+
+    def _parse_create_index(self, statement: str, source: str) -> None:
+        match = re.match(r'CREATE\s+(UNIQUE\s+)?INDEX\s+(?:CONCURRENTLY\s+)?(?:IF\s+NOT\s+EXISTS\s+)?([\w."]+)?\s*'
+                         r'ON\s+(?:ONLY\s+)?([\w."]+)\s*(?:USING\s+(\w+)\s*)?\(([\s\S]*?)\)\s*'
+                         r'(?:INCLUDE\s*\([^)]*\)\s*)?(WHERE[\s\S]*)?$', statement, re.I)
+        if not match:
+            return
+        table = _identifier(match.group(3))
+        columns = _index_columns(match.group(5))
+        name = _identifier(match.group(2)) if match.group(2) else f"{table}_{'_'.join(columns)}_idx"
+        self.add_index(IndexDef(name, table, columns, unique=bool(match.group(1)),
+                                method=(match.group(4) or 'btree').lower(), partial=bool(match.group(6)),
+                                source=source))
+
+    def load_sql(self, sql: str, source: str = '') -> None:
+        for statement in self._statements(sql):
+            head = ' '.join(statement.split()[:3]).upper()
+            if head.startswith('CREATE') and re.match(r'CREATE\s+(UNIQUE\s+)?INDEX', statement, re.I):
+                self._parse_create_index(statement, source)
+            elif re.match(r'CREATE\s+(?:UNLOGGED\s+|TEMP(?:ORARY)?\s+)?TABLE', statement, re.I):
+                self._parse_create_table(statement, source)
+            elif head.startswith('ALTER TABLE'):
+                self._parse_alter_table(statement, source)
+            elif head.startswith('DROP INDEX'):
+                for name in re.sub(r'DROP\s+INDEX\s+(CONCURRENTLY\s+)?(IF\s+EXISTS\s+)?', '', statement,
+                                   flags=re.I).split(','):
+                    self.indexes.pop(_identifier(name.split()[0]), None)
+
+    @classmethod
+    def from_migrations(cls, paths: Iterable[Path]) -> 'SchemaCatalog':
+        """Aplica os arquivos na ordem recebida"""
+        catalog = cls()
+        for path in paths:
+            try:
+                catalog.load_sql(Path(path).read_text(encoding='utf-8'), Path(path).name)
+            except (OSError, UnicodeDecodeError) as e:
+                print(f"Erro ao ler {path}: {e}")
+        return catalog
+
+
+def load_schema(project_root: Path, extra_sql: Iterable[str] = ()) -> SchemaCatalog:
+    """Catálogo a partir de supabase/migrations/*.sql (mais arquivos extras, em ordem)"""
+    # Migrations em ordem de nome (timestamp); os extras depois, na ordem da linha de comando
+    paths = sorted((Path(project_root) / 'supabase' / 'migrations').glob('*.sql'))
+    paths += [Path(project_root) / p for p in extra_sql]
+    return SchemaCatalog.from_migrations(paths)
+
+
+def index_support(index_columns: Tuple[str, ...], equality: Set[str], next_columns: Tuple[str, ...]) -> int:
+    """Quantas colunas da query o índice btree atende: prefixo de igualdade e
+    depois uma coluna de intervalo/ordenação"""
+    used = 0
+    for column in index_columns:
+        if column in equality:
+            used += 1
+            continue
+        if column in next_columns:
+            used += 1
+        break
+    return used
@@ -0,0 +1,966 @@
+#!/usr/bin/env python3
+"""
+Índice global de símbolos do projeto Doc Forge Buddy
+Registra, em uma única passada tokenizada, exports por módulo, imports por arquivo
+e os identificadores usados no corpo de cada arquivo
+"""
+
+import os
+import re
+import json
+import fnmatch
+from collections import Counter, defaultdict, deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from ts_tokenizer import Token, tokenize, is_jsx_file, string_value, matching_brackets
+
+SOURCE_EXTENSIONS = ('.ts', '.tsx', '.js', '.jsx')
+RESOLVE_EXTENSIONS = ('.ts', '.tsx', '.d.ts', '.js', '.jsx')
+IGNORED_DIRS = {'node_modules', 'dist', 'build', '.git', 'coverage', '.next', '.nuxt'}
+
+# Pontos de entrada da aplicação (relativos à raiz do projeto)
+DEFAULT_ENTRY_PATTERNS = ['src/main.tsx', 'src/pages/*', 'src/service-worker.ts']
+
+
+@dataclass
+class ImportBinding:
+    local: str
+    imported: str  # nome exportado, 'default' ou '*'
+    type_only: bool
+    line: int
+    start: int
+    end: int
+
+
+@dataclass
+class ImportStatement:
+    source: str
+    resolved: Optional[str]
+    bindings: List[ImportBinding]
+    type_only: bool
+    dynamic: bool
+    line: int
+    start: int
+    end: int
+    token_start: int
+    token_end: int
+
+    @property
+    def is_relative(self) -> bool:
+        return self.source.startswith('.')
+
+    @property
+    def package(self) -> Optional[str]:
+        """Nome do pacote npm quando o import é externo"""
+        if self.resolved or self.is_relative:
+            return None
+        return package_name(self.source)
+
+
+@dataclass
+class ExportEntry:
+    name: str
+    kind: str  # 'value' ou 'type'
+    line: int
+    local: Optional[str] = None
+
+
+@dataclass
+class ReExport:
+    source: str
+    resolved: Optional[str]
+    names: Dict[str, str]  # exportado -> importado (vazio em export *)
+    star: bool
+    type_only: bool
+    line: int
+
+
+@dataclass
+class ModuleInfo:
+    path: str
+    imports: List[ImportStatement]
+    exports: Dict[str, ExportEntry]
+    reexports: List[ReExport]
+    usages: Counter
+    value_usages: Counter  # usos fora de posições de tipo
+    tokens: List[Token] = field(repr=False)
+    source: str = field(repr=False)
+
+    def binding_usage(self, local: str) -> str:
+        """'value', 'type' (só usado em posições de tipo) ou 'unused'"""
+        if self.value_usages.get(local, 0):
+            return 'value'
+        if self.usages.get(local, 0):
+            return 'type'
+        return 'unused'
+
+    def binding_for(self, local: str) -> Optional[Tuple[ImportStatement, ImportBinding]]:
+        for statement in self.imports:
+            for binding in statement.bindings:
+                if binding.local == local:
+                    return statement, binding
+        return None
+
+
+def package_name(specifier: str) -> str:
+    """'@scope/pkg/sub' -> '@scope/pkg', 'pkg/sub' -> 'pkg'"""
+    parts = specifier.split('/')
+    if specifier.startswith('@') and len(parts) > 1:
+        return '/'.join(parts[:2])
+    return parts[0]
+
+
+def is_test_file(path: str) -> bool:
+    return bool(re.search(r'(__tests__|/test/|\.test\.|\.spec\.|\.stories\.|/stories/)', path))
+
+
+def load_jsonc(file_path: Path) -> Dict:
+    """Carrega JSON com comentários e vírgulas finais (tsconfig)"""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    text = re.sub(r'"(?:[^"\\]|\\.)*"|//[^\n]*|/\*[\s\S]*?\*/',
+                  lambda m: m.group() if m.group().startswith('"') else '', text)
+    text = re.sub(r',(\s*[}\]])', r'\1', text)
+    return json.loads(text)
+
+
+class ModuleResolver:
+    """Resolve especificadores de import para caminhos relativos à raiz do projeto"""
+
+    def __init__(self, project_root: Path, known_files: Optional[Set[str]] = None):
+        self.project_root = Path(project_root)
+        self.known_files = known_files if known_files is not None else set()
+        self.path_aliases = self._load_path_aliases()
+
+    def _load_path_aliases(self) -> List[Tuple[str, List[str]]]:
+        aliases: Dict[str, List[str]] = {}
+        for name in ('tsconfig.json', 'tsconfig.app.json'):
+            config_path = self.project_root / name
+            if not config_path.exists():
+                continue
+            try:
+                options = load_jsonc(config_path).get('compilerOptions', {})
+            except (ValueError, OSError) as e:
+                print(f"Erro ao ler {config_path}: {e}")
+                continue
+            base_url = options.get('baseUrl', '.')
+            for pattern, targets in options.get('paths', {}).items():
+                aliases[pattern] = [os.path.normpath(os.path.join(base_url, t)).replace('\\', '/')
+                                    for t in targets]
+        if not aliases:
+            aliases['@/*'] = ['src/*']
+        # Padrões mais específicos primeiro
+        return sorted(aliases.items(), key=lambda item: len(item[0].split('*')[0]), reverse=True)
+
+    def _exists(self, rel_path: str) -> bool:
+        if rel_path in self.known_files:
+            return True
+        return (self.project_root / rel_path).is_file()
+
+    def _probe(self, base: str) -> Optional[str]:
+        base = os.path.normpath(base).replace('\\', '/')
+        if base.startswith('..'):
+            return None
+        if self._exists(base) and os.path.splitext(base)[1]:
+            return base
+        if base.endswith('.js'):
+            for ext in ('.ts', '.tsx'):
+                if self._exists(base[:-3] + ext):
+                    return base[:-3] + ext
+        for ext in RESOLVE_EXTENSIONS:
+            if self._exists(base + ext):
+                return base + ext
+        for ext in RESOLVE_EXTENSIONS:
+            if self._exists(f"{base}/index{ext}"):
+                return f"{base}/index{ext}"
+        return None
+
+    def alias_targets(self, specifier: str) -> List[str]:
+        """Caminhos candidatos para um especificador com alias do tsconfig"""
+        for pattern, targets in self.path_aliases:
+            if '*' in pattern:
+                prefix, suffix = pattern.split('*', 1)
+                if specifier.startswith(prefix) and specifier.endswith(suffix) \
+                        and len(specifier) >= len(prefix) + len(suffix):
+                    middle = specifier[len(prefix):len(specifier) - len(suffix)]
+                    return [t.replace('*', middle) for t in targets]
+            elif specifier == pattern:
+                return list(targets)
+        return []
+
+    def resolve(self, from_path: str, specifier: str) -> Optional[str]:
+        specifier = specifier.split('?')[0]
+        if specifier.startswith('.'):
+            return self._probe(os.path.join(os.path.dirname(from_path), specifier))
+        for candidate in self.alias_targets(specifier):
+            resolved = self._probe(candidate)
+            if resolved:
+                return resolved
+        return None
+
+
+def _skip_semicolon(tokens: List[Token], j: int) -> int:
+    if j < len(tokens) and tokens[j].kind == 'punct' and tokens[j].value == ';':
+        return j + 1
+    return j
+
+
+def _parse_specifiers(tokens: List[Token], j: int) -> Tuple[List[Tuple[str, str, bool, Token, Token]], int]:
+    """Lê ``{ a, type b, c as d }`` a partir de ``{``; retorna (importado, local, type, ini, fim)"""
+    specs = []
+    j += 1
+    while j < len(tokens) and not (tokens[j].kind == 'punct' and tokens[j].value == '}'):
+        token = tokens[j]
+        if token.kind == 'punct' and token.value == ',':
+            j += 1
+            continue
+        first = token
+        type_only = False
+        if token.value == 'type' and j + 1 < len(tokens) and \
+                (tokens[j + 1].kind in ('name', 'string')) and tokens[j + 1].value != 'as':
+            type_only = True
+            j += 1
+            token = tokens[j]
+        imported = string_value(token) if token.kind == 'string' else token.value
+        local = imported
+        last = token
+        if j + 2 < len(tokens) and tokens[j + 1].value == 'as' and tokens[j + 1].kind == 'name':
+            last = tokens[j + 2]
+            local = string_value(last) if last.kind == 'string' else last.value
+            j += 2
+        specs.append((imported, local, type_only, first, last))
+        j += 1
+    return specs, j + 1
+
+
+def _pattern_names(tokens: List[Token], j: int, close: int) -> List[str]:
+    """Nomes declarados em um padrão de desestruturação ``{ a, b: c, d = 1 }``"""
+    names = []
+    for k in range(j + 1, close):
+        token = tokens[k]
+        if token.kind != 'name':
+            continue
+        nxt = tokens[k + 1] if k + 1 < len(tokens) else None
+        prev = tokens[k - 1]
+        if nxt is not None and nxt.value in (',', '}', ']', '=') and prev.value not in ('=', '.', '...'):
+            names.append(token.value)
+        elif prev.value == '...':
+            names.append(token.value)
+    return names
+
+_TYPE_PREFIXES = {'keyof', 'typeof', 'readonly', 'unique', 'infer', 'asserts', 'new', 'abstract'}
+_DECLARATION_KEYWORDS = {'const', 'let', 'var'}
+_EXPRESSION_KEYWORDS = {'return', 'typeof', 'in', 'of', 'case', 'await', 'yield', 'else', 'do',
+                        'void', 'delete', 'throw', 'instanceof'}
+_CLASS_HEADER = {'.', ',', '<', '>', '[', ']'}
+
+
+class _TypeScanner:
+    """Reconhece expressões de tipo a partir dos tokens (sem análise semântica)"""
+
+    def __init__(self, tokens: List[Token], brackets: List[int]):
+        self.tokens = tokens
+        self.brackets = brackets
+        self.n = len(tokens)
+
+    def value(self, i: int) -> str:
+        return self.tokens[i].value if 0 <= i < self.n else ''
+
+    def angle_end(self, i: int) -> int:
+        """Índice do ``>`` que fecha o ``<`` em ``i`` ou -1 se não for genérico"""
+        depth = 0
+        k = i
+        limit = min(self.n, i + 400)
+        while k < limit:
+            token = self.tokens[k]
+            if token.kind == 'punct':
+                value = token.value
+                if value == '<':
+                    depth += 1
+                elif value == '>':
+                    depth -= 1
+                    if depth == 0:
+                        return k
+                elif value in ('(', '[', '{'):
+                    if self.brackets[k] < 0:
+                        return -1
+                    k = self.brackets[k]
+                elif value in (';', ')', ']', '}', '&&', '||', '?', '=', '+', '-', '*', '/'):
+                    if not (value == '=' and self.value(k - 1) not in ('<', ',')):
+                        return -1
+            elif token.kind not in ('name', 'string', 'number', 'template'):
+                return -1
+            k += 1
+        return -1
+
+    def parameter_list(self, i: int) -> bool:
+        """``(`` em ``i`` abre parâmetros de um tipo função, não um tipo entre parênteses:
+        em ``(): (() => void) => {`` o ``=>`` seguinte é o da própria arrow"""
+        first = i + 1
+        value = self.value(first)
+        if value in (')', '...'):
+            return True
+        if value in ('{', '[') and self.brackets[first] > 0:
+            return self.value(self.brackets[first] + 1) in (':', ',', ')', '?', '=')
+        return self.tokens[first].kind == 'name' and self.value(first + 1) in (':', '?', ',', ')')
+
+    def scan_type(self, i: int) -> int:
+        """Retorna o índice logo após o tipo que começa em ``i`` (-1 se não houver tipo)"""
+        if self.value(i) in ('|', '&'):
+            i += 1
+        while True:
+            i = self.scan_primary(i)
+            if i < 0:
+                return -1
+            while self.value(i) == '[' and self.tokens[i].kind == 'punct' and self.brackets[i] > 0:
+                i = self.brackets[i] + 1
+            value = self.value(i)
+            if value in ('|', '&') and self.tokens[i].kind == 'punct':
+                i += 1
+                continue
+            if value == 'extends' and self.value(i + 1) not in ('{', ''):
+                end = self.scan_type(i + 1)
+                if end > 0 and self.value(end) == '?':
+                    end = self.scan_type(end + 1)
+                    if end > 0 and self.value(end) == ':':
+                        end = self.scan_type(end + 1)
+                return end if end > 0 else i
+            if value == 'is':
+                end = self.scan_type(i + 1)
+                return end if end > 0 else i
+            return i
+
+    def scan_primary(self, i: int) -> int:
+        if i >= self.n:
+            return -1
+        token = self.tokens[i]
+        value = token.value
+        if token.kind == 'name':
+            if value in _TYPE_PREFIXES and self.value(i + 1) not in (',', ';', ')', ']', '}', '>', '=', '|', '&', ''):
+                return self.scan_primary(i + 1)
+            j = i + 1
+            while self.value(j) in ('.', '?.') and j + 1 < self.n and self.tokens[j + 1].kind == 'name':
+                j += 2
+            if self.value(j) == '<' and self.tokens[j].kind == 'punct':
+                close = self.angle_end(j)
+                if close > 0:
+                    j = close + 1
+            return j
+        if token.kind in ('string', 'number', 'regex'):
+            return i + 1
+        if token.kind == 'template':
+            j = i
+            while j < self.n and not (self.tokens[j].kind == 'template' and self.tokens[j].value.endswith('`')
+                                      and (j > i or len(self.tokens[j].value) > 1)):
+                j += 1
+            return j + 1
+        if token.kind != 'punct':
+            return -1
+        if value == '(':
+            close = self.brackets[i]
+            if close < 0:
+                return -1
+            if self.value(close + 1) == '=>' and self.parameter_list(i):
+                return self.scan_type(close + 2)
+            return close + 1
+        if value == '<':
+            close = self.angle_end(i)
+            if close > 0 and self.value(close + 1) == '(':
+                paren_close = self.brackets[close + 1]
+                if paren_close > 0 and self.value(paren_close + 1) == '=>':
+                    return self.scan_type(paren_close + 2)
+            return -1
+        if value in ('{', '['):
+            close = self.brackets[i]
+            return close + 1 if close > 0 else -1
+        if value == '-' and i + 1 < self.n and self.tokens[i + 1].kind == 'number':
+            return i + 2
+        if value == '...':
+            return self.scan_type(i + 1)
+        return -1
+
+
+def _is_class_body(tokens: List[Token], i: int) -> bool:
+    """Verifica se o ``{`` em ``i`` abre o corpo de uma classe"""
+    k = i - 1
+    steps = 0
+    while k >= 0 and steps < 40:
+        token = tokens[k]
+        if token.kind == 'name':
+            if token.value == 'class':
+                return True
+        elif not (token.kind == 'punct' and token.value in _CLASS_HEADER):
+            return False
+        k -= 1
+        steps += 1
+    return False
+
+
+def type_positions(tokens: List[Token]) -> bytearray:
+    """Marca (com 1) os tokens que estão em posição de tipo: anotações, interfaces,
+    aliases ``type``, argumentos genéricos, ``as``/``satisfies`` e ``implements``"""
+    n = len(tokens)
+    marks = bytearray(n)
+    brackets = matching_brackets(tokens)
+    scanner = _TypeScanner(tokens, brackets)
+    value = scanner.value
+    # Pilha de contextos: [índice_abertura, tipo ('(', '[', 'class', '{'), ternários_pendentes]
+    frames: List[list] = [[-1, '{', 0]]
+
+    def mark(start: int, end: int) -> None:
+        if end > start:
+            marks[start:end] = b'\x01' * (end - start)
+
+    def is_annotation(i: int) -> bool:
+        frame = frames[-1]
+        if frame[2] > 0:
+            frame[2] -= 1  # ``:`` de um ternário
+            return False
+        prev = tokens[i - 1] if i else None
+        if prev is None:
+            return False
+        if prev.value in ('?', '!') and prev.kind == 'punct':
+            return True
+        if prev.value == ')' and prev.kind == 'punct':
+            return True
+        kind = frame[1]
+        if prev.kind == 'name' or prev.value in ('}', ']'):
+            if kind in ('(', '[', 'class'):
+                return prev.value not in ('case', 'default')
+            if prev.kind == 'name':
+                return value(i - 2) in _DECLARATION_KEYWORDS
+            opening = brackets[i - 1]
+            return opening > 0 and value(opening - 1) in _DECLARATION_KEYWORDS
+        return False
+
+    i = 0
+    while i < n:
+        token = tokens[i]
+        tv = token.value
+        if token.kind == 'name':
+            prev_value = value(i - 1)
+            if prev_value in ('.', '?.'):
+                i += 1
+                continue
+            next_token = tokens[i + 1] if i + 1 < n else None
+            if tv == 'interface' and next_token is not None and next_token.kind == 'name':
+                k = i + 2
+                while k < n and tokens[k].value != '{':
+                    k += 1
+                end = brackets[k] + 1 if k < n and brackets[k] > 0 else k
+                mark(i, end)
+                i = end
+                continue
+            if tv == 'type' and next_token is not None and next_token.kind == 'name' \
+                    and value(i + 2) in ('=', '<') and prev_value not in ('=', '(', ','):
+                j = i + 2
+                if value(j) == '<':
+                    close = scanner.angle_end(j)
+                    j = close + 1 if close > 0 else j
+                if value(j) == '=':
+                    end = scanner.scan_type(j + 1)
+                    if end > 0:
+                        mark(i, end)
+                        i = end
+                        continue
+            if tv == 'type' and prev_value == 'export' and value(i + 1) == '{' and brackets[i + 1] > 0:
+                end = brackets[i + 1] + 1
+                mark(i, end)
+                i = end
+                continue
+            if tv in ('as', 'satisfies') and i > 0 and prev_value not in ('*', '{', ',', 'import', 'export'):
+                end = scanner.scan_type(i + 1)
+                if end > 0:
+                    mark(i + 1, end)
+                    i = end
+                    continue
+            if tv == 'implements':
+                k = i + 1
+                while k < n and tokens[k].value != '{':
+                    k += 1
+                mark(i + 1, k)
+                i = k
+                continue
+        elif token.kind == 'punct':
+            if tv == ':':
+                if is_annotation(i):
+                    end = scanner.scan_type(i + 1)
+                    if end > 0:
+                        mark(i + 1, end)
+                        i = end
+                        continue
+            elif tv == '?':
+                if value(i + 1) not in (':', ',', ')', '='):
+                    frames[-1][2] += 1
+            elif tv == '<':
+                prev = tokens[i - 1] if i else None
+                if prev is not None and (prev.kind == 'name' and prev.value not in _EXPRESSION_KEYWORDS
+                                         or prev.value in ('=', '(', ',')):
+                    close = scanner.angle_end(i)
+                    after = tokens[close + 1] if 0 < close < n - 1 else None
+                    if after is not None and (after.value in ('(', '{', 'extends', 'implements', '=')
+                                              or after.kind == 'template'):
+                        mark(i, close + 1)
+                        i = close + 1
+                        continue
+            elif tv in ('(', '['):
+                frames.append([i, tv, 0])
+            elif tv == '{':
+                frames.append([i, 'class' if _is_class_body(tokens, i) else '{', 0])
+            elif tv in (')', ']', '}'):
+                if len(frames) > 1 and brackets[i] == frames[-1][0]:
+                    frames.pop()
+        i += 1
+    return marks
+
+
+
+class ModuleParser:
+    """Extrai imports, exports e usos de identificadores a partir dos tokens"""
+
+    def __init__(self, path: str, source: str, resolver: ModuleResolver):
+        self.path = path
+        self.source = source
+        self.resolver = resolver
+        self.tokens = tokenize(source, jsx=is_jsx_file(path))
+
+    def _statement(self, source: str, bindings, type_only, dynamic, first: Token, last: Token,
+                   token_start: int, token_end: int) -> ImportStatement:
+        return ImportStatement(
+            source=source,
+            resolved=self.resolver.resolve(self.path, source),
+            bindings=bindings,
+            type_only=type_only,
+            dynamic=dynamic,
+            line=first.line,
+            start=first.start,
+            end=last.end,
+            token_start=token_start,
+            token_end=token_end,
+        )
+
+    def _parse_import(self, i: int) -> Tuple[Optional[ImportStatement], int]:
+        tokens = self.tokens
+        n = len(tokens)
+        j = i + 1
+        if j >= n:
+            return None, j
+        token = tokens[j]
+
+        # import('...') dinâmico
+        if token.kind == 'punct' and token.value == '(':
+            if j + 2 < n and string_value(tokens[j + 1]) is not None and tokens[j + 2].value in (')', ','):
+                statement = self._statement(string_value(tokens[j + 1]), [], False, True,
+                                            tokens[i], tokens[j + 2], i, j + 3)
+                return statement, j + 2
+            return None, j
+        if token.kind == 'punct' and token.value == '.':
+            return None, j  # import.meta
+
+        # import './side-effect.css'
+        if token.kind == 'string':
+            end = _skip_semicolon(tokens, j + 1)
+            return self._statement(string_value(token), [], False, False,
+                                   tokens[i], tokens[end - 1], i, end), end
+
+        type_only = False
+        if token.value == 'type' and j + 1 < n and \
+                (tokens[j + 1].value in ('{', '*') or (tokens[j + 1].kind == 'name' and tokens[j + 1].value != 'from')):
+            type_only = True
+            j += 1
+
+        bindings: List[ImportBinding] = []
+        while j < n:
+            token = tokens[j]
+            if token.kind == 'name' and token.value == 'from':
+                break
+            if token.kind == 'punct' and token.value == ',':
+                j += 1
+            elif token.kind == 'punct' and token.value == '{':
+                specs, j = _parse_specifiers(tokens, j)
+                for imported, local, spec_type, first, last in specs:
+                    bindings.append(ImportBinding(local, imported, type_only or spec_type,
+                                                  first.line, first.start, last.end))
+            elif token.kind == 'punct' and token.value == '*':
+                if j + 2 < n and tokens[j + 1].value == 'as':
+                    local = tokens[j + 2]
+                    bindings.append(ImportBinding(local.value, '*', type_only, token.line, token.start, local.end))
+                j += 3
+            elif token.kind == 'name':
+                if j + 1 < n and tokens[j + 1].value == '=':
+                    return None, j  # import x = require(...)
+                bindings.append(ImportBinding(token.value, 'default', type_only, token.line, token.start, token.end))
+                j += 1
+            else:
+                return None, j
+
+        if j + 1 >= n or string_value(tokens[j + 1]) is None:
+            return None, j
+        end = _skip_semicolon(tokens, j + 2)
+        return self._statement(string_value(tokens[j + 1]), bindings, type_only, False,
+                               tokens[i], tokens[end - 1], i, end), end
+
+    def _parse_export(self, i: int, exports: Dict[str, ExportEntry], reexports: List[ReExport]) -> int:
+        tokens = self.tokens
+        n = len(tokens)
+        j = i + 1
+        line = tokens[i].line
+        while j < n and tokens[j].value in ('declare', 'async'):
+            j += 1
+        if j >= n:
+            return j
+        token = tokens[j]
+        value = token.value
+
+        if value == 'default':
+            nxt = tokens[j + 1] if j + 1 < n else None
+            kind = 'type' if nxt is not None and nxt.value == 'interface' else 'value'
+            local = None
+            if nxt is not None and nxt.value in ('function', 'class', 'interface', 'async', 'abstract'):
+                k = j + 1
+                while k < n and tokens[k].value in ('async', 'function', 'class', 'interface', 'abstract', '*'):
+                    k += 1
+                if k < n and tokens[k].kind == 'name' and tokens[k].value not in ('extends', 'implements'):
+                    local = tokens[k].value
+            elif nxt is not None and nxt.kind == 'name' and \
+                    (j + 2 >= n or tokens[j + 2].value == ';' or tokens[j + 2].line > nxt.line):
+                local = nxt.value
+            exports['default'] = ExportEntry('default', kind, line, local)
+            return j + 1
+
+        if value == '*':
+            k = j + 1
+            names: Dict[str, str] = {}
+            if k + 1 < n and tokens[k].value == 'as':
+                names[tokens[k + 1].value] = '*'
+                k += 2
+            if k + 1 < n and tokens[k].value == 'from' and string_value(tokens[k + 1]) is not None:
+                source = string_value(tokens[k + 1])
+                reexports.append(ReExport(source, self.resolver.resolve(self.path, source),
+                                          names, not names, False, line))
+                return k + 2
+            return k
+
+        type_only = False
+        if value == 'type' and j + 1 < n and tokens[j + 1].value in ('{', '*'):
+            type_only = True
+            j += 1
+            token = tokens[j]
+            value = token.value
+
+        if value == '{':
+            specs, k = _parse_specifiers(tokens, j)
+            if k + 1 < n and tokens[k].value == 'from' and string_value(tokens[k + 1]) is not None:
+                source = string_value(tokens[k + 1])
+                names = {exported: imported for imported, exported, _, _, _ in specs}
+                reexports.append(ReExport(source, self.resolver.resolve(self.path, source),
+                                          names, False, type_only, line))
+                return k + 2
+            for local, exported, spec_type, _, _ in specs:
+                exports[exported] = ExportEntry(exported, 'type' if type_only or spec_type else 'value', line, local)
+            return k
+
+        if value in ('const', 'let', 'var'):
+            k = j + 1
+            if k < n and tokens[k].value == 'enum':
+                k += 1
+            if k < n and tokens[k].kind == 'name':
+                exports[tokens[k].value] = ExportEntry(tokens[k].value, 'value', line, tokens[k].value)
+                return k + 1
+            if k < n and tokens[k].value in ('{', '['):
+                depth = 0
+                close = k
+                for close in range(k, n):
+                    if tokens[close].value in ('{', '['):
+                        depth += 1
+                    elif tokens[close].value in ('}', ']'):
+                        depth -= 1
+                        if depth == 0:
+                            break
+                for name in _pattern_names(tokens, k, close):
+                    exports[name] = ExportEntry(name, 'value', line, name)
+                return close + 1
+            return k
+
+        declaration_kinds = {
+            'function': 'value', 'class': 'value', 'enum': 'value', 'namespace': 'value',
+            'module': 'value', 'abstract': 'value', 'interface': 'type', 'type': 'type',
+        }
+        if value in declaration_kinds:
+            kind = declaration_kinds[value]
+            k = j + 1
+            while k < n and tokens[k].value in ('*', 'class', 'function'):
+                k += 1
+            if k < n and tokens[k].kind == 'name':
+                exports[tokens[k].value] = ExportEntry(tokens[k].value, kind, line, tokens[k].value)
+                return k + 1
+        return j
+
+    def scan_statements(self) -> Tuple[List[ImportStatement], Dict[str, ExportEntry], List[ReExport], bytearray]:
+        """Somente as declarações de import/export, sem contar usos"""
+        tokens = self.tokens
+        imports: List[ImportStatement] = []
+        exports: Dict[str, ExportEntry] = {}
+        reexports: List[ReExport] = []
+        excluded = bytearray(len(tokens))  # tokens que não contam como uso
+
+        i = 0
+        n = len(tokens)
+        while i < n:
+            token = tokens[i]
+            if token.kind == 'name' and (i == 0 or tokens[i - 1].value not in ('.', '?.')):
+                if token.value == 'import':
+                    statement, nxt = self._parse_import(i)
+                    if statement is not None:
+                        imports.append(statement)
+                        if not statement.dynamic:
+                            for k in range(statement.token_start, statement.token_end):
+                                excluded[k] = 1
+                    i = max(nxt, i + 1)
+                    continue
+                if token.value == 'export':
+                    before = len(reexports)
+                    nxt = self._parse_export(i, exports, reexports)
+                    if len(reexports) > before:
+                        for k in range(i, nxt):
+                            excluded[k] = 1
+                        i = nxt
+                        continue
+            i += 1
+        return imports, exports, reexports, excluded
+
+    def parse(self) -> ModuleInfo:
+        tokens = self.tokens
+        imports, exports, reexports, excluded = self.scan_statements()
+        in_type = type_positions(tokens)
+        usages: Counter = Counter()
+        value_usages: Counter = Counter()
+        for k, token in enumerate(tokens):
+            if token.kind != 'name' or excluded[k]:
+                continue
+            if k and tokens[k - 1].kind == 'punct' and tokens[k - 1].value in ('.', '?.'):
+                continue
+            usages[token.value] += 1
+            if not in_type[k]:
+                value_usages[token.value] += 1
+
+        return ModuleInfo(self.path, imports, exports, reexports, usages, value_usages, tokens, self.source)
+
+
+class SymbolIndex:
+    """Índice de símbolos construído em uma única passada sobre a árvore"""
+
+    def __init__(self, project_root: str, source_dirs: Iterable[str] = ('src',)):
+        self.project_root = Path(project_root)
+        self.source_dirs = list(source_dirs)
+        self.modules: Dict[str, ModuleInfo] = {}
+        self.importers: Dict[str, List[Tuple[str, ImportStatement]]] = defaultdict(list)
+        self.resolver: Optional[ModuleResolver] = None
+        self._used_exports: Optional[Dict[str, Set[str]]] = None
+        self._views: Dict[str, 'SourceView'] = {}
+
+    def find_source_files(self) -> List[str]:
+        files = []
+        for source_dir in self.source_dirs:
+            for root, dirs, names in os.walk(self.project_root / source_dir):
+                dirs[:] = [d for d in dirs if d not in IGNORED_DIRS]
+                for name in names:
+                    if name.endswith(SOURCE_EXTENSIONS):
+                        full_path = os.path.join(root, name)
+                        files.append(os.path.relpath(full_path, self.project_root).replace('\\', '/'))
+        return sorted(files)
+
+    def build(self) -> 'SymbolIndex':
+        files = self.find_source_files()
+        self.resolver = ModuleResolver(self.project_root, set(files))
+        for rel_path in files:
+            try:
+                with open(self.project_root / rel_path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+            except (OSError, UnicodeDecodeError) as e:
+                print(f"Erro ao ler {rel_path}: {e}")
+                continue
+            self.add_module(ModuleParser(rel_path, content, self.resolver).parse())
+        return self
+
+    def add_module(self, module: ModuleInfo) -> None:
+        self.modules[module.path] = module
+        for statement in module.imports:
+            if statement.resolved:
+                self.importers[statement.resolved].append((module.path, statement))
+        self._used_exports = None
+
+    # ------------------------------------------------------------------ grafo
+    def dependencies_of(self, path: str, include_dynamic: bool = True, include_types: bool = True) -> Set[str]:
+        module = self.modules.get(path)
+        if module is None:
+            return set()
+        deps = set()
+        for statement in module.imports:
+            if not statement.resolved:
+                continue
+            if statement.dynamic and not include_dynamic:
+                continue
+            if not include_types and statement.type_only:
+                continue
+            if not include_types and statement.bindings and all(b.type_only for b in statement.bindings):
+                continue
+            deps.add(statement.resolved)
+        for reexport in module.reexports:
+            if reexport.resolved and (include_types or not reexport.type_only):
+                deps.add(reexport.resolved)
+        return deps
+
+    def entry_points(self, patterns: Iterable[str] = DEFAULT_ENTRY_PATTERNS) -> List[str]:
+        patterns = list(patterns)
+        return sorted(p for p in self.modules
+                      if any(fnmatch.fnmatch(p, pattern) for pattern in patterns) and not is_test_file(p))
+
+    def reachable_from(self, entries: Iterable[str]) -> Set[str]:
+        seen = set(entries)
+        queue = deque(seen)
+        while queue:
+            current = queue.popleft()
+            for dep in self.dependencies_of(current):
+                if dep not in seen:
+                    seen.add(dep)
+                    queue.append(dep)
+        return seen
+
+    # ---------------------------------------------------------------- exports
+    def resolve_export(self, path: str, name: str, _seen: Optional[Set[Tuple[str, str]]] = None) -> List[Tuple[str, str]]:
+        """Segue barrels e re-exports até o módulo que declara ``name``"""
+        seen = _seen if _seen is not None else set()
+        if (path, name) in seen:
+            return []
+        seen.add((path, name))
+        module = self.modules.get(path)
+        if module is None:
+            return []
+        result = [(path, name)]
+        entry = module.exports.get(name)
+        if entry is not None:
+            if entry.local:
+                binding = module.binding_for(entry.local)
+                if binding and binding[0].resolved and binding[1].imported != '*':
+                    result += self.resolve_export(binding[0].resolved, binding[1].imported, seen)
+            return result
+        for reexport in module.reexports:
+            if not reexport.resolved:
+                continue
+            if name in reexport.names:
+                imported = reexport.names[name]
+                if imported != '*':
+                    result += self.resolve_export(reexport.resolved, imported, seen)
+                return result
+        if name != 'default':
+            for reexport in module.reexports:
+                if reexport.star and reexport.resolved:
+                    found = self.resolve_export(reexport.resolved, name, seen)
+                    if len(found) > 1 or (found and found[0][1] in self.modules[found[0][0]].exports):
+                        return result + found
+        return result
+
+    def resolve_local(self, module: ModuleInfo, local: str) -> Tuple[str, str]:
+        """(módulo, nome declarado) de ``local``, seguindo imports, barrels e ``export { a as b }``"""
+        binding = module.binding_for(local)
+        if binding is None or not binding[0].resolved:
+            return module.path, local
+        statement, imported = binding
+        chain = self.resolve_export(statement.resolved, imported.imported)
+        origin, name = chain[-1] if chain else (statement.resolved, imported.imported)
+        target = self.modules.get(origin)
+        export = target.exports.get(name) if target is not None else None
+        return origin, export.local if export is not None and export.local else name
+
+    def view(self, path: str) -> Optional['SourceView']:
+        """``SourceView`` do módulo, criado uma vez e compartilhado pelas análises"""
+        view = self._views.get(path)
+        if view is None:
+            module = self.modules.get(path)
+            if module is None:
+                return None
+            from ts_scopes import SourceView  # ts_scopes importa este módulo
+            view = self._views[path] = SourceView(path, module.source, module.tokens)
+        return view
+
+    def _mark_all_exports(self, path: str, used: Dict[str, Set[str]], seen: Set[str]) -> None:
+        if path in seen or path not in self.modules:
+            return
+        seen.add(path)
+        module = self.modules[path]
+        used[path].update(module.exports)
+        for reexport in module.reexports:
+            if reexport.resolved:
+                self._mark_all_exports(reexport.resolved, used, seen)
+
+    def used_exports(self) -> Dict[str, Set[str]]:
+        """Exports referenciados por algum import (diretamente ou via barrel)"""
+        if self._used_exports is not None:
+            return self._used_exports
+        used: Dict[str, Set[str]] = defaultdict(set)
+        for module in self.modules.values():
+            for statement in module.imports:
+                if not statement.resolved:
+                    continue
+                if statement.dynamic or any(b.imported == '*' for b in statement.bindings):
+                    self._mark_all_exports(statement.resolved, used, set())
+                    continue
+                for binding in statement.bindings:
+                    for origin, name in self.resolve_export(statement.resolved, binding.imported):
+                        used[origin].add(name)
+            for reexport in module.reexports:
+                # export * as ns expõe o módulo inteiro
+                if reexport.resolved and '*' in reexport.names.values():
+                    self._mark_all_exports(reexport.resolved, used, set())
+        self._used_exports = used
+        return used
+
+    # --------------------------------------------------------------- relatórios
+    def unused_imports(self) -> List[Dict]:
+        findings = []
+        for path, module in sorted(self.modules.items()):
+            if path.endswith('.d.ts'):
+                continue
+            for statement in module.imports:
+                for binding in statement.bindings:
+                    if module.usages.get(binding.local, 0) == 0:
+                        findings.append({
+                            'file': path,
+                            'line': binding.line,
+                            'name': binding.local,
+                            'source': statement.source,
+                        })
+        return findings
+
+    def unused_exports(self, entries: Optional[Iterable[str]] = None) -> List[Dict]:
+        used = self.used_exports()
+        entry_set = set(entries if entries is not None else self.entry_points())
+        findings = []
+        for path, module in sorted(self.modules.items()):
+            if path in entry_set or path.endswith('.d.ts') or is_test_file(path):
+                continue
+            for name, entry in sorted(module.exports.items()):
+                if name in used.get(path, ()):
+                    continue
+                findings.append({
+                    'file': path,
+                    'line': entry.line,
+                    'name': name,
+                    'kind': entry.kind,
+                    'used_locally': module.usages.get(entry.local or name, 0) > 1,
+                })
+        return findings
+
+    def unreachable_files(self, entries: Optional[Iterable[str]] = None) -> List[str]:
+        entries = list(entries if entries is not None else self.entry_points())
+        reachable = self.reachable_from(entries)
+        return sorted(p for p in self.modules
+                      if p not in reachable and not p.endswith('.d.ts') and not is_test_file(p))
+
+
+def build_index(project_root: str, source_dirs: Iterable[str] = ('src',)) -> SymbolIndex:
+    """Atalho: constrói o índice de símbolos do projeto"""
+    return SymbolIndex(project_root, source_dirs).build()
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Índice persistido de localização de símbolos - Doc Forge Buddy
+Mapeia cada símbolo exportado para os módulos que o declaram e cada caminho de módulo
+para a sua localização atual. É atualizado de forma incremental: só arquivos com data
+de modificação ou tamanho diferentes têm o hash recalculado, e um arquivo que some de
+um caminho e aparece em outro com o mesmo hash de conteúdo é registrado como movido.
+Quando o conteúdo mudou junto com o caminho, cai-se para nome de arquivo + conjunto de
+exports idênticos.
+
+As declarações de import/export vêm do cache do ``import_validator``.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from import_validator import ImportValidator
+from symbol_index import RESOLVE_EXTENSIONS
+
+INDEX_FILE = 'node_modules/.cache/doc-forge-tools/symbol_locations.json'
+INDEX_VERSION = 1
+
+
+def content_hash(full_path: Path) -> str:
+    digest = hashlib.sha1()
+    with open(full_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def module_stem(path: str) -> str:
+    """'src/hooks/useAuth.tsx' -> 'useAuth'; 'src/lib/x/index.ts' -> 'x'"""
+    base = os.path.basename(path)
+    for ext in sorted(RESOLVE_EXTENSIONS, key=len, reverse=True):
+        if base.endswith(ext):
+            base = base[:-len(ext)]
+            break
+    if base == 'index':
+        return os.path.basename(os.path.dirname(path))
+    return base
+
+
+class SymbolLocationIndex:
+    """Símbolo exportado -> módulos e caminho antigo -> caminho atual"""
+
+    def __init__(self, project_root: str, validator: Optional[ImportValidator] = None):
+        self.project_root = Path(project_root)
+        self.validator = validator
+        self.files: Dict[str, Dict] = {}  # caminho -> {mtime, size, hash, exports}
+        self.moves: Dict[str, str] = {}  # caminho antigo -> caminho atual
+        self.symbols: Dict[str, List[str]] = {}
+        self.stats = {'files': 0, 'hashed': 0, 'added': 0, 'removed': 0, 'moved': 0}
+
+    @property
+    def index_path(self) -> Path:
+        return self.project_root / INDEX_FILE
+
+    def _load(self) -> Dict:
+        if not self.index_path.exists():
+            return {}
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data if data.get('version') == INDEX_VERSION else {}
+
+    def save(self) -> None:
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.index_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': INDEX_VERSION, 'files': self.files, 'moves': self.moves,
+                           'symbols': self.symbols}, f, separators=(',', ':'))
+        except OSError as e:
+            print(f"⚠️  Não foi possível gravar o índice de símbolos: {e}")
+
+    # -------------------------------------------------------------- atualização
+    def build(self) -> 'SymbolLocationIndex':
+        if self.validator is None:
+            self.validator = ImportValidator(str(self.project_root)).build()
+        previous = self._load()
+        old_files: Dict[str, Dict] = previous.get('files', {})
+        self.moves = dict(previous.get('moves', {}))
+
+        for path, facts in self.validator.facts.items():
+            full_path = self.project_root / path
+            try:
+                stat = os.stat(full_path)
+            except OSError:
+                continue
+            entry = old_files.get(path)
+            if entry and entry['mtime'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+                digest = entry['hash']
+            else:
+                digest = content_hash(full_path)
+                self.stats['hashed'] += 1
+            self.files[path] = {'mtime': stat.st_mtime_ns, 'size': stat.st_size, 'hash': digest,
+                                'exports': sorted(facts.exports)}
+
+        if old_files:
+            self._detect_moves(old_files)
+        self.symbols = self._build_symbols()
+        self.stats['files'] = len(self.files)
+        self.save()
+        return self
+
+    def _detect_moves(self, old_files: Dict[str, Dict]) -> None:
+        removed = [p for p in old_files if p not in self.files]
+        added = [p for p in self.files if p not in old_files]
+        self.stats['removed'] = len(removed)
+        self.stats['added'] = len(added)
+
+        by_hash: Dict[str, List[str]] = defaultdict(list)
+        by_signature: Dict[tuple, List[str]] = defaultdict(list)
+        for path in added:
+            by_hash[self.files[path]['hash']].append(path)
+            if self.files[path]['exports']:
+                by_signature[(module_stem(path), tuple(self.files[path]['exports']))].append(path)
+
+        for old_path in removed:
+            entry = old_files[old_path]
+            candidates = by_hash.get(entry['hash'], [])
+            if len(candidates) != 1:
+                candidates = by_signature.get((module_stem(old_path), tuple(entry.get('exports', []))), [])
+            if len(candidates) == 1:
+                self.moves[old_path] = candidates[0]
+                self.stats['moved'] += 1
+
+        # Colapsa cadeias a -> b -> c e descarta caminhos que voltaram a existir
+        for old_path in list(self.moves):
+            if old_path in self.files:
+                del self.moves[old_path]
+                continue
+            target, seen = self.moves[old_path], {old_path}
+            while target in self.moves and target not in seen:
+                seen.add(target)
+                target = self.moves[target]
+            self.moves[old_path] = target
+
+    def _build_symbols(self) -> Dict[str, List[str]]:
+        symbols: Dict[str, Set[str]] = defaultdict(set)
+        for path, entry in self.files.items():
+            for name in entry['exports']:
+                symbols[name].add(path)
+        return {name: sorted(paths) for name, paths in symbols.items()}
+
+    # ------------------------------------------------------------------ consultas
+    def current_location(self, path: str) -> Optional[str]:
+        if path in self.files:
+            return path
+        target = self.moves.get(path)
+        return target if target in self.files else None
+
+    def moved_module(self, base: str) -> Optional[str]:
+        """Localização atual de um módulo que antes resolvia para ``base`` (sem extensão)"""
+        for candidate in [base + ext for ext in RESOLVE_EXTENSIONS] + \
+                [f"{base}/index{ext}" for ext in RESOLVE_EXTENSIONS]:
+            if candidate in self.moves:
+                return self.current_location(candidate)
+        return None
+
+    def modules_exporting(self, name: str) -> List[str]:
+        return self.symbols.get(name, [])
+
+    def modules_named(self, stem: str) -> List[str]:
+        return sorted(p for p in self.files if module_stem(p) == stem)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Atualiza o índice de localização de símbolos')
+    parser.add_argument('--project-dir', default='/workspace/doc-forge-buddy-Cain',
+                        help='Diretório do projeto')
+    parser.add_argument('--symbol', action='append', default=[],
+                        help='Mostra onde um símbolo é exportado (pode repetir)')
+    args = parser.parse_args()
+
+    index = SymbolLocationIndex(args.project_dir).build()
+    stats = index.stats
+    print(f"📚 {stats['files']} módulos, {len(index.symbols)} símbolos exportados")
+    print(f"   🔄 {stats['hashed']} arquivos com hash recalculado; {stats['added']} novos, "
+          f"{stats['removed']} removidos, {stats['moved']} movidos detectados")
+    for old_path, new_path in sorted(index.moves.items()):
+        print(f"   ➡️  {old_path} → {new_path}")
+    for symbol in args.symbol:
+        locations = index.modules_exporting(symbol)
+        print(f"   🔎 {symbol}: {', '.join(locations) if locations else 'não encontrado'}")
+
+
+if __name__ == "__main__":
+    main()
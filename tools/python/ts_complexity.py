@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Passada única de complexidade sobre o fluxo de tokens TypeScript/TSX
+Percorre os tokens uma vez, mantendo a pilha de aninhamento (corpos de if/else/laços/
+switch/catch, ternários e corpos de função do ``ScopeIndex``), e registra um evento por
+ponto de decisão com o nível de aninhamento em que ele ocorre. Dos eventos saem, para
+qualquer intervalo de tokens:
+
+- a decomposição ciclomática (mesmas chaves de ``complexity_weights`` do analisador)
+- a complexidade cognitiva (SonarSource): +1 por estrutura, somado ao nível de
+  aninhamento relativo à função; +1 sem aninhamento para ``else``/``else if`` e para
+  cada sequência de operadores lógicos iguais
+- a profundidade máxima de aninhamento
+
+Tokens em posição de tipo (``type_positions``) são ignorados.
+"""
+
+import re
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from symbol_index import type_positions
+from ts_outline import OutlineNode
+from ts_scopes import FunctionScope, ScopeIndex
+from ts_tokenizer import Token, matching_brackets
+
+# Contribuição cognitiva de um evento
+COGNITIVE_NONE, COGNITIVE_FLAT, COGNITIVE_NESTED = 0, 1, 2
+
+_LOOP_HEADERS = {'if', 'for', 'while', 'switch'}
+_LOGICAL_PATTERNS = {'&&': 'logical_and', '||': 'logical_or', '??': 'nullish_coalescing'}
+_SEQUENCE_BREAKS = {',', ';', '?', ':', '=>', '=', '+=', '-=', '||=', '&&=', '??='}
+_CALLBACK_PATTERNS = {'map': 'map_with_condition', 'filter': 'filter_with_condition',
+                      'reduce': 'reduce_with_condition'}
+_EVENT_HANDLER = re.compile(r'on[A-Z]')
+_MAX_LEVEL = 255
+
+
+class ComplexityEvent(NamedTuple):
+    index: int  # token
+    pattern: Optional[str]  # chave ciclomática (None: só cognitiva)
+    level: int  # aninhamento no token
+    cognitive: int  # COGNITIVE_*
+
+
+class FunctionMetrics(NamedTuple):
+    breakdown: Dict[str, int]
+    cognitive: int
+    max_nesting: int
+
+
+class ComplexityPass:
+    """Eventos de complexidade e nível de aninhamento por token de um arquivo"""
+
+    def __init__(self, tokens: List[Token], in_type: Optional[bytearray] = None,
+                 brackets: Optional[List[int]] = None, scopes: Optional[ScopeIndex] = None):
+        self.tokens = tokens
+        self.brackets = brackets if brackets is not None else matching_brackets(tokens)
+        self.in_type = in_type if in_type is not None else type_positions(tokens)
+        self.scopes = scopes if scopes is not None else ScopeIndex(tokens, self.brackets, self.in_type)
+        self.levels = bytearray(len(tokens))
+        self.events: List[ComplexityEvent] = []
+        self._event_index: List[int] = []
+        self._run()
+
+    # ---------------------------------------------------------------- helpers
+    def value(self, i: int) -> str:
+        return self.tokens[i].value if 0 <= i < len(self.tokens) else ''
+
+    def _statement_end(self, k: int) -> int:
+        """Último token do comando iniciado em ``k`` (bloco ou comando simples)"""
+        tokens, brackets = self.tokens, self.brackets
+        n = len(tokens)
+        if k >= n:
+            return n - 1
+        if self.value(k) == '{' and brackets[k] > k:
+            return brackets[k]
+        if tokens[k].kind == 'name' and tokens[k].value in _LOOP_HEADERS and self.value(k + 1) == '(' \
+                and brackets[k + 1] > k:
+            end = self._statement_end(brackets[k + 1] + 1)
+            if tokens[k].value == 'if' and self.value(end + 1) == 'else':
+                end = self._statement_end(end + 2)
+            return end
+        while k < n:
+            value = tokens[k].value
+            if tokens[k].kind == 'punct':
+                if value in ('(', '[', '{') and brackets[k] > k:
+                    k = brackets[k] + 1
+                    continue
+                if value == ';':
+                    return k
+                if value in (')', ']', '}'):
+                    return k - 1
+            k += 1
+        return n - 1
+
+    def _expression_end(self, k: int) -> int:
+        """Último token da expressão que contém ``k`` (fim de um ternário)"""
+        tokens, brackets = self.tokens, self.brackets
+        n = len(tokens)
+        last = k
+        while k < n:
+            token = tokens[k]
+            if token.kind == 'punct':
+                if token.value in ('(', '[', '{') and brackets[k] > k:
+                    last = brackets[k]
+                    k = last + 1
+                    continue
+                if token.value in (',', ';', ')', ']', '}'):
+                    return last
+            elif token.kind == 'jsx':
+                return last
+            last = k
+            k += 1
+        return n - 1
+
+    # ------------------------------------------------------------------ passada
+    def _run(self) -> None:
+        tokens, brackets, in_type, levels = self.tokens, self.brackets, self.in_type, self.levels
+        value = self.value
+        events = self.events
+        pending: Dict[int, List[int]] = {}  # início -> fins de frames de aninhamento
+        for scope in self.scopes.functions:
+            pending.setdefault(scope.body_start, []).append(scope.body_end)
+        scope_starts = {scope.start for scope in self.scopes.functions}
+
+        frames: List[int] = []  # fim de cada frame aberto
+        jsx_containers: List[Tuple[int, bool]] = []  # (fechamento, é atributo)
+        attribute_with_ternary = set()
+        jsx_closers = set()
+        tag_stack: List[str] = []
+        depth_stack: List[int] = []  # aberturas de colchetes
+        last_logical: Dict[int, Optional[str]] = {}
+
+        def open_frame(start: int, end: int) -> None:
+            if end >= start:
+                pending.setdefault(start, []).append(end)
+
+        for i, token in enumerate(tokens):
+            while frames and frames[-1] < i:
+                frames.pop()
+            if i in pending:
+                for end in sorted(pending.pop(i), reverse=True):
+                    frames.append(min(end, frames[-1]) if frames else end)
+            level = len(frames)
+            levels[i] = level if level < _MAX_LEVEL else _MAX_LEVEL
+            while jsx_containers and jsx_containers[-1][0] < i:
+                jsx_containers.pop()
+            if in_type[i]:
+                continue
+
+            kind, text = token.kind, token.value
+            prev = value(i - 1)
+            if kind == 'name':
+                if prev in ('.', '?.'):
+                    continue
+                if text == 'if':
+                    if prev == 'else':
+                        events.append(ComplexityEvent(i, 'else_if', level, COGNITIVE_FLAT))
+                    else:
+                        events.append(ComplexityEvent(i, 'if_statements', level, COGNITIVE_NESTED))
+                    if value(i + 1) == '(' and brackets[i + 1] > i:
+                        body = brackets[i + 1] + 1
+                        open_frame(body, self._statement_end(body))
+                elif text == 'else':
+                    if value(i + 1) != 'if':
+                        events.append(ComplexityEvent(i, 'else', level, COGNITIVE_FLAT))
+                        open_frame(i + 1, self._statement_end(i + 1))
+                elif text in ('switch', 'for', 'while'):
+                    k = i + 2 if text == 'for' and value(i + 1) == 'await' else i + 1
+                    if value(k) != '(' or brackets[k] < k:
+                        continue
+                    if text == 'while' and prev == '}' and value(brackets[i - 1] - 1) == 'do':
+                        continue  # do { } while (...)
+                    pattern = {'switch': 'switch', 'for': 'for_loop', 'while': 'while_loop'}[text]
+                    events.append(ComplexityEvent(i, pattern, level, COGNITIVE_NESTED))
+                    body = brackets[k] + 1
+                    open_frame(body, self._statement_end(body))
+                elif text == 'do' and value(i + 1) == '{':
+                    events.append(ComplexityEvent(i, 'while_loop', level, COGNITIVE_NESTED))
+                    open_frame(i + 1, self._statement_end(i + 1))
+                elif text == 'case':
+                    events.append(ComplexityEvent(i, 'case', level, COGNITIVE_NONE))
+                elif text == 'default' and value(i + 1) == ':':
+                    events.append(ComplexityEvent(i, 'default', level, COGNITIVE_NONE))
+                elif text == 'try' and value(i + 1) == '{':
+                    events.append(ComplexityEvent(i, 'try_catch', level, COGNITIVE_NONE))
+                elif text == 'catch':
+                    events.append(ComplexityEvent(i, 'catch', level, COGNITIVE_NESTED))
+                    body = brackets[i + 1] + 1 if value(i + 1) == '(' and brackets[i + 1] > i else i + 1
+                    open_frame(body, self._statement_end(body))
+                elif text == 'finally' and value(i + 1) == '{':
+                    events.append(ComplexityEvent(i, 'finally', level, COGNITIVE_NONE))
+                elif text == 'return':
+                    last_logical[len(depth_stack)] = None
+                continue
+
+            if kind == 'jsx':
+                if text in ('<', '</'):
+                    tag_stack.append(text)
+                elif text in ('>', '/>') and tag_stack:
+                    tag_stack.pop()
+                continue
+            if kind != 'punct':
+                continue
+
+            depth = len(depth_stack)
+            if text in ('(', '[', '{'):
+                if text == '{' and brackets[i] > i:
+                    previous = tokens[i - 1] if i else None
+                    in_tag = bool(tag_stack) and tag_stack[-1] == '<'
+                    if previous is not None and (previous.kind in ('jsx', 'jsx_text')
+                                                 or (previous.value == '=' and in_tag)
+                                                 or (previous.value == '}' and i - 1 in jsx_closers)):
+                        jsx_containers.append((brackets[i], previous.value == '=' and in_tag))
+                        jsx_closers.add(brackets[i])
+                depth_stack.append(i)
+                last_logical[depth + 1] = None
+            elif text in (')', ']', '}'):
+                last_logical.pop(depth, None)
+                if depth_stack:
+                    depth_stack.pop()
+            elif text == '?':
+                if value(i + 1) in (':', ')', ',', '=', ';'):
+                    continue  # parâmetro/propriedade opcional
+                events.append(ComplexityEvent(i, 'ternary', level, COGNITIVE_NESTED))
+                if jsx_containers:
+                    close, is_attribute = jsx_containers[-1]
+                    events.append(ComplexityEvent(i, 'conditional_jsx', level, COGNITIVE_NONE))
+                    if is_attribute and close not in attribute_with_ternary:
+                        attribute_with_ternary.add(close)
+                        events.append(ComplexityEvent(i, 'nested_component', level, COGNITIVE_NONE))
+                open_frame(i + 1, self._expression_end(i + 1))
+                last_logical[depth] = None
+            elif text in _LOGICAL_PATTERNS:
+                changed = last_logical.get(depth) != text
+                events.append(ComplexityEvent(i, _LOGICAL_PATTERNS[text], level,
+                                              COGNITIVE_FLAT if changed else COGNITIVE_NONE))
+                if text == '&&' and jsx_containers:
+                    events.append(ComplexityEvent(i, 'short_circuit_render', level, COGNITIVE_NONE))
+                last_logical[depth] = text
+            elif text == '?.':
+                events.append(ComplexityEvent(i, 'optional_chaining', level, COGNITIVE_NONE))
+            elif text == '=' and tag_stack and tag_stack[-1] == '<' and _EVENT_HANDLER.match(prev) \
+                    and value(i + 1) == '{' and i + 2 in scope_starts:
+                events.append(ComplexityEvent(i, 'event_handler_simple', level, COGNITIVE_NONE))
+            if text in _SEQUENCE_BREAKS:
+                last_logical[depth] = None
+
+        self._event_index = [event.index for event in events]
+        self._add_callback_events()
+
+    def _add_callback_events(self) -> None:
+        """Arrows com chaves e callbacks de map/filter/reduce que contêm decisões"""
+        extra = []
+        for scope in self.scopes.functions:
+            if scope.kind != 'arrow':
+                continue
+            lo = bisect_left(self._event_index, scope.body_start)
+            hi = bisect_right(self._event_index, scope.body_end)
+            if not any(self.events[k].cognitive for k in range(lo, hi)):
+                continue
+            level = self.levels[scope.start]
+            if scope.braced:
+                extra.append(ComplexityEvent(scope.start, 'arrow_function_complex', level, COGNITIVE_NONE))
+            pattern = _CALLBACK_PATTERNS.get(scope.call_context or '')
+            if pattern:
+                extra.append(ComplexityEvent(scope.start, pattern, level, COGNITIVE_NONE))
+        if extra:
+            self.events = sorted(self.events + extra, key=lambda event: event.index)
+            self._event_index = [event.index for event in self.events]
+
+    # ---------------------------------------------------------------- consultas
+    def metrics(self, start: int, end: int, base: Optional[int] = None) -> FunctionMetrics:
+        """Métricas dos tokens ``start..end`` (inclusive), com aninhamento relativo a ``base``"""
+        if end < start or not self.tokens:
+            return FunctionMetrics({}, 0, 0)
+        if base is None:
+            base = min(self.levels[start:end + 1])
+        breakdown: Counter = Counter()
+        cognitive = 0
+        lo, hi = bisect_left(self._event_index, start), bisect_right(self._event_index, end)
+        for event in self.events[lo:hi]:
+            if event.pattern:
+                breakdown[event.pattern] += 1
+            if event.cognitive == COGNITIVE_FLAT:
+                cognitive += 1
+            elif event.cognitive == COGNITIVE_NESTED:
+                cognitive += 1 + max(event.level - base, 0)
+        max_nesting = max(max(self.levels[start:end + 1]) - base, 0)
+        return FunctionMetrics(dict(breakdown), cognitive, max_nesting)
+
+    def scope_metrics(self, scope: FunctionScope) -> FunctionMetrics:
+        """Métricas de uma função: o nível dentro do próprio corpo é o aninhamento zero"""
+        return self.metrics(scope.start, scope.body_end, self.levels[scope.body_start])
+
+    def node_metrics(self, node: OutlineNode) -> FunctionMetrics:
+        """Métricas de um nó do ``ts_outline`` (mesma regra de ``scope_metrics``)"""
+        return self.metrics(node.start, node.end, self.levels[node.body_start])
+
+    def file_metrics(self) -> FunctionMetrics:
+        return self.metrics(0, len(self.tokens) - 1, 0)
@@ -0,0 +1,630 @@
+#!/usr/bin/env python3
+"""
+Parser de comandos TypeScript/TSX por descida recursiva (só estrutura, sem tipos)
+Percorre o fluxo de tokens uma vez, descendo por blocos, corpos de classe, literais de
+objeto, argumentos de chamada e corpos de função, e monta a árvore de declarações do
+arquivo: funções, arrows, métodos e classes, com nome, tipo (componente, hook...) e
+faixas de tokens e linhas.
+
+Nomes seguem a forma como o código os declara:
+
+- ``function X`` / ``class X`` / métodos de classe e de objeto
+- ``const X = () => ...``, ``X = function () {}``, ``obj.x = () => ...``
+- ``const X = useCallback(() => ...)`` / ``memo(forwardRef(...))`` (``NAMING_WRAPPERS``)
+- ``{ chave: () => ... }`` e propriedades de classe ``handler = async () => {}``
+- ``export default () => ...`` vira ``default``
+- argumentos de chamada viram ``<callback nome>``; o resto, ``<anônima>``
+
+Tokens em posição de tipo (``type_positions``) são ignorados; interfaces, aliases de
+tipo, enums e ``declare`` são pulados inteiros.
+"""
+
+import hashlib
+import re
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+from ts_tokenizer import Token, matching_brackets
+
+NAMING_WRAPPERS = {'useCallback', 'useMemo', 'memo', 'forwardRef', 'useEvent'}
+_COMPONENT_WRAPPERS = {'memo', 'forwardRef'}
+_METHOD_MODIFIERS = {'async', 'get', 'set', 'static', 'public', 'private', 'protected', 'readonly',
+                     'override', 'abstract', 'declare', 'accessor', '*'}
+_STATEMENT_KEYWORDS = {'const', 'let', 'var', 'function', 'return', 'export', 'import', 'if', 'for',
+                       'while', 'switch', 'class', 'interface', 'type', 'throw', 'try'}
+# Início de declaração mesmo quando marcado como tipo (``interface``/``type`` após outro tipo)
+_DECLARATION_STARTS = {'interface', 'type', 'export', 'declare', 'const', 'let', 'var', 'function', 'class'}
+# Palavras que não encerram uma expressão (a próxima linha continua o comando)
+_OPERATOR_WORDS = {'return', 'throw', 'await', 'typeof', 'new', 'void', 'delete', 'in', 'of', 'instanceof',
+                   'as', 'satisfies', 'extends', 'implements', 'keyof', 'case', 'yield', 'else', 'do',
+                   'export', 'default', 'const', 'let', 'var', 'async', 'function', 'class', 'import'}
+_NOT_CALLEES = _OPERATOR_WORDS | {'if', 'for', 'while', 'switch', 'catch', 'with', 'super', 'this'}
+# Palavras que, no início de uma linha, continuam a expressão da linha anterior
+_CONTINUATION_WORDS = {'in', 'of', 'instanceof', 'as', 'satisfies', 'extends', 'implements', 'keyof'}
+_CLOSE_EXPRESSION_PUNCT = {')', ']', '}', '++', '--', '!'}
+_HOOK_NAME = re.compile(r'use[A-Z0-9]')
+_MAX_DEPTH = 400
+
+Hint = Tuple[str, Optional[str], Optional[str], Optional[int]]  # (nome, call_context, wrapper, declaração)
+
+
+@dataclass
+class OutlineNode:
+    name: str
+    kind: str  # 'function', 'arrow', 'method' ou 'class'
+    start: int  # primeiro token (inclui ``async`` e modificadores)
+    end: int  # ``}`` do corpo, ou último token da expressão
+    line: int  # linha da palavra-chave, do nome do método ou dos parâmetros
+    params_start: int = -1  # ``(`` (ou o parâmetro único de ``x =>``); -1 em classes
+    params_end: int = -1
+    body_start: int = -1  # ``{`` do corpo, ou primeiro token da expressão
+    decl_start: int = -1  # início do comando que declara (``export const X = ...``)
+    braced: bool = True
+    call_context: Optional[str] = None  # função que recebe a arrow como argumento (ex.: 'map')
+    wrapper: Optional[str] = None  # useCallback, memo...
+    exported: bool = False
+    parent: Optional[int] = None
+    children: List[int] = field(default_factory=list)
+    role: str = ''  # 'component', 'hook' ou o próprio kind
+
+    @property
+    def anonymous(self) -> bool:
+        return self.name.startswith('<')
+
+
+class Outline:
+    """Árvore de funções/classes de um arquivo, em ordem de posição (pré-ordem)"""
+
+    def __init__(self, tokens: List[Token], brackets: Optional[List[int]] = None,
+                 in_type: Optional[bytearray] = None):
+        self.tokens = tokens
+        self.brackets = brackets if brackets is not None else matching_brackets(tokens)
+        self.in_type = in_type if in_type is not None else bytearray(len(tokens))
+        self.nodes: List[OutlineNode] = []
+        self._depth = 0
+        self._statements(0, len(tokens), None)
+        self._assign_roles()
+
+    # ---------------------------------------------------------------- consultas
+    @property
+    def roots(self) -> List[OutlineNode]:
+        return [node for node in self.nodes if node.parent is None]
+
+    def functions(self) -> List[OutlineNode]:
+        return [node for node in self.nodes if node.kind != 'class']
+
+    def named_functions(self) -> List[OutlineNode]:
+        """Funções com nome próprio (declaradas, atribuídas, métodos, hooks e componentes)"""
+        return [node for node in self.nodes if node.kind != 'class' and not node.anonymous]
+
+    def line_span(self, node: OutlineNode) -> Tuple[int, int]:
+        """Linhas da declaração completa (do ``export``/``const`` ao fim do corpo)"""
+        start = node.decl_start if node.decl_start >= 0 else node.start
+        return self.tokens[start].line, self.tokens[node.end].line
+
+    def qualified_name(self, node: OutlineNode) -> str:
+        """``Classe.metodo`` / ``Componente.handler``: ancestrais com nome, de fora para dentro"""
+        names = [node.name]
+        parent = node.parent
+        while parent is not None:
+            ancestor = self.nodes[parent]
+            if not ancestor.anonymous:
+                names.append(ancestor.name)
+            parent = ancestor.parent
+        return '.'.join(reversed(names))
+
+    def fingerprint(self, node: OutlineNode) -> str:
+        """Hash dos tokens de parâmetros e corpo: não muda com linhas movidas, espaços,
+        comentários ou troca de nome da função"""
+        first = node.params_start if node.params_start >= 0 else node.start
+        digest = hashlib.blake2b(digest_size=8)
+        for token in self.tokens[first:node.end + 1]:
+            digest.update(token.value.encode('utf-8', 'surrogatepass'))
+            digest.update(b'\0')
+        return digest.hexdigest()
+
+    # ---------------------------------------------------------------- helpers
+    def value(self, i: int) -> str:
+        return self.tokens[i].value if 0 <= i < len(self.tokens) else ''
+
+    def _add(self, parent: Optional[int], hint: Optional[Hint], default_name: str, **fields) -> int:
+        name, context, wrapper, declaration = hint if hint else (default_name, None, None, None)
+        node = OutlineNode(name=name, call_context=context, wrapper=wrapper, parent=parent, **fields)
+        node.decl_start = node.start if declaration is None else min(declaration, node.start)
+        index = len(self.nodes)
+        self.nodes.append(node)
+        if parent is not None:
+            self.nodes[parent].children.append(index)
+        return index
+
+    def _skip_type(self, k: int, stop: int) -> int:
+        while k < stop and self.in_type[k]:
+            k += 1
+        return k
+
+    def _skip_return_type(self, k: int, stop: int) -> int:
+        """A partir do token após ``)``, pula ``: Tipo`` e retorna o índice seguinte"""
+        if self.value(k) == ':':
+            return self._skip_type(k + 1, stop)
+        return k
+
+    def _ends_expression(self, i: int) -> bool:
+        token = self.tokens[i]
+        if token.kind == 'name':
+            return token.value not in _OPERATOR_WORDS
+        if token.kind == 'punct':
+            return token.value in _CLOSE_EXPRESSION_PUNCT
+        if token.kind == 'template':
+            return token.value.endswith('`')
+        return token.kind in ('number', 'string', 'regex') or (token.kind == 'jsx' and token.value in ('>', '/>'))
+
+    def _statement_end(self, k: int, stop: int) -> int:
+        """Índice seguinte ao fim do comando iniciado em ``k`` (``;``, fechamento ou ASI)"""
+        tokens, brackets, in_type = self.tokens, self.brackets, self.in_type
+        i = k
+        while i < stop:
+            token = tokens[i]
+            if token.kind == 'punct':
+                value = token.value
+                if value in ('(', '[', '{') and brackets[i] > i:
+                    i = min(brackets[i] + 1, stop)
+                    continue
+                if value == ';':
+                    return i + 1
+                if value in (')', ']', '}'):
+                    return i
+            elif i > k and token.kind == 'name' and token.value not in _CONTINUATION_WORDS \
+                    and token.line > tokens[i - 1].line and self._ends_expression(i - 1) \
+                    and (not (in_type[i] or in_type[i - 1]) or token.value in _DECLARATION_STARTS):
+                return i  # inserção automática de ponto e vírgula
+            i += 1
+        return stop
+
+    def _arrow_body_end(self, k: int, stop: int) -> int:
+        """Último token do corpo sem chaves de uma arrow"""
+        tokens, brackets = self.tokens, self.brackets
+        last = k
+        while k < stop:
+            token = tokens[k]
+            if token.kind == 'punct':
+                if token.value in ('(', '[', '{') and brackets[k] > k:
+                    last = min(brackets[k], stop - 1)
+                    k = last + 1
+                    continue
+                if token.value in (',', ';', ')', ']', '}'):
+                    return last
+            elif token.kind == 'name' and token.value in _STATEMENT_KEYWORDS and k > last \
+                    and token.line > tokens[last].line and tokens[last].value not in ('=>', '?', ':'):
+                return last
+            last = k
+            k += 1
+        return last
+
+    def _assignment_hint(self, equals: int) -> Optional[Hint]:
+        """Nome à esquerda de ``=``, pulando uma anotação de tipo (``const X: React.FC<P> =``)"""
+        k = equals - 1
+        if k >= 0 and self.in_type[k]:
+            while k > 0 and self.in_type[k]:
+                k -= 1
+            if self.value(k) != ':':
+                return None
+            k -= 1
+        if k < 0 or self.tokens[k].kind != 'name':
+            return None
+        declaration = k
+        if self.value(declaration - 1) in ('const', 'let', 'var'):
+            declaration -= 1
+        return self.tokens[k].value, None, None, declaration
+
+    def _callee(self, open_index: int) -> Tuple[Optional[str], int]:
+        """Nome da função chamada em ``(`` e o início da cadeia ``a.b.c``"""
+        c = open_index - 1
+        while c > 0 and self.in_type[c]:  # argumentos de tipo: useState<T>(...)
+            c -= 1
+        if c < 0 or self.tokens[c].kind != 'name' \
+                or (self.tokens[c].value in _NOT_CALLEES and self.value(c - 1) not in ('.', '?.')):
+            return None, open_index
+        callee = self.tokens[c].value
+        while c >= 2 and self.value(c - 1) in ('.', '?.') and self.tokens[c - 2].kind == 'name':
+            c -= 2
+        return callee, c
+
+    def _arrow_head(self, i: int, stop: int) -> Optional[Tuple[int, int, int, int]]:
+        """(primeiro token, início e fim dos parâmetros, ``=>``) se uma arrow começa em ``i``"""
+        tokens, brackets = self.tokens, self.brackets
+        j = i
+        if tokens[j].kind == 'name' and tokens[j].value == 'async' and j + 1 < stop \
+                and tokens[j + 1].line == tokens[j].line \
+                and (self.value(j + 1) in ('(', '<') or tokens[j + 1].kind == 'name'):
+            j += 1
+        first = j
+        if self.value(j) == '<' and tokens[j].kind == 'punct':
+            m = j + 1
+            while m < stop and m - j < 64 and self.value(m) != '(' \
+                    and (tokens[m].kind == 'name' or self.value(m) in (',', '>', '=', '<', '.', '[', ']')):
+                m += 1
+            if self.value(m) != '(' or self.value(m - 1) != '>':
+                return None
+            j = m
+        token = tokens[j]
+        if token.kind == 'name' and self.value(j + 1) == '=>' and not self.in_type[j]:
+            return first, j, j, j + 1
+        if token.value == '(' and token.kind == 'punct' and brackets[j] > j and not self.in_type[j]:
+            m = self._skip_return_type(brackets[j] + 1, stop)
+            if self.value(m) == '=>' and m < stop:
+                return first, j, brackets[j], m
+        return None
+
+    # ----------------------------------------------------------------- comandos
+    def _statements(self, k: int, stop: int, parent: Optional[int]) -> None:
+        if self._depth > _MAX_DEPTH:
+            return
+        self._depth += 1
+        while k < stop:
+            k = max(self._statement(k, stop, parent), k + 1)
+        self._depth -= 1
+
+    def _statement(self, k: int, stop: int, parent: Optional[int], hint: Optional[Hint] = None) -> int:
+        """Analisa um comando e retorna o índice seguinte a ele"""
+        tokens, brackets = self.tokens, self.brackets
+        token = tokens[k]
+        value = token.value
+        if token.kind == 'punct':
+            if value == ';':
+                return k + 1
+            if value == '{' and brackets[k] > k:
+                self._statements(k + 1, brackets[k], parent)
+                return brackets[k] + 1
+            return self._expression_statement(k, stop, parent)
+        if token.kind != 'name':
+            return self._expression_statement(k, stop, parent)
+
+        following = self.value(k + 1)
+        if value == 'export':
+            return self._export(k, stop, parent)
+        if value == 'function' or (value == 'async' and following == 'function'):
+            return self._function(k + 1 if value == 'async' else k, stop, parent, hint)
+        if value == 'class' or (value == 'abstract' and following == 'class'):
+            return self._class(k + 1 if value == 'abstract' else k, stop, parent, hint)
+        if value in ('const', 'let', 'var'):
+            if following == 'enum':
+                return self._skip_braced(k, stop)
+            return self._expression_statement(k + 1, stop, parent)
+        if value in ('if', 'while', 'for', 'switch', 'with') and following in ('(', 'await'):
+            j = k + 2 if following == 'await' else k + 1
+            if self.value(j) != '(' or brackets[j] < j:
+                return self._expression_statement(k, stop, parent)
+            self._expression(j + 1, brackets[j], parent)
+            body = brackets[j] + 1
+            if value == 'switch' and self.value(body) == '{' and brackets[body] > body:
+                self._statements(body + 1, brackets[body], parent)
+                return brackets[body] + 1
+            if body >= stop:
+                return body
+            after = self._statement(body, stop, parent)
+            if value == 'if' and after < stop and self.value(after) == 'else':
+                after = self._statement(after + 1, stop, parent) if after + 1 < stop else after + 1
+            return after
+        if value in ('else', 'do', 'try', 'finally') and k + 1 < stop:
+            after = self._statement(k + 1, stop, parent)
+            if value == 'do' and self.value(after) == 'while' and self.value(after + 1) == '(' \
+                    and brackets[after + 1] > after:
+                after = brackets[after + 1] + 1
+                if self.value(after) == ';':
+                    after += 1
+            return after
+        if value == 'catch':
+            j = brackets[k + 1] + 1 if following == '(' and brackets[k + 1] > k else k + 1
+            return self._statement(j, stop, parent) if j < stop else j
+        if value == 'case' or (value == 'default' and following == ':'):
+            j = k + 1
+            while j < stop and self.value(j) != ':':
+                j = brackets[j] + 1 if self.value(j) in ('(', '[', '{') and brackets[j] > j else j + 1
+            self._expression(k + 1, j, parent)
+            return j + 1
+        if value in ('interface', 'enum') and k + 1 < stop and tokens[k + 1].kind == 'name':
+            return self._skip_braced(k, stop)
+        if value in ('type', 'declare') and k + 1 < len(tokens) and tokens[k + 1].kind == 'name' \
+                and tokens[k + 1].line == token.line:
+            return self._statement_end(k, stop)
+        if value == 'import' and following not in ('(', '.'):
+            return self._statement_end(k, stop)
+        if value in ('namespace', 'module') and k + 2 < stop and self.value(k + 2) == '{':
+            self._statements(k + 3, brackets[k + 2], parent)
+            return brackets[k + 2] + 1
+        if following == ':' and value not in _OPERATOR_WORDS:
+            return k + 2  # rótulo
+        return self._expression_statement(k, stop, parent)
+
+    def _export(self, k: int, stop: int, parent: Optional[int]) -> int:
+        """``export [default] declaração``: marca as declarações e estende o início ao ``export``"""
+        j = k + 1
+        default = self.value(j) == 'default'
+        if default:
+            j += 1
+        if self.value(j) == '=':  # export = valor
+            return self._expression_statement(j + 1, stop, parent)
+        if self.value(j) in ('{', '*') or (self.value(j) == 'type' and self.value(j + 1) == '{'):
+            return self._statement_end(k, stop)
+        before = len(self.nodes)
+        hint = ('default', None, None, k) if default else None
+        if default and self.value(j) not in ('function', 'async', 'class', 'abstract'):
+            end = self._statement_end(j, stop)
+            self._expression(j, end, parent, hint)
+        else:
+            end = self._statement(j, stop, parent, hint)
+        for node in self.nodes[before:]:
+            if node.parent == parent and k <= node.decl_start <= j + 1:
+                node.decl_start = k
+                node.exported = True
+        return end
+
+    def _expression_statement(self, k: int, stop: int, parent: Optional[int]) -> int:
+        end = self._statement_end(k, stop)
+        self._expression(k, end, parent)
+        return end
+
+    def _skip_braced(self, k: int, stop: int) -> int:
+        """Pula ``interface X { }`` / ``enum X { }``"""
+        j = k
+        while j < stop and self.value(j) != '{':
+            j += 1
+        if j < stop and self.brackets[j] > j:
+            return self.brackets[j] + 1
+        return self._statement_end(k, stop)
+
+    # ----------------------------------------------------------- declarações
+    def _function(self, i: int, stop: int, parent: Optional[int], hint: Optional[Hint]) -> int:
+        """``[async] function [*] [nome](...) [: T] { }`` a partir da palavra ``function``"""
+        tokens, brackets = self.tokens, self.brackets
+        k = i + 1
+        if self.value(k) == '*':
+            k += 1
+        name = None
+        if k < stop and tokens[k].kind == 'name' and self.value(k + 1) in ('(', '<'):
+            name = tokens[k].value
+            k += 1
+        k = self._skip_type(k, stop)  # function f<T extends (...a: A) => B>(
+        if k >= stop or self.value(k) != '(' or brackets[k] < k:
+            return i + 1
+        body = self._skip_return_type(brackets[k] + 1, stop)
+        if body >= stop or self.value(body) != '{' or brackets[body] < body:
+            return max(body, i + 1)  # sobrecarga sem corpo
+        start = i - 1 if self.value(i - 1) == 'async' else i
+        index = self._add(parent, (name, None, None, None) if name else hint, '<anônima>', kind='function',
+                          start=start, end=brackets[body], line=tokens[i].line, params_start=k,
+                          params_end=brackets[k], body_start=body)
+        self._expression(k + 1, brackets[k], index)
+        self._statements(body + 1, brackets[body], index)
+        return brackets[body] + 1
+
+    def _arrow(self, head: Tuple[int, int, int, int], stop: int, parent: Optional[int],
+               hint: Optional[Hint]) -> int:
+        first, params_start, params_end, arrow = head
+        brackets = self.brackets
+        body = arrow + 1
+        braced = self.value(body) == '{' and brackets[body] > body
+        end = brackets[body] if braced else self._arrow_body_end(body, stop)
+        start = first - 1 if self.value(first - 1) == 'async' else first
+        index = self._add(parent, hint, '<anônima>', kind='arrow', start=start, end=end,
+                          line=self.tokens[first].line, params_start=params_start, params_end=params_end,
+                          body_start=body, braced=braced)
+        if params_end > params_start:
+            self._expression(params_start + 1, params_end, index)
+        if braced:
+            self._statements(body + 1, end, index)
+        else:
+            self._expression(body, end + 1, index)
+        return end + 1
+
+    def _class(self, i: int, stop: int, parent: Optional[int], hint: Optional[Hint]) -> int:
+        """``class [Nome] [extends ...] { membros }`` a partir da palavra ``class``"""
+        tokens, brackets = self.tokens, self.brackets
+        k = i + 1
+        name = None
+        if k < stop and tokens[k].kind == 'name' and tokens[k].value not in ('extends', 'implements'):
+            name = tokens[k].value
+        while k < stop and not (self.value(k) == '{' and not self.in_type[k]):
+            if self.value(k) in ('(', '[') and brackets[k] > k:
+                self._expression(k + 1, brackets[k], parent)
+                k = brackets[k] + 1
+                continue
+            k += 1
+        if k >= stop or brackets[k] < k:
+            return k
+        start = i - 1 if self.value(i - 1) == 'abstract' else i
+        index = self._add(parent, (name, None, None, None) if name else hint, '<anônima>', kind='class', start=start,
+                          end=brackets[k], line=tokens[i].line, body_start=k)
+        self._class_body(k, brackets[k], index)
+        return brackets[k] + 1
+
+    def _class_body(self, open_index: int, close: int, parent: int) -> None:
+        tokens, brackets = self.tokens, self.brackets
+        m = open_index + 1
+        while m < close:
+            value = self.value(m)
+            if value == ';':
+                m += 1
+                continue
+            if value == '@':  # decorador
+                m += 1
+                while m < close and (tokens[m].kind == 'name' or self.value(m) == '.'):
+                    m += 1
+                if self.value(m) == '(' and brackets[m] > m:
+                    m = brackets[m] + 1
+                continue
+            member_start = m
+            while m + 1 < close and self.value(m) in _METHOD_MODIFIERS \
+                    and (tokens[m + 1].kind in ('name', 'string', 'number') or self.value(m + 1) in ('[', '*', '#')):
+                m += 1
+            if self.value(m) == '{' and brackets[m] > m:  # bloco static
+                self._statements(m + 1, brackets[m], parent)
+                m = brackets[m] + 1
+                continue
+            m = self._member(m, member_start, close, parent, class_member=True)
+
+    def _member(self, m: int, member_start: int, stop: int, parent: Optional[int], class_member: bool) -> int:
+        """Membro de classe ou de objeto a partir da chave: método, propriedade ou valor"""
+        tokens, brackets = self.tokens, self.brackets
+        if self.value(m) == '#':
+            m += 1
+        if self.value(m) == '[' and brackets[m] > m:
+            self._expression(m + 1, brackets[m], parent)
+            key, k = '<computada>', brackets[m] + 1
+        elif tokens[m].kind in ('name', 'string', 'number'):
+            key, k = tokens[m].value.strip('\'"'), m + 1
+        else:
+            return self._statement_end(m, stop) if class_member else stop
+        if self.value(k) in ('?', '!'):
+            k += 1
+        k = self._skip_type(k, stop)
+        if self.value(k) == '(' and brackets[k] > k:
+            body = self._skip_return_type(brackets[k] + 1, stop)
+            if self.value(body) == '{' and brackets[body] > body:
+                index = self._add(parent, (key, None, None, member_start), key, kind='method', start=member_start,
+                                  end=brackets[body], line=tokens[m].line, params_start=k,
+                                  params_end=brackets[k], body_start=body)
+                self._expression(k + 1, brackets[k], index)
+                self._statements(body + 1, brackets[body], index)
+                return brackets[body] + 1
+            if class_member:
+                return self._statement_end(body, stop)
+            self._expression(member_start, stop, parent)  # chamada num contêiner JSX: {render(x)}
+            return stop
+        if not class_member:
+            if self.value(k) == ':':
+                self._expression(k + 1, stop, parent, (key, None, None, member_start))
+            else:
+                self._expression(member_start, stop, parent)
+            return stop
+        end = self._statement_end(k, stop)
+        j = k
+        while j < end and (self.in_type[j] or self.value(j) in (':', '?', '!')):
+            j += 1
+        if self.value(j) == '=':
+            self._expression(j + 1, end, parent, (key, None, None, member_start))
+        return max(end, m + 1)
+
+    # -------------------------------------------------------------- expressões
+    def _expression(self, k: int, stop: int, parent: Optional[int], hint: Optional[Hint] = None) -> None:
+        """Procura funções numa faixa de expressão; ``hint`` nomeia a que começar em ``k``"""
+        if self._depth > _MAX_DEPTH:
+            return
+        self._depth += 1
+        tokens, brackets, in_type = self.tokens, self.brackets, self.in_type
+        hint_at = k if hint else -1
+        i = k
+        while i < stop:
+            token = tokens[i]
+            kind, value = token.kind, token.value
+            if in_type[i] and not (value == '<' and kind == 'punct'):  # <T,>(x) => ...
+                i += 1
+                continue
+            current = hint if i == hint_at else None
+            if kind == 'name' and self.value(i - 1) not in ('.', '?.'):
+                if value == 'function' or (value == 'async' and self.value(i + 1) == 'function'):
+                    i = self._function(i + 1 if value == 'async' else i, stop, parent, current)
+                    continue
+                if value == 'class':
+                    i = self._class(i, stop, parent, current)
+                    continue
+            if kind in ('name', 'punct') and (kind == 'name' or value in ('(', '<')):
+                head = self._arrow_head(i, stop)
+                if head:
+                    i = self._arrow(head, stop, parent, current)
+                    continue
+            if kind == 'punct':
+                if value == '=':
+                    assignment = self._assignment_hint(i)
+                    if assignment:
+                        hint, hint_at = assignment, i + 1
+                elif value in ('(', '[') and brackets[i] > i:
+                    self._arguments(i, parent, hint, hint_at)
+                    i = brackets[i] + 1
+                    continue
+                elif value == '{' and brackets[i] > i:
+                    self._object(i, parent)
+                    i = brackets[i] + 1
+                    continue
+            i += 1
+        self._depth -= 1
+
+    def _arguments(self, open_index: int, parent: Optional[int], hint: Optional[Hint], hint_at: int) -> None:
+        """Argumentos de chamada (ou itens de parênteses/arrays): nomeia callbacks e wrappers"""
+        parenthesis = self.value(open_index) == '('
+        callee, chain_start = self._callee(open_index) if parenthesis else (None, open_index)
+        # O nome pendente (``const X = memo(...)``) só vale para a expressão que começa nele
+        outer = hint if hint and chain_start == hint_at else None
+        for position, (start, end) in enumerate(self._split(open_index, self.brackets[open_index])):
+            if callee in NAMING_WRAPPERS and outer and position == 0:
+                item_hint = (outer[0], callee, callee, outer[3])
+            elif callee:
+                item_hint = (f"<callback {callee}>", callee, None, None)
+            elif parenthesis:
+                item_hint = outer if outer and position == 0 else ('<callback>', None, None, None)
+            else:
+                item_hint = None
+            self._expression(start, end + 1, parent, item_hint)
+
+    def _object(self, open_index: int, parent: Optional[int]) -> None:
+        """Literal de objeto (ou contêiner JSX): métodos, ``chave: valor``, abreviações e spreads"""
+        tokens = self.tokens
+        for start, end in self._split(open_index, self.brackets[open_index]):
+            m = start
+            while m < end and self.value(m) in ('async', 'get', 'set', '*') \
+                    and (tokens[m + 1].kind in ('name', 'string', 'number') or self.value(m + 1) in ('[', '*')):
+                m += 1
+            if tokens[m].kind in ('name', 'string', 'number') and self.value(m + 1) in (':', '(', '<') \
+                    or self.value(m) == '[' and self.value(self.brackets[m] + 1) in (':', '('):
+                if self.value(m + 1) == '<' and not self.in_type[m + 1]:
+                    self._expression(start, end + 1, parent)
+                else:
+                    self._member(m, start, end + 1, parent, class_member=False)
+            else:
+                self._expression(start, end + 1, parent)
+
+    def _split(self, open_index: int, close: int) -> List[Tuple[int, int]]:
+        """Itens (início, fim inclusive) separados por vírgula dentro de um colchete"""
+        tokens, brackets = self.tokens, self.brackets
+        items = []
+        start = k = open_index + 1
+        while k < close:
+            token = tokens[k]
+            if token.kind == 'punct':
+                if token.value in ('(', '[', '{') and brackets[k] > k:
+                    k = brackets[k] + 1
+                    continue
+                if token.value == ',' and not self.in_type[k]:
+                    if k > start:
+                        items.append((start, k - 1))
+                    start = k + 1
+            k += 1
+        if close > start:
+            items.append((start, close - 1))
+        return items
+
+    # ------------------------------------------------------------------ papéis
+    def _assign_roles(self) -> None:
+        """Hooks (``useX``) e componentes (PascalCase que renderizam JSX ou são memo/forwardRef)"""
+        if not self.nodes:
+            return
+        jsx_before = [0] * (len(self.tokens) + 1)
+        count = 0
+        for position, token in enumerate(self.tokens):
+            if token.kind == 'jsx':
+                count += 1
+            jsx_before[position + 1] = count
+        for node in self.nodes:
+            name = node.name
+            if node.kind == 'class':
+                heritage = {self.value(j) for j in range(node.start, node.body_start)}
+                react = bool(heritage & {'Component', 'PureComponent'}) and 'extends' in heritage
+                node.role = 'component' if name[:1].isupper() and react else 'class'
+            elif _HOOK_NAME.match(name):
+                node.role = 'hook'
+            elif node.wrapper in _COMPONENT_WRAPPERS or (
+                    (name[:1].isupper() or name == 'default')
+                    and jsx_before[node.end + 1] > jsx_before[node.body_start]):
+                node.role = 'component'
+            else:
+                node.role = node.kind
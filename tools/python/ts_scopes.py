@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Índice de escopos de função sobre o fluxo de tokens
+Funções, arrow functions e métodos (nome, parâmetros, corpo) vêm da árvore do
+``ts_outline``; o índice permite descobrir a função que envolve qualquer token
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from symbol_index import type_positions
+from ts_outline import Outline
+from ts_tokenizer import Token, matching_brackets
+
+_STATEMENT_KEYWORDS = {'const', 'let', 'var', 'function', 'return', 'export', 'import', 'if', 'for',
+                       'while', 'switch', 'class', 'interface', 'type', 'throw', 'try'}
+_METHOD_MODIFIERS = {'async', 'get', 'set', 'static', 'public', 'private', 'protected', 'readonly',
+                     'override', 'abstract', '*'}
+
+
+@dataclass
+class FunctionScope:
+    name: str
+    kind: str  # 'function', 'arrow' ou 'method'
+    start: int  # primeiro token da declaração
+    params_start: int  # índice do ``(`` (ou do parâmetro único de ``x =>``)
+    params_end: int  # índice do ``)`` (igual a params_start em ``x =>``)
+    body_start: int  # ``{`` do corpo, ou primeiro token da expressão
+    body_end: int  # ``}`` do corpo, ou último token da expressão
+    line: int
+    parent: Optional[int] = None
+    call_context: Optional[str] = None  # função que recebe a arrow como argumento (ex.: 'map')
+    braced: bool = True  # False em ``x => expressão``
+
+    def contains(self, index: int) -> bool:
+        return self.start <= index <= self.body_end
+
+
+class ScopeIndex:
+    """Funções de um arquivo ordenadas por posição, com a hierarquia de aninhamento"""
+
+    def __init__(self, tokens: List[Token], brackets: Optional[List[int]] = None,
+                 in_type: Optional[bytearray] = None):
+        self.tokens = tokens
+        self.brackets = brackets if brackets is not None else matching_brackets(tokens)
+        self.in_type = in_type if in_type is not None else bytearray(len(tokens))
+        self.functions: List[FunctionScope] = []
+        self._build()
+
+    # ---------------------------------------------------------------- helpers
+    def value(self, i: int) -> str:
+        return self.tokens[i].value if 0 <= i < len(self.tokens) else ''
+
+    def _expression_end(self, k: int) -> int:
+        """Último token de uma expressão iniciada em ``k`` (corpo de arrow sem chaves)"""
+        tokens = self.tokens
+        n = len(tokens)
+        last = k
+        while k < n:
+            token = tokens[k]
+            if token.kind == 'punct':
+                if token.value in ('(', '[', '{') and self.brackets[k] > 0:
+                    last = self.brackets[k]
+                    k = last + 1
+                    continue
+                if token.value in (',', ';', ')', ']', '}'):
+                    return last
+            elif token.kind == 'name' and token.value in _STATEMENT_KEYWORDS and k > last \
+                    and tokens[k].line > tokens[last].line and tokens[last].value not in ('=>', '?', ':'):
+                return last
+            last = k
+            k += 1
+        return last
+
+    # ------------------------------------------------------------------ build
+    def _build(self) -> None:
+        self.outline = Outline(self.tokens, self.brackets, self.in_type)
+        found = [FunctionScope(node.name, node.kind, node.start, node.params_start, node.params_end,
+                               node.body_start, node.end, node.line, call_context=node.call_context,
+                               braced=node.braced)
+                 for node in self.outline.nodes if node.kind != 'class']
+
+        found.sort(key=lambda f: (f.start, -f.body_end))
+        stack: List[int] = []
+        for index, scope in enumerate(found):
+            while stack and found[stack[-1]].body_end < scope.start:
+                stack.pop()
+            scope.parent = stack[-1] if stack else None
+            stack.append(index)
+        self.functions = found
+
+    # ---------------------------------------------------------------- queries
+    def enclosing(self, index: int) -> Optional[int]:
+        """Índice (em ``functions``) da função mais interna que contém o token"""
+        best = None
+        for position, scope in enumerate(self.functions):
+            if scope.start > index:
+                break
+            if scope.params_start <= index <= scope.body_end:
+                best = position
+        return best
+
+    def named_ancestor(self, position: Optional[int]) -> Optional[FunctionScope]:
+        """Primeira função com nome próprio subindo a partir de ``position``"""
+        while position is not None:
+            scope = self.functions[position]
+            if not scope.name.startswith('<'):
+                return scope
+            position = scope.parent
+        return None
+
+    def chain(self, position: Optional[int]) -> List[FunctionScope]:
+        """Funções do mais interno ao mais externo"""
+        result = []
+        while position is not None:
+            result.append(self.functions[position])
+            position = self.functions[position].parent
+        return result
+
+    def param_names(self, scope: FunctionScope) -> List[str]:
+        """Nomes dos parâmetros de primeiro nível (ignora padrões de desestruturação)"""
+        if scope.params_start == scope.params_end:
+            return [self.tokens[scope.params_start].value]
+        names = []
+        k = scope.params_start + 1
+        expect_name = True
+        while k < scope.params_end:
+            token = self.tokens[k]
+            if token.kind == 'punct' and token.value in ('(', '[', '{') and self.brackets[k] > 0:
+                k = self.brackets[k] + 1
+                expect_name = False
+                continue
+            if token.value == ',':
+                expect_name = True
+            elif expect_name and token.kind == 'name' and token.value not in _METHOD_MODIFIERS and not self.in_type[k]:
+                names.append(token.value)
+                expect_name = False
+            k += 1
+        return names
+
+
+class SourceView:
+    """Tokens, colchetes, posições de tipo e escopos de um arquivo, com utilitários de navegação"""
+
+    def __init__(self, path: str, source: str, tokens: List[Token], in_type: Optional[bytearray] = None):
+        self.path = path
+        self.source = source
+        self.tokens = tokens
+        self.brackets = matching_brackets(tokens)
+        self.in_type = in_type if in_type is not None else type_positions(tokens)
+        self.scopes = ScopeIndex(tokens, self.brackets, self.in_type)
+
+    def value(self, i: int) -> str:
+        return self.tokens[i].value if 0 <= i < len(self.tokens) else ''
+
+    def line(self, i: int) -> int:
+        return self.tokens[min(max(i, 0), len(self.tokens) - 1)].line if self.tokens else 0
+
+    def text(self, start: int, end: int) -> str:
+        """Trecho do código-fonte entre dois tokens (inclusive), normalizado numa linha"""
+        if start > end or start < 0:
+            return ''
+        return ' '.join(self.source[self.tokens[start].start:self.tokens[end].end].split())
+
+    def opener(self, i: int) -> int:
+        """Índice do ``(``/``[``/``{`` não fechado mais próximo antes de ``i``"""
+        k = i - 1
+        while k >= 0:
+            token = self.tokens[k]
+            if token.kind == 'punct' and token.value in (')', ']', '}') and self.brackets[k] >= 0:
+                k = self.brackets[k] - 1
+                continue
+            if token.kind == 'punct' and token.value in ('(', '[', '{'):
+                return k
+            k -= 1
+        return -1
+
+    def expression_start(self, i: int) -> int:
+        """Início da cadeia ``a.b(c).d`` que termina no token ``i``"""
+        k = i
+        while k > 0:
+            if self.value(k) in (')', ']') and self.brackets[k] >= 0:
+                k = self.brackets[k]
+                if self.value(k - 1) in ('.', '?.') or self.tokens[k - 1].kind == 'name':
+                    k -= 1
+                    continue
+                return k
+            if self.value(k - 1) in ('.', '?.'):
+                k -= 2
+                continue
+            return k
+        return k
+
+    def expression_end(self, i: int) -> int:
+        """Último token da expressão que começa em ``i`` (para em ``,``/``;``/fechamento ou nova instrução)"""
+        return self.scopes._expression_end(i)
+
+    def split_top_level(self, open_index: int) -> List[Tuple[int, int]]:
+        """Faixas (início, fim inclusive) dos itens separados por vírgula dentro de um colchete"""
+        close = self.brackets[open_index]
+        items = []
+        start = k = open_index + 1
+        while 0 < k < close:
+            value = self.value(k)
+            if value in ('(', '[', '{') and self.tokens[k].kind == 'punct' and self.brackets[k] > k:
+                k = self.brackets[k] + 1
+                continue
+            if value == ',':
+                if k > start:
+                    items.append((start, k - 1))
+                start = k + 1
+            k += 1
+        if close > start:
+            items.append((start, close - 1))
+        return items
+
+    def object_properties(self, open_index: int) -> Dict[str, Tuple[int, int]]:
+        """``{ a: 1, b, c() {} }`` -> nome -> faixa do valor; spreads ficam como ``...nome``"""
+        properties: Dict[str, Tuple[int, int]] = {}
+        for start, end in self.split_top_level(open_index):
+            token = self.tokens[start]
+            if token.value == '...':
+                properties[f"...{self.text(start + 1, end)}"] = (start + 1, end)
+            elif token.kind in ('name', 'string'):
+                key = token.value.strip('\'"')
+                if self.value(start + 1) == ':':
+                    properties[key] = (start + 2, end)
+                elif start == end:
+                    properties[key] = (start, end)  # abreviado
+                else:
+                    properties[key] = (start + 1, end)  # método
+            elif token.value == 'async' and self.tokens[start + 1].kind == 'name':
+                properties[self.tokens[start + 1].value] = (start, end)
+        return properties
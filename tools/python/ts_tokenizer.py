@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""
+Tokenizador léxico para TypeScript/TSX compartilhado pelas ferramentas de análise
+Reconhece strings, template literals, regex, comentários e JSX sem depender de Node
+"""
+
+import re
+from typing import List, NamedTuple, Optional
+
+
+class Token(NamedTuple):
+    kind: str  # 'name', 'number', 'string', 'template', 'regex', 'punct', 'jsx', 'jsx_attr', 'jsx_text', 'comment'
+    value: str
+    start: int
+    end: int
+    line: int
+
+
+# Palavras reservadas (inclui as contextuais usadas pelas análises)
+KEYWORDS = {
+    'abstract', 'as', 'async', 'await', 'break', 'case', 'catch', 'class', 'const',
+    'continue', 'debugger', 'declare', 'default', 'delete', 'do', 'else', 'enum',
+    'export', 'extends', 'false', 'finally', 'for', 'from', 'function', 'if',
+    'implements', 'import', 'in', 'instanceof', 'interface', 'keyof', 'let', 'new',
+    'null', 'of', 'private', 'protected', 'public', 'readonly', 'return', 'satisfies',
+    'static', 'super', 'switch', 'this', 'throw', 'true', 'try', 'type', 'typeof',
+    'undefined', 'var', 'void', 'while', 'with', 'yield',
+}
+
+# Palavras após as quais começa uma expressão (regex ou JSX são possíveis)
+_EXPRESSION_KEYWORDS = {
+    'return', 'typeof', 'instanceof', 'in', 'of', 'new', 'delete', 'void', 'throw',
+    'case', 'do', 'else', 'yield', 'await', 'default',
+}
+
+_CODE_PATTERN = re.compile(r'''
+    (?P<ws>\s+)
+  | (?P<lc>//[^\n]*)
+  | (?P<bc>/\*[\s\S]*?(?:\*/|\Z))
+  | (?P<name>(?:[^\W\d]|\$)[\w$]*)
+  | (?P<num>(?:0[xX][0-9a-fA-F_]+|0[bB][01_]+|0[oO][0-7_]+|(?:\d[\d_]*(?:\.[\d_]*)?|\.\d[\d_]*)(?:[eE][+-]?\d+)?)n?)
+  | (?P<str>"(?:[^"\\\n]|\\[\s\S])*"|'(?:[^'\\\n]|\\[\s\S])*')
+  | (?P<punct>\.\.\.|===|!==|\*\*=|<<=|&&=|\|\|=|\?\?=|=>|==|!=|<=|>=|&&|\|\||\?\?|\?\.(?!\d)
+              |\+\+|--|\+=|-=|\*=|/=|%=|&=|\|=|\^=|<<|\*\*|[{}()\[\];,<>+\-*/%&|^!~?:=.@\#])
+  | (?P<other>[\s\S])
+''', re.X)
+
+_REGEX_PATTERN = re.compile(r'/(?![*/])(?:[^/\\\[\n]|\\.|\[(?:[^\]\\\n]|\\.)*\])+/[A-Za-z]*')
+_TEMPLATE_CHUNK = re.compile(r'[^`\\$]*(?:(?:\\[\s\S]|\$(?!\{))[^`\\$]*)*')
+_JSX_TEXT = re.compile(r'[^<{]+')
+_JSX_NAME = re.compile(r'(?:[^\W\d]|\$)[\w$\-:]*')
+_JSX_STRING = re.compile(r'"[^"]*"|\'[^\']*\'')
+_JSX_SPACE = re.compile(r'(?:\s+|//[^\n]*|/\*[\s\S]*?\*/)+')
+_GENERIC_ARROW = re.compile(r'\s*(?:const\s+)?(?:[^\W\d]|\$)[\w$]*\s*(?:,|extends\b|=|>\s*\()')
+
+
+def _starts_expression(prev: Optional[Token]) -> bool:
+    """Indica se, após ``prev``, o próximo token inicia uma expressão"""
+    if prev is None:
+        return True
+    if prev.kind == 'punct':
+        return prev.value not in (')', ']', '}')
+    if prev.kind == 'name':
+        return prev.value in _EXPRESSION_KEYWORDS
+    return False
+
+
+class _Lexer:
+    """Máquina de estados: código, template literal, tag JSX e filhos JSX"""
+
+    def __init__(self, source: str, jsx: bool, keep_comments: bool):
+        self.src = source
+        self.jsx = jsx
+        self.keep_comments = keep_comments
+        self.tokens: List[Token] = []
+        self.pos = 0
+        self.line = 1
+        # Cada quadro: [modo, profundidade_de_chaves | flag]
+        self.stack: List[list] = [['code', 0]]
+
+    def _emit(self, kind: str, value: str, start: int) -> None:
+        self.tokens.append(Token(kind, value, start, start + len(value), self.line))
+        self.line += value.count('\n')
+
+    def _prev(self) -> Optional[Token]:
+        return self.tokens[-1] if self.tokens else None
+
+    def run(self) -> List[Token]:
+        src_len = len(self.src)
+        while self.pos < src_len:
+            mode = self.stack[-1][0]
+            if mode == 'code':
+                self._scan_code()
+            elif mode == 'template':
+                self._scan_template()
+            elif mode == 'tag' or mode == 'closing':
+                self._scan_tag()
+            else:
+                self._scan_children()
+        return self.tokens
+
+    # ------------------------------------------------------------------ código
+    def _scan_code(self) -> None:
+        src = self.src
+        src_len = len(src)
+        frame = self.stack[-1]
+        match = _CODE_PATTERN.match
+        while self.pos < src_len:
+            pos = self.pos
+            char = src[pos]
+
+            if char == '`':
+                self._emit_template_start()
+                return
+            if char == '/' and pos + 1 < src_len and src[pos + 1] not in '/*' and _starts_expression(self._prev()):
+                regex = _REGEX_PATTERN.match(src, pos)
+                if regex:
+                    self._emit('regex', regex.group(), pos)
+                    self.pos = regex.end()
+                    continue
+            if char == '<' and self.jsx and _starts_expression(self._prev()) and self._is_jsx_start(pos):
+                self._emit('jsx', '<', pos)
+                self.pos = pos + 1
+                self._open_element()
+                return
+
+            m = match(src, pos)
+            kind = m.lastgroup
+            value = m.group()
+            self.pos = m.end()
+            if kind == 'ws':
+                self.line += value.count('\n')
+            elif kind == 'lc' or kind == 'bc':
+                if self.keep_comments:
+                    self._emit('comment', value, pos)
+                else:
+                    self.line += value.count('\n')
+            elif kind == 'name':
+                self.tokens.append(Token('name', value, pos, self.pos, self.line))
+            elif kind == 'punct':
+                if value == '}' and frame[1] == 0 and len(self.stack) > 1:
+                    self.stack.pop()
+                    if self.stack[-1][0] == 'template':
+                        # O ``}`` da interpolação pertence ao próximo trecho do template
+                        self.pos = pos
+                    else:
+                        self.tokens.append(Token('punct', value, pos, self.pos, self.line))
+                    return
+                self.tokens.append(Token('punct', value, pos, self.pos, self.line))
+                if value == '{':
+                    frame[1] += 1
+                elif value == '}':
+                    frame[1] = max(frame[1] - 1, 0)
+            elif kind == 'num':
+                self.tokens.append(Token('number', value, pos, self.pos, self.line))
+            elif kind == 'str':
+                self._emit('string', value, pos)
+            else:
+                self.tokens.append(Token('punct', value, pos, self.pos, self.line))
+
+    def _is_jsx_start(self, pos: int) -> bool:
+        """Diferencia ``<Tag`` de genéricos de arrow functions (``<T,>``)"""
+        nxt = self.src[pos + 1:pos + 2]
+        if nxt == '>':
+            return True
+        if not nxt or not (nxt.isalpha() or nxt in '_$'):
+            return False
+        return _GENERIC_ARROW.match(self.src, pos + 1) is None
+
+    # ---------------------------------------------------------------- template
+    def _emit_template_start(self) -> None:
+        self.stack.append(['template', 0])
+        self._scan_template()
+
+    def _scan_template(self) -> None:
+        """Lê um trecho a partir da crase inicial ou do ``}`` que fecha uma interpolação"""
+        src = self.src
+        start = self.pos
+        chunk = _TEMPLATE_CHUNK.match(src, start + 1)
+        end = chunk.end()
+        if src.startswith('${', end):
+            self._emit('template', src[start:end + 2], start)
+            self.pos = end + 2
+            self.stack.append(['code', 0])
+            return
+        end = min(end + 1, len(src))  # inclui a crase final
+        self._emit('template', src[start:end], start)
+        self.pos = end
+        self.stack.pop()
+
+    # --------------------------------------------------------------------- JSX
+    def _open_element(self) -> None:
+        """Chamado logo após emitir ``<``: abre fragmento ou tag"""
+        space = _JSX_SPACE.match(self.src, self.pos)
+        if space:
+            self.line += space.group().count('\n')
+            self.pos = space.end()
+        if self.src.startswith('>', self.pos):
+            self._emit('jsx', '>', self.pos)
+            self.pos += 1
+            self.stack.append(['children', 0])
+        else:
+            self.stack.append(['tag', False])
+
+    def _scan_tag(self) -> None:
+        src = self.src
+        frame = self.stack[-1]
+        while self.pos < len(src):
+            pos = self.pos
+            space = _JSX_SPACE.match(src, pos)
+            if space:
+                self.line += space.group().count('\n')
+                self.pos = space.end()
+                continue
+            char = src[pos]
+            if src.startswith('/>', pos):
+                self._emit('jsx', '/>', pos)
+                self.pos = pos + 2
+                self.stack.pop()
+                return
+            if char == '>':
+                self._emit('jsx', '>', pos)
+                self.pos = pos + 1
+                if frame[0] == 'closing':
+                    self.stack.pop()  # tag de fechamento
+                    if self.stack[-1][0] == 'children':
+                        self.stack.pop()  # filhos do elemento
+                else:
+                    frame[0] = 'children'
+                    frame[1] = 0
+                return
+            if char == '{':
+                self._emit('punct', '{', pos)
+                self.pos = pos + 1
+                self.stack.append(['code', 0])
+                return
+            if char in '"\'':
+                string = _JSX_STRING.match(src, pos)
+                if string:
+                    self._emit('string', string.group(), pos)
+                    self.pos = string.end()
+                    continue
+            name = _JSX_NAME.match(src, pos)
+            if name:
+                value = name.group()
+                if frame[1]:
+                    self._emit('jsx_attr', value, pos)
+                else:
+                    # Nome da tag: ``Foo.Bar`` vira name . name
+                    self._emit('name', value, pos)
+                    if not src.startswith('.', name.end()):
+                        frame[1] = True
+                self.pos = name.end()
+                continue
+            self._emit('punct', char, pos)
+            self.pos = pos + 1
+
+    def _scan_children(self) -> None:
+        src = self.src
+        while self.pos < len(src):
+            pos = self.pos
+            char = src[pos]
+            if char == '{':
+                self._emit('punct', '{', pos)
+                self.pos = pos + 1
+                self.stack.append(['code', 0])
+                return
+            if char == '<':
+                if src.startswith('</', pos):
+                    self._emit('jsx', '</', pos)
+                    self.pos = pos + 2
+                    self.stack.append(['closing', False])
+                    # Fechamento de fragmento ``</>``
+                    if src.startswith('>', self.pos):
+                        self._emit('jsx', '>', self.pos)
+                        self.pos += 1
+                        self.stack.pop()
+                        self.stack.pop()
+                    return
+                self._emit('jsx', '<', pos)
+                self.pos = pos + 1
+                self._open_element()
+                return
+            text = _JSX_TEXT.match(src, pos)
+            value = text.group()
+            if value.strip():
+                self._emit('jsx_text', value, pos)
+            else:
+                self.line += value.count('\n')
+            self.pos = text.end()
+
+
+def tokenize(source: str, jsx: bool = True, keep_comments: bool = False) -> List[Token]:
+    """Converte o código-fonte em tokens (sem espaços; comentários opcionais)"""
+    return _Lexer(source, jsx, keep_comments).run()
+
+
+def is_jsx_file(file_path: str) -> bool:
+    """Arquivos .tsx/.jsx aceitam JSX; em .ts ``<T>x`` é asserção de tipo"""
+    return str(file_path).endswith(('.tsx', '.jsx'))
+
+
+def tokenize_file(file_path: str, keep_comments: bool = False) -> List[Token]:
+    """Lê e tokeniza um arquivo TypeScript/TSX"""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    return tokenize(content, jsx=is_jsx_file(file_path), keep_comments=keep_comments)
+
+
+def string_value(token: Token) -> Optional[str]:
+    """Conteúdo de uma string literal ou template sem interpolação"""
+    if token.kind == 'string':
+        return token.value[1:-1]
+    if token.kind == 'template' and token.value.startswith('`') and token.value.endswith('`') \
+            and len(token.value) >= 2 and not token.value.endswith('${'):
+        return token.value[1:-1]
+    return None
+
+
+def matching_brackets(tokens: List[Token]) -> List[int]:
+    """Para cada ``(``, ``[`` ou ``{`` retorna o índice do fechamento (e vice-versa); -1 nos demais"""
+    pairs = {')': '(', ']': '[', '}': '{'}
+    result = [-1] * len(tokens)
+    stack: List[int] = []
+    for i, token in enumerate(tokens):
+        if token.kind != 'punct':
+            continue
+        value = token.value
+        if value in ('(', '[', '{'):
+            stack.append(i)
+        elif value in pairs:
+            # Descarta aberturas órfãs até achar a correspondente
+            while stack and tokens[stack[-1]].value != pairs[value]:
+                stack.pop()
+            if stack:
+                opening = stack.pop()
+                result[opening] = i
+                result[i] = opening
+    return result
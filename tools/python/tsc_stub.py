@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Compilador falso para testar o parallel_tsc.py sem Node
+Aceita ``-p <tsconfig>`` como o tsc, lê a lista ``files`` e emite um diagnóstico no
+formato ``--pretty false`` para cada linha marcada com ``@stub-error [TSxxxx] mensagem``.
+
+Simula o custo da checagem dormindo ``STUB_TSC_MS_PER_KB`` milissegundos por KB de
+arquivo alterado desde a última execução (registrada no ``tsBuildInfoFile``), o que
+permite observar o ganho do paralelismo e do modo incremental.
+"""
+
+import json
+import os
+import re
+import sys
+import time
+
+MARKER = re.compile(r'@stub-error(?:\s+(TS\d+))?\s*(.*)')
+
+
+def main(argv):
+    config_path = None
+    for i, arg in enumerate(argv):
+        if arg in ('-p', '--project') and i + 1 < len(argv):
+            config_path = argv[i + 1]
+    if config_path is None:
+        print("error TS5058: The specified path does not exist: ''.")
+        return 1
+
+    with open(config_path, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+    build_info_path = config.get('compilerOptions', {}).get('tsBuildInfoFile')
+    previous = {}
+    if build_info_path and os.path.exists(build_info_path):
+        with open(build_info_path, 'r', encoding='utf-8') as f:
+            previous = json.load(f)
+
+    ms_per_kb = float(os.environ.get('STUB_TSC_MS_PER_KB', '0'))
+    state = {}
+    changed_bytes = 0
+    errors = 0
+    for file_path in config.get('files', []):
+        try:
+            stat = os.stat(file_path)
+            with open(file_path, 'r', encoding='utf-8') as f:
+                lines = f.read().splitlines()
+        except (OSError, UnicodeDecodeError):
+            print(f"error TS6053: File '{file_path}' not found.")
+            errors += 1
+            continue
+        state[file_path] = [stat.st_mtime_ns, stat.st_size]
+        if previous.get(file_path) != state[file_path]:
+            changed_bytes += stat.st_size
+        shown = os.path.relpath(file_path)
+        for number, line in enumerate(lines, 1):
+            match = MARKER.search(line)
+            if match:
+                code = match.group(1) or 'TS2304'
+                message = match.group(2).strip() or 'Stub error.'
+                print(f"{shown}({number},{match.start() + 1}): error {code}: {message}")
+                errors += 1
+
+    time.sleep(changed_bytes / 1024 * ms_per_kb / 1000)
+    if build_info_path:
+        os.makedirs(os.path.dirname(build_info_path), exist_ok=True)
+        with open(build_info_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+    return 2 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -3,14 +3,17 @@
 Script de validação para imports de tipos otimizados
 """
 
-import os
-import subprocess
+import argparse
+import re
 import json
 from pathlib import Path
 from typing import List, Dict
 
+from import_validator import ImportValidator
+from parallel_tsc import ShardedTypeChecker
+
 def validate_typescript_compilation(project_root: str) -> Dict:
-    """Valida se o TypeScript está compilando sem erros"""
+    """Valida os imports (módulos e nomes exportados) sem chamar o tsc"""
     result = {
         'success': False,
         'output': '',
@@ -18,27 +21,31 @@ def validate_typescript_compilation(project_root: str) -> Dict:
     }
     
     try:
-        # Executa tsc --noEmit para verificar tipos sem gerar arquivos
-        os.chdir(project_root)
-        process = subprocess.run(
-            ['npx', 'tsc', '--noEmit', '--skipLibCheck'],
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
-        
-        result['output'] = process.stdout + process.stderr
-        result['success'] = process.returncode == 0
-        
-        if not result['success']:
-            # Extrai apenas erros relacionados a imports
-            lines = result['output'].split('\n')
-            for line in lines:
-                if 'import' in line and ('error' in line.lower() or 'cannot find module' in line.lower()):
-                    result['errors'].append(line.strip())
-        
-    except subprocess.TimeoutExpired:
-        result['errors'].append('Timeout na compilação TypeScript')
+        validator = ImportValidator(project_root)
+        problems = validator.validate()
+        result['errors'] = [f"{p.file}:{p.line} - {p.message}" for p in problems]
+        result['output'] = '\n'.join(result['errors'])
+        result['success'] = not problems
+    except Exception as e:
+        result['errors'].append(f'Erro ao validar imports: {e}')
+    
+    return result
+
+def run_full_tsc(project_root: str, timeout: int = 900, shards: int = None) -> Dict:
+    """Portão final: tsc completo, em shards paralelos com .tsbuildinfo próprio"""
+    result = {
+        'success': False,
+        'output': '',
+        'errors': []
+    }
+    
+    try:
+        checker = ShardedTypeChecker(project_root, shards=shards, timeout=timeout)
+        diagnostics = checker.run()
+        result['errors'] = [d.format() for d in diagnostics if d.category == 'error']
+        result['errors'] += [f'shard {s.index}: {s.error}' for s in checker.shards if s.error]
+        result['output'] = '\n'.join(d.format() for d in diagnostics)
+        result['success'] = checker.success
     except Exception as e:
         result['errors'].append(f'Erro ao executar TypeScript: {e}')
     
@@ -145,20 +152,41 @@ def check_barrel_exports(project_root: str) -> Dict:
     return status
 
 def main():
-    project_root = "/workspace/doc-forge-buddy-Cain"
+    parser = argparse.ArgumentParser(description='Validação das otimizações de imports de tipos')
+    parser.add_argument('--project-dir', default='/workspace/doc-forge-buddy-Cain',
+                        help='Diretório do projeto')
+    parser.add_argument('--full-tsc', action='store_true',
+                        help='Executa também o tsc completo (portão final)')
+    parser.add_argument('--shards', type=int, default=None,
+                        help='Shards do tsc completo (padrão: número de CPUs)')
+    args = parser.parse_args()
+    project_root = args.project_dir
     
     print("🔍 Validando otimizações de imports de tipos...\n")
     
-    # 1. Validação de compilação TypeScript
-    print("1. 📋 Verificando compilação TypeScript...")
+    # 1. Validação rápida de imports (módulos e nomes exportados)
+    print("1. 📋 Verificando imports...")
     ts_result = validate_typescript_compilation(project_root)
     
     if ts_result['success']:
-        print("   ✅ TypeScript compilou sem erros")
+        print("   ✅ Todos os imports resolvem")
     else:
-        print("   ❌ Erros encontrados na compilação:")
-        for error in ts_result['errors']:
+        print(f"   ❌ {len(ts_result['errors'])} imports quebrados:")
+        for error in ts_result['errors'][:20]:
             print(f"      - {error}")
+        if len(ts_result['errors']) > 20:
+            print(f"      ... e mais {len(ts_result['errors']) - 20} problemas")
+    
+    if args.full_tsc:
+        print("\n   🔧 Executando tsc completo...")
+        tsc_result = run_full_tsc(project_root, shards=args.shards)
+        if tsc_result['success']:
+            print("   ✅ TypeScript compilou sem erros")
+        else:
+            print(f"   ❌ {len(tsc_result['errors'])} erros de compilação")
+            for error in tsc_result['errors'][:20]:
+                print(f"      - {error}")
+        ts_result['success'] = ts_result['success'] and tsc_result['success']
     
     # 2. Verificação de padrões de import
     print("\n2. 📊 Analisando padrões de import...")
@@ -203,7 +231,7 @@ def main():
         print("⚠️  ALGUNS PROBLEMAS FORAM IDENTIFICADOS:")
         
         if not ts_result['success']:
-            print("   - Erros de compilação TypeScript")
+            print("   - Imports quebrados ou erros de compilação TypeScript")
         if import_analysis['import_errors']:
             print(f"   - {len(import_analysis['import_errors'])} padrões de import melhoráveis")
         if not barrel_status['export_consistency']:
@@ -220,5 +248,4 @@ def main():
     print("   - Mantenha a estrutura de tipos organizada")
 
 if __name__ == "__main__":
-    import re
-    main()
\ No newline at end of file
+    main()